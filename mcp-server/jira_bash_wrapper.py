@@ -7,22 +7,1128 @@ Exposes all JIRA functionality through MCP (Model Context Protocol).
 """
 
 import asyncio
+import concurrent.futures
+import contextlib
+import contextvars
+import hashlib
 import json
 import os
 import re
+import shutil
+import signal
 import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List
 
 from dotenv import load_dotenv
 from mcp.server import Server, NotificationOptions, InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp import types
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from jira_client import JiraApiError, JiraClient, RateLimiter  # noqa: E402
+
+
+# Set by handle_call_tool for the duration of a tool call. Tool methods are synchronous
+# and run in a worker thread; _run_script uses this to hand the script back to the
+# server event loop, where it is bounded by the ScriptPool and can be cancelled.
+_CALL_CONTEXT: contextvars.ContextVar = contextvars.ContextVar('jira_mcp_call', default=None)
+
+
+class ScriptPool:
+    """
+    Bounded pool for running bash scripts as asyncio subprocesses
+
+    Callers queue for a slot in arrival order (asyncio.Semaphore wakes waiters FIFO),
+    so a burst of slow grooms cannot starve a quick search or close. Every script is
+    started in its own session, which makes it the leader of a new process group:
+    on timeout or cancellation the whole group (curl, jq, python helpers) is killed.
+    """
+
+    def __init__(self, max_concurrency: int = 4, timeout: int = 60, workers: 'BashWorkerPool' = None):
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.timeout = timeout
+        self.workers = workers
+        self._semaphore = None
+        self._loop = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    async def run(self, cmd: List[str], cwd: str, input_data: str = None,
+                  timeout: int = None, env: Dict[str, str] = None,
+                  on_line: Callable[[str, str], None] = None) -> Dict:
+        """Wait for a free slot, then run the command (on a warm worker when available)"""
+        async with self._get_semaphore():
+            if self.workers is not None and self.workers.accepts(cmd):
+                result = await self.workers.run(cmd, cwd, input_data, timeout or self.timeout, env, on_line)
+                if result is not None:
+                    return result
+            return await self.execute(cmd, cwd, input_data, timeout, env, on_line)
+
+    async def execute(self, cmd: List[str], cwd: str, input_data: str = None,
+                      timeout: int = None, env: Dict[str, str] = None,
+                      on_line: Callable[[str, str], None] = None) -> Dict:
+        """
+        Run the command immediately (no slot accounting)
+
+        on_line(stream, line) is called for every stdout/stderr line as it is printed.
+        """
+        timeout = timeout or self.timeout
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=cwd,
+            env={**os.environ, **env} if env else None,
+            stdin=asyncio.subprocess.PIPE if input_data is not None else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(self._communicate(proc, input_data, on_line), timeout)
+        except asyncio.TimeoutError:
+            await self._kill(proc)
+            return {
+                "success": False,
+                "error": f"Script execution timed out ({timeout}s)"
+            }
+        except asyncio.CancelledError:
+            await self._kill(proc)
+            raise
+
+        stdout = stdout.decode('utf-8', errors='replace')
+        stderr = stderr.decode('utf-8', errors='replace')
+        return {
+            "success": proc.returncode == 0,
+            "output": stdout,
+            "error": stderr if proc.returncode != 0 else None,
+            "exit_code": proc.returncode
+        }
+
+    @staticmethod
+    async def _communicate(proc, input_data: Optional[str], on_line) -> tuple:
+        """Like proc.communicate(), but hands each output line to on_line as it arrives"""
+        if on_line is None:
+            return await proc.communicate(input_data.encode() if input_data is not None else None)
+
+        async def feed():
+            if input_data is not None:
+                try:
+                    proc.stdin.write(input_data.encode())
+                    await proc.stdin.drain()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                proc.stdin.close()
+
+        async def pump(reader, stream):
+            chunks = []
+            lines = _LineSplitter(stream, on_line)
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                chunks.append(data)
+                lines.feed(data)
+            lines.close()
+            return b''.join(chunks)
+
+        _, stdout, stderr = await asyncio.gather(feed(), pump(proc.stdout, 'stdout'), pump(proc.stderr, 'stderr'))
+        await proc.wait()
+        return stdout, stderr
+
+    @staticmethod
+    async def _kill(proc, grace: float = 2.0):
+        """Terminate the script's process group, escalating to SIGKILL"""
+        for sig in (signal.SIGTERM, signal.SIGKILL):
+            try:
+                os.killpg(proc.pid, sig)
+            except (ProcessLookupError, PermissionError):
+                pass
+            try:
+                await asyncio.wait_for(proc.wait(), grace)
+                return
+            except asyncio.TimeoutError:
+                continue
+
+
+class _LineSplitter:
+    """Feeds complete lines of a byte stream to on_line(stream, line)"""
+
+    # Longer lines (e.g. a one-line JSON document) are not progress messages: skip them
+    MAX_LINE = 64 * 1024
+
+    def __init__(self, stream: str, on_line: Callable[[str, str], None]):
+        self.stream = stream
+        self.on_line = on_line
+        self._pending = b''
+        self._skipping = False
+
+    def feed(self, data: bytes):
+        *lines, self._pending = (self._pending + data).split(b'\n')
+        for line in lines:
+            if self._skipping:
+                self._skipping = False
+                continue
+            self.on_line(self.stream, line.decode('utf-8', errors='replace'))
+        if len(self._pending) > self.MAX_LINE:
+            self._pending = b''
+            self._skipping = True
+
+    def close(self):
+        if self._pending and not self._skipping:
+            self.on_line(self.stream, self._pending.decode('utf-8', errors='replace'))
+        self._pending = b''
+
+
+class _FileTail:
+    """Follows a job output file written by a bash worker"""
+
+    def __init__(self, path: str, lines: _LineSplitter):
+        self.path = path
+        self.lines = lines
+        self._file = None
+
+    def poll(self):
+        if self._file is None:
+            try:
+                self._file = open(self.path, 'rb')
+            except FileNotFoundError:
+                return
+        data = self._file.read()
+        if data:
+            self.lines.feed(data)
+
+    def close(self):
+        self.poll()
+        if self._file is not None:
+            self._file.close()
+        self.lines.close()
+
+
+_ENV_NAME = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+class BashWorker:
+    """
+    One long-lived scripts/lib/mcp-worker.sh process
+
+    The worker has the libraries and .env loaded and runs one job at a time by
+    sourcing the script in a forked subshell (protocol described in mcp-worker.sh).
+    Job stdin/stdout/stderr go through files in a private temp dir, so the pipe only
+    carries the job header and the READY / DONE lines.
+    """
+
+    def __init__(self, worker_script: str, signature: tuple):
+        self.signature = signature
+        self.jobs = 0
+        self.env = dict(os.environ)
+        self.tmpdir = tempfile.mkdtemp(prefix='jira-mcp-worker-')
+        self.proc = subprocess.Popen(
+            [worker_script],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=self.env,
+            start_new_session=True,
+        )
+        os.set_blocking(self.proc.stdout.fileno(), False)
+        self._buf = b''
+        self._ready = False
+
+    async def _read_line(self) -> str:
+        """Read one protocol line without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        fd = self.proc.stdout.fileno()
+        while b'\n' not in self._buf:
+            readable = loop.create_future()
+            loop.add_reader(fd, lambda: readable.done() or readable.set_result(None))
+            try:
+                await readable
+            finally:
+                loop.remove_reader(fd)
+            try:
+                chunk = os.read(fd, 4096)
+            except BlockingIOError:
+                continue
+            if not chunk:
+                raise EOFError('bash worker exited')
+            self._buf += chunk
+        line, _, self._buf = self._buf.partition(b'\n')
+        return line.decode()
+
+    async def ready(self) -> bool:
+        """Wait until the worker has loaded the libraries"""
+        if not self._ready:
+            try:
+                self._ready = await self._read_line() == 'READY'
+            except EOFError:
+                return False
+        return self._ready
+
+    async def run(self, cmd: List[str], cwd: str, input_data: str = None,
+                  env: Dict[str, str] = None, on_line: Callable[[str, str], None] = None) -> Dict:
+        """Run one script; the caller owns timeouts and cancellation"""
+        stdin_path = os.devnull
+        if input_data is not None:
+            stdin_path = os.path.join(self.tmpdir, 'stdin')
+            with open(stdin_path, 'w') as f:
+                f.write(input_data)
+        stdout_path = os.path.join(self.tmpdir, 'stdout')
+        stderr_path = os.path.join(self.tmpdir, 'stderr')
+        for path in (stdout_path, stderr_path):
+            if os.path.exists(path):
+                os.unlink(path)
+
+        # Send only the difference between the job's environment and the worker's
+        job_env = {**os.environ, **(env or {})}
+        assign = [f'{k}={v}' for k, v in job_env.items() if self.env.get(k) != v and _ENV_NAME.match(k)]
+        unset = [k for k in self.env if k not in job_env and _ENV_NAME.match(k)]
+        args = cmd[1:]
+        fields = [cwd, cmd[0], stdin_path, stdout_path, stderr_path,
+                  str(len(assign)), *assign, str(len(unset)), *unset, str(len(args)), *args]
+        self.proc.stdin.write(b''.join(f.encode() + b'\0' for f in fields))
+        self.proc.stdin.flush()
+
+        if on_line is None:
+            line = await self._read_line()
+        else:
+            line = await self._follow(stdout_path, stderr_path, on_line)
+        if not line.startswith('DONE '):
+            raise EOFError(f'unexpected bash worker reply: {line!r}')
+        self.jobs += 1
+        returncode = int(line.split()[1])
+        with open(stdout_path, encoding='utf-8', errors='replace') as f:
+            stdout = f.read()
+        with open(stderr_path, encoding='utf-8', errors='replace') as f:
+            stderr = f.read()
+        return {
+            "success": returncode == 0,
+            "output": stdout,
+            "error": stderr if returncode != 0 else None,
+            "exit_code": returncode
+        }
+
+    async def _follow(self, stdout_path: str, stderr_path: str, on_line, interval: float = 0.1) -> str:
+        """Wait for the job's DONE line, handing its output lines to on_line meanwhile"""
+        tails = [_FileTail(stdout_path, _LineSplitter('stdout', on_line)),
+                 _FileTail(stderr_path, _LineSplitter('stderr', on_line))]
+        done = asyncio.ensure_future(self._read_line())
+        try:
+            while not done.done():
+                await asyncio.wait({done}, timeout=interval)
+                for tail in tails:
+                    tail.poll()
+        except BaseException:
+            done.cancel()
+            raise
+        finally:
+            for tail in tails:
+                tail.close()
+        return done.result()
+
+    async def kill(self, grace: float = 2.0):
+        """Terminate the worker and whatever job it is running (one process group)"""
+        for sig in (signal.SIGTERM, signal.SIGKILL):
+            try:
+                os.killpg(self.proc.pid, sig)
+            except (ProcessLookupError, PermissionError):
+                pass
+            deadline = time.monotonic() + grace
+            while self.proc.poll() is None and time.monotonic() < deadline:
+                await asyncio.sleep(0.02)
+            if self.proc.poll() is not None:
+                break
+        self.close()
+
+    def close(self):
+        """Let an idle worker exit (EOF on its stdin) and remove its temp dir"""
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+        self.proc.stdout.close()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+
+class BashWorkerPool:
+    """
+    Pre-warmed bash workers for ScriptPool
+
+    Forking a fresh bash per tool call means re-parsing utils.sh, jira-api.sh and the
+    other libraries and re-running load_env before the script does any work. Workers
+    keep that state loaded; a job only pays for a fork. A worker is recycled after
+    `max_jobs` jobs, or when .env or a library changes (tracked by mtime), and a
+    replacement is started right away so the pool stays warm.
+
+    ScriptPool bounds concurrency, so the pool never runs more than `size` jobs.
+    If workers cannot start (e.g. bash older than 5), run() returns None and the
+    script is forked as before.
+    """
+
+    def __init__(self, scripts_dir: str, size: int = 4, max_jobs: int = 100):
+        self.worker_script = os.path.join(scripts_dir, 'lib', 'mcp-worker.sh')
+        self.size = max(1, int(size))
+        self.max_jobs = max(1, int(max_jobs))
+        lib_dir = os.path.join(scripts_dir, 'lib')
+        project_dir = os.path.dirname(os.path.abspath(scripts_dir))
+        self._watched = [os.path.join(project_dir, '.env'), os.path.join(project_dir, '.env.test.local')]
+        self._watched += sorted(os.path.join(lib_dir, f) for f in os.listdir(lib_dir) if f.endswith('.sh'))
+        self.available = os.path.exists(self.worker_script)
+        self._idle: List[BashWorker] = []
+        self._lock = threading.Lock()
+        self.jobs = 0
+        self.spawned = 0
+        self.recycled = 0
+
+    def _signature(self) -> tuple:
+        sig = []
+        for path in self._watched:
+            try:
+                sig.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                sig.append(None)
+        return tuple(sig)
+
+    def _spawn(self, signature: tuple = None) -> BashWorker:
+        worker = BashWorker(self.worker_script, signature or self._signature())
+        self.spawned += 1
+        return worker
+
+    def warm(self):
+        """Start workers up to the pool size (they load the libraries in the background)"""
+        if not self.available:
+            return
+        signature = self._signature()
+        with self._lock:
+            while len(self._idle) < self.size:
+                self._idle.append(self._spawn(signature))
+
+    def accepts(self, cmd: List[str]) -> bool:
+        return self.available and cmd[0].endswith('.sh')
+
+    def _acquire(self) -> BashWorker:
+        signature = self._signature()
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.signature == signature and worker.proc.poll() is None:
+                    return worker
+                self.recycled += 1
+                worker.close()
+        return self._spawn(signature)
+
+    def _release(self, worker: BashWorker):
+        signature = self._signature()
+        if worker.jobs < self.max_jobs and worker.signature == signature:
+            with self._lock:
+                self._idle.append(worker)
+            return
+        self.recycled += 1
+        worker.close()
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(self._spawn(signature))
+
+    async def run(self, cmd: List[str], cwd: str, input_data: str = None,
+                  timeout: float = 60, env: Dict[str, str] = None,
+                  on_line: Callable[[str, str], None] = None) -> Optional[Dict]:
+        """
+        Run a script on a warm worker
+
+        Returns:
+            Result dict like ScriptPool.execute, or None if no worker could start
+        """
+        try:
+            worker = self._acquire()
+        except OSError:
+            self.available = False
+            return None
+        try:
+            ready = await asyncio.wait_for(worker.ready(), timeout)
+        except asyncio.TimeoutError:
+            ready = False
+        except asyncio.CancelledError:
+            await worker.kill()
+            raise
+        if not ready:
+            await worker.kill()
+            self.available = False
+            print("Warm bash workers unavailable; forking scripts instead", file=sys.stderr)
+            return None
+        try:
+            result = await asyncio.wait_for(worker.run(cmd, cwd, input_data, env, on_line), timeout)
+        except asyncio.TimeoutError:
+            await worker.kill()
+            return {
+                "success": False,
+                "error": f"Script execution timed out ({timeout}s)"
+            }
+        except asyncio.CancelledError:
+            await worker.kill()
+            raise
+        except Exception:
+            await worker.kill()
+            raise
+        self.jobs += 1
+        self._release(worker)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            idle = len(self._idle)
+        return {
+            "available": self.available,
+            "size": self.size,
+            "idle": idle,
+            "jobs": self.jobs,
+            "spawned": self.spawned,
+            "recycled": self.recycled,
+        }
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.close()
+
+
+class IssueCache:
+    """
+    LRU + TTL cache of issue JSON shared by all tool calls
+
+    An entry is fresh for `ttl` seconds after it was fetched or last revalidated.
+    Stale entries are revalidated against the issue's `updated` timestamp and only
+    refetched in full when it changed. Size is capped by entry count and by bytes;
+    the least recently used entries are evicted first.
+    """
+
+    def __init__(self, ttl: float = 120, max_entries: int = 256, max_bytes: int = 16 * 1024 * 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> [data, updated, validated_at]
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.refreshes = 0
+        self.evictions = 0
+
+    def lookup(self, key: str):
+        """
+        Returns:
+            (data, updated, fresh) for a cached issue, or None (counted as a miss)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            fresh = (time.monotonic() - entry[2]) < self.ttl
+            if fresh:
+                self.hits += 1
+            return entry[0], entry[1], fresh
+
+    def put(self, key: str, data: str, updated: Optional[str], refreshed: bool = False):
+        size = len(data.encode('utf-8'))
+        with self._lock:
+            self._pop(key)
+            if refreshed:
+                self.refreshes += 1
+            if size > self.max_bytes:
+                return
+            self._entries[key] = [data, updated, time.monotonic()]
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._pop(oldest)
+                self.evictions += 1
+
+    def revalidated(self, key: str):
+        """Mark a stale entry as confirmed unchanged (restarts its TTL)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry[2] = time.monotonic()
+                self.revalidations += 1
+
+    def invalidate(self, key: str):
+        with self._lock:
+            self._pop(key)
+
+    def _pop(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[0].encode('utf-8'))
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses + self.revalidations + self.refreshes
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "refreshes": self.refreshes,
+                "evictions": self.evictions,
+                "hit_rate": round((self.hits + self.revalidations) / lookups, 3) if lookups else 0.0
+            }
+
+
+class PromptCatalog:
+    """
+    In-memory catalog of the prompt templates in .prompts
+
+    Files are read once and kept with their mtime, size and SHA-256. A refresh only
+    stats the directory and the files; a file is re-read when its mtime or size moved,
+    and its entry is replaced only if the content hash differs. Without a watcher every
+    lookup refreshes first; with `start_watching()` a background thread refreshes
+    every `interval` seconds and lookups are served from memory alone.
+    """
+
+    def __init__(self, prompts_dir: str):
+        self.prompts_dir = prompts_dir
+        self._entries: Dict[str, Dict] = {}  # filename -> {stat, sha256, content}
+        self._dir_stat = None
+        self._lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.loads = 0
+        self.reloads = 0
+
+    @staticmethod
+    def _stat_key(path: str):
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+
+    def refresh(self):
+        """Pick up added, removed and changed templates"""
+        with self._lock:
+            try:
+                dir_stat = self._stat_key(self.prompts_dir)
+            except OSError:
+                self._entries = {}
+                self._dir_stat = None
+                return
+            if dir_stat != self._dir_stat:
+                try:
+                    names = sorted(f for f in os.listdir(self.prompts_dir) if f.endswith('.md'))
+                except OSError:
+                    names = []
+                self._entries = {name: self._entries.get(name) for name in names}
+                self._dir_stat = dir_stat
+            for name, entry in list(self._entries.items()):
+                path = os.path.join(self.prompts_dir, name)
+                try:
+                    stat = self._stat_key(path)
+                    if entry is not None and entry['stat'] == stat:
+                        continue
+                    with open(path, 'r') as f:
+                        content = f.read()
+                except OSError:
+                    self._entries.pop(name)
+                    continue
+                digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+                if entry is not None and entry['sha256'] == digest:
+                    entry['stat'] = stat
+                    continue
+                if entry is None:
+                    self.loads += 1
+                else:
+                    self.reloads += 1
+                self._entries[name] = {'stat': stat, 'sha256': digest, 'content': content}
+
+    def _current(self) -> Dict[str, Dict]:
+        if self._watcher is None:
+            self.refresh()
+        return self._entries
+
+    def names(self) -> List[str]:
+        return [name for name, entry in self._current().items() if entry is not None]
+
+    def content(self, filename: str) -> Optional[str]:
+        entry = self._current().get(filename)
+        return entry['content'] if entry is not None else None
+
+    def __contains__(self, filename: str) -> bool:
+        return self._current().get(filename) is not None
+
+    def start_watching(self, interval: float):
+        """Refresh in a daemon thread every `interval` seconds instead of on lookup"""
+        if self._watcher is not None:
+            return
+        self.refresh()
+        self._stop.clear()
+
+        def watch():
+            while not self._stop.wait(interval):
+                self.refresh()
+
+        self._watcher = threading.Thread(target=watch, name='prompt-catalog-watcher', daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self):
+        if self._watcher is not None:
+            self._stop.set()
+            self._watcher.join()
+            self._watcher = None
+
+    def stats(self) -> Dict:
+        return {"templates": len(self.names()), "loads": self.loads, "reloads": self.reloads,
+                "watching": self._watcher is not None}
+
+
+class OutputStore:
+    """
+    LRU store of full script output that was too large to return inline
+
+    Each entry is served as an `output://<run-id>` resource, whole or in fixed-size
+    chunks (`output://<run-id>?chunk=N`). Retention is capped by entry count and by
+    total characters; the least recently read entries are dropped first.
+    """
+
+    def __init__(self, max_entries: int = 32, max_chars: int = 8 * 1024 * 1024, chunk_chars: int = 16 * 1024):
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self.chunk_chars = max(1, chunk_chars)
+        self._entries = OrderedDict()  # run_id -> (tool, text)
+        self._chars = 0
+        self._lock = threading.Lock()
+        self.stored = 0
+        self.evictions = 0
+
+    def put(self, tool: str, text: str) -> Optional[str]:
+        """Keep `text` and return its run id (None if it alone exceeds the cap)"""
+        if len(text) > self.max_chars:
+            return None
+        run_id = uuid.uuid4().hex[:12]
+        with self._lock:
+            self._entries[run_id] = (tool, text)
+            self._chars += len(text)
+            self.stored += 1
+            while len(self._entries) > self.max_entries or self._chars > self.max_chars:
+                _, (_, dropped) = self._entries.popitem(last=False)
+                self._chars -= len(dropped)
+                self.evictions += 1
+        return run_id
+
+    def chunks(self, text: str) -> int:
+        return max(1, -(-len(text) // self.chunk_chars))
+
+    def read(self, run_id: str, chunk: Optional[int] = None) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(run_id)
+            if entry is None:
+                return None
+            self._entries.move_to_end(run_id)
+        text = entry[1]
+        if chunk is None:
+            return text
+        if chunk < 0 or chunk >= self.chunks(text):
+            raise ValueError(f"Chunk {chunk} out of range for output://{run_id} ({self.chunks(text)} chunks)")
+        return text[chunk * self.chunk_chars:(chunk + 1) * self.chunk_chars]
+
+    def entries(self) -> List[tuple]:
+        """(run_id, tool, chars) for the retained outputs, oldest first"""
+        with self._lock:
+            return [(run_id, tool, len(text)) for run_id, (tool, text) in self._entries.items()]
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"entries": len(self._entries), "chars": self._chars,
+                    "stored": self.stored, "evictions": self.evictions}
+
+
+class SingleFlight:
+    """
+    Shares one in-flight execution between concurrent identical calls
+
+    The first caller for a key starts the work as a task; callers arriving while it
+    runs await the same task and get the same result (they are counted as coalesced).
+    The task is cancelled only when every caller waiting on it has been cancelled.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Any, list] = {}  # key -> [task, waiters]
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key, factory: Callable[[], Any]):
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = [asyncio.ensure_future(factory()), 0]
+            self._flights[key] = flight
+            self.executions += 1
+            flight[0].add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            self.coalesced += 1
+        flight[1] += 1
+        try:
+            return await asyncio.shield(flight[0])
+        finally:
+            flight[1] -= 1
+            if flight[1] == 0 and not flight[0].done():
+                flight[0].cancel()
+
+    def _forget(self, key, flight):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def stats(self) -> Dict:
+        return {"in_flight": len(self._flights), "executions": self.executions, "coalesced": self.coalesced}
+
+
+class TicketLocks:
+    """
+    Per-ticket locks that serialize mutating calls on the same key
+
+    Tool methods run in worker threads, so these are threading locks. A call waiting
+    for a lock gives up as soon as its MCP call is cancelled.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._locks: Dict[str, list] = {}  # key -> [lock, users]
+        self.waits = 0
+
+    @contextlib.contextmanager
+    def hold(self, key: str):
+        with self._lock:
+            entry = self._locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            if not entry[0].acquire(blocking=False):
+                with self._lock:
+                    self.waits += 1
+                call = _CALL_CONTEXT.get()
+                while not entry[0].acquire(timeout=0.1):
+                    if call is not None and call.cancelled:
+                        raise concurrent.futures.CancelledError()
+            try:
+                yield
+            finally:
+                entry[0].release()
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._locks[key]
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"held": len(self._locks), "waits": self.waits}
+
+
+class _Histogram:
+    """Cumulative latency histogram (seconds) with Prometheus-style buckets"""
+
+    BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+
+    def __init__(self):
+        self.counts = [0] * len(self.BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+        for i, bound in enumerate(self.BUCKETS):
+            if seconds <= bound:
+                self.counts[i] += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile (max if it is past the last bucket)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, count in zip(self.BUCKETS, self.counts):
+            if count >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self) -> Dict:
+        return {
+            "count": self.count,
+            "sum_seconds": round(self.sum, 3),
+            "mean_seconds": round(self.sum / self.count, 3) if self.count else None,
+            "max_seconds": round(self.max, 3),
+            "p50_seconds": self.quantile(0.5),
+            "p95_seconds": self.quantile(0.95),
+            "buckets": {str(bound): count for bound, count in zip(self.BUCKETS, self.counts)},
+        }
+
+
+# Marker line printed on stderr by phase_end (scripts/lib/utils.sh)
+_PHASE_MARKER = re.compile(r'^::jira-mcp-phase name=([A-Za-z0-9_]+) ms=(\d+)\s*$')
+# Marker line printed on stderr by jira_get_issue_profile (scripts/lib/jira-api.sh)
+_FETCH_MARKER = re.compile(r'^::jira-mcp-fetch profile=([A-Za-z0-9_-]+) bytes=(\d+)\s*$')
+
+
+def _strip_phase_markers(text: str) -> str:
+    if '::jira-mcp-' not in text:
+        return text
+    return ''.join(line for line in text.splitlines(keepends=True)
+                   if not (_PHASE_MARKER.match(line) or _FETCH_MARKER.match(line)))
+
+
+class Metrics:
+    """
+    In-process metrics for tool calls and script phases
+
+    Tools: call and error counts plus a latency histogram per tool. Phases: a latency
+    histogram per phase (jira_fetch, github_search, llm_call, adf_merge, jira_update),
+    fed by the marker lines scripts print through phase_start/phase_end. Fetch
+    profiles: issue fetches and bytes received per field-projection profile.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tools: Dict[str, Dict] = {}
+        self._phases: Dict[str, _Histogram] = {}
+        self._fetches: Dict[str, Dict[str, int]] = {}
+        self.started = time.time()
+
+    def record_call(self, tool: str, seconds: float, error: bool):
+        with self._lock:
+            stats = self._tools.setdefault(tool, {"calls": 0, "errors": 0, "latency": _Histogram()})
+            stats["calls"] += 1
+            stats["errors"] += int(error)
+            stats["latency"].observe(seconds)
+
+    def record_phase(self, phase: str, seconds: float):
+        with self._lock:
+            self._phases.setdefault(phase, _Histogram()).observe(seconds)
+
+    def record_fetch(self, profile: str, nbytes: int):
+        with self._lock:
+            stats = self._fetches.setdefault(profile, {"fetches": 0, "bytes": 0})
+            stats["fetches"] += 1
+            stats["bytes"] += nbytes
+
+    def record_marker(self, line: str) -> bool:
+        """Record a phase or fetch marker line; returns False for any other line"""
+        match = _PHASE_MARKER.match(line)
+        if match is not None:
+            self.record_phase(match.group(1), int(match.group(2)) / 1000)
+            return True
+        match = _FETCH_MARKER.match(line)
+        if match is not None:
+            self.record_fetch(match.group(1), int(match.group(2)))
+            return True
+        return False
+
+    def summary(self) -> Dict:
+        with self._lock:
+            return {
+                "uptime_seconds": round(time.time() - self.started, 1),
+                "tools": {
+                    name: {
+                        "calls": stats["calls"],
+                        "errors": stats["errors"],
+                        "latency": stats["latency"].summary(),
+                    }
+                    for name, stats in sorted(self._tools.items())
+                },
+                "phases": {name: hist.summary() for name, hist in sorted(self._phases.items())},
+                "fetch_profiles": {name: dict(stats) for name, stats in sorted(self._fetches.items())},
+            }
+
+    def prometheus(self) -> str:
+        """Render the metrics in the Prometheus text exposition format"""
+        lines = []
+
+        def histogram(metric: str, label: str, series: Dict[str, _Histogram]):
+            lines.append(f"# TYPE {metric} histogram")
+            for name, hist in series:
+                for bound, count in zip(hist.BUCKETS, hist.counts):
+                    lines.append(f'{metric}_bucket{{{label}="{name}",le="{bound}"}} {count}')
+                lines.append(f'{metric}_bucket{{{label}="{name}",le="+Inf"}} {hist.count}')
+                lines.append(f'{metric}_sum{{{label}="{name}"}} {hist.sum:.6f}')
+                lines.append(f'{metric}_count{{{label}="{name}"}} {hist.count}')
+
+        with self._lock:
+            tools = sorted(self._tools.items())
+            lines.append("# TYPE jira_mcp_tool_calls_total counter")
+            lines += [f'jira_mcp_tool_calls_total{{tool="{name}"}} {stats["calls"]}' for name, stats in tools]
+            lines.append("# TYPE jira_mcp_tool_errors_total counter")
+            lines += [f'jira_mcp_tool_errors_total{{tool="{name}"}} {stats["errors"]}' for name, stats in tools]
+            histogram("jira_mcp_tool_duration_seconds", "tool", [(name, stats["latency"]) for name, stats in tools])
+            histogram("jira_mcp_phase_duration_seconds", "phase", sorted(self._phases.items()))
+            fetches = sorted(self._fetches.items())
+            lines.append("# TYPE jira_mcp_fetches_total counter")
+            lines += [f'jira_mcp_fetches_total{{profile="{name}"}} {stats["fetches"]}' for name, stats in fetches]
+            lines.append("# TYPE jira_mcp_fetch_bytes_total counter")
+            lines += [f'jira_mcp_fetch_bytes_total{{profile="{name}"}} {stats["bytes"]}' for name, stats in fetches]
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str):
+        """Atomically replace `path` with the current metrics (for a node_exporter textfile collector)"""
+        tmp = f"{path}.tmp"
+        with open(tmp, 'w') as f:
+            f.write(self.prometheus())
+        os.replace(tmp, path)
+
+
+# info/success/warning lines printed by scripts/lib/utils.sh (once colour codes are stripped)
+_ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*m')
+_PROGRESS_PREFIXES = ('ℹ️', '✅', '⚠️')
+# "  KEY (score): summary" lines jira-create.sh prints under "Possible duplicates:"
+_DUPLICATE_LINE = re.compile(r'^  ([A-Z][A-Z0-9_]*-\d+) \(([\d.]+)\): (.*)$')
+
+
+def _progress_message(line: str) -> Optional[str]:
+    """Return the message of a utils.sh info/success/warning line, or None for other output"""
+    text = _ANSI_ESCAPE.sub('', line).strip()
+    return text if text.startswith(_PROGRESS_PREFIXES) else None
+
+
+class _ToolCall:
+    """Tracks the scripts started by one tool call so they can be cancelled together"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.cancelled = False
+        self.env = {}
+        self.on_line = None
+        self.progress = 0
+        self._futures = set()
+        self._snapshot_dir = None
+        self._snapshot_lock = threading.Lock()
+        self._progress_queue = None
+        self._progress_task = None
+
+    def stream_progress(self, send: Callable[[int, str], Any]):
+        """
+        Forward script progress lines to `send(progress, message)` (a coroutine function)
+
+        Lines are queued and sent by a single task, so notifications keep script order.
+        """
+        self._progress_queue = asyncio.Queue()
+        self._progress_task = self.loop.create_task(self._send_progress(send))
+        self.on_line = self._progress_line
+
+    def _progress_line(self, stream: str, line: str):
+        message = _progress_message(line)
+        if message is not None:
+            self._queue_progress(message)
+
+    def _queue_progress(self, message: str):
+        if not self._progress_task.done():
+            self.progress += 1
+            self._progress_queue.put_nowait((self.progress, message))
+
+    def notify_progress(self, message: str):
+        """Send a progress message of the tool itself (from any thread), in order with script lines"""
+        if self._progress_task is not None:
+            self.loop.call_soon_threadsafe(self._queue_progress, message)
+
+    async def _send_progress(self, send):
+        while True:
+            item = await self._progress_queue.get()
+            if item is None:
+                return
+            try:
+                await send(*item)
+            except Exception as e:
+                # The client went away or rejects progress: keep the tool running
+                print(f"Progress notification failed: {e}", file=sys.stderr)
+                return
+
+    async def finish_progress(self, cancelled: bool = False):
+        """Flush queued notifications (so they precede the result) or drop them"""
+        if self._progress_task is None:
+            return
+        if cancelled:
+            self._progress_task.cancel()
+        else:
+            self._progress_queue.put_nowait(None)
+        try:
+            await self._progress_task
+        except asyncio.CancelledError:
+            pass
+
+    def share_snapshot(self, key: str, data: str):
+        """Hand an issue snapshot to every script started later in this call"""
+        # groom_tickets shares one call between its pool threads: create the directory once
+        with self._snapshot_lock:
+            if self._snapshot_dir is None:
+                self._snapshot_dir = tempfile.mkdtemp(prefix='jira_issue_snapshots_')
+                self.env['JIRA_ISSUE_SNAPSHOT_DIR'] = self._snapshot_dir
+        # Written aside and renamed, so a script never reads a half-written snapshot
+        fd, tmp = tempfile.mkstemp(dir=self._snapshot_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            f.write(data)
+        os.replace(tmp, os.path.join(self._snapshot_dir, f"{key}.json"))
+
+    def close(self):
+        if self._snapshot_dir is not None:
+            shutil.rmtree(self._snapshot_dir, ignore_errors=True)
+
+    def run(self, coro) -> Dict:
+        """Run coro on the server loop from a worker thread and wait for it"""
+        if self.cancelled:
+            coro.close()
+            return {"success": False, "error": "Script execution cancelled"}
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        self._futures.add(future)
+        try:
+            return future.result()
+        except concurrent.futures.CancelledError:
+            return {"success": False, "error": "Script execution cancelled"}
+        finally:
+            self._futures.discard(future)
+
+    def cancel(self):
+        self.cancelled = True
+        for future in list(self._futures):
+            future.cancel()
+
 
 class JiraBashWrapper:
     """Wrapper for jira-copilot-assistant bash scripts"""
     
+    # Shared issue snapshot cache; None disables it (JIRA_MCP_ISSUE_CACHE=false)
+    issue_cache: Optional[IssueCache] = None
+    
+    # Tool and phase metrics (metrics://summary); None when not set up
+    metrics: Optional[Metrics] = None
+    metrics_file: Optional[str] = None
+    
+    # Identical concurrent calls to these tools share one execution
+    READ_ONLY_TOOLS = frozenset({"find_related_tickets", "fetch_confluence_page"})
+    # These tools change the ticket named by ticket_key: one at a time per key
+    MUTATING_TOOLS = frozenset({"groom_ticket", "close_ticket", "sync_to_confluence"})
+    single_flight: Optional[SingleFlight] = None
+    ticket_locks: Optional[TicketLocks] = None
+    
+    # Pooled in-process Jira client for issue reads and JQL; None runs them through the scripts
+    jira_client: Optional[JiraClient] = None
+    
+    # Full output of results over inline_output_chars (output://<run-id>); None returns everything inline
+    output_store: Optional[OutputStore] = None
+    inline_output_chars = 0
+    
+    # Prompt templates held in memory (built on first use for the current prompts_dir)
+    prompt_catalog: Optional[PromptCatalog] = None
+    _prompt_resources = ((), [])
+    
     def __init__(self):
         # Find script directory
         self.mcp_dir = os.path.dirname(os.path.abspath(__file__))
@@ -35,6 +1141,59 @@ class JiraBashWrapper:
         
         # Prompts directory for type-specific templates
         self.prompts_dir = os.path.join(self.project_dir, '.prompts')
+        self.prompt_catalog = PromptCatalog(self.prompts_dir)
+        # Seconds between background checks of .prompts; 0 checks on every lookup instead
+        self.prompt_watch_interval = float(os.environ.get('JIRA_MCP_PROMPT_WATCH_INTERVAL', '0'))
+        
+        # Bounded pool shared by all tool calls (JIRA_MCP_MAX_CONCURRENCY scripts at once),
+        # dispatching to pre-warmed bash workers unless JIRA_MCP_WARM_WORKERS=false
+        max_concurrency = int(os.environ.get('JIRA_MCP_MAX_CONCURRENCY', '4'))
+        workers = None
+        if os.environ.get('JIRA_MCP_WARM_WORKERS', 'true').lower() != 'false':
+            workers = BashWorkerPool(
+                self.scripts_dir,
+                size=max_concurrency,
+                max_jobs=int(os.environ.get('JIRA_MCP_WORKER_MAX_JOBS', '100'))
+            )
+        self.script_pool = ScriptPool(
+            max_concurrency=max_concurrency,
+            timeout=int(os.environ.get('JIRA_MCP_SCRIPT_TIMEOUT', '60')),
+            workers=workers
+        )
+        
+        if os.environ.get('JIRA_MCP_ISSUE_CACHE', 'true').lower() != 'false':
+            self.issue_cache = IssueCache(
+                ttl=float(os.environ.get('JIRA_MCP_ISSUE_CACHE_TTL', '120')),
+                max_entries=int(os.environ.get('JIRA_MCP_ISSUE_CACHE_MAX_ENTRIES', '256')),
+                max_bytes=int(os.environ.get('JIRA_MCP_ISSUE_CACHE_MAX_BYTES', str(16 * 1024 * 1024)))
+            )
+        
+        # Issue fetches and JQL resolution go through a pooled keep-alive client instead of
+        # curl, unless JIRA_MCP_NATIVE_CLIENT=false or Jira is not configured
+        if os.environ.get('JIRA_MCP_NATIVE_CLIENT', 'true').lower() != 'false':
+            # Same file precedence as load_env in scripts/lib/utils.sh
+            for env_name in ('.env.test.local', '.env'):
+                env_file = os.path.join(self.project_dir, env_name)
+                if os.path.exists(env_file):
+                    load_dotenv(env_file, override=True)
+                    break
+            self.jira_client = JiraClient.from_env(pool_size=max_concurrency, on_throttle=self._record_throttle)
+        
+        # Results are capped at JIRA_MCP_INLINE_OUTPUT_CHARS per text field (0 disables the cap)
+        self.inline_output_chars = int(os.environ.get('JIRA_MCP_INLINE_OUTPUT_CHARS', '8192'))
+        if self.inline_output_chars > 0:
+            self.output_store = OutputStore(
+                max_entries=int(os.environ.get('JIRA_MCP_OUTPUT_RETAIN', '32')),
+                max_chars=int(os.environ.get('JIRA_MCP_OUTPUT_RETAIN_CHARS', str(8 * 1024 * 1024))),
+                chunk_chars=int(os.environ.get('JIRA_MCP_OUTPUT_CHUNK_CHARS', str(16 * 1024)))
+            )
+        
+        self.single_flight = SingleFlight()
+        self.ticket_locks = TicketLocks()
+        
+        self.metrics = Metrics()
+        # Optional Prometheus text dump, rewritten after every tool call
+        self.metrics_file = os.environ.get('JIRA_MCP_METRICS_FILE') or None
         
         self.server = Server("jira-mcp-server")
         self._setup_handlers()
@@ -76,17 +1235,68 @@ class JiraBashWrapper:
         # Default to tech-debt for generic tasks
         return 'tech-debt'
     
-    def _get_prompt_template(self, ticket_key: str, issue_type: Optional[str] = None) -> Optional[str]:
+    @staticmethod
+    def _first_description_text(fields: Dict) -> str:
+        """First text node of an ADF description (what get-description-template.sh inspects)"""
+        description = fields.get('description')
+        if isinstance(description, str):
+            return description
+        try:
+            return description['content'][0]['content'][0].get('text') or ''
+        except (TypeError, KeyError, IndexError):
+            return ''
+    
+    def _prompts(self) -> PromptCatalog:
+        """The prompt catalog for the current prompts_dir"""
+        if self.prompt_catalog is None or self.prompt_catalog.prompts_dir != self.prompts_dir:
+            self.prompt_catalog = PromptCatalog(self.prompts_dir)
+        return self.prompt_catalog
+    
+    def _prompt_resource_list(self) -> list:
+        """Resources for the generate-* templates, rebuilt only when the set of files changes"""
+        names = tuple(n for n in self._prompts().names() if n.startswith('generate-'))
+        if names != self._prompt_resources[0]:
+            resources = []
+            for filename in names:
+                name = filename.replace('generate-description-', '').replace('.md', '').replace('-', ' ').title()
+                resources.append(types.Resource(
+                    uri=f"prompt://{filename}",
+                    name=f"Prompt Template: {name}",
+                    description=f"AI prompt template for {name} ticket descriptions",
+                    mimeType="text/markdown"
+                ))
+            self._prompt_resources = (names, resources)
+        return self._prompt_resources[1]
+    
+    def _get_prompt_template(self, ticket_key: str, issue_type: Optional[str] = None,
+                             issue: Optional[Dict] = None) -> Optional[str]:
         """
         Get the appropriate prompt template for a ticket
         
         Args:
             ticket_key: JIRA ticket key
             issue_type: Optional issue type override
+            issue: Optional already-fetched issue; otherwise it comes from the issue cache
+                   (fetched into it on a miss). The template is chosen from it without
+                   running get-description-template.sh
             
         Returns:
             Path to prompt template file, or None if unable to determine
         """
+        if not issue_type and issue is None:
+            # Read-only lookup: the issue is fetched through the shared cache and stays there
+            issue_json = self._get_issue_snapshot(ticket_key, fetch=True)
+            if issue_json is not None:
+                issue = json.loads(issue_json)
+        
+        if not issue_type and issue:
+            fields = issue.get('fields') or {}
+            issue_type = (fields.get('issuetype') or {}).get('name')
+            # Generic 'Task' tickets get a content-based suggestion, as in the bash script
+            if issue_type and issue_type.lower() == 'task':
+                issue_type = self._suggest_template_smart(fields.get('summary') or '',
+                                                          self._first_description_text(fields))
+        
         # Fetch ticket data if issue type not provided
         if not issue_type:
             result = self._run_script('get-description-template.sh', [ticket_key, '--print'])
@@ -106,25 +1316,62 @@ class JiraBashWrapper:
             'spike': 'generate-description-spike.md',
             'research': 'generate-description-spike.md',
             'investigation': 'generate-description-spike.md',
+            'technical investigation': 'generate-description-spike.md',
             'technical debt': 'generate-description-tech-debt.md',
             'improvement': 'generate-description-tech-debt.md',
             'tech debt': 'generate-description-tech-debt.md',
             'tech-debt': 'generate-description-tech-debt.md',
             'refactor': 'generate-description-tech-debt.md',
+            'refactoring': 'generate-description-tech-debt.md',
+            'techdebt': 'generate-description-tech-debt.md',
+            'task': 'generate-description-tech-debt.md',
         }
         
         template_file = template_map.get(issue_type_lower, 'generate-description-default.md')
+        # Checked against the in-memory catalog, no disk access
+        if template_file not in self._prompts() and 'generate-description-default.md' in self._prompts():
+            template_file = 'generate-description-default.md'
         return os.path.join(self.prompts_dir, template_file)
     
     def _run_script(self, script_name: str, args: List[str] = None, input_data: str = None) -> Dict:
         """
         Run a bash script and return result
         
+        Inside a tool call the script is scheduled on the server event loop through the
+        bounded ScriptPool (and is killed if the call is cancelled). If the client asked
+        for progress, the script's info/success/warning lines are sent as MCP progress
+        notifications while it runs. Outside a tool call (CLI use, tests) it runs to
+        completion on a private event loop.
+        
         Args:
             script_name: Name of script (e.g., 'jira-groom.sh')
             args: List of command line arguments
             input_data: Optional stdin input
             
+        Returns:
+            Dict with success, output, error
+        """
+        call = _CALL_CONTEXT.get()
+        if call is None:
+            return asyncio.run(self._run_script_async(script_name, args, input_data, bounded=False))
+        return call.run(self._run_script_async(script_name, args, input_data, env=dict(call.env),
+                                               on_line=call.on_line))
+    
+    async def _run_script_async(self, script_name: str, args: List[str] = None,
+                                input_data: str = None, bounded: bool = True,
+                                env: Dict[str, str] = None,
+                                on_line: Callable[[str, str], None] = None) -> Dict:
+        """
+        Run a bash script as an asyncio subprocess
+        
+        Args:
+            script_name: Name of script (e.g., 'jira-groom.sh')
+            args: List of command line arguments
+            input_data: Optional stdin input
+            bounded: Wait for a ScriptPool slot before starting
+            env: Extra environment variables for the script
+            on_line: Called with (stream, line) for each output line as it is printed
+            
         Returns:
             Dict with success, output, error
         """
@@ -139,34 +1386,328 @@ class JiraBashWrapper:
         # Build command
         cmd = [script_path] + (args or [])
         
-        try:
-            result = subprocess.run(
-                cmd,
-                cwd=self.project_dir,
-                capture_output=True,
-                text=True,
-                input=input_data,
-                timeout=60
-            )
-            
-            return {
-                "success": result.returncode == 0,
-                "output": result.stdout,
-                "error": result.stderr if result.returncode != 0 else None,
-                "exit_code": result.returncode
-            }
+        # Scripts report phase timings as marker lines; record them and keep them out of the result
+        if self.metrics is not None:
+            env = {**(env or {}), 'JIRA_MCP_PHASE_MARKERS': '1'}
+            on_line = self._phase_marker_filter(on_line)
         
-        except subprocess.TimeoutExpired:
-            return {
-                "success": False,
-                "error": "Script execution timed out (60s)"
-            }
+        try:
+            if bounded:
+                result = await self.script_pool.run(cmd, self.project_dir, input_data, env=env, on_line=on_line)
+            else:
+                result = await self.script_pool.execute(cmd, self.project_dir, input_data, env=env, on_line=on_line)
+            if result.get('error'):
+                result['error'] = _strip_phase_markers(result['error'])
+            return result
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             return {
                 "success": False,
                 "error": f"Script execution failed: {str(e)}"
             }
     
+    def _phase_marker_filter(self, on_line: Optional[Callable[[str, str], None]]) -> Callable[[str, str], None]:
+        """Line handler recording phase markers and passing every other line to on_line"""
+        def handle(stream: str, line: str):
+            if stream == 'stderr' and self.metrics.record_marker(line):
+                return
+            if on_line is not None:
+                on_line(stream, line)
+        return handle
+    
+    def _ticket_lock(self, ticket_key: Optional[str]):
+        """Context manager serializing mutations of one ticket (no-op without a key)"""
+        if self.ticket_locks is None or not ticket_key:
+            return contextlib.nullcontext()
+        return self.ticket_locks.hold(ticket_key)
+    
+    def _dispatch_tool(self, name: str, arguments: dict) -> Dict:
+        """Route a tool call to its (synchronous) implementation"""
+        if name in self.MUTATING_TOOLS:
+            with self._ticket_lock(arguments.get('ticket_key')):
+                return self._dispatch(name, arguments)
+        return self._dispatch(name, arguments)
+    
+    def _dispatch(self, name: str, arguments: dict) -> Dict:
+        if name == "groom_ticket":
+            return self.groom_ticket(**arguments)
+        elif name == "groom_tickets":
+            return self.groom_tickets(**arguments)
+        elif name == "create_ticket":
+            return self.create_ticket(**arguments)
+        elif name == "fetch_confluence_page":
+            return self.fetch_confluence_page(**arguments)
+        elif name == "find_related_tickets":
+            return self.find_related_tickets(**arguments)
+        elif name == "close_ticket":
+            return self.close_ticket(**arguments)
+        elif name == "sync_to_confluence":
+            return self.sync_to_confluence(**arguments)
+        else:
+            raise ValueError(f"Unknown tool: {name}")
+    
+    async def _call_tool(self, name: str, arguments: dict) -> Dict:
+        """
+        Run a tool, sharing one execution between identical concurrent read-only calls
+        
+        Every caller is timed and counted in the metrics, coalesced or not.
+        """
+        failed = True
+        start = time.monotonic()
+        try:
+            if name in self.READ_ONLY_TOOLS and self.single_flight is not None:
+                key = (name, json.dumps(arguments, sort_keys=True, default=str))
+                result = await self.single_flight.do(key, lambda: self._run_tool(name, arguments))
+            else:
+                result = await self._run_tool(name, arguments)
+            failed = isinstance(result, dict) and result.get('success') is False
+            return result
+        finally:
+            self._record_call(name, time.monotonic() - start, failed)
+    
+    async def _run_tool(self, name: str, arguments: dict) -> Dict:
+        """
+        Run a tool in a worker thread so the stdio event loop stays responsive
+        
+        Scripts started by the tool are routed back to this loop via _CALL_CONTEXT.
+        If the MCP call is cancelled, those scripts (and their process groups) are killed.
+        """
+        call = _ToolCall(asyncio.get_running_loop())
+        send = self._progress_sender()
+        if send is not None:
+            call.stream_progress(send)
+        token = _CALL_CONTEXT.set(call)
+        cancelled = False
+        try:
+            result = await asyncio.to_thread(self._dispatch_tool, name, arguments)
+            return self._bound_result(name, result)
+        except asyncio.CancelledError:
+            cancelled = True
+            call.cancel()
+            raise
+        finally:
+            _CALL_CONTEXT.reset(token)
+            await call.finish_progress(cancelled)
+            call.close()
+    
+    # Text fields of a result that are capped; the rest of the result is returned as is
+    BOUNDED_FIELDS = ('output', 'error')
+    # Lines worth surfacing from output that was cut short
+    _HIGHLIGHT_PREFIXES = _PROGRESS_PREFIXES + ('❌',)
+    
+    def _bound_result(self, name: str, result: Any) -> Any:
+        """
+        Cap the text fields of a result at inline_output_chars
+        
+        An oversized field keeps its first inline_output_chars characters (cut at a line
+        break where possible); the full text goes to the output store and the result gets
+        a `<field>_overflow` summary with its output:// URI, size, chunk count and the
+        status lines (✅/⚠️/❌/ℹ️) found in the text.
+        """
+        if self.output_store is None or self.inline_output_chars <= 0 or not isinstance(result, dict):
+            return result
+        bounded = None
+        for field in self.BOUNDED_FIELDS:
+            text = result.get(field)
+            if not isinstance(text, str) or len(text) <= self.inline_output_chars:
+                continue
+            run_id = self.output_store.put(name, text)
+            if run_id is None:
+                continue
+            head = text[:self.inline_output_chars]
+            cut = head.rfind('\n')
+            if cut > self.inline_output_chars // 2:
+                head = head[:cut + 1]
+            highlights = []
+            for line in text.splitlines():
+                line = _ANSI_ESCAPE.sub('', line).strip()
+                if line.startswith(self._HIGHLIGHT_PREFIXES):
+                    highlights.append(line)
+            if bounded is None:
+                bounded = dict(result)
+            bounded[field] = head
+            bounded[f"{field}_overflow"] = {
+                "uri": f"output://{run_id}",
+                "total_chars": len(text),
+                "total_lines": text.count('\n') + (0 if text.endswith('\n') else 1),
+                "inline_chars": len(head),
+                "chunks": self.output_store.chunks(text),
+                "chunk_chars": self.output_store.chunk_chars,
+                "highlights": highlights[-20:]
+            }
+        return bounded if bounded is not None else result
+    
+    def _read_output_resource(self, uri: str) -> str:
+        """Serve output://<run-id>[?chunk=N] from the output store"""
+        run_id, _, query = uri[len("output://"):].partition('?')
+        chunk = None
+        if query:
+            key, _, value = query.partition('=')
+            if key != 'chunk' or not value.isdigit():
+                raise ValueError(f"Unsupported output query: {query} (use ?chunk=N)")
+            chunk = int(value)
+        text = self.output_store.read(run_id, chunk) if self.output_store is not None else None
+        if text is None:
+            raise ValueError(f"Output not found (expired or unknown run id): {uri}")
+        return text
+    
+    def _record_call(self, name: str, seconds: float, failed: bool):
+        """Count a finished tool call and refresh the Prometheus file if configured"""
+        if self.metrics is None:
+            return
+        self.metrics.record_call(name, seconds, failed)
+        if self.metrics_file:
+            try:
+                self.metrics.write_prometheus(self.metrics_file)
+            except OSError as e:
+                print(f"Could not write metrics file {self.metrics_file}: {e}", file=sys.stderr)
+    
+    def _record_throttle(self, seconds: float):
+        """Time the in-process client spent waiting for the shared rate limiter"""
+        if self.metrics is not None:
+            self.metrics.record_phase('throttle_wait', seconds)
+    
+    def metrics_summary(self) -> Dict:
+        """Metrics plus cache and worker pool statistics (metrics://summary)"""
+        summary = self.metrics.summary() if self.metrics is not None else {}
+        if self.issue_cache is not None:
+            summary["issue_cache"] = self.issue_cache.stats()
+        workers = getattr(getattr(self, 'script_pool', None), 'workers', None)
+        if workers is not None:
+            summary["workers"] = workers.stats()
+        if self.single_flight is not None:
+            summary["single_flight"] = self.single_flight.stats()
+        if self.ticket_locks is not None:
+            summary["ticket_locks"] = self.ticket_locks.stats()
+        if self.prompt_catalog is not None:
+            summary["prompt_catalog"] = self.prompt_catalog.stats()
+        if self.output_store is not None:
+            summary["output_store"] = self.output_store.stats()
+        if self.jira_client is not None:
+            summary["jira_client"] = self.jira_client.stats()
+        # Shared with the scripts (scripts/lib/rate-limit.sh): totals across all processes
+        limiter = getattr(self.jira_client, 'rate_limiter', None) or RateLimiter.from_env()
+        summary["rate_limit"] = limiter.totals()
+        return summary
+    
+    def _progress_sender(self) -> Optional[Callable[[int, str], Any]]:
+        """
+        Progress notifier for the current MCP request
+        
+        Returns None unless the client sent a progressToken with the call.
+        """
+        try:
+            ctx = self.server.request_context
+        except (LookupError, AttributeError):
+            return None
+        progress_token = getattr(ctx.meta, 'progressToken', None) if ctx.meta else None
+        if progress_token is None:
+            return None
+        
+        async def send(progress: int, message: str):
+            try:
+                await ctx.session.send_progress_notification(progress_token, progress, message=message)
+            except TypeError:
+                # Older mcp releases have no message field on progress notifications
+                await ctx.session.send_progress_notification(progress_token, progress)
+        
+        return send
+    
+    def _fetch_issue(self, ticket_key: str, fields: str = None) -> Optional[Dict]:
+        """Fetch an issue (pooled client, else jira-fetch.sh --json); returns the parsed issue or None"""
+        if self.jira_client is not None:
+            started = time.monotonic()
+            try:
+                return self.jira_client.get_issue(ticket_key, fields)
+            except JiraApiError as e:
+                print(f"Fetching {ticket_key} failed: {e}", file=sys.stderr)
+                return None
+            finally:
+                if self.metrics is not None:
+                    self.metrics.record_phase('jira_fetch', time.monotonic() - started)
+        args = [ticket_key, '--json']
+        if fields:
+            args.extend(['--fields', fields])
+        result = self._run_script('jira-fetch.sh', args)
+        if not result['success']:
+            return None
+        try:
+            return json.loads(result['output'])
+        except (TypeError, ValueError):
+            return None
+    
+    def _get_issue_snapshot(self, ticket_key: str, fetch: bool = True) -> Optional[str]:
+        """
+        Get issue JSON from the shared cache, revalidating or fetching as needed
+        
+        Args:
+            ticket_key: JIRA ticket key
+            fetch: Fetch the issue on a cache miss (otherwise only cached issues are returned)
+            
+        Returns:
+            Issue JSON string, or None if unavailable
+        """
+        cache = self.issue_cache
+        if cache is None:
+            return None
+        
+        cached = cache.lookup(ticket_key)
+        if cached is not None:
+            data, updated, fresh = cached
+            if fresh:
+                return data
+            # Stale: a fields=updated GET is enough to prove the snapshot still holds
+            current = self._fetch_issue(ticket_key, fields='updated')
+            if current is not None and updated and current.get('fields', {}).get('updated') == updated:
+                cache.revalidated(ticket_key)
+                return data
+            cache.invalidate(ticket_key)
+            if not fetch:
+                return None
+        elif not fetch:
+            return None
+        
+        issue = self._fetch_issue(ticket_key)
+        if issue is None:
+            return None
+        data = json.dumps(issue)
+        cache.put(ticket_key, data, issue.get('fields', {}).get('updated'), refreshed=cached is not None)
+        return data
+    
+    def _prefetch_issue(self, ticket_key: str) -> Optional[str]:
+        """
+        Fetch an issue once for a whole tool call (through the cache when enabled)
+        
+        Returns:
+            Issue JSON string to hand to scripts via --issue-json, or None on failure
+        """
+        if self.issue_cache is not None:
+            return self._get_issue_snapshot(ticket_key, fetch=True)
+        issue = self._fetch_issue(ticket_key)
+        return json.dumps(issue) if issue is not None else None
+    
+    def _share_issue_snapshot(self, ticket_key: str, fetch: bool = True) -> bool:
+        """
+        Hand the cached issue to the scripts run by the current tool call
+        
+        jira_get_issue (scripts/lib/jira-api.sh) answers from JIRA_ISSUE_SNAPSHOT_DIR
+        instead of calling the API, so every script in the call shares one fetch.
+        """
+        call = _CALL_CONTEXT.get()
+        if call is None:
+            return False
+        data = self._get_issue_snapshot(ticket_key, fetch=fetch)
+        if data is None:
+            return False
+        call.share_snapshot(ticket_key, data)
+        return True
+    
+    def _invalidate_issue(self, ticket_key: str):
+        """Drop a ticket from the cache after a tool changed it"""
+        if self.issue_cache is not None and ticket_key:
+            self.issue_cache.invalidate(ticket_key)
+    
     def _setup_handlers(self):
         """Setup MCP request handlers"""
         
@@ -228,6 +1769,53 @@ class JiraBashWrapper:
                         "required": ["ticket_key"]
                     }
                 ),
+                types.Tool(
+                    name="groom_tickets",
+                    description="Groom several Jira tickets in one call (list of keys or a JQL query) with a bounded worker pool",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "ticket_keys": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Jira ticket keys to groom (e.g., ['RVV-1234', 'RVV-1235'])",
+                            },
+                            "jql": {
+                                "type": "string",
+                                "description": "JQL query selecting the tickets to groom (alternative to ticket_keys)",
+                            },
+                            "max_results": {
+                                "type": "integer",
+                                "description": "Maximum tickets to take from the JQL query",
+                                "default": 50
+                            },
+                            "max_parallel": {
+                                "type": "integer",
+                                "description": "Maximum tickets groomed at the same time",
+                                "default": 4
+                            },
+                            "reference_file": {
+                                "type": "string",
+                                "description": "Path to spec file with technical details (applied to every ticket)",
+                            },
+                            "auto_template": {
+                                "type": "boolean",
+                                "description": "Auto-select prompt template per ticket",
+                                "default": False
+                            },
+                            "estimate": {
+                                "type": "boolean",
+                                "description": "Enable AI-powered story point estimation (auto-accepted in batch mode)",
+                                "default": False
+                            },
+                            "team_scale": {
+                                "type": "boolean",
+                                "description": "Use team scale (0.5-5) instead of Fibonacci",
+                                "default": True
+                            }
+                        }
+                    }
+                ),
                 types.Tool(
                     name="create_ticket",
                     description="Create a new Jira ticket",
@@ -259,6 +1847,12 @@ class JiraBashWrapper:
                             "epic": {
                                 "type": "string",
                                 "description": "Epic ticket key to link to",
+                            },
+                            "duplicates": {
+                                "type": "string",
+                                "enum": ["warn", "block", "off"],
+                                "description": "Near-duplicate check: warn (create and list them), block (do not create if any) or off",
+                                "default": "warn"
                             }
                         },
                         "required": ["summary"]
@@ -287,13 +1881,24 @@ class JiraBashWrapper:
                 ),
                 types.Tool(
                     name="find_related_tickets",
-                    description="Find tickets related to a specific ticket",
+                    description="Find tickets related to a specific ticket: the tickets under it as an epic, "
+                                "or with similar=true the most similar tickets of its project, scored",
                     inputSchema={
                         "type": "object",
                         "properties": {
                             "ticket_key": {
                                 "type": "string",
                                 "description": "Jira ticket key (e.g., 'RVV-1234')",
+                            },
+                            "similar": {
+                                "type": "boolean",
+                                "description": "Rank the project's tickets by text similarity to the ticket",
+                                "default": False
+                            },
+                            "top_k": {
+                                "type": "integer",
+                                "description": "Similar tickets to return",
+                                "default": 10
                             }
                         },
                         "required": ["ticket_key"]
@@ -339,38 +1944,41 @@ class JiraBashWrapper:
         
         @self.server.list_resources()
         async def handle_list_resources() -> list[types.Resource]:
-            """List available prompt templates as resources"""
-            resources = []
-            
-            if os.path.exists(self.prompts_dir):
-                for filename in os.listdir(self.prompts_dir):
-                    if filename.endswith('.md') and filename.startswith('generate-'):
-                        uri = f"prompt://{filename}"
-                        name = filename.replace('generate-description-', '').replace('.md', '').replace('-', ' ').title()
-                        resources.append(types.Resource(
-                            uri=uri,
-                            name=f"Prompt Template: {name}",
-                            description=f"AI prompt template for {name} ticket descriptions",
-                            mimeType="text/markdown"
-                        ))
+            """List prompt templates, retained tool outputs and the metrics summary as resources"""
+            resources = [types.Resource(
+                uri="metrics://summary",
+                name="Server Metrics",
+                description="Per-tool call/error counts and latency histograms, script phase timings, cache and worker stats",
+                mimeType="application/json"
+            )]
             
+            resources.extend(self._prompt_resource_list())
+            if self.output_store is not None:
+                for run_id, tool, chars in reversed(self.output_store.entries()):
+                    resources.append(types.Resource(
+                        uri=f"output://{run_id}",
+                        name=f"Output: {tool} ({run_id})",
+                        description=f"Full output of a {tool} call ({chars} characters); append ?chunk=N to read it in parts",
+                        mimeType="text/plain"
+                    ))
             return resources
         
         @self.server.read_resource()
         async def handle_read_resource(uri: str) -> str:
-            """Read a prompt template resource"""
+            """Read a prompt template, a retained tool output or the metrics summary"""
             uri_str = str(uri)
+            if uri_str == "metrics://summary":
+                return json.dumps(self.metrics_summary(), indent=2)
+            if uri_str.startswith("output://"):
+                return self._read_output_resource(uri_str)
             if not uri_str.startswith("prompt://"):
                 raise ValueError(f"Unknown resource URI: {uri_str}")
             
             filename = uri_str.replace("prompt://", "")
-            filepath = os.path.join(self.prompts_dir, filename)
-            
-            if not os.path.exists(filepath):
+            content = self._prompts().content(filename)
+            if content is None:
                 raise ValueError(f"Prompt template not found: {filename}")
-            
-            with open(filepath, 'r') as f:
-                return f.read()
+            return content
         
         @self.server.call_tool()
         async def handle_call_tool(
@@ -379,20 +1987,7 @@ class JiraBashWrapper:
             """Handle tool calls"""
             
             try:
-                if name == "groom_ticket":
-                    result = self.groom_ticket(**arguments)
-                elif name == "create_ticket":
-                    result = self.create_ticket(**arguments)
-                elif name == "fetch_confluence_page":
-                    result = self.fetch_confluence_page(**arguments)
-                elif name == "find_related_tickets":
-                    result = self.find_related_tickets(**arguments)
-                elif name == "close_ticket":
-                    result = self.close_ticket(**arguments)
-                elif name == "sync_to_confluence":
-                    result = self.sync_to_confluence(**arguments)
-                else:
-                    raise ValueError(f"Unknown tool: {name}")
+                result = await self._call_tool(name, arguments or {})
                 
                 return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
             
@@ -420,11 +2015,22 @@ class JiraBashWrapper:
         - Manual story points (--points)
         """
         args = [ticket_key]
+        input_data = None
+        
+        # Any script reading the ticket answers from the cached snapshot, if there is one
+        self._share_issue_snapshot(ticket_key, fetch=False)
         
         # Auto-select template if requested
         template_info = None
         if auto_template:
-            template_path = self._get_prompt_template(ticket_key)
+            # Fetch once: pick the template here and hand the same JSON to jira-groom.sh
+            issue_json = self._prefetch_issue(ticket_key)
+            issue = None
+            if issue_json is not None:
+                issue = json.loads(issue_json)
+                args.extend(['--issue-json', '-'])
+                input_data = issue_json
+            template_path = self._get_prompt_template(ticket_key, issue=issue)
             if template_path:
                 template_info = {
                     "template_path": template_path,
@@ -466,7 +2072,8 @@ class JiraBashWrapper:
                 args.append('--team-scale')
         
         # Run script
-        result = self._run_script('jira-groom.sh', args)
+        result = self._run_script('jira-groom.sh', args, input_data)
+        self._invalidate_issue(ticket_key)
         
         if result['success']:
             response = {
@@ -485,11 +2092,138 @@ class JiraBashWrapper:
         else:
             return result
     
+    def groom_tickets(self, ticket_keys: List[str] = None, jql: str = None,
+                      max_results: int = 50, max_parallel: int = 4,
+                      reference_file: str = None, auto_template: bool = False,
+                      estimate: bool = False, team_scale: bool = True) -> Dict:
+        """
+        Groom a batch of tickets with a bounded worker pool
+        
+        Tickets come from ticket_keys, or from a JQL query resolved with jira_search
+        (find-related-tickets.sh --jql). Each ticket is groomed with groom_ticket;
+        estimation is auto-accepted because a batch cannot answer interactive prompts.
+        
+        Returns:
+            Aggregated result with per-key success, error and timing
+        """
+        if not ticket_keys and not jql:
+            return {
+                "success": False,
+                "error": "Either ticket_keys or jql is required"
+            }
+        
+        keys = list(ticket_keys or [])
+        if jql:
+            resolved = self._resolve_jql(jql, max_results)
+            if not resolved['success']:
+                return resolved
+            keys.extend(resolved['ticket_keys'])
+        
+        # Preserve order, drop duplicates
+        keys = list(dict.fromkeys(k.strip() for k in keys if k and k.strip()))
+        if not keys:
+            return {
+                "success": True,
+                "total": 0,
+                "succeeded": 0,
+                "failed": 0,
+                "message": "No tickets matched",
+                "results": []
+            }
+        
+        def groom_one(key: str) -> Dict:
+            started = time.monotonic()
+            try:
+                with self._ticket_lock(key):
+                    result = self.groom_ticket(
+                        key, reference_file=reference_file, auto_template=auto_template,
+                        estimate=estimate, auto_estimate=estimate, team_scale=team_scale
+                    )
+            except Exception as e:
+                result = {"success": False, "error": str(e)}
+            entry = {
+                "ticket_key": key,
+                "success": bool(result.get('success')),
+                "seconds": round(time.monotonic() - started, 2)
+            }
+            if entry['success']:
+                entry["message"] = result.get('message')
+            else:
+                entry["error"] = result.get('error')
+            return entry
+        
+        started = time.monotonic()
+        results = {}
+        progress = []
+        call = _CALL_CONTEXT.get()
+        workers = max(1, min(int(max_parallel or 1), len(keys)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            # copy_context so each worker's scripts are still routed through the call's ScriptPool
+            futures = {
+                pool.submit(contextvars.copy_context().run, groom_one, key): key
+                for key in keys
+            }
+            for future in concurrent.futures.as_completed(futures):
+                entry = future.result()
+                results[entry['ticket_key']] = entry
+                status = "groomed" if entry['success'] else f"failed: {entry['error']}"
+                line = f"[{len(results)}/{len(keys)}] {entry['ticket_key']} {status} ({entry['seconds']}s)"
+                progress.append(line)
+                if call is not None:
+                    call.notify_progress(line)
+        
+        ordered = [results[k] for k in keys]
+        succeeded = sum(1 for r in ordered if r['success'])
+        failed = len(ordered) - succeeded
+        return {
+            "success": failed == 0,
+            "total": len(ordered),
+            "succeeded": succeeded,
+            "failed": failed,
+            "elapsed_seconds": round(time.monotonic() - started, 2),
+            "message": f"Groomed {succeeded}/{len(ordered)} tickets",
+            "results": ordered,
+            "progress": progress
+        }
+    
+    def _resolve_jql(self, jql: str, max_results: int = 50) -> Dict:
+        """
+        Resolve a JQL query to ticket keys (pooled client, else find-related-tickets.sh --jql)
+        
+        Returns:
+            Dict with success and ticket_keys (or error)
+        """
+        if self.jira_client is not None:
+            try:
+                found = self.jira_client.search(jql, 'summary,issuetype,status', max_results)
+            except JiraApiError as e:
+                return {"success": False, "error": str(e)}
+            return {"success": True, "ticket_keys": [i['key'] for i in found.get('issues', []) if i.get('key')]}
+        
+        fd, keys_file = tempfile.mkstemp(suffix='.txt', prefix='jql_keys_')
+        os.close(fd)
+        try:
+            result = self._run_script(
+                'find-related-tickets.sh',
+                ['--jql', jql, '--max-results', str(max_results), '--output', keys_file]
+            )
+            if not result['success']:
+                return result
+            with open(keys_file, 'r') as f:
+                keys = [line.strip() for line in f if line.strip()]
+            return {"success": True, "ticket_keys": keys}
+        finally:
+            if os.path.exists(keys_file):
+                os.remove(keys_file)
+    
     def create_ticket(self, summary: str, description: str = None,
                      features: str = None, priority: str = "Medium",
-                     issue_type: str = "Task", epic: str = None) -> Dict:
+                     issue_type: str = "Task", epic: str = None, duplicates: str = None) -> Dict:
         """
         Create a new Jira ticket using jira-create.sh
+        
+        Near-duplicates of the new ticket are returned under "duplicates"; with
+        duplicates="block" the ticket is not created when there are any.
         """
         args = ['--summary', summary]
         
@@ -505,14 +2239,20 @@ class JiraBashWrapper:
         if epic:
             args.extend(['--epic', epic])
         
+        if duplicates:
+            args.extend(['--duplicates', duplicates])
+        
         # Run script
         result = self._run_script('jira-create.sh', args)
+        found = self._duplicate_tickets(result.get('output') or '')
         
         if result['success']:
             # Extract ticket key from output
             output = result['output']
             ticket_key = None
             for line in output.split('\n'):
+                if _DUPLICATE_LINE.match(line):
+                    continue
                 if 'Created ticket:' in line or 'RVV-' in line:
                     # Extract ticket key
                     import re
@@ -525,11 +2265,20 @@ class JiraBashWrapper:
                 "success": True,
                 "ticket_key": ticket_key,
                 "message": f"Created {ticket_key}: {summary}",
+                "duplicates": found,
                 "output": result['output']
             }
+        elif result.get('exit_code') == 3:
+            return {**result, "blocked": True, "duplicates": found}
         else:
             return result
     
+    @staticmethod
+    def _duplicate_tickets(output: str) -> List[Dict]:
+        """Key, score and summary of each "  KEY (score): summary" line jira-create.sh prints"""
+        return [{"key": m.group(1), "score": float(m.group(2)), "summary": m.group(3)}
+                for m in map(_DUPLICATE_LINE.match, output.split('\n')) if m]
+    
     def fetch_confluence_page(self, page_url: str = None, page_id: str = None, output_file: str = None) -> Dict:
         """
         Fetch Confluence page using confluence-to-spec.sh
@@ -563,21 +2312,45 @@ class JiraBashWrapper:
         else:
             return result
     
-    def find_related_tickets(self, ticket_key: str) -> Dict:
+    def find_related_tickets(self, ticket_key: str, similar: bool = False, top_k: int = 10) -> Dict:
         """
         Find related tickets using find-related-tickets.sh
+        
+        By default these are the tickets under ticket_key as an epic. With similar=True
+        they are the top_k tickets of its project ranked by TF-IDF similarity of summary
+        and description, listed with their scores in `related`.
         """
-        result = self._run_script('find-related-tickets.sh', [ticket_key])
+        # Read-only: fetching into the cache lets later calls on the ticket skip the GET
+        self._share_issue_snapshot(ticket_key)
+        if similar:
+            args = ['--similar', ticket_key, '--top', str(top_k)]
+        else:
+            args = ['--epic', ticket_key]
+        result = self._run_script('find-related-tickets.sh', args)
         
         if result['success']:
-            return {
+            response = {
                 "success": True,
                 "ticket_key": ticket_key,
                 "output": result['output']
             }
+            if similar:
+                response["related"] = self._ranked_tickets(result['output'])
+            return response
         else:
             return result
     
+    @staticmethod
+    def _ranked_tickets(output: str) -> List[Dict]:
+        """Key, score and summary of each issue in the JSON that ends find-related-tickets.sh output"""
+        start = output.rfind('\n{')
+        try:
+            issues = json.loads(output[start + 1:]).get('issues', [])
+        except ValueError:
+            return []
+        return [{"key": issue.get('key'), "score": issue.get('score'),
+                 "summary": (issue.get('fields') or {}).get('summary')} for issue in issues]
+    
     def close_ticket(self, ticket_key: str, comment: str = None) -> Dict:
         """
         Close a ticket using jira-close.sh
@@ -587,7 +2360,9 @@ class JiraBashWrapper:
         if comment:
             args.extend(['--comment', comment])
         
+        self._share_issue_snapshot(ticket_key, fetch=False)
         result = self._run_script('jira-close.sh', args)
+        self._invalidate_issue(ticket_key)
         
         if result['success']:
             return {
@@ -604,6 +2379,7 @@ class JiraBashWrapper:
         Sync ticket to Confluence using confluence-to-jira.sh
         """
         result = self._run_script('confluence-to-jira.sh', [ticket_key, page_id])
+        self._invalidate_issue(ticket_key)
         
         if result['success']:
             return {
@@ -618,6 +2394,21 @@ class JiraBashWrapper:
     
     async def run(self):
         """Run the MCP server"""
+        if self.script_pool.workers is not None:
+            self.script_pool.workers.warm()
+        if self.prompt_watch_interval > 0:
+            self._prompts().start_watching(self.prompt_watch_interval)
+        try:
+            await self._serve()
+        finally:
+            if self.script_pool.workers is not None:
+                self.script_pool.workers.close()
+            if self.prompt_catalog is not None:
+                self.prompt_catalog.stop_watching()
+            if self.jira_client is not None:
+                self.jira_client.close()
+    
+    async def _serve(self):
         async with stdio_server() as (read_stream, write_stream):
             await self.server.run(
                 read_stream,
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Pooled Jira REST client
+
+Python counterpart of scripts/lib/jira-api.sh and jira_search (jira-search.sh) for use
+inside the MCP server. Every bash call starts a new curl with a fresh TCP+TLS handshake;
+this client keeps keep-alive connections in a small pool and reuses them across calls
+and threads. HTTP status handling matches jira_api_call: 200/201/204 succeed, 401/403/404
+and any other status raise JiraApiError with the same messages.
+
+Requests share the rate-limit governor of scripts/lib/rate-limit.sh (same bucket
+files), so the server and the scripts spend one request budget and back off
+together on HTTP 429.
+"""
+
+import base64
+import fcntl
+import http.client
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
+from urllib.parse import quote, urlsplit
+
+# Errors on a reused keep-alive connection that mean the server closed it while idle
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class JiraApiError(Exception):
+    """A Jira request failed; `status` is the HTTP status (None if no response)"""
+
+    def __init__(self, message: str, status: Optional[int] = None, body: str = ''):
+        super().__init__(message)
+        self.status = status
+        self.body = body
+
+
+class RateLimiter:
+    """
+    Python side of the shared token bucket in scripts/lib/rate-limit.sh
+
+    The bucket is a one-line state file (`tokens_micro last_us blocked_until_us
+    requests wait_ms throttled`) in `directory`, updated under flock on `lock`, so
+    this process and every script draw from the same budget. Settings come from the
+    same JIRA_RATE_LIMIT_* variables, with the same defaults.
+    """
+
+    def __init__(self, directory: str, rps: int = 10, burst: int = 10, max_retries: int = 5,
+                 backoff_ms: int = 1000, max_backoff_ms: int = 60000):
+        self.directory = directory
+        self.rps = rps
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_ms = backoff_ms
+        self.max_backoff_ms = max_backoff_ms
+        self.wait_seconds = 0.0  # waited by this process
+        self.throttled = 0       # 429s seen by this process
+
+    @classmethod
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> 'RateLimiter':
+        env = os.environ if env is None else env
+        directory = env.get('JIRA_RATE_LIMIT_DIR') or os.path.join(
+            env.get('TMPDIR') or '/tmp', f"jira-rate-limit-{os.getuid()}")
+        return cls(
+            directory,
+            rps=int(env.get('JIRA_RATE_LIMIT_RPS') or 10),
+            burst=int(env.get('JIRA_RATE_LIMIT_BURST') or 10),
+            max_retries=int(env.get('JIRA_RATE_LIMIT_MAX_RETRIES') or 5),
+            backoff_ms=int(env.get('JIRA_RATE_LIMIT_BACKOFF_MS') or 1000),
+            max_backoff_ms=int(env.get('JIRA_RATE_LIMIT_MAX_BACKOFF_MS') or 60000),
+        )
+
+    def _update(self, change) -> Optional[list]:
+        """Apply `change(state, now_us)` to the shared state under the lock"""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, 'lock'), 'a') as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                path = os.path.join(self.directory, 'state')
+                state = [0] * 6
+                try:
+                    with open(path) as f:
+                        values = f.read().split()
+                    state = [int(v) for v in values[:6]] + [0] * (6 - len(values[:6]))
+                except (OSError, ValueError):
+                    pass
+                change(state, time.time_ns() // 1000)
+                with open(path, 'w') as f:
+                    f.write(' '.join(str(v) for v in state) + '\n')
+                return state
+        except OSError:
+            return None
+
+    def acquire(self) -> float:
+        """Wait for a request slot; returns the seconds waited"""
+        wait_us = 0
+
+        def take(state, now):
+            nonlocal wait_us
+            tokens, last, blocked = state[0], state[1], state[2]
+            cap = self.burst * 1000000
+            if self.rps > 0:
+                if last == 0:
+                    tokens = cap
+                tokens = min(cap, tokens + (now - last) * self.rps) - 1000000
+                if tokens < 0:
+                    wait_us = -tokens // self.rps
+            wait_us = max(wait_us, blocked - now)
+            state[0], state[1] = tokens, now
+            state[3] += 1
+            state[4] += wait_us // 1000
+
+        self._update(take)
+        seconds = wait_us / 1e6
+        if seconds > 0:
+            time.sleep(seconds)
+            self.wait_seconds += seconds
+        return seconds
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None):
+        """Record a 429: pause every process for exponential backoff with jitter, at least Retry-After"""
+        delay_us = min(self.backoff_ms * 1000 << attempt, self.max_backoff_ms * 1000)
+        delay_us = delay_us // 2 + random.randint(0, delay_us // 2)
+        if retry_after and retry_after.strip().isdigit() and int(retry_after) * 1000000 > delay_us:
+            delay_us = int(retry_after) * 1000000 + random.randint(0, 250000)
+        self.throttled += 1
+
+        def block(state, now):
+            state[2] = max(state[2], now + delay_us)
+            state[5] += 1
+
+        self._update(block)
+
+    def totals(self) -> Dict:
+        """Totals shared by every process using this bucket, plus this process's share"""
+        state = self._update(lambda state, now: None) or [0] * 6
+        return {"requests": state[3], "wait_seconds": state[4] / 1000, "throttled": state[5],
+                "process_wait_seconds": round(self.wait_seconds, 3), "process_throttled": self.throttled}
+
+
+class JiraClient:
+    """
+    Jira REST API v3 client over a pool of keep-alive HTTP(S) connections
+
+    Args:
+        base_url: JIRA_BASE_URL (e.g. https://example.atlassian.net)
+        email: JIRA_EMAIL
+        token: JIRA_TOKEN / JIRA_API_TOKEN
+        pool_size: Idle connections kept for reuse
+        timeout: Socket timeout per request in seconds
+        rate_limiter: Shared governor every request goes through (None: no throttling or retries)
+        on_throttle: Called with the seconds each request waited for the governor
+    """
+
+    API_PREFIX = '/rest/api/3'
+
+    def __init__(self, base_url: str, email: str, token: str, pool_size: int = 4, timeout: float = 30,
+                 rate_limiter: Optional[RateLimiter] = None, on_throttle: Optional[Callable[[float], Any]] = None):
+        parts = urlsplit(base_url.rstrip('/'))
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f"Invalid JIRA_BASE_URL: {base_url}")
+        self.base_url = base_url.rstrip('/')
+        self._https = parts.scheme == 'https'
+        self._host = parts.hostname
+        self._port = parts.port
+        self._path_prefix = parts.path
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.on_throttle = on_throttle
+        credentials = base64.b64encode(f"{email}:{token}".encode('utf-8')).decode('ascii')
+        self._headers = {
+            'Authorization': f'Basic {credentials}',
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+        }
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+        self.connections_reused = 0
+
+    @classmethod
+    def from_env(cls, env: Optional[Mapping[str, str]] = None, **kwargs) -> Optional['JiraClient']:
+        """
+        Build a client from the same variables check_jira_config requires
+
+        Requests go through the shared rate limiter configured by JIRA_RATE_LIMIT_*.
+        
+        Returns:
+            A client, or None if JIRA_BASE_URL, JIRA_EMAIL or the token is missing
+        """
+        env = os.environ if env is None else env
+        base_url = env.get('JIRA_BASE_URL')
+        email = env.get('JIRA_EMAIL')
+        token = env.get('JIRA_TOKEN') or env.get('JIRA_API_TOKEN')
+        if not (base_url and email and token):
+            return None
+        kwargs.setdefault('rate_limiter', RateLimiter.from_env(env))
+        return cls(base_url, email, token, **kwargs)
+
+    # -- connection pool -------------------------------------------------------
+
+    def _connect(self) -> http.client.HTTPConnection:
+        conn_class = http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+        with self._lock:
+            self.connections_opened += 1
+        return conn_class(self._host, self._port, timeout=self.timeout)
+
+    def _acquire(self):
+        with self._lock:
+            if self._idle:
+                self.connections_reused += 1
+                return self._idle.pop(), True
+        return self._connect(), False
+
+    def _release(self, conn: http.client.HTTPConnection):
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close(self):
+        """Close all idle connections"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"requests": self.requests, "connections_opened": self.connections_opened,
+                    "connections_reused": self.connections_reused, "idle": len(self._idle)}
+
+    # -- requests --------------------------------------------------------------
+
+    def _send(self, method: str, path: str, body: Optional[bytes]):
+        """One HTTP exchange; a stale pooled connection is replaced and the request retried once"""
+        conn, reused = self._acquire()
+        while True:
+            try:
+                conn.request(method, path, body=body, headers=self._headers)
+                resp = conn.getresponse()
+                data = resp.read()
+            except _STALE_CONNECTION_ERRORS as e:
+                conn.close()
+                if not reused:
+                    raise JiraApiError(f"Connection to Jira failed: {e}") from e
+                conn, reused = self._connect(), False
+                continue
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                raise JiraApiError(f"Connection to Jira failed: {e}") from e
+            if resp.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            return resp.status, resp.getheader('Retry-After'), data.decode('utf-8', errors='replace')
+
+    def request(self, method: str, endpoint: str, data: Any = None) -> Any:
+        """
+        Call the API like jira_api_call <method> <endpoint> [data]
+
+        Returns:
+            Parsed JSON body, or None for an empty body (e.g. 204)
+
+        Raises:
+            JiraApiError: Non-2xx status or connection failure
+        """
+        body = json.dumps(data).encode('utf-8') if data is not None else None
+        path = f"{self._path_prefix}{self.API_PREFIX}{endpoint}"
+        limiter = self.rate_limiter
+        attempt = 0
+        while True:
+            if limiter is not None:
+                waited = limiter.acquire()
+                if waited and self.on_throttle is not None:
+                    self.on_throttle(waited)
+            with self._lock:
+                self.requests += 1
+            status, retry_after, text = self._send(method, path, body)
+            if status != 429 or limiter is None or attempt >= limiter.max_retries:
+                break
+            limiter.backoff(attempt, retry_after)
+            attempt += 1
+
+        if status in (200, 201, 204):
+            if not text.strip():
+                return None
+            try:
+                return json.loads(text)
+            except ValueError as e:
+                raise JiraApiError(f"Invalid JSON from Jira (HTTP {status})", status, text) from e
+        if status == 401:
+            raise JiraApiError("Authentication failed. Check your JIRA_EMAIL and JIRA_TOKEN.", status, text)
+        if status == 403:
+            raise JiraApiError("Permission denied. Check your JIRA permissions.", status, text)
+        if status == 404:
+            raise JiraApiError("Resource not found.", status, text)
+        raise JiraApiError(f"API error (HTTP {status}): {_error_detail(text)}", status, text)
+
+    def get_issue(self, issue_key: str, fields: Optional[str] = None) -> Dict:
+        endpoint = f"/issue/{quote(issue_key)}"
+        if fields:
+            endpoint += f"?fields={quote(fields, safe=',')}"
+        return self.request('GET', endpoint)
+
+    def create_issue(self, issue_data: Dict) -> Dict:
+        return self.request('POST', '/issue', issue_data)
+
+    def update_issue(self, issue_key: str, update_data: Dict) -> None:
+        self.request('PUT', f"/issue/{quote(issue_key)}", update_data)
+
+    def get_transitions(self, issue_key: str) -> Dict:
+        return self.request('GET', f"/issue/{quote(issue_key)}/transitions")
+
+    def transition(self, issue_key: str, transition_name: str) -> None:
+        """Move an issue through the transition with this name (case-insensitive)"""
+        transitions = (self.get_transitions(issue_key) or {}).get('transitions', [])
+        wanted = transition_name.lower()
+        match = next((t for t in transitions if (t.get('name') or '').lower() == wanted), None)
+        if match is None:
+            available = ', '.join(t.get('name', '') for t in transitions)
+            raise JiraApiError(f"Transition '{transition_name}' not found. Available transitions: {available}")
+        self.request('POST', f"/issue/{quote(issue_key)}/transitions", {"transition": {"id": match['id']}})
+
+    def add_comment(self, issue_key: str, comment_text: str) -> Dict:
+        """Add a plain-text comment (one ADF paragraph, as jira_add_comment does)"""
+        body = {
+            "body": {
+                "type": "doc",
+                "version": 1,
+                "content": [{"type": "paragraph", "content": [{"type": "text", "text": comment_text}]}]
+            }
+        }
+        return self.request('POST', f"/issue/{quote(issue_key)}/comment", body)
+
+    def search(self, jql: str, fields: str = 'summary,issuetype,status,description', max_results: int = 50) -> Dict:
+        """Run a JQL query against /search/jql across pages (same result as jira_search)"""
+        issues = list(self.iter_search(jql, fields, max_results))
+        return {"issues": issues, "total": len(issues)}
+
+    def iter_search(self, jql: str, fields: str = 'summary,issuetype,status,description',
+                    max_results: int = 0, page_size: int = 100) -> Iterator[Dict]:
+        """
+        Yield the issues matching a JQL query, following nextPageToken (jira_search_stream)
+
+        The next page is fetched on a background thread while the caller consumes the
+        current one. max_results 0 yields every match.
+        """
+        if not jql:
+            raise JiraApiError("JQL query is required")
+
+        def fetch(token: Optional[str], emitted: int) -> Dict:
+            want = page_size if not max_results else min(page_size, max_results - emitted)
+            body: Dict[str, Any] = {"jql": jql, "maxResults": want, "fields": fields.split(',')}
+            if token:
+                body["nextPageToken"] = token
+            result = self.request('POST', '/search/jql', body) or {}
+            if result.get('errorMessages'):
+                raise JiraApiError(f"JIRA search failed: {' '.join(result['errorMessages'])}")
+            return result
+
+        emitted = 0
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='jira-search') as prefetch:
+            page = fetch(None, 0)
+            while True:
+                issues = page.get('issues') or []
+                if max_results:
+                    issues = issues[:max_results - emitted]
+                emitted += len(issues)
+                token = None if page.get('isLast') else page.get('nextPageToken')
+                more = bool(token) and (not max_results or emitted < max_results)
+                pending = prefetch.submit(fetch, token, emitted) if more else None
+                yield from issues
+                if pending is None:
+                    return
+                page = pending.result()
+
+
+def _error_detail(text: str) -> str:
+    """errorMessages / errors from a Jira error body, else the body itself"""
+    try:
+        body = json.loads(text)
+    except ValueError:
+        return text.strip()
+    if isinstance(body, dict):
+        if body.get('errorMessages'):
+            return '; '.join(body['errorMessages'])
+        if body.get('errors'):
+            return json.dumps(body['errors'])
+    return text.strip()
@@ -22,14 +22,20 @@ usage() {
     cat << EOF
 Usage: $(basename "$0") [OPTIONS]
 
-Find JIRA tickets related to a specific epic or search criteria.
+Find JIRA tickets related to a specific epic, search criteria or ticket.
 
 OPTIONS:
     -e, --epic EPIC_KEY          Epic key to search under (e.g., RVV-1178)
     -t, --text SEARCH_TEXT       Text to search for
     -p, --project PROJECT_KEY    Project key (default: RVV)
     -f, --filter JQL             Additional JQL filter
+    -q, --jql JQL                Run a raw JQL query (instead of --epic/--text)
+    -s, --similar TICKET_KEY     Rank tickets by similarity to this ticket (its project,
+                                 or the --epic/--text/--jql results when given)
+    -k, --top N                  Similar tickets to return (default: 10)
+    -m, --max-results N          Maximum tickets to return (default: 50, every ticket for epics)
     -o, --output FILE            Save ticket keys to file
+    --no-cache                   Bypass the search result cache (JIRA_SEARCH_NO_CACHE=1)
     -h, --help                   Show this help message
 
 EXAMPLES:
@@ -44,6 +50,13 @@ EXAMPLES:
     
     # Save results to file
     $(basename "$0") -e RVV-1178 -o .temp/tickets.txt
+    
+    # Resolve a raw JQL query (e.g. a sprint backlog) to ticket keys
+    $(basename "$0") -q 'project = RVV AND sprint in openSprints()' -o .temp/sprint.txt
+    
+    # The 5 tickets most similar to RVV-1234 (whole project, or just under an epic)
+    $(basename "$0") -s RVV-1234 -k 5
+    $(basename "$0") -s RVV-1234 -e RVV-1178
 
 EOF
     exit 1
@@ -54,6 +67,10 @@ EPIC_KEY=""
 SEARCH_TEXT=""
 PROJECT_KEY="RVV"
 ADDITIONAL_FILTER=""
+JQL_QUERY=""
+SIMILAR_KEY=""
+TOP="10"
+MAX_RESULTS=""
 OUTPUT_FILE=""
 DRY_RUN=0
 
@@ -75,6 +92,22 @@ while [[ $# -gt 0 ]]; do
             ADDITIONAL_FILTER="$2"
             shift 2
             ;;
+        -q|--jql)
+            JQL_QUERY="$2"
+            shift 2
+            ;;
+        -s|--similar)
+            SIMILAR_KEY="$2"
+            shift 2
+            ;;
+        -k|--top)
+            TOP="$2"
+            shift 2
+            ;;
+        -m|--max-results)
+            MAX_RESULTS="$2"
+            shift 2
+            ;;
         -o|--output)
             OUTPUT_FILE="$2"
             shift 2
@@ -83,6 +116,10 @@ while [[ $# -gt 0 ]]; do
             DRY_RUN=1
             shift
             ;;
+        --no-cache)
+            export JIRA_SEARCH_NO_CACHE=1
+            shift
+            ;;
         -h|--help)
             usage
             ;;
@@ -94,8 +131,8 @@ while [[ $# -gt 0 ]]; do
 done
 
 # Validate input
-if [[ -z "$EPIC_KEY" ]] && [[ -z "$SEARCH_TEXT" ]]; then
-    error "Either --epic or --text must be provided"
+if [[ -z "$EPIC_KEY" ]] && [[ -z "$SEARCH_TEXT" ]] && [[ -z "$JQL_QUERY" ]] && [[ -z "$SIMILAR_KEY" ]]; then
+    error "One of --epic, --text, --jql or --similar must be provided"
     usage
 fi
 
@@ -108,18 +145,13 @@ if [[ -n "$EPIC_KEY" ]]; then
     info "Epic: $EPIC_KEY"
     
     # Get epic details
-    epic_data=$(jira_get_issue "$EPIC_KEY")
+    epic_data=$(jira_get_issue_profile "$EPIC_KEY" summary)
     epic_summary=$(echo "$epic_data" | jq -r '.fields.summary')
     info "Epic Summary: $epic_summary"
     echo ""
     
-    # Search for tickets under epic
-    if [[ "$DRY_RUN" -eq 1 ]]; then
-        echo "Dry-run: would search for tickets under epic $EPIC_KEY"
-        search_results='[]'
-    else
-        search_results=$(jira_search_by_epic "$EPIC_KEY" "$ADDITIONAL_FILTER")
-    fi
+    search_stream=(jira_search_epic_stream "$EPIC_KEY" "$ADDITIONAL_FILTER" "${MAX_RESULTS:-0}")
+    dry_run_message="Dry-run: would search for tickets under epic $EPIC_KEY"
     
 elif [[ -n "$SEARCH_TEXT" ]]; then
     # Search by text
@@ -127,28 +159,59 @@ elif [[ -n "$SEARCH_TEXT" ]]; then
     info "Search Text: $SEARCH_TEXT"
     echo ""
     
-    if [[ "$DRY_RUN" -eq 1 ]]; then
-        echo "Dry-run: would search by text '$SEARCH_TEXT' in project $PROJECT_KEY"
-        search_results='[]'
+    search_stream=(jira_search_text_stream "$PROJECT_KEY" "$SEARCH_TEXT" "$ADDITIONAL_FILTER" "${MAX_RESULTS:-50}")
+    dry_run_message="Dry-run: would search by text '$SEARCH_TEXT' in project $PROJECT_KEY"
+
+elif [[ -n "$JQL_QUERY" ]]; then
+    # Raw JQL query
+    info "JQL: $JQL_QUERY"
+    echo ""
+    
+    # Similarity ranking reads the descriptions too
+    search_stream=(jira_search_stream_cached "$JQL_QUERY" "summary,issuetype,status${SIMILAR_KEY:+,description}" "${MAX_RESULTS:-50}")
+    dry_run_message="Dry-run: would search with JQL '$JQL_QUERY'"
+fi
+
+if [[ -n "$SIMILAR_KEY" ]]; then
+    # Rank the candidates above (or the whole project) by similarity
+    info "Similar to: $SIMILAR_KEY (top $TOP)"
+    echo ""
+    
+    if [[ -n "${search_stream+set}" ]]; then
+        search_stream=(jira_search_similar_stream "$SIMILAR_KEY" "$TOP" "${search_stream[@]}")
+        dry_run_message="$dry_run_message, ranked by similarity to $SIMILAR_KEY"
     else
-        search_results=$(jira_search_by_text "$PROJECT_KEY" "$SEARCH_TEXT" "$ADDITIONAL_FILTER")
+        [[ -n "$MAX_RESULTS" ]] && export JIRA_SIMILAR_MAX_CANDIDATES="$MAX_RESULTS"
+        search_stream=(jira_search_similar_stream "$SIMILAR_KEY" "$TOP")
+        dry_run_message="Dry-run: would rank ${SIMILAR_KEY%%-*} tickets by similarity to $SIMILAR_KEY"
     fi
 fi
 
-# Display results
-total=$(jira_search_count "$search_results")
-info "Found $total tickets:"
+# Issues are streamed page by page: summaries print as each page arrives and
+# the NDJSON is kept on disk, not in memory. Epic and text searches come from
+# the local mirror when it is fresh; repeated JIRA searches are answered from
+# the search cache, revalidated against issues updated since.
+issues_file=$(mktemp "${TMPDIR:-/tmp}/related-tickets.XXXXXX")
+trap 'rm -f "$issues_file"' EXIT
+
+if [[ "$DRY_RUN" -eq 1 ]]; then
+    echo "$dry_run_message"
+else
+    "${search_stream[@]}" | tee "$issues_file" | jira_extract_summaries
+fi
 echo ""
 
-jira_extract_summaries "$search_results"
+# Display results
+total=$(jira_search_count < "$issues_file")
+info "Found $total tickets"
 echo ""
 
 # Save to file if requested
 if [[ -n "$OUTPUT_FILE" ]]; then
     mkdir -p "$(dirname "$OUTPUT_FILE")"
-    jira_extract_keys "$search_results" > "$OUTPUT_FILE"
+    jira_extract_keys < "$issues_file" > "$OUTPUT_FILE"
     success "Ticket keys saved to: $OUTPUT_FILE"
 fi
 
 # Return the results for scripting
-echo "$search_results"
+jq -s '{issues: ., total: length}' "$issues_file"
@@ -16,9 +16,6 @@ if [[ -f "${SCRIPT_DIR}/../.env" ]]; then
     source "${SCRIPT_DIR}/../.env"
 fi
 
-# Validate JIRA configuration
-check_jira_config
-
 # Function to show usage
 show_usage() {
     cat << EOF
@@ -33,10 +30,12 @@ Examples:
     $(basename "$0") RVV-1234
     $(basename "$0") RVV-1234 --print
     $(basename "$0") RVV-1234 --ai-suggest
+    $(basename "$0") RVV-1234 --print --issue-json .temp/RVV-1234.json
 
 Options:
-    --print         Print the template path instead of opening in editor
-    --ai-suggest    Use AI to suggest template based on ticket content (overrides issue type)
+    --print             Print the template path instead of opening in editor
+    --ai-suggest        Use AI to suggest template based on ticket content (overrides issue type)
+    --issue-json FILE   Use an already-fetched issue JSON instead of fetching it ("-" reads stdin)
 
 Output:
     Opens the appropriate prompt template in VS Code, or prints the path if --print is used.
@@ -141,6 +140,7 @@ main() {
     local ticket_id="${1:-}"
     local print_only=false
     local use_ai_suggest=false
+    local issue_json_file=""
     local DRY_RUN=0
 
     # Parse dry-run early from args so we can short-circuit network calls
@@ -167,6 +167,10 @@ main() {
                 use_ai_suggest=true
                 shift
                 ;;
+            --issue-json)
+                issue_json_file="${2:-}"
+                shift 2
+                ;;
             *)
                 warning "Unknown option: $1"
                 shift
@@ -174,8 +178,6 @@ main() {
         esac
     done
     
-    info "Fetching ticket details for ${ticket_id}..."
-    
     # If dry-run, skip network call and write artifact for tests
     if [[ "$DRY_RUN" -eq 1 ]]; then
         info "Dry-run: would fetch ticket ${ticket_id} from JIRA (no network calls)."
@@ -192,8 +194,17 @@ EOF
         exit 0
     fi
 
-    # Fetch ticket data
-    local ticket_data=$(jira_get_issue "$ticket_id")
+    # Fetch ticket data (or reuse a prefetched copy)
+    local ticket_data
+    if [[ -n "$issue_json_file" ]]; then
+        info "Using prefetched ticket details for ${ticket_id}..."
+        ticket_data=$(read_issue_json "$issue_json_file") || exit 1
+    else
+        info "Fetching ticket details for ${ticket_id}..."
+        # Validate JIRA configuration
+        check_jira_config
+        ticket_data=$(jira_get_issue_profile "$ticket_id" template-detect)
+    fi
     
     if [[ -z "$ticket_data" ]] || [[ "$ticket_data" == "null" ]]; then
         error "Failed to fetch ticket ${ticket_id}"
@@ -117,13 +117,14 @@ EOF
     
     # Fetch ticket details
     local ticket_data
-    if ! ticket_data=$(jira_get_issue "$ticket_key"); then
+    if ! ticket_data=$(jira_get_issue_profile "$ticket_key" close); then
         error "Failed to fetch ticket $ticket_key"
         exit 1
     fi
     
     # Check current status
     local current_status=$(echo "$ticket_data" | jq -r '.fields.status.name')
+    local issue_type=$(echo "$ticket_data" | jq -r '.fields.issuetype.name // ""')
     local status_lower=$(echo "$current_status" | tr '[:upper:]' '[:lower:]')
     info "Current status: $current_status"
     
@@ -146,7 +147,7 @@ EOF
     
     # Transition to Done
     info "Transitioning to Done status..."
-    if ! jira_transition "$ticket_key" "Done" > /dev/null; then
+    if ! jira_transition "$ticket_key" "Done" "$issue_type" "$current_status" > /dev/null; then
         warning "Failed to transition to Done. The ticket might not have a 'Done' transition available."
         warning "Comment has been added, but status unchanged."
         exit 1
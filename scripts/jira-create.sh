@@ -16,6 +16,8 @@ source "${SCRIPT_DIR}/lib/utils.sh"
 source "${SCRIPT_DIR}/lib/jira-api.sh"
 # shellcheck disable=SC1091
 source "${SCRIPT_DIR}/lib/jira-format.sh"
+# shellcheck disable=SC1091
+source "${SCRIPT_DIR}/lib/jira-search.sh"
 
 # Load environment
 load_env "${SCRIPT_DIR}/../.env"
@@ -34,6 +36,8 @@ Optional Arguments:
   --description TEXT    Detailed description of the ticket
   --features LIST       Comma-separated list of features/requirements
   --priority LEVEL      Priority: High, Medium, Low (default: Medium)
+  --duplicates MODE     Near-duplicate check before creating: warn, block
+                        (exit 3 without creating) or off (default: warn)
   --help, -h           Show this help message
 
 Examples:
@@ -51,10 +55,33 @@ Environment Variables:
   JIRA_BASE_URL        Your JIRA instance URL (e.g., https://company.atlassian.net)
   JIRA_TOKEN          JIRA API token
   JIRA_PROJECT        JIRA project key (e.g., PROJ)
+  JIRA_DUPLICATE_CHECK      Default for --duplicates
+  JIRA_DUPLICATE_THRESHOLD  Minimum similarity reported as a duplicate (default: 0.5)
 
 EOF
 }
 
+# Report existing tickets that nearly duplicate the new one
+# Usage: check_duplicates <summary> <description> <warn|block>
+# Returns 1 in block mode when duplicates were found
+check_duplicates() {
+    local summary="$1" description="$2" mode="$3"
+    local found
+    if ! found=$(jira_search_duplicates_stream "$JIRA_PROJECT" "$summary" "$description"); then
+        warning "Duplicate check failed; creating anyway"
+        return 0
+    fi
+    [[ -n "$found" ]] || return 0
+    
+    echo "⚠️  Possible duplicates:"
+    jq -r '"  \(.key) (\(.score)): \(.fields.summary)"' <<< "$found"
+    if [[ "$mode" == "block" ]]; then
+        error "Not created: near-duplicate of an existing ticket (--duplicates warn to create anyway)"
+        return 1
+    fi
+    return 0
+}
+
 # Main function
 main() {
     # Check dependencies
@@ -90,6 +117,7 @@ main() {
     local description="${ARG_DESCRIPTION:-}"
     local features="${ARG_FEATURES:-}"
     local priority="${ARG_PRIORITY:-Medium}"
+    local duplicates_mode="${ARG_DUPLICATES:-${JIRA_DUPLICATE_CHECK:-warn}}"
     
     # Validate priority (convert to lowercase for comparison)
     local priority_lower=$(echo "$priority" | tr '[:upper:]' '[:lower:]')
@@ -102,6 +130,19 @@ main() {
             ;;
     esac
     
+    # Look for near-duplicates before creating anything
+    case "$duplicates_mode" in
+        warn|block)
+            check_duplicates "$summary" "$description" "$duplicates_mode" || exit 3
+            ;;
+        off)
+            ;;
+        *)
+            error "Invalid --duplicates '$duplicates_mode' (expected warn, block or off)"
+            exit 1
+            ;;
+    esac
+    
     # Build description with features
     local full_description="$description"
     
@@ -0,0 +1,152 @@
+#!/usr/bin/env bash
+#
+# Jira Estimate Batch - estimate a whole backlog in one pass
+# Streams the tickets of a JQL query, an epic or an NDJSON export through the
+# estimation engine (scripts/lib/jira_estimate.py) and writes the team-scale and
+# Fibonacci estimates of every ticket as NDJSON or CSV. Nothing is written back
+# to JIRA; jira-groom.sh --estimate gives the same numbers for one ticket.
+#
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+
+source "$SCRIPT_DIR/lib/utils.sh"
+
+# Load environment before sourcing other libs that use it
+cd "$PROJECT_ROOT"
+load_env .env
+
+source "$SCRIPT_DIR/lib/jira-api.sh"
+source "$SCRIPT_DIR/lib/jira-search.sh"
+
+# Usage information
+usage() {
+    cat << EOF
+Usage: $(basename "$0") [OPTIONS]
+
+Estimate story points for many tickets at once (team scale and Fibonacci).
+
+OPTIONS:
+    -q, --jql JQL                Estimate the tickets matching a JQL query
+    -e, --epic EPIC_KEY          Estimate the tickets under an epic
+    -i, --input FILE             Estimate issues from an NDJSON export ("-" for stdin)
+    -m, --max-results N          Maximum tickets to fetch (default: 0 = all)
+    --format ndjson|csv          Output format (default: ndjson)
+    -o, --output FILE            Write the estimates to FILE (default: stdout)
+    --no-cache                   Bypass the search result cache (JIRA_SEARCH_NO_CACHE=1)
+    -h, --help                   Show this help message
+
+Each row has the ticket key, summary and issue type, the team-scale estimate
+(estimated_points, base, complexity, uncertainty, testing, total_raw,
+should_split, confidence) and the Fibonacci estimate (fibonacci_points,
+fibonacci_raw, fibonacci_factors).
+
+EXAMPLES:
+    # Re-estimate the open backlog as CSV
+    $(basename "$0") -q 'project = RVV AND statusCategory != Done' --format csv -o .temp/estimates.csv
+
+    # Every ticket under an epic
+    $(basename "$0") -e RVV-1178
+
+    # An existing export (one issue per line, as jira_search_stream prints them)
+    $(basename "$0") -i .temp/backlog.ndjson
+
+EOF
+    exit 1
+}
+
+JQL_QUERY=""
+EPIC_KEY=""
+INPUT_FILE=""
+MAX_RESULTS="0"
+FORMAT="ndjson"
+OUTPUT_FILE=""
+
+while [[ $# -gt 0 ]]; do
+    case $1 in
+        -q|--jql)
+            JQL_QUERY="$2"
+            shift 2
+            ;;
+        -e|--epic)
+            EPIC_KEY="$2"
+            shift 2
+            ;;
+        -i|--input)
+            INPUT_FILE="$2"
+            shift 2
+            ;;
+        -m|--max-results)
+            MAX_RESULTS="$2"
+            shift 2
+            ;;
+        --format)
+            FORMAT="$2"
+            shift 2
+            ;;
+        -o|--output)
+            OUTPUT_FILE="$2"
+            shift 2
+            ;;
+        --no-cache)
+            export JIRA_SEARCH_NO_CACHE=1
+            shift
+            ;;
+        -h|--help)
+            usage
+            ;;
+        *)
+            error "Unknown option: $1"
+            usage
+            ;;
+    esac
+done
+
+sources=0
+[[ -n "$JQL_QUERY" ]] && sources=$((sources + 1))
+[[ -n "$EPIC_KEY" ]] && sources=$((sources + 1))
+[[ -n "$INPUT_FILE" ]] && sources=$((sources + 1))
+if [[ "$sources" -ne 1 ]]; then
+    error "Exactly one of --jql, --epic or --input must be provided"
+    usage
+fi
+if [[ "$FORMAT" != "ndjson" ]] && [[ "$FORMAT" != "csv" ]]; then
+    error "Unknown format: $FORMAT (expected ndjson or csv)"
+    exit 1
+fi
+
+# The estimators read only these fields
+ESTIMATE_FIELDS="summary,issuetype,description"
+
+# Streams the selected issues as NDJSON
+read_issues() {
+    if [[ -n "$INPUT_FILE" ]]; then
+        if [[ "$INPUT_FILE" == "-" ]]; then
+            cat
+        else
+            cat -- "$INPUT_FILE"
+        fi
+    elif [[ -n "$EPIC_KEY" ]]; then
+        # Live (cached) search rather than the mirror: the estimators read the
+        # description exactly as JIRA returns it
+        jira_search_stream_cached "$(jira_epic_jql "$EPIC_KEY")" "$ESTIMATE_FIELDS" "$MAX_RESULTS"
+    else
+        jira_search_stream_cached "$JQL_QUERY" "$ESTIMATE_FIELDS" "$MAX_RESULTS"
+    fi
+}
+
+if [[ -z "$INPUT_FILE" ]]; then
+    check_jira_config || exit 1
+    info "Fetching tickets${EPIC_KEY:+ under $EPIC_KEY}..." >&2
+elif [[ "$INPUT_FILE" != "-" ]] && [[ ! -r "$INPUT_FILE" ]]; then
+    error "Cannot read $INPUT_FILE"
+    exit 1
+fi
+
+if [[ -n "$OUTPUT_FILE" ]]; then
+    read_issues | python3 "$SCRIPT_DIR/lib/jira_estimate.py" batch --format "$FORMAT" > "$OUTPUT_FILE"
+    success "Estimates written to $OUTPUT_FILE" >&2
+else
+    read_issues | python3 "$SCRIPT_DIR/lib/jira_estimate.py" batch --format "$FORMAT"
+fi
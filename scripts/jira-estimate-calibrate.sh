@@ -0,0 +1,130 @@
+#!/usr/bin/env bash
+#
+# Jira Estimate Calibrate - fit the team-scale estimation weights to history
+# Streams completed tickets with their story points (a JQL query or an NDJSON
+# export) through scripts/lib/jira_calibrate.py, which fits the factor weights
+# and rounding thresholds of estimate_story_points_team and writes a versioned
+# weights file. The estimator uses it when JIRA_ESTIMATE_WEIGHTS points at it.
+#
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+
+source "$SCRIPT_DIR/lib/utils.sh"
+
+# Load environment before sourcing other libs that use it
+cd "$PROJECT_ROOT"
+load_env .env
+
+source "$SCRIPT_DIR/lib/jira-api.sh"
+source "$SCRIPT_DIR/lib/jira-search.sh"
+
+# Usage information
+usage() {
+    cat << EOF
+Usage: $(basename "$0") [OPTIONS]
+
+Fit the team-scale estimation weights to the story points of completed tickets.
+
+OPTIONS:
+    -q, --jql JQL                Calibrate on the tickets matching a JQL query
+    -i, --input FILE             Calibrate on issues from an NDJSON export ("-" for stdin)
+    -m, --max-results N          Maximum tickets to fetch (default: 0 = all)
+    -o, --output FILE            Weights file to write (default: \$JIRA_ESTIMATE_WEIGHTS,
+                                 else .temp/estimate-weights.json)
+    --points-field FIELD         Story points field (default: \$JIRA_STORY_POINTS_FIELD,
+                                 else customfield_10016)
+    --no-cache                   Bypass the search result cache (JIRA_SEARCH_NO_CACHE=1)
+    -h, --help                   Show this help message
+
+Tickets without story points are skipped. Recalibrating into the same file
+bumps its version. Estimates use the file once JIRA_ESTIMATE_WEIGHTS names it.
+
+EXAMPLES:
+    # Last quarter's completed work
+    $(basename "$0") -q 'project = RVV AND statusCategory = Done AND resolved >= -90d'
+
+    # An existing export (one issue per line, as jira_search_stream prints them)
+    $(basename "$0") -i .temp/done.ndjson -o config/estimate-weights.json
+
+EOF
+    exit 1
+}
+
+JQL_QUERY=""
+INPUT_FILE=""
+MAX_RESULTS="0"
+OUTPUT_FILE="${JIRA_ESTIMATE_WEIGHTS:-.temp/estimate-weights.json}"
+POINTS_FIELD="${JIRA_STORY_POINTS_FIELD:-customfield_10016}"
+
+while [[ $# -gt 0 ]]; do
+    case $1 in
+        -q|--jql)
+            JQL_QUERY="$2"
+            shift 2
+            ;;
+        -i|--input)
+            INPUT_FILE="$2"
+            shift 2
+            ;;
+        -m|--max-results)
+            MAX_RESULTS="$2"
+            shift 2
+            ;;
+        -o|--output)
+            OUTPUT_FILE="$2"
+            shift 2
+            ;;
+        --points-field)
+            POINTS_FIELD="$2"
+            shift 2
+            ;;
+        --no-cache)
+            export JIRA_SEARCH_NO_CACHE=1
+            shift
+            ;;
+        -h|--help)
+            usage
+            ;;
+        *)
+            error "Unknown option: $1"
+            usage
+            ;;
+    esac
+done
+
+sources=0
+[[ -n "$JQL_QUERY" ]] && sources=$((sources + 1))
+[[ -n "$INPUT_FILE" ]] && sources=$((sources + 1))
+if [[ "$sources" -ne 1 ]]; then
+    error "Exactly one of --jql or --input must be provided"
+    usage
+fi
+
+# Streams the selected issues as NDJSON
+read_issues() {
+    if [[ -n "$INPUT_FILE" ]]; then
+        if [[ "$INPUT_FILE" == "-" ]]; then
+            cat
+        else
+            cat -- "$INPUT_FILE"
+        fi
+    else
+        jira_search_stream_cached "$JQL_QUERY" "summary,issuetype,description,$POINTS_FIELD" "$MAX_RESULTS"
+    fi
+}
+
+if [[ -z "$INPUT_FILE" ]]; then
+    check_jira_config || exit 1
+    info "Fetching completed tickets..." >&2
+elif [[ "$INPUT_FILE" != "-" ]] && [[ ! -r "$INPUT_FILE" ]]; then
+    error "Cannot read $INPUT_FILE"
+    exit 1
+fi
+
+read_issues | python3 "$SCRIPT_DIR/lib/jira_calibrate.py" --points-field "$POINTS_FIELD" --output "$OUTPUT_FILE"
+success "Weights written to $OUTPUT_FILE" >&2
+if [[ "${JIRA_ESTIMATE_WEIGHTS:-}" != "$OUTPUT_FILE" ]]; then
+    info "Set JIRA_ESTIMATE_WEIGHTS=$OUTPUT_FILE (e.g. in .env) to estimate with them" >&2
+fi
@@ -1,3 +1,4 @@
+#!/usr/bin/env bash
 ## Dry-run support
 # shellcheck disable=SC1091
 source "$(dirname "${BASH_SOURCE[0]}")/lib/dryrun.sh"
@@ -12,21 +13,40 @@ fi
 set -euo pipefail
 
 # jira-fetch.sh - read-only fetch of a JIRA issue and save JSON + markdown summary
-# Usage: jira-fetch.sh <ISSUE-KEY>
+# Usage: jira-fetch.sh [--dry-run] [--json] [--fields LIST | --profile NAME] [--profile-sizes] [--issue-json FILE] <ISSUE-KEY>
+#   --json             Print the raw issue JSON to stdout instead of writing .temp files
+#   --fields LIST      Only request these fields (comma-separated, e.g. "updated")
+#   --profile NAME     Only request the fields of a projection profile (see jira_issue_profile)
+#   --profile-sizes    Fetch the issue once per profile and print bytes saved against a full fetch
+#   --issue-json FILE  Use an already-fetched issue JSON instead of calling JIRA ("-" reads stdin)
 
 DRY_RUN=0
-if [ "${1:-}" = "--dry-run" ]; then
-  DRY_RUN=1
-  ISSUE_KEY=${2:-}
-else
-  ISSUE_KEY=${1:-}
-fi
+JSON_ONLY=0
+FIELDS=""
+PROFILE=""
+PROFILE_SIZES=0
+ISSUE_JSON_FILE=""
+ISSUE_KEY=""
+while [ $# -gt 0 ]; do
+  case "$1" in
+    --dry-run) DRY_RUN=1; shift ;;
+    --json) JSON_ONLY=1; shift ;;
+    --fields) FIELDS="${2:-}"; shift 2 ;;
+    --profile) PROFILE="${2:-}"; shift 2 ;;
+    --profile-sizes) PROFILE_SIZES=1; shift ;;
+    --issue-json) ISSUE_JSON_FILE="${2:-}"; shift 2 ;;
+    *) ISSUE_KEY="$1"; shift ;;
+  esac
+done
 
 if [ -z "$ISSUE_KEY" ]; then
-  echo "Usage: $0 [--dry-run] <ISSUE-KEY>"
+  echo "Usage: $0 [--dry-run] [--json] [--fields LIST | --profile NAME] [--profile-sizes] [--issue-json FILE] <ISSUE-KEY>"
   exit 2
 fi
 
+# This script is the source of truth for issue snapshots: never answer from one
+unset JIRA_ISSUE_SNAPSHOT_DIR
+
 ROOT_DIR=$(cd "$(dirname "$0")/.." && pwd)
 TMP_DIR="$ROOT_DIR/.temp"
 mkdir -p "$TMP_DIR"
@@ -40,13 +60,53 @@ load_env "$ROOT_DIR/.env"
 
 check_dependencies || exit 1
 
-if [ "$DRY_RUN" -eq 0 ]; then
+if [ "$DRY_RUN" -eq 0 ] && [ -z "$ISSUE_JSON_FILE" ]; then
   # check_jira_config will validate required env vars and JIRA_TOKEN/JIRA_API_TOKEN
   check_jira_config || exit 1
 else
   echo "Dry run: will not contact JIRA."
 fi
 
+if [ -n "$PROFILE" ]; then
+  jira_issue_profile "$PROFILE" || exit 2
+  FIELDS="$JIRA_PROFILE_FIELDS"
+fi
+
+# Bytes each projection profile transfers for this issue, against a full fetch
+if [ "$PROFILE_SIZES" -eq 1 ]; then
+  LC_ALL=C
+  full=$(jira_get_issue "$ISSUE_KEY") || exit 1
+  full_bytes=${#full}
+  printf '%-16s %-34s %9s %9s\n' "profile" "fields" "bytes" "saved"
+  for profile in $JIRA_ISSUE_PROFILES; do
+    jira_issue_profile "$profile"
+    if [ -z "$JIRA_PROFILE_FIELDS" ]; then
+      bytes=$full_bytes
+    else
+      data=$(jira_get_issue "$ISSUE_KEY" "$JIRA_PROFILE_FIELDS" "$JIRA_PROFILE_EXPAND") || exit 1
+      bytes=${#data}
+    fi
+    saved=0
+    [ "$full_bytes" -gt 0 ] && saved=$(( (full_bytes - bytes) * 100 / full_bytes ))
+    printf '%-16s %-34s %9d %8d%%\n' "$profile" "${JIRA_PROFILE_FIELDS:-*all}" "$bytes" "$saved"
+  done
+  exit 0
+fi
+
+# Prefetched issue (or a fresh fetch): one of the two is the source for everything below
+fetch_issue() {
+  if [ -n "$ISSUE_JSON_FILE" ]; then
+    read_issue_json "$ISSUE_JSON_FILE"
+  else
+    jira_get_issue "$ISSUE_KEY" "$FIELDS"
+  fi
+}
+
+if [ "$JSON_ONLY" -eq 1 ] && [ "$DRY_RUN" -eq 0 ]; then
+  fetch_issue || exit 1
+  exit 0
+fi
+
 OUT_JSON="$TMP_DIR/${ISSUE_KEY}.json"
 OUT_MD="$TMP_DIR/${ISSUE_KEY}.md"
 
@@ -58,8 +118,12 @@ if [ "$DRY_RUN" -eq 1 ]; then
   echo "**Assignee:** <assignee>" 
   echo
 else
-  echo "Fetching $ISSUE_KEY from JIRA..."
-  if ! jira_get_issue "$ISSUE_KEY" > "$OUT_JSON"; then
+  if [ -n "$ISSUE_JSON_FILE" ]; then
+    echo "Using prefetched $ISSUE_KEY..."
+  else
+    echo "Fetching $ISSUE_KEY from JIRA..."
+  fi
+  if ! fetch_issue > "$OUT_JSON"; then
     echo "Failed to fetch issue or API returned an error." >&2
     exit 1
   fi
@@ -54,6 +54,7 @@ Options:
   --points N               Manually set story points to N (0.5, 1, 2, 3, 4, 5)
   --auto-estimate          Auto-accept AI estimation without confirmation
   --team-scale             Use team-specific estimation (0.5-5, default: Fibonacci)
+  --issue-json FILE        Use an already-fetched issue JSON instead of fetching it ("-" reads stdin)
   --help, -h               Show this help message
 
 Examples:
@@ -72,6 +73,9 @@ Examples:
   # Manually set story points
   $(basename "$0") PROJ-123 --points 3
   
+  # Reuse a ticket that was already fetched (e.g. by jira-fetch.sh)
+  $(basename "$0") PROJ-123 --issue-json .temp/PROJ-123.json
+  
   # Groom with technical reference from spec file (uses template)
   $(basename "$0") RVV-1171 --reference-file specs/betmaker-ingestor-springboot3/spec.md
   
@@ -287,6 +291,7 @@ Return ONLY valid JSON, no explanation."
     if [[ -n "${OPENAI_API_KEY:-}" ]]; then
         info "🤖 Using OpenAI for AI generation..." >&2
         
+        phase_start llm_call
         llm_response=$(curl -s https://api.openai.com/v1/chat/completions \
             -H "Content-Type: application/json" \
             -H "Authorization: Bearer ${OPENAI_API_KEY}" \
@@ -301,6 +306,7 @@ Return ONLY valid JSON, no explanation."
                 }],
                 \"temperature\": 0.3
             }" 2>/dev/null)
+        phase_end llm_call
         
         # Extract and clean response
         local content
@@ -475,6 +481,16 @@ format_github_context() {
     echo -e "$context"
 }
 
+# Reads the header line of estimate_story_points_memo output into estimate_hash
+# and reports when the ticket's estimate was reused
+read_estimate_memo_header() {
+    local state skipped
+    read -r estimate_hash state skipped <<< "${1%%$'\n'*}"
+    if [[ "$state" == "hit" ]]; then
+        info "Ticket unchanged since its last estimate; reusing it (${skipped} estimate(s) skipped so far)"
+    fi
+}
+
 # Main function
 main() {
     # Note: dependency checks are performed later unless running in dry-run.
@@ -489,6 +505,7 @@ main() {
     local manual_points=""
     local auto_estimate=false
     local use_team_scale=false
+    local issue_json_file=""
     
     while [[ $# -gt 0 ]]; do
         case "$1" in
@@ -532,6 +549,10 @@ main() {
                 use_team_scale=true
                 shift
                 ;;
+            --issue-json)
+                issue_json_file="$2"
+                shift 2
+                ;;
             *)
                 if [[ -z "$ticket_key" ]]; then
                     ticket_key="$1"
@@ -567,6 +588,12 @@ main() {
     local temp_dir="${SCRIPT_DIR}/../.temp"
     mkdir -p "$temp_dir"
 
+    # A prefetched issue on stdin is saved once so every step below can reuse it
+    if [[ "$issue_json_file" == "-" ]]; then
+        issue_json_file="$temp_dir/${ticket_key}-issue.json"
+        read_issue_json - > "$issue_json_file" || exit 1
+    fi
+
     # If auto description requested, generate AI description and set ai_description_file
     if [[ "${auto_description:-false}" == "true" ]]; then
         info "Auto-selecting description template and generating AI description..."
@@ -574,7 +601,11 @@ main() {
         # Use helper to pick template (ai-suggest) and print the chosen template path.
         # get-description-template.sh may emit informational lines; capture only the last non-empty line.
         local template_path
-        template_path=$("${SCRIPT_DIR}/get-description-template.sh" "$ticket_key" --print --ai-suggest 2>/dev/null | sed -n '/./p' | tail -n1 || true)
+        local template_args=("$ticket_key" --print --ai-suggest)
+        if [[ -n "$issue_json_file" ]]; then
+            template_args+=(--issue-json "$issue_json_file")
+        fi
+        template_path=$("${SCRIPT_DIR}/get-description-template.sh" "${template_args[@]}" 2>/dev/null | sed -n '/./p' | tail -n1 || true)
 
         if [[ -z "$template_path" ]] || [[ ! -f "$template_path" ]]; then
             warning "Could not determine template automatically; creating fallback AI description"
@@ -633,15 +664,21 @@ main() {
         check_dependencies || exit 1
     fi
 
-    info "Fetching ticket details for $ticket_key..."
-
     # Fetch ticket details
     local ticket_data
     if [[ "$DRY_RUN" -eq 1 ]]; then
         # In dry-run, create a minimal fake ticket_data to exercise local logic
         ticket_data='{"fields": {"summary": "(dry-run) Test ticket", "description": ""}}'
+    elif [[ -n "$issue_json_file" ]]; then
+        info "Using prefetched ticket details for $ticket_key..."
+        if ! ticket_data=$(read_issue_json "$issue_json_file"); then
+            error "Failed to read prefetched ticket $ticket_key"
+            exit 1
+        fi
     else
-        if ! ticket_data=$(jira_get_issue "$ticket_key"); then
+        info "Fetching ticket details for $ticket_key..."
+
+        if ! ticket_data=$(jira_get_issue_profile "$ticket_key" groom); then
             error "Failed to fetch ticket $ticket_key"
             exit 1
         fi
@@ -671,6 +708,8 @@ main() {
     # AI Story Point Estimation (if enabled)
     local story_points=""
     local estimation_explanation=""
+    # Content hash of the memoized estimate (empty when the memo is off)
+    local estimate_hash=""
     if [[ "$enable_estimation" == "true" ]]; then
         local current_description
         current_description=$(echo "$ticket_data" | jq -r '.fields.description // empty')
@@ -693,10 +732,15 @@ main() {
         echo ""
         
         # Choose estimation method based on flag
-        local estimation_result
+        local estimation_result memo_output
         if [[ "$use_team_scale" == "true" ]]; then
             info "Using team-specific estimation (0.5, 1, 2, 3, 4, 5)..."
-            estimation_result=$(estimate_story_points_team "$ticket_data")
+            if jira_estimate_memo_enabled && memo_output=$(estimate_story_points_memo team "$ticket_data"); then
+                read_estimate_memo_header "$memo_output"
+                estimation_result="${memo_output#*$'\n'}"
+            else
+                estimation_result=$(estimate_story_points_team "$ticket_data")
+            fi
             
             # Extract from JSON
             story_points=$(echo "$estimation_result" | jq -r '.estimated_points')
@@ -729,12 +773,20 @@ main() {
             info "Using default Fibonacci estimation (1, 2, 3, 5, 8, 13...)..."
             # shellcheck disable=SC2034
             local estimation_output
-            # Capture stdout (the number) and stderr (the analysis) separately
-            story_points=$(estimate_story_points "$description_text" "$summary" 2>/dev/null)
-            
-            # Re-run to get the analysis from stderr
-            local analysis
-            analysis=$(estimate_story_points "$description_text" "$summary" 2>&1 >/dev/null)
+            local analysis=""
+            if jira_estimate_memo_enabled && memo_output=$(estimate_story_points_memo fibonacci "$ticket_data"); then
+                # The points, then the analysis
+                read_estimate_memo_header "$memo_output"
+                memo_output="${memo_output#*$'\n'}"
+                story_points="${memo_output%%$'\n'*}"
+                [[ "$memo_output" == *$'\n'* ]] && analysis="${memo_output#*$'\n'}"
+            else
+                # Capture stdout (the number) and stderr (the analysis) separately
+                story_points=$(estimate_story_points "$description_text" "$summary" 2>/dev/null)
+                
+                # Re-run to get the analysis from stderr
+                analysis=$(estimate_story_points "$description_text" "$summary" 2>&1 >/dev/null)
+            fi
             
             if [[ -n "$analysis" ]]; then
                 echo "$analysis"
@@ -792,10 +844,12 @@ main() {
     
     # Search GitHub for related work
     info "Searching GitHub for related PRs and commits..."
+    phase_start github_search
     local prs
     prs=$(github_search_prs "$ticket_key")
     local commits
     commits=$(github_search_commits "$ticket_key")
+    phase_end github_search
     
     local pr_count
     pr_count=$(echo "$prs" | jq 'length' 2>/dev/null || echo "0")
@@ -1050,6 +1104,7 @@ main() {
 
     # Merge original + enhanced ADF using the Python helper to avoid fragile shell/json handling
     local merged_adf_file="$temp_dir/${ticket_key}-merged-adf.json"
+    phase_start adf_merge
     if ! python3 "${SCRIPT_DIR}/lib/merge_adf.py" --original "$original_adf_file" --enhanced "$enhanced_adf_file" --output "$merged_adf_file" >/dev/null 2>&1; then
         warning "merge_adf.py failed; falling back to using the enhanced ADF only"
         # Use the enhanced ADF as-is
@@ -1057,6 +1112,7 @@ main() {
     else
         description_adf=$(cat "$merged_adf_file")
     fi
+    phase_end adf_merge
 
     # Validate that the final description_adf is valid JSON ADF
     if ! echo "$description_adf" | jq -e '.' >/dev/null 2>&1; then
@@ -1128,7 +1184,12 @@ main() {
     fi
 
     # If estimation was enabled, also add a rich ADF-formatted comment with details
-    if [[ "$enable_estimation" == "true" ]] && [[ -n "$story_points" ]]; then
+    # (unless this ticket already has the comment for this estimate)
+    local comments_skipped=""
+    if [[ "$enable_estimation" == "true" ]] && [[ -n "$story_points" ]] && [[ -n "$estimate_hash" ]] &&
+        comments_skipped=$(estimation_comment_posted "$ticket_key" "$estimate_hash" "$story_points"); then
+        info "Estimation comment unchanged; not posting it again (${comments_skipped} comment(s) skipped so far)"
+    elif [[ "$enable_estimation" == "true" ]] && [[ -n "$story_points" ]]; then
         info "Adding ADF-formatted estimation comment..."
         local est_comment_file="/tmp/jira-estimation-comment-$$.json"
 
@@ -1142,7 +1203,7 @@ main() {
 
             # Post the formatted comment to JIRA
             local add_est_resp
-            add_est_resp=$(curl -s -X POST \
+            add_est_resp=$(atlassian_curl -s -X POST \
                 -H "Authorization: Basic $(echo -n "${JIRA_EMAIL}:${JIRA_API_TOKEN}" | base64)" \
                 -H "Content-Type: application/json" \
                 -d @"$est_comment_file" \
@@ -1152,6 +1213,9 @@ main() {
 
             if echo "$add_est_resp" | jq -e '.id' > /dev/null 2>&1; then
                 success "Added ADF-formatted estimation comment"
+                if [[ -n "$estimate_hash" ]]; then
+                    estimation_comment_mark "$ticket_key" "$estimate_hash" "$story_points" || true
+                fi
             else
                 warning "Failed to add ADF-formatted estimation comment"
                 echo "$add_est_resp" | jq -r '.errorMessages[]?, .errors | to_entries[] | "\(.key): \(.value)"' 2>/dev/null || true
@@ -1178,7 +1242,7 @@ main() {
         
         # Use JIRA API directly with the AI-generated JSON
         local add_comment_response
-        add_comment_response=$(curl -s -X POST \
+        add_comment_response=$(atlassian_curl -s -X POST \
             -H "Authorization: Basic $(echo -n "${JIRA_EMAIL}:${JIRA_API_TOKEN}" | base64)" \
             -H "Content-Type: application/json" \
             -d @"$ai_guide_file" \
@@ -1208,7 +1272,7 @@ main() {
         
         # Use JIRA API directly with properly formatted document JSON
         local add_comment_response
-        add_comment_response=$(curl -s -X POST \
+        add_comment_response=$(atlassian_curl -s -X POST \
             -H "Authorization: Basic $(echo -n "${JIRA_EMAIL}:${JIRA_API_TOKEN}" | base64)" \
             -H "Content-Type: application/json" \
             -d @"$temp_comment_file" \
@@ -0,0 +1,104 @@
+#!/usr/bin/env bash
+#
+# Jira Mirror - keep the local ticket mirror current
+# Loads JIRA_PROJECT into a local SQLite FTS5 mirror (first run) and applies the
+# tickets updated since the previous sync (later runs). find-related-tickets.sh
+# and the search library answer epic and text searches from it while it is fresh.
+#
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+
+source "$SCRIPT_DIR/lib/utils.sh"
+
+# Load environment before sourcing other libs that use it
+cd "$PROJECT_ROOT"
+load_env .env
+
+source "$SCRIPT_DIR/lib/jira-api.sh"
+source "$SCRIPT_DIR/lib/jira-search.sh"
+
+# Usage information
+usage() {
+    cat << EOF
+Usage: $(basename "$0") [OPTIONS]
+
+Sync the local ticket mirror used for epic and text searches.
+
+OPTIONS:
+    -p, --project PROJECT_KEY    Project to mirror (default: \$JIRA_PROJECT)
+    --full                       Reload every ticket (also drops deleted or moved tickets)
+    --status                     Show the mirror state without syncing
+    -h, --help                   Show this help message
+
+EXAMPLES:
+    # First run loads the project; later runs fetch only updated tickets
+    $(basename "$0")
+
+    # Keep it current from cron
+    */5 * * * * $PROJECT_ROOT/scripts/$(basename "$0") >/dev/null
+
+EOF
+    exit 1
+}
+
+PROJECT_KEY="${JIRA_PROJECT:-}"
+FULL=""
+STATUS_ONLY=0
+
+while [[ $# -gt 0 ]]; do
+    case $1 in
+        -p|--project)
+            PROJECT_KEY="$2"
+            shift 2
+            ;;
+        --full)
+            FULL="--full"
+            shift
+            ;;
+        --status)
+            STATUS_ONLY=1
+            shift
+            ;;
+        -h|--help)
+            usage
+            ;;
+        *)
+            error "Unknown option: $1"
+            usage
+            ;;
+    esac
+done
+
+if [[ -z "$PROJECT_KEY" ]]; then
+    error "A project is required (--project or JIRA_PROJECT)"
+    exit 1
+fi
+
+show_status() {
+    local last_sync full_sync count
+    read -r last_sync full_sync count < <(jira_mirror_status "$PROJECT_KEY")
+    info "Mirror: $(jira_mirror_db "$PROJECT_KEY")"
+    if [[ "$full_sync" -eq 0 ]]; then
+        info "Not loaded yet"
+        return 0
+    fi
+    local now="${EPOCHSECONDS:-$(date +%s)}"
+    info "Tickets: $count"
+    info "Last sync: $(( now - last_sync ))s ago (full load $(( now - full_sync ))s ago)"
+}
+
+if [[ "$STATUS_ONLY" -eq 1 ]]; then
+    show_status
+    exit 0
+fi
+
+check_jira_config || exit 1
+
+info "Syncing $PROJECT_KEY mirror${FULL:+ (full reload)}..."
+if ! count=$(jira_mirror_sync $FULL "$PROJECT_KEY"); then
+    exit 1
+fi
+success "$count ticket(s) written"
+show_status
@@ -15,6 +15,10 @@ source "${SCRIPT_DIR}/lib/utils.sh"
 # shellcheck disable=SC1091
 source "${SCRIPT_DIR}/lib/jira-api.sh"
 # shellcheck disable=SC1091
+source "${SCRIPT_DIR}/lib/jira-search.sh"
+# shellcheck disable=SC1091
+source "${SCRIPT_DIR}/lib/jira-bulk.sh"
+# shellcheck disable=SC1091
 source "${SCRIPT_DIR}/lib/github-api.sh"
 
 # Load environment
@@ -25,21 +29,17 @@ show_help() {
     cat << EOF
 Usage: $(basename "$0") [OPTIONS]
 
-    # Load dry-run helper
-    # shellcheck disable=SC1091
-    source "$(dirname "${BASH_SOURCE[0]}")/lib/dryrun.sh"
-
-    # Parse dry-run arg early
-    parse_dry_run_arg "$@"
-
 Sync GitHub repositories with JIRA ticket statuses by:
   1. Scanning recent PRs and commits for JIRA keys
   2. Determining appropriate status based on PR state
-  3. Transitioning JIRA tickets accordingly
+  3. Planning every transition across all repositories (one JIRA search per 50 tickets)
+  4. Transitioning JIRA tickets accordingly, several at a time
 
 Options:
   --repo OWNER/REPO   Sync only a specific repository
   --days N            Look back N days (default: 7)
+  --parallel N        Transitions in flight at once (default: \$JIRA_SYNC_PARALLEL or 4)
+  --dry-run           Print the plan without transitioning anything
   --help, -h         Show this help message
 
 Examples:
@@ -52,16 +52,15 @@ Examples:
   # Sync last 14 days
   $(basename "$0") --days 14
 
+  # Show what would change
+  $(basename "$0") --dry-run
+
 Status Transitions:
   - Open PR → "In Review" or "In Progress"
   - Merged PR → "Done"
   - Closed PR (not merged) → No change
 
 Environment Variables:
-    if is_dry_run; then
-        echo "Dry-run: would sync JIRA from GitHub (no network calls)." >&2
-        exit 0
-    fi
   JIRA_BASE_URL      Your JIRA instance URL
   JIRA_EMAIL         Your JIRA email
   JIRA_TOKEN         JIRA API token
@@ -72,8 +71,9 @@ Environment Variables:
 EOF
 }
 
-# Sync a single repository
-sync_repository() {
+# Collect transition decisions for a single repository
+# Prints one "key<TAB>target status<TAB>repo#pr" line per JIRA key found
+collect_repository() {
     local repo="$1"
     local days="${2:-7}"
     
@@ -90,9 +90,6 @@ sync_repository() {
     
     debug "Found $pr_count recent PR(s) in $repo"
     
-    local updated=0
-    local errors=0
-    
     # Process each PR
     while IFS= read -r pr; do
         local pr_number=$(echo "$pr" | jq -r '.number')
@@ -101,61 +98,26 @@ sync_repository() {
         local pr_state=$(echo "$pr" | jq -r '.state')
         local pr_merged=$(echo "$pr" | jq -r '.mergedAt // "null"')
         
-        # Extract JIRA keys from title and body
-        local jira_keys=$(extract_jira_keys "$pr_title $pr_body")
+        # Determine target status based on PR state
+        local target_status=""
         
-        if [[ -z "$jira_keys" ]]; then
-            continue
+        if [[ "$pr_merged" != "null" ]]; then
+            target_status="Done"
+        elif [[ "$pr_state" == "OPEN" ]]; then
+            target_status="In Progress"
+        else
+            continue  # Closed but not merged - skip
         fi
         
-        # Process each JIRA key found
+        # Extract JIRA keys from title and body
+        local jira_keys=$(extract_jira_keys "$pr_title $pr_body")
+        
         while IFS= read -r jira_key; do
             [[ -z "$jira_key" ]] && continue
-            
-            # Determine target status based on PR state
-            local target_status=""
-            
-            if [[ "$pr_merged" != "null" ]]; then
-                target_status="Done"
-            elif [[ "$pr_state" == "OPEN" ]]; then
-                target_status="In Progress"
-            else
-                continue  # Closed but not merged - skip
-            fi
-            
-            # Get current ticket status
-            local ticket_data
-            if ! ticket_data=$(jira_get_issue "$jira_key" 2>/dev/null); then
-                debug "Ticket $jira_key not found or inaccessible"
-                continue
-            fi
-            
-            local current_status=$(echo "$ticket_data" | jq -r '.fields.status.name')
-            local current_status_lower=$(echo "$current_status" | tr '[:upper:]' '[:lower:]')
-            local target_status_lower=$(echo "$target_status" | tr '[:upper:]' '[:lower:]')
-            
-            # Skip if already in target status
-            if [[ "$current_status_lower" == "$target_status_lower" ]]; then
-                debug "$jira_key already in $target_status"
-                continue
-            fi
-            
-            # Attempt transition
-            info "Transitioning $jira_key: $current_status → $target_status (PR #$pr_number)"
-            
-            if jira_transition "$jira_key" "$target_status" > /dev/null 2>&1; then
-                success "$jira_key → $target_status"
-                ((updated++))
-            else
-                warning "Failed to transition $jira_key (transition may not be available)"
-                ((errors++))
-            fi
-            
+            printf '%s\t%s\t%s\n' "$jira_key" "$target_status" "${repo}#${pr_number}"
         done <<< "$jira_keys"
         
     done < <(echo "$prs" | jq -c '.[]' 2>/dev/null)
-    
-    echo "$updated $errors"
 }
 
 # Main function
@@ -173,6 +135,8 @@ main() {
     # Parse arguments
     local specific_repo=""
     local days=7
+    local parallel="${JIRA_SYNC_PARALLEL:-4}"
+    local dry_run=false
     
     while [[ $# -gt 0 ]]; do
         case "$1" in
@@ -184,6 +148,14 @@ main() {
                 days="${2:-7}"
                 shift 2
                 ;;
+            --parallel)
+                parallel="${2:-4}"
+                shift 2
+                ;;
+            --dry-run)
+                dry_run=true
+                shift
+                ;;
             --help|-h)
                 show_help
                 exit 0
@@ -232,24 +204,61 @@ main() {
         info "Found ${#repos[@]} repositories"
     fi
     
-    # Sync each repository
+    # Governor totals before the run (shared with every process using the bucket)
+    local rl_before
+    rl_before=$(rate_limit_totals)
+    
+    # Stage 1: collect every (key, target status) decision across all repositories
     local total_updated=0
     local total_errors=0
     local total_scanned=0
+    local decisions=""
     
     for repo in "${repos[@]}"; do
         [[ -z "$repo" ]] && continue
         
-        ((total_scanned++))
+        ((total_scanned++)) || true
         
-        local result=$(sync_repository "$repo" "$days")
-        local updated=$(echo "$result" | cut -d' ' -f1)
-        local errors=$(echo "$result" | cut -d' ' -f2)
-        
-        ((total_updated += updated))
-        ((total_errors += errors))
+        decisions+=$(collect_repository "$repo" "$days")$'\n'
     done
     
+    # Stage 2: plan - current statuses come from batched JQL searches, not one fetch per ticket
+    local plan=""
+    if [[ -n "${decisions//[[:space:]]/}" ]]; then
+        info "Looking up current statuses..."
+        if ! plan=$(jira_bulk_plan <<< "$decisions"); then
+            error "Failed to look up ticket statuses"
+            exit 1
+        fi
+    fi
+    
+    echo ""
+    info "Plan:"
+    jira_bulk_print_plan <<< "$plan"
+    
+    if [[ "$dry_run" == "true" ]]; then
+        echo ""
+        info "Dry run: no tickets were transitioned"
+        exit 0
+    fi
+    
+    # Stage 3: apply the plan through a bounded parallel pool
+    if [[ -n "$plan" ]]; then
+        echo ""
+        info "Transitioning with up to $parallel in parallel..."
+        local key status current target message
+        while IFS=$'\t' read -r key status current target message; do
+            [[ -z "$key" ]] && continue
+            if [[ "$status" == "ok" ]]; then
+                success "$key: $current → $target"
+                ((total_updated++)) || true
+            else
+                warning "$key: $current → $target failed: ${message}"
+                ((total_errors++)) || true
+            fi
+        done < <(jira_bulk_transition "$parallel" <<< "$plan")
+    fi
+    
     # Summary
     echo ""
     success "Sync complete!"
@@ -262,6 +271,20 @@ main() {
         info "Errors: 0"
     fi
     
+    # Throttling while this sync ran (includes concurrent grooms sharing the quota);
+    # tune JIRA_RATE_LIMIT_RPS / JIRA_RATE_LIMIT_BURST against it
+    local rl_after rl_wait_ms rl_throttled rl_before_wait rl_before_throttled
+    rl_after=$(rate_limit_totals)
+    read -r _ rl_wait_ms rl_throttled <<< "$rl_after"
+    read -r _ rl_before_wait rl_before_throttled <<< "$rl_before"
+    rl_wait_ms=$(( rl_wait_ms - rl_before_wait ))
+    rl_throttled=$(( rl_throttled - rl_before_throttled ))
+    if [[ $rl_throttled -gt 0 ]]; then
+        warning "Rate limit: waited $(( rl_wait_ms / 1000 )).$(printf '%03d' $(( rl_wait_ms % 1000 )))s, $rl_throttled HTTP 429 responses"
+    else
+        info "Rate limit: waited $(( rl_wait_ms / 1000 )).$(printf '%03d' $(( rl_wait_ms % 1000 )))s"
+    fi
+    
     echo ""
 }
 
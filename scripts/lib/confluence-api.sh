@@ -2,14 +2,22 @@
 # Confluence REST API helper functions
 # Provides functions to interact with Confluence Cloud REST API
 
+# Load once per shell (scripts/lib/mcp-worker.sh preloads the libraries)
+if [[ -n "${_CONFLUENCE_API_SH_LOADED:-}" ]]; then
+    return 0
+fi
+_CONFLUENCE_API_SH_LOADED=1
+
 # Source utilities (use relative path from lib directory)
 CONFLUENCE_LIB_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 source "${CONFLUENCE_LIB_DIR}/utils.sh"
+# Every request goes through the shared rate-limit governor
+source "${CONFLUENCE_LIB_DIR}/rate-limit.sh"
 
 # Verify Confluence authentication
 # Returns: 0 if authenticated, 1 if failed
 confluence_check_auth() {
-    local response=$(curl -s -w "\n%{http_code}" \
+    local response=$(atlassian_curl -s -w "\n%{http_code}" \
         -u "${JIRA_EMAIL}:${JIRA_API_TOKEN}" \
         "${CONFLUENCE_BASE_URL}/rest/api/user/current" 2>/dev/null)
     
@@ -34,7 +42,7 @@ confluence_get_page() {
         return 1
     fi
     
-    local response=$(curl -s -w "\n%{http_code}" \
+    local response=$(atlassian_curl -s -w "\n%{http_code}" \
         -u "${JIRA_EMAIL}:${JIRA_API_TOKEN}" \
         "${CONFLUENCE_BASE_URL}/rest/api/content/${page_id}?expand=body.storage,version,space,metadata.labels" 2>/dev/null)
     
@@ -320,7 +328,7 @@ confluence_list_pages_in_space() {
     fi
 
     # Fetch first page of results (limit 200). For larger spaces, paging would be required.
-    local response=$(curl -s -u "${JIRA_EMAIL}:${JIRA_API_TOKEN}" "${CONFLUENCE_BASE_URL}/rest/api/content?spaceKey=${space_key}&type=page&limit=200")
+    local response=$(atlassian_curl -s -u "${JIRA_EMAIL}:${JIRA_API_TOKEN}" "${CONFLUENCE_BASE_URL}/rest/api/content?spaceKey=${space_key}&type=page&limit=200")
     local http_code=200
     # Extract IDs
     echo "$response" | jq -r '.results[].id // empty'
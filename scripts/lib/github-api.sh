@@ -6,6 +6,12 @@
 
 set -euo pipefail
 
+# Load once per shell (scripts/lib/mcp-worker.sh preloads the libraries)
+if [[ -n "${_GITHUB_API_SH_LOADED:-}" ]]; then
+    return 0
+fi
+_GITHUB_API_SH_LOADED=1
+
 # Colors for output
 RED='\033[0;31m'
 GREEN='\033[0;32m'
@@ -6,6 +6,18 @@
 # Note: This is a library file meant to be sourced.
 # Do not use 'set -euo pipefail' here as it affects the calling script.
 
+# Load once per shell (scripts/lib/mcp-worker.sh preloads the libraries)
+if [[ -n "${_JIRA_API_SH_LOADED:-}" ]]; then
+    return 0
+fi
+_JIRA_API_SH_LOADED=1
+
+# Every request goes through the shared rate-limit governor
+_JIRA_API_LIB_DIR="${BASH_SOURCE[0]%/*}"
+[[ "$_JIRA_API_LIB_DIR" == "${BASH_SOURCE[0]}" ]] && _JIRA_API_LIB_DIR="."
+# shellcheck source=./rate-limit.sh
+source "${_JIRA_API_LIB_DIR}/rate-limit.sh"
+
 # Colors for output
 RED='\033[0;31m'
 GREEN='\033[0;32m'
@@ -13,6 +25,12 @@ YELLOW='\033[1;33m'
 BLUE='\033[0;34m'
 NC='\033[0m' # No Color
 
+# Phase markers come from utils.sh; stay silent when this library is used on its own
+if ! declare -F phase_start >/dev/null; then
+    phase_start() { :; }
+    phase_end() { :; }
+fi
+
 # Check required environment variables
 check_jira_config() {
     local missing=()
@@ -55,14 +73,14 @@ jira_api_call() {
     # Create a temporary netrc-style auth to avoid shell escaping issues
     # Use curl's built-in Basic Auth with proper quoting
     if [[ -n "$data" ]]; then
-        response=$(curl -s -w "\n%{http_code}" -X "${method}" \
+        response=$(atlassian_curl -s -w "\n%{http_code}" -X "${method}" \
             --user "${JIRA_EMAIL}:${JIRA_TOKEN}" \
             -H "Content-Type: application/json" \
             -H "Accept: application/json" \
             --data "${data}" \
             "${url}")
     else
-        response=$(curl -s -w "\n%{http_code}" -X "${method}" \
+        response=$(atlassian_curl -s -w "\n%{http_code}" -X "${method}" \
             --user "${JIRA_EMAIL}:${JIRA_TOKEN}" \
             -H "Content-Type: application/json" \
             -H "Accept: application/json" \
@@ -71,6 +89,8 @@ jira_api_call() {
     
     http_code=$(echo "$response" | tail -n1)
     local body=$(echo "$response" | sed '$d')
+    # Status of the last call, for callers that react to specific errors
+    JIRA_API_LAST_STATUS="$http_code"
     
     # Handle HTTP errors
     case "$http_code" in
@@ -106,10 +126,81 @@ jira_create_issue() {
 }
 
 # Get a JIRA issue
-# Usage: jira_get_issue <issue_key>
+# Usage: jira_get_issue <issue_key> [fields] [expand]
+# If JIRA_ISSUE_SNAPSHOT_DIR contains <issue_key>.json (handed over by the MCP
+# server's issue cache), that snapshot is returned instead of calling the API.
 jira_get_issue() {
     local issue_key="$1"
-    jira_api_call "GET" "/issue/${issue_key}"
+    local fields="${2:-}"
+    local expand="${3:-}"
+    
+    if [[ -n "${JIRA_ISSUE_SNAPSHOT_DIR:-}" ]] && [[ -f "${JIRA_ISSUE_SNAPSHOT_DIR}/${issue_key}.json" ]]; then
+        cat "${JIRA_ISSUE_SNAPSHOT_DIR}/${issue_key}.json"
+        return 0
+    fi
+    
+    local endpoint="/issue/${issue_key}"
+    local sep="?"
+    if [[ -n "$fields" ]]; then
+        endpoint+="${sep}fields=${fields}"
+        sep="&"
+    fi
+    if [[ -n "$expand" ]]; then
+        endpoint+="${sep}expand=${expand}"
+    fi
+    local rc=0
+    phase_start jira_fetch
+    jira_api_call "GET" "$endpoint" || rc=$?
+    phase_end jira_fetch
+    return $rc
+}
+
+# Field projection profiles: the fields (and expand) each caller actually reads,
+# so a fetch skips the full ADF description and custom fields it does not need.
+# Usage: jira_issue_profile <profile>   (sets JIRA_PROFILE_FIELDS / JIRA_PROFILE_EXPAND)
+#   status           status and issue type, for transitions (jira-sync.sh)
+#   summary          summary only (epic lookup in find-related-tickets.sh)
+#   similar          summary and description (find-related-tickets.sh --similar target)
+#   template-detect  issue type, summary, description (get-description-template.sh)
+#   estimate         what the estimators read (jira-estimate*.sh)
+#   groom            what jira-groom.sh reads, estimation included
+#   close            status plus the text for the completion summary (jira-close.sh)
+#   full             every field (no projection)
+JIRA_ISSUE_PROFILES="status summary similar template-detect estimate groom close full"
+jira_issue_profile() {
+    JIRA_PROFILE_EXPAND=""
+    case "$1" in
+        status)          JIRA_PROFILE_FIELDS="status,issuetype" ;;
+        summary)         JIRA_PROFILE_FIELDS="summary" ;;
+        similar)         JIRA_PROFILE_FIELDS="summary,description" ;;
+        template-detect) JIRA_PROFILE_FIELDS="summary,issuetype,description" ;;
+        estimate)        JIRA_PROFILE_FIELDS="summary,description,issuetype" ;;
+        groom)           JIRA_PROFILE_FIELDS="summary,description,issuetype" ;;
+        close)           JIRA_PROFILE_FIELDS="summary,description,status,issuetype" ;;
+        full)            JIRA_PROFILE_FIELDS="" ;;
+        *)
+            echo -e "${RED}❌ Unknown issue profile: $1 (one of: ${JIRA_ISSUE_PROFILES})${NC}" >&2
+            return 1
+            ;;
+    esac
+}
+
+# Get a JIRA issue with a projection profile (see jira_issue_profile)
+# Usage: jira_get_issue_profile <issue_key> <profile>
+# Under the MCP server the bytes received are reported per profile (snapshot hits
+# transfer nothing and are not counted).
+jira_get_issue_profile() {
+    local issue_key="$1"
+    jira_issue_profile "$2" || return 1
+    local data rc=0 snapshot=""
+    [[ -n "${JIRA_ISSUE_SNAPSHOT_DIR:-}" ]] && [[ -f "${JIRA_ISSUE_SNAPSHOT_DIR}/${issue_key}.json" ]] && snapshot=1
+    data=$(jira_get_issue "$issue_key" "$JIRA_PROFILE_FIELDS" "$JIRA_PROFILE_EXPAND") || rc=$?
+    if [[ $rc -eq 0 ]] && [[ -z "$snapshot" ]] && [[ "${JIRA_MCP_PHASE_MARKERS:-}" == "1" ]]; then
+        local LC_ALL=C
+        echo "::jira-mcp-fetch profile=$2 bytes=${#data}" >&2
+    fi
+    [[ $rc -eq 0 ]] && echo "$data"
+    return $rc
 }
 
 # Update a JIRA issue
@@ -117,7 +208,11 @@ jira_get_issue() {
 jira_update_issue() {
     local issue_key="$1"
     local update_data="$2"
-    jira_api_call "PUT" "/issue/${issue_key}" "$update_data"
+    local rc=0
+    phase_start jira_update
+    jira_api_call "PUT" "/issue/${issue_key}" "$update_data" || rc=$?
+    phase_end jira_update
+    return $rc
 }
 
 # Get available transitions for an issue
@@ -127,17 +222,91 @@ jira_get_transitions() {
     jira_api_call "GET" "/issue/${issue_key}/transitions"
 }
 
+# Transition IDs rarely change within a workflow, so the name -> ID map is cached
+# on disk per project, issue type and current status (JIRA_TRANSITION_CACHE_DIR,
+# default $TMPDIR/jira-transitions-<uid>) for JIRA_TRANSITION_CACHE_TTL seconds
+# (default 86400, 0 disables the cache). A cached ID rejected by JIRA (HTTP 400/409)
+# invalidates the entry, and the transitions are fetched once more.
+#
+# Cache file: first line is the fetch time (epoch seconds), then one
+# "<lowercase name><TAB><id><TAB><name>" line per transition.
+
+# Sets _JIRA_TC_FILE to the cache file for <project> <issue_type> <status> ("" when disabled)
+_jira_transition_cache_file() {
+    _JIRA_TC_FILE=""
+    [[ "${JIRA_TRANSITION_CACHE_TTL:-86400}" =~ ^[1-9][0-9]*$ ]] || return 0
+    [[ -n "$2" ]] && [[ -n "$3" ]] || return 0
+    local dir="${JIRA_TRANSITION_CACHE_DIR:-${TMPDIR:-/tmp}}"
+    [[ -n "${JIRA_TRANSITION_CACHE_DIR:-}" ]] || dir="${dir%/}/jira-transitions-${UID:-0}"
+    [[ -d "$dir" ]] || mkdir -p "$dir" 2>/dev/null || return 0
+    local name="$1__$2__$3"
+    _JIRA_TC_FILE="${dir}/${name//[^A-Za-z0-9._-]/_}"
+}
+
+# Sets _JIRA_TC_ID to the cached ID of <lowercase_name> ("" when missing or expired)
+_jira_transition_cache_lookup() {
+    local file="$1" wanted="$2" fetched lower id name now
+    _JIRA_TC_ID=""
+    [[ -f "$file" ]] || return 0
+    now="${EPOCHSECONDS:-$(date +%s)}"
+    {
+        read -r fetched || return 0
+        [[ "$fetched" =~ ^[0-9]+$ ]] || return 0
+        (( now - fetched < ${JIRA_TRANSITION_CACHE_TTL:-86400} )) || return 0
+        while IFS=$'\t' read -r lower id name; do
+            if [[ "$lower" == "$wanted" ]]; then
+                _JIRA_TC_ID="$id"
+                return 0
+            fi
+        done
+    } < "$file"
+}
+
+# Write a transitions response to <file> (atomically, so parallel syncs never read half a file)
+_jira_transition_cache_store() {
+    local file="$1" transitions="$2"
+    {
+        echo "${EPOCHSECONDS:-$(date +%s)}"
+        echo "$transitions" | jq -r '.transitions[] | [(.name | ascii_downcase), .id, .name] | @tsv'
+    } > "${file}.$$" 2>/dev/null && mv -f "${file}.$$" "$file" || rm -f "${file}.$$"
+}
+
 # Transition a JIRA issue to a new status
-# Usage: jira_transition <issue_key> <transition_name>
+# Usage: jira_transition <issue_key> <transition_name> [issue_type current_status]
+# With the issue type and current status, the transition ID comes from the cache
+# when possible and the transition costs a single request.
 jira_transition() {
     local issue_key="$1"
     local transition_name="$2"
-    
-    # Get available transitions
-    local transitions=$(jira_get_transitions "$issue_key")
+    local issue_type="${3:-}"
+    local current_status="${4:-}"
     
     # Find transition ID by name (case-insensitive)
     local transition_name_lower=$(echo "$transition_name" | tr '[:upper:]' '[:lower:]')
+    
+    _jira_transition_cache_file "${issue_key%%-*}" "$issue_type" "$current_status"
+    local cache_file="$_JIRA_TC_FILE"
+    if [[ -n "$cache_file" ]]; then
+        _jira_transition_cache_lookup "$cache_file" "$transition_name_lower"
+        if [[ -n "$_JIRA_TC_ID" ]]; then
+            local cached_data=$(jq -n --arg id "$_JIRA_TC_ID" '{transition: {id: $id}}')
+            if jira_api_call "POST" "/issue/${issue_key}/transitions" "$cached_data"; then
+                return 0
+            fi
+            case "${JIRA_API_LAST_STATUS:-}" in
+                400|409) ;;
+                *) return 1 ;;
+            esac
+            echo -e "${YELLOW}⚠️  Cached transition ID for '${transition_name}' was rejected; refreshing transitions${NC}" >&2
+            rm -f "$cache_file"
+        fi
+    fi
+    
+    # Get available transitions
+    local transitions
+    transitions=$(jira_get_transitions "$issue_key") || return 1
+    [[ -n "$cache_file" ]] && _jira_transition_cache_store "$cache_file" "$transitions"
+    
     local transition_id=$(echo "$transitions" | jq -r \
         ".transitions[] | select(.name | ascii_downcase == \"${transition_name_lower}\") | .id" | head -1)
     
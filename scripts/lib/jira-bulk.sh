@@ -0,0 +1,138 @@
+#!/usr/bin/env bash
+#
+# JIRA Bulk Library
+# Plan and apply status transitions for many tickets at once (used by jira-sync.sh)
+#
+# Decisions, plans and results are tab-separated lines, so each stage can be
+# inspected, filtered or replayed:
+#   decision: key  target_status  source
+#   plan:     key  current_status  target_status  issue_type  source
+#   result:   key  ok|failed  current_status  target_status  message
+#
+# Note: This is a library file meant to be sourced after utils.sh, jira-api.sh
+# and jira-search.sh. Do not use 'set -euo pipefail' here.
+
+# Load once per shell (scripts/lib/mcp-worker.sh preloads the libraries)
+if [[ -n "${_JIRA_BULK_SH_LOADED:-}" ]]; then
+    return 0
+fi
+_JIRA_BULK_SH_LOADED=1
+
+# Keys per status lookup; one search request replaces this many issue fetches
+JIRA_BULK_LOOKUP_BATCH="${JIRA_BULK_LOOKUP_BATCH:-50}"
+
+# Turn decisions into a plan: one decision per key (a "Done" decision wins over
+# any other), current status and issue type looked up with batched JQL searches,
+# and tickets already in their target status or not found dropped.
+# Usage: jira_bulk_plan < decisions > plan
+jira_bulk_plan() {
+    local decisions
+    # Rank: "done" first, then the first decision seen for the key
+    decisions=$(awk -F'\t' 'NF >= 2 && $1 != "" {
+            rank = (tolower($2) == "done") ? 0 : 1
+            print $1 "\t" rank "\t" NR "\t" $2 "\t" $3
+        }' | sort -t$'\t' -k1,1 -k2,2n -k3,3n | awk -F'\t' '!seen[$1]++ { print $1 "\t" $4 "\t" $5 }')
+    [[ -n "$decisions" ]] || return 0
+
+    # Current status and issue type per key: "key<TAB>status<TAB>type"
+    local statuses="" batch=() key
+    while IFS=$'\t' read -r key _; do
+        batch+=("$key")
+        if (( ${#batch[@]} >= JIRA_BULK_LOOKUP_BATCH )); then
+            statuses+=$(_jira_bulk_lookup "${batch[@]}")$'\n'
+            batch=()
+        fi
+    done <<< "$decisions"
+    if (( ${#batch[@]} > 0 )); then
+        statuses+=$(_jira_bulk_lookup "${batch[@]}")$'\n'
+    fi
+
+    # Join decisions with statuses (the status lines come first in the awk input)
+    printf '%s\n' "$statuses" | awk -F'\t' -v OFS='\t' '
+        FNR == NR { if ($1 != "") { status[$1] = $2; type[$1] = $3 } ; next }
+        !($1 in status) { print "⚠️  " $1 " not found or inaccessible" > "/dev/stderr"; next }
+        tolower(status[$1]) == tolower($2) { next }
+        { print $1, status[$1], $2, type[$1], $3 }
+    ' - <(printf '%s\n' "$decisions")
+}
+
+# Usage: _jira_bulk_lookup <key>...   (prints key<TAB>status<TAB>issue type; keys Jira
+# cannot return are left out)
+_jira_bulk_lookup() {
+    local keys
+    keys=$(IFS=,; echo "$*")
+    local response
+    if (( $# > 1 )); then
+        # Jira rejects the whole "key in (...)" query (HTTP 400) when any key does
+        # not exist or is not visible: look the halves up separately until the
+        # offending keys are on their own
+        if ! response=$(jira_search "key in (${keys})" "status,issuetype" "$#" 2>/dev/null); then
+            local half=$(( $# / 2 ))
+            _jira_bulk_lookup "${@:1:half}"
+            _jira_bulk_lookup "${@:half+1}"
+            return 0
+        fi
+    elif ! response=$(jira_search "key in (${keys})" "status,issuetype" 1); then
+        # Left out of the output; jira_bulk_plan reports it as not found
+        return 0
+    fi
+    # "-" stands in for a missing issue type: `read` would collapse an empty tab field
+    echo "$response" | jq -r '.issues[]? | [.key, (.fields.status.name // ""), (.fields.issuetype.name // "-")] | @tsv'
+}
+
+# Print a plan as a table
+# Usage: jira_bulk_print_plan < plan
+jira_bulk_print_plan() {
+    local key current target issue_type source count=0
+    while IFS=$'\t' read -r key current target issue_type source; do
+        [[ -n "$key" ]] || continue
+        printf '  %-14s %-16s → %-14s %s\n' "$key" "$current" "$target" "$source"
+        count=$(( count + 1 ))
+    done
+    echo "  ${count} transition(s) planned"
+}
+
+# Apply a plan with at most <max_parallel> transitions in flight; prints one
+# result line per plan line, in plan order.
+# Usage: jira_bulk_transition <max_parallel> < plan > results
+jira_bulk_transition() {
+    local max_parallel="${1:-4}"
+    (( max_parallel >= 1 )) || max_parallel=1
+    local work_dir
+    work_dir=$(mktemp -d "${TMPDIR:-/tmp}/jira-bulk.XXXXXX") || return 1
+
+    local index=0 key current target issue_type source
+    while IFS=$'\t' read -r key current target issue_type source; do
+        [[ -n "$key" ]] || continue
+        index=$(( index + 1 ))
+        # bash 3.2 has no `wait -n`: poll until a slot frees up
+        while (( $(jobs -rp | wc -l) >= max_parallel )); do
+            sleep 0.05
+        done
+        _jira_bulk_apply "$work_dir/$index" "$key" "$current" "$target" "$issue_type" < /dev/null &
+    done
+    wait
+
+    local i
+    for (( i = 1; i <= index; i++ )); do
+        cat "$work_dir/$i"
+    done
+    rm -rf "$work_dir"
+}
+
+# Run one transition and write its result line to <result_file>
+_jira_bulk_apply() {
+    local result_file="$1" key="$2" current="$3" target="$4" issue_type="$5"
+    local message=""
+    [[ "$issue_type" == "-" ]] && issue_type=""
+    if jira_transition "$key" "$target" "$issue_type" "$current" > /dev/null 2> "${result_file}.err"; then
+        printf '%s\tok\t%s\t%s\t\n' "$key" "$current" "$target" > "$result_file"
+    else
+        # The first error line is the reason (later lines list available transitions);
+        # "API error (HTTP n):" is followed by JIRA's message on the next line
+        message=$(sed "s/$(printf '\033')\[[0-9;]*m//g; s/^❌ *//" "${result_file}.err" |
+            awk 'NF { if (msg == "") { msg = $0; if (msg !~ /:$/) exit } else { msg = msg " " $0; exit } } END { print msg }')
+        printf '%s\tfailed\t%s\t%s\t%s\n' "$key" "$current" "$target" "${message:-transition failed}" > "$result_file"
+    fi
+    rm -f "${result_file}.err"
+}
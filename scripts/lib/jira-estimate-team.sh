@@ -15,6 +15,20 @@
 #   - uncertainty: 0-1 (none=0, medium=0.5, high=1)
 #   - testing: 0-1 (none=0, unit=0.5, integration=1)
 
+# Load once per shell (scripts/lib/mcp-worker.sh preloads the libraries)
+if [[ -n "${_JIRA_ESTIMATE_TEAM_SH_LOADED:-}" ]]; then
+    return 0
+fi
+_JIRA_ESTIMATE_TEAM_SH_LOADED=1
+
+# estimate_story_points_team runs scripts/lib/jira_estimate.py, which compiles
+# the keyword tables below (keep the two in sync). The path is absolute and
+# exported with the functions, so child shells running them find it too.
+_JIRA_ESTIMATE_TEAM_LIB_DIR="${BASH_SOURCE[0]%/*}"
+[[ "$_JIRA_ESTIMATE_TEAM_LIB_DIR" == "${BASH_SOURCE[0]}" ]] && _JIRA_ESTIMATE_TEAM_LIB_DIR="."
+_JIRA_ESTIMATE_TEAM_LIB_DIR="$(cd "$_JIRA_ESTIMATE_TEAM_LIB_DIR" && pwd)"
+export _JIRA_ESTIMATE_PY="${_JIRA_ESTIMATE_TEAM_LIB_DIR}/jira_estimate.py"
+
 # Complexity keyword arrays (using simple arrays instead of associative for compatibility)
 HIGH_COMPLEXITY_KEYWORDS=(
     "framework upgrade"
@@ -130,6 +144,8 @@ CONFIG_KEYWORDS=(
 # Main team estimation function
 # Usage: estimate_story_points_team "$ticket_json"
 # Returns: JSON with estimated points and reasoning
+# Scores the ticket in one python3 process (scripts/lib/jira_estimate.py) with
+# the same rules as the helpers below, printing exactly what they would add up to
 estimate_story_points_team() {
     local ticket_data="$1"
     
@@ -138,57 +154,67 @@ estimate_story_points_team() {
         return 1
     fi
     
-    # Extract fields from ticket JSON
-    local summary=$(echo "$ticket_data" | jq -r '.fields.summary // ""' | tr '[:upper:]' '[:lower:]')
-    local description=$(echo "$ticket_data" | jq -r '.fields.description // ""' | tr '[:upper:]' '[:lower:]')
-    local issue_type=$(echo "$ticket_data" | jq -r '.fields.issuetype.name // "Story"')
-    
-    # Combine summary and description for analysis
-    local combined_text="$summary $description"
-    
-    # Calculate base points
-    local base_points=$(calculate_base_points_team "$summary" "$issue_type")
-    
-    # Calculate complexity factor (0-2)
-    local complexity=$(calculate_complexity_factor_team "$combined_text")
-    
-    # Calculate uncertainty factor (0-1)
-    local uncertainty=$(calculate_uncertainty_factor_team "$description")
-    
-    # Calculate testing factor (0-1)
-    local testing=$(calculate_testing_factor_team "$combined_text" "$complexity")
-    
-    # Calculate total
-    local total=$(echo "$base_points + $complexity + $uncertainty + $testing" | bc -l)
-    
-    # Round to team scale
-    local final_points=$(round_to_team_scale "$total")
-    
-    # Check if should suggest breakdown
-    local should_split=$(should_suggest_breakdown "$final_points")
-    
-    # Determine confidence level
-    local confidence=$(calculate_confidence "$complexity" "$uncertainty")
+    printf '%s\n' "$ticket_data" | python3 "$_JIRA_ESTIMATE_PY" team
+}
+
+# Estimate memo (used by jira-groom.sh --estimate)
+# Estimates are stored on disk under a hash of the normalized inputs the
+# estimator reads (summary, description, issue type, scale, ruleset version), so
+# re-grooming an unchanged ticket skips the estimator and the estimation comment.
+#
+# Environment:
+#   JIRA_ESTIMATE_CACHE_DIR - memo directory (default: ~/.cache/jira-copilot-assistant/estimates)
+#   JIRA_ESTIMATE_NO_CACHE  - 1 to always estimate and comment
+jira_estimate_memo_enabled() {
+    [[ "${JIRA_ESTIMATE_NO_CACHE:-}" != "1" ]]
+}
+
+jira_estimate_cache_dir() {
+    echo "${JIRA_ESTIMATE_CACHE_DIR:-${XDG_CACHE_HOME:-${HOME:-/tmp}/.cache}/jira-copilot-assistant/estimates}"
+}
+
+# Function: estimate_story_points_memo
+# Estimates a ticket through the memo
+#
+# Arguments:
+#   $1 - Scale: team or fibonacci
+#   $2 - Ticket JSON data
+#
+# Returns:
+#   A header line "<content hash> <hit|miss> <estimates skipped so far>", then
+#   the estimate_story_points_team JSON (team) or the points followed by the
+#   analysis estimate_story_points prints on stderr (fibonacci)
+#
+estimate_story_points_memo() {
+    local scale="$1"
+    local ticket_data="$2"
     
-    # Format reasoning
-    local reasoning=$(format_estimation_reasoning_team "$base_points" "$complexity" "$uncertainty" "$testing" "$final_points")
+    if [ -z "$ticket_data" ]; then
+        echo '{"error": "Ticket data is required"}' >&2
+        return 1
+    fi
     
-    # Return JSON
-    cat << EOF
-{
-  "estimated_points": $final_points,
-  "breakdown": {
-    "base": $base_points,
-    "complexity": $complexity,
-    "uncertainty": $uncertainty,
-    "testing": $testing,
-    "total_raw": $total
-  },
-  "reasoning": "$reasoning",
-  "should_split": $should_split,
-  "confidence": "$confidence"
+    printf '%s\n' "$ticket_data" | python3 "$_JIRA_ESTIMATE_PY" memo --scale "$scale" --cache-dir "$(jira_estimate_cache_dir)"
 }
-EOF
+
+# Function: estimation_comment_posted
+# Succeeds (printing the comments skipped so far) when this estimate was the
+# last estimation comment posted on the ticket
+#
+# Arguments:
+#   $1 - Ticket key
+#   $2 - Content hash from estimate_story_points_memo
+#   $3 - Story points in the comment
+#
+estimation_comment_posted() {
+    python3 "$_JIRA_ESTIMATE_PY" comment --cache-dir "$(jira_estimate_cache_dir)" \
+        --ticket "$1" --hash "$2" --points "$3" --check
+}
+
+# Records the estimation comment just posted: <ticket key> <content hash> <story points>
+estimation_comment_mark() {
+    python3 "$_JIRA_ESTIMATE_PY" comment --cache-dir "$(jira_estimate_cache_dir)" \
+        --ticket "$1" --hash "$2" --points "$3" --mark
 }
 
 # Calculate base points based on ticket type
@@ -550,6 +576,11 @@ EOF
 
 # Export team functions
 export -f estimate_story_points_team
+export -f jira_estimate_memo_enabled
+export -f jira_estimate_cache_dir
+export -f estimate_story_points_memo
+export -f estimation_comment_posted
+export -f estimation_comment_mark
 export -f calculate_base_points_team
 export -f calculate_complexity_factor_team
 export -f calculate_uncertainty_factor_team
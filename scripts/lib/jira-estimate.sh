@@ -4,6 +4,12 @@
 # Analyzes ticket content and suggests story point estimates
 #
 
+# Load once per shell (scripts/lib/mcp-worker.sh preloads the libraries)
+if [[ -n "${_JIRA_ESTIMATE_SH_LOADED:-}" ]]; then
+    return 0
+fi
+_JIRA_ESTIMATE_SH_LOADED=1
+
 # Estimate story points based on ticket content
 estimate_story_points() {
     local description="$1"
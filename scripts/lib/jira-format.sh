@@ -3,6 +3,12 @@
 # Minimal markdown -> ADF converter
 # Conservative support: ATX headings, fenced code blocks, bullet lists, paragraphs, inline code, bold
 
+# Load once per shell (scripts/lib/mcp-worker.sh preloads the libraries)
+if [[ -n "${_JIRA_FORMAT_SH_LOADED:-}" ]]; then
+    return 0
+fi
+_JIRA_FORMAT_SH_LOADED=1
+
 # Helper: process inline formatting (bold, inline code)
 process_inline_formatting() {
     local text="$1"
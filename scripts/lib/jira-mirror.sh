@@ -0,0 +1,157 @@
+#!/usr/bin/env bash
+#
+# JIRA Mirror Library
+# Local SQLite FTS5 mirror of a project's tickets (scripts/lib/jira_mirror.py)
+#
+# A full load fetches every ticket of the project once; incremental syncs then
+# fetch only tickets matching "updated >= -<N>m" since the previous sync. The
+# search library answers epic and plain-text searches from the mirror while it
+# is fresh and falls back to the live API otherwise.
+#
+# Environment:
+#   JIRA_MIRROR            - set to 0 to never answer searches from the mirror
+#   JIRA_MIRROR_DIR        - where mirror-<PROJECT>.sqlite lives
+#                            (default: ${XDG_CACHE_HOME:-~/.cache}/jira-copilot-assistant)
+#   JIRA_MIRROR_MAX_AGE    - seconds since the last sync before the mirror counts as stale (default: 900)
+#   JIRA_MIRROR_AUTO_SYNC  - run an incremental sync when a loaded mirror is stale (default: 1)
+#
+# Note: This is a library file meant to be sourced after utils.sh and jira-search.sh.
+# Do not use 'set -euo pipefail' here as it affects the calling script.
+
+# Load once per shell (scripts/lib/mcp-worker.sh preloads the libraries)
+if [[ -n "${_JIRA_MIRROR_SH_LOADED:-}" ]]; then
+    return 0
+fi
+_JIRA_MIRROR_SH_LOADED=1
+
+_JIRA_MIRROR_LIB_DIR="${BASH_SOURCE[0]%/*}"
+[[ "$_JIRA_MIRROR_LIB_DIR" == "${BASH_SOURCE[0]}" ]] && _JIRA_MIRROR_LIB_DIR="."
+_JIRA_MIRROR_PY="${_JIRA_MIRROR_LIB_DIR}/jira_mirror.py"
+
+# Fields a sync fetches (jira_mirror.py SYNC_FIELDS)
+_JIRA_MIRROR_FIELDS="summary,issuetype,status,description,parent,updated"
+
+# Usage: jira_mirror_db <project>   (prints the mirror database path)
+jira_mirror_db() {
+    local dir="${JIRA_MIRROR_DIR:-${XDG_CACHE_HOME:-${HOME:-/tmp}/.cache}/jira-copilot-assistant}"
+    mkdir -p "$dir" 2>/dev/null || return 1
+    echo "${dir}/mirror-$1.sqlite"
+}
+
+# Function: jira_mirror_status
+# Prints "<last sync epoch> <last full sync epoch> <tickets>" for a project
+#
+# Arguments:
+#   $1 - (optional) Project key (default: $JIRA_PROJECT)
+#
+jira_mirror_status() {
+    local project="${1:-${JIRA_PROJECT:-}}"
+    local db
+    db=$(jira_mirror_db "$project") || return 1
+    if [[ ! -f "$db" ]]; then
+        echo "0 0 0"
+        return 0
+    fi
+    python3 "$_JIRA_MIRROR_PY" status --db "$db" --project "$project"
+}
+
+# Function: jira_mirror_sync
+# Loads the project into the mirror (first run or --full) or applies the tickets
+# updated since the previous sync. Issues are buffered on disk and only ingested
+# once the whole search succeeded, so a failed sync never advances the watermark
+# or deletes tickets.
+#
+# Arguments:
+#   $1 - (optional) --full to reload every ticket (also drops deleted/moved ones)
+#   $2 - (optional) Project key (default: $JIRA_PROJECT)
+#
+# Example:
+#   jira_mirror_sync            # incremental
+#   jira_mirror_sync --full RVV
+#
+jira_mirror_sync() {
+    local full=""
+    if [[ "${1:-}" == "--full" ]]; then
+        full="--full"
+        shift
+    fi
+    local project="${1:-${JIRA_PROJECT:-}}"
+    if [[ -z "$project" ]]; then
+        error "Project key is required (set JIRA_PROJECT)"
+        return 1
+    fi
+
+    local db last_sync
+    db=$(jira_mirror_db "$project") || return 1
+    read -r last_sync _ _ < <(jira_mirror_status "$project") || last_sync=0
+    [[ "$last_sync" =~ ^[0-9]+$ ]] || last_sync=0
+
+    local now="${EPOCHSECONDS:-$(date +%s)}"
+    local jql="project = ${project} ORDER BY key ASC"
+    if [[ -z "$full" ]] && (( last_sync > 0 )); then
+        # Relative dates avoid the profile time zone; two minutes of slack for skew and rounding
+        jql="project = ${project} AND updated >= -$(( (now - last_sync) / 60 + 2 ))m ORDER BY key ASC"
+    else
+        full="--full"
+    fi
+
+    local issues_file
+    issues_file=$(mktemp "${TMPDIR:-/tmp}/jira-mirror.XXXXXX") || return 1
+    if ! jira_search_stream "$jql" "$_JIRA_MIRROR_FIELDS" 0 > "$issues_file"; then
+        rm -f "$issues_file"
+        error "Mirror sync of ${project} failed"
+        return 1
+    fi
+    local count rc=0
+    count=$(python3 "$_JIRA_MIRROR_PY" ingest --db "$db" --project "$project" --synced-at "$now" $full < "$issues_file") || rc=$?
+    rm -f "$issues_file"
+    if [[ $rc -ne 0 ]]; then
+        error "Mirror sync of ${project} failed"
+        return 1
+    fi
+    debug "Mirror ${project}: ${count} ticket(s) $([[ -n "$full" ]] && echo loaded || echo updated)"
+    echo "$count"
+}
+
+# Function: jira_mirror_usable
+# Succeeds when searches for <project> can be answered from the mirror: it was
+# loaded, and it was synced within JIRA_MIRROR_MAX_AGE seconds (a stale mirror
+# gets one incremental sync first unless JIRA_MIRROR_AUTO_SYNC=0)
+#
+# Arguments:
+#   $1 - Project key
+#
+jira_mirror_usable() {
+    local project="$1"
+    [[ "${JIRA_MIRROR:-1}" != "0" ]] && [[ -n "$project" ]] || return 1
+    command -v python3 >/dev/null 2>&1 || return 1
+    local db
+    db=$(jira_mirror_db "$project") || return 1
+    [[ -f "$db" ]] || return 1
+
+    local last_sync full_sync count
+    read -r last_sync full_sync count < <(jira_mirror_status "$project") || return 1
+    [[ "$full_sync" =~ ^[0-9]+$ ]] && (( full_sync > 0 )) || return 1
+    local now="${EPOCHSECONDS:-$(date +%s)}"
+    if (( now - last_sync <= ${JIRA_MIRROR_MAX_AGE:-900} )); then
+        return 0
+    fi
+    [[ "${JIRA_MIRROR_AUTO_SYNC:-1}" != "0" ]] || return 1
+    jira_mirror_sync "$project" >/dev/null
+}
+
+# Function: jira_mirror_search_stream
+# Streams matching tickets from the mirror as NDJSON (ordered by key)
+#
+# Arguments:
+#   $1 - Project key
+#   $2 - --epic or --text
+#   $3 - Epic key or search text
+#   $4 - (optional) Max results (default: 0 = all)
+#
+jira_mirror_search_stream() {
+    local project="$1" mode="$2" value="$3" max_results="${4:-0}"
+    local db
+    db=$(jira_mirror_db "$project") || return 1
+    python3 "$_JIRA_MIRROR_PY" search --db "$db" --project "$project" "$mode" "$value" --max-results "$max_results"
+}
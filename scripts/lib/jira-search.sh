@@ -4,31 +4,100 @@
 # Reusable functions for searching JIRA tickets using JQL queries
 #
 
-# Function: jira_search
-# Searches JIRA using a JQL query
+# Load once per shell (scripts/lib/mcp-worker.sh preloads the libraries)
+if [[ -n "${_JIRA_SEARCH_SH_LOADED:-}" ]]; then
+    return 0
+fi
+_JIRA_SEARCH_SH_LOADED=1
+
+# Every request goes through the shared rate-limit governor
+_JIRA_SEARCH_LIB_DIR="${BASH_SOURCE[0]%/*}"
+[[ "$_JIRA_SEARCH_LIB_DIR" == "${BASH_SOURCE[0]}" ]] && _JIRA_SEARCH_LIB_DIR="."
+# shellcheck source=./rate-limit.sh
+source "${_JIRA_SEARCH_LIB_DIR}/rate-limit.sh"
+# Epic and text searches can be answered from the local ticket mirror
+# shellcheck source=./jira-mirror.sh
+source "${_JIRA_SEARCH_LIB_DIR}/jira-mirror.sh"
+
+# Function: jira_search_stream
+# Searches JIRA using a JQL query and streams the matching issues as NDJSON
+# (one compact issue object per line), following nextPageToken across pages.
+# While one page is written out the next one is already being fetched, so a
+# consumer reading the pipe starts before the last page arrives and only two
+# pages are held at a time, however large the result set.
 #
 # Arguments:
 #   $1 - JQL query string
 #   $2 - (optional) Fields to retrieve (comma-separated, default: "summary,issuetype,status,description")
-#   $3 - (optional) Max results (default: 50)
+#   $3 - (optional) Max results (default: 0 = every match)
+#
+# Environment:
+#   JIRA_SEARCH_PAGE_SIZE - issues requested per page (default: 100)
 #
 # Returns:
-#   JSON response from JIRA search API
+#   Issues as NDJSON; warns on stderr when max results cut the result set short
 #
 # Example:
-#   results=$(jira_search "project = RVV AND text ~ \"spring boot\"")
-#   echo "$results" | jq -r '.issues[] | "\(.key): \(.fields.summary)"'
+#   jira_search_stream "parent = RVV-1178" "summary" | jira_extract_keys
 #
-jira_search() {
+jira_search_stream() {
     local jql="$1"
     local fields="${2:-summary,issuetype,status,description}"
-    local max_results="${3:-50}"
+    local max_results="${3:-0}"
+    local page_size="${JIRA_SEARCH_PAGE_SIZE:-100}"
     
     if [[ -z "$jql" ]]; then
         error "JQL query is required"
         return 1
     fi
     
+    local work_dir
+    work_dir=$(mktemp -d "${TMPDIR:-/tmp}/jira-search.XXXXXX") || return 1
+    
+    local page=0 emitted=0 count token take want next_pid rc=0
+    want=$page_size
+    (( max_results > 0 && max_results < want )) && want=$max_results
+    if ! _jira_search_page "$jql" "$fields" "$want" "" > "$work_dir/0"; then
+        rm -rf "$work_dir"
+        return 1
+    fi
+    
+    while true; do
+        read -r count token < <(jq -r '"\(.issues // [] | length) \(if .isLast == true then "" else .nextPageToken // "" end)"' "$work_dir/$page")
+        take=$count
+        (( max_results > 0 && emitted + take > max_results )) && take=$(( max_results - emitted ))
+        emitted=$(( emitted + take ))
+        
+        # Prefetch the next page while this one is written out
+        next_pid=""
+        if [[ -n "$token" ]] && (( max_results == 0 || emitted < max_results )); then
+            want=$page_size
+            (( max_results > 0 && max_results - emitted < want )) && want=$(( max_results - emitted ))
+            _jira_search_page "$jql" "$fields" "$want" "$token" > "$work_dir/$(( page + 1 ))" &
+            next_pid=$!
+        fi
+        
+        jq -c --argjson n "$take" '(.issues // [])[:$n][]' "$work_dir/$page"
+        rm -f "$work_dir/$page"
+        
+        if [[ -z "$next_pid" ]]; then
+            if [[ -n "$token" ]]; then
+                warning "Stopped at ${emitted} results; more tickets match (raise max results)"
+            fi
+            break
+        fi
+        wait "$next_pid" || { rc=1; break; }
+        page=$(( page + 1 ))
+    done
+    
+    rm -rf "$work_dir"
+    return $rc
+}
+
+# Fetch one page of /search/jql: <jql> <fields> <max_results> <next_page_token>
+_jira_search_page() {
+    local jql="$1" fields="$2" max_results="$3" token="$4"
+    
     # Support both JIRA_TOKEN and JIRA_API_TOKEN
     local jira_token="${JIRA_TOKEN:-${JIRA_API_TOKEN}}"
     
@@ -38,15 +107,16 @@ jira_search() {
         --arg jql "$jql" \
         --arg fields "$fields" \
         --argjson maxResults "$max_results" \
+        --arg token "$token" \
         '{
             jql: $jql,
             maxResults: $maxResults,
             fields: ($fields | split(","))
-        }')
+        } + (if $token == "" then {} else {nextPageToken: $token} end)')
     
     # Use JIRA search API v3 with POST (/search/jql endpoint, not /search)
     local response
-    response=$(curl -s -X POST \
+    response=$(atlassian_curl -s -X POST \
         --user "${JIRA_EMAIL}:${jira_token}" \
         -H "Content-Type: application/json" \
         -H "Accept: application/json" \
@@ -60,10 +130,227 @@ jira_search() {
         error "JIRA search failed: $error_messages"
         return 1
     fi
+    if ! echo "$response" | jq -e 'type == "object"' >/dev/null 2>&1; then
+        error "JIRA search failed: unexpected response"
+        return 1
+    fi
     
     echo "$response"
 }
 
+# Function: jira_search_stream_cached
+# jira_search_stream with an on-disk result cache. Entries are keyed by the
+# normalized JQL (whitespace collapsed and keywords upper-cased outside quotes),
+# the sorted field list and max results.
+#   - younger than JIRA_SEARCH_CACHE_FRESH seconds (default 60): served from disk
+#   - otherwise revalidated: only issues matching "(filter) AND updated >= -Nm"
+#     since the last validation are fetched and merged in by key
+#   - older than JIRA_SEARCH_CACHE_MAX_AGE seconds (default 900) since the last
+#     full fetch: fetched in full, which also drops issues that stopped matching
+# The cache is LRU-evicted down to JIRA_SEARCH_CACHE_MAX_BYTES (default 50 MB).
+# JIRA_SEARCH_NO_CACHE=1 bypasses it.
+#
+# Arguments: same as jira_search_stream
+#
+# Example:
+#   jira_search_stream_cached "$(jira_epic_jql RVV-1178)" summary | jira_extract_keys
+#
+jira_search_stream_cached() {
+    local jql="$1"
+    local fields="${2:-summary,issuetype,status,description}"
+    local max_results="${3:-0}"
+    
+    _jira_search_cache_dir
+    if [[ "${JIRA_SEARCH_NO_CACHE:-}" == "1" ]] || [[ -z "$_JSC_DIR" ]] || [[ -z "$jql" ]]; then
+        jira_search_stream "$jql" "$fields" "$max_results"
+        return
+    fi
+    
+    # Normalized filter and ORDER BY clause, one per line
+    local filter order
+    {
+        IFS= read -r filter
+        IFS= read -r order
+    } < <(_jira_jql_normalize "$jql")
+    local sorted_fields
+    sorted_fields=$(printf '%s\n' "${fields//,/$'\n'}" | sed 's/^ *//; s/ *$//' | grep -v '^$' | sort -u | paste -sd, -)
+    local cache_key="${filter}|${order}|${sorted_fields}|${max_results}"
+    local entry
+    entry="${_JSC_DIR}/$(printf '%s' "$cache_key" | cksum | tr ' ' '-')"
+    
+    local now="${EPOCHSECONDS:-$(date +%s)}"
+    local stored_key="" validated_at=0 full_at=0
+    if [[ -f "${entry}.meta" ]] && [[ -f "${entry}.ndjson" ]]; then
+        {
+            IFS= read -r stored_key
+            read -r validated_at
+            read -r full_at
+        } < "${entry}.meta" || true
+    fi
+    
+    if [[ "$stored_key" == "$cache_key" ]]; then
+        touch "${entry}.ndjson"
+        if (( now - validated_at < ${JIRA_SEARCH_CACHE_FRESH:-60} )); then
+            debug "Search cache hit"
+            cat "${entry}.ndjson"
+            return 0
+        fi
+        if (( now - full_at < ${JIRA_SEARCH_CACHE_MAX_AGE:-900} )) &&
+            _jira_search_cache_revalidate "$entry" "$filter" "$order" "$fields" "$max_results" "$now" "$validated_at"; then
+            debug "Search cache revalidated"
+            printf '%s\n%s\n%s\n' "$cache_key" "$now" "$full_at" > "${entry}.meta"
+            cat "${entry}.ndjson"
+            return 0
+        fi
+    fi
+    
+    # Full fetch: stream to the caller while writing the new entry
+    local rc=0
+    {
+        jira_search_stream "$jql" "$fields" "$max_results"
+        echo $? > "${entry}.$$.rc"
+    } | tee "${entry}.$$.ndjson"
+    rc=$(cat "${entry}.$$.rc" 2>/dev/null || echo 1)
+    rm -f "${entry}.$$.rc"
+    if [[ "$rc" -ne 0 ]]; then
+        rm -f "${entry}.$$.ndjson"
+        return "$rc"
+    fi
+    mv -f "${entry}.$$.ndjson" "${entry}.ndjson"
+    printf '%s\n%s\n%s\n' "$cache_key" "$now" "$now" > "${entry}.meta"
+    _jira_search_cache_evict
+    return 0
+}
+
+# Sets _JSC_DIR to the search cache directory ("" when unavailable)
+_jira_search_cache_dir() {
+    _JSC_DIR="${JIRA_SEARCH_CACHE_DIR:-${TMPDIR:-/tmp}}"
+    [[ -n "${JIRA_SEARCH_CACHE_DIR:-}" ]] || _JSC_DIR="${_JSC_DIR%/}/jira-search-cache-${UID:-0}"
+    [[ -d "$_JSC_DIR" ]] || mkdir -p "$_JSC_DIR" 2>/dev/null || _JSC_DIR=""
+    return 0
+}
+
+# Print the normalized filter and ORDER BY clause of a JQL query (one per line)
+_jira_jql_normalize() {
+    printf '%s\n' "$1" | awk '
+        { text = text (NR > 1 ? " " : "") $0 }
+        function flush() {
+            if (word == "") return
+            upper = toupper(word)
+            if (upper ~ /^(AND|OR|NOT|IN|IS|EMPTY|NULL|ORDER|BY|ASC|DESC|WAS|CHANGED)$/) word = upper
+            out = out (out != "" && space ? " " : "") word
+            word = ""; space = 0
+        }
+        END {
+            quote = ""; word = ""; out = ""; space = 0
+            for (i = 1; i <= length(text); i++) {
+                c = substr(text, i, 1)
+                if (quote != "") {
+                    word = word c
+                    if (c == quote && substr(text, i - 1, 1) != "\\") quote = ""
+                } else if (c == "\"" || c == "\047") {
+                    quote = c; word = word c
+                } else if (c ~ /[ \t\r]/) {
+                    if (word != "") { flush(); space = 1 }
+                    else if (out != "") space = 1
+                } else {
+                    if (word == "" && out != "" && space) { out = out " "; space = 0 }
+                    word = word c
+                }
+            }
+            flush()
+            # Split off the ORDER BY clause (the keyword was upper-cased outside quotes)
+            n = split(out, parts, / ORDER BY /)
+            if (out ~ /^ORDER BY /) { print ""; print substr(out, 10); exit }
+            if (n > 1) { print substr(out, 1, length(out) - length(parts[n]) - 10); print parts[n] }
+            else { print out; print "" }
+        }'
+}
+
+# Merge issues updated since the last validation into <entry>.ndjson
+# Usage: _jira_search_cache_revalidate <entry> <filter> <order> <fields> <max> <now> <validated_at>
+_jira_search_cache_revalidate() {
+    local entry="$1" filter="$2" order="$3" fields="$4" max_results="$5" now="$6" validated_at="$7"
+    # Relative dates avoid the user-profile time zone JQL applies to absolute ones;
+    # a minute of slack covers clock skew and minute rounding
+    local minutes=$(( (now - validated_at) / 60 + 2 ))
+    local delta_jql="updated >= -${minutes}m"
+    [[ -n "$filter" ]] && delta_jql="(${filter}) AND ${delta_jql}"
+    [[ -n "$order" ]] && delta_jql+=" ORDER BY ${order}"
+    
+    jira_search_stream "$delta_jql" "$fields" 0 > "${entry}.$$.delta" || { rm -f "${entry}.$$.delta"; return 1; }
+    
+    # Changed issues replace their cached copy in place, new ones are appended.
+    # The merged list is put back in the query's order where that can be done
+    # without the fields it sorts on: "ORDER BY key" is re-sorted, and for
+    # "ORDER BY updated DESC" the delta is by definition the head of the list.
+    # A capped query in any other order could lose issues that now belong above
+    # the cut, so it is fetched in full instead.
+    local merge=append
+    if [[ "$order" =~ ^key( ASC)?$ ]]; then
+        merge=by_key
+    elif [[ "$order" == "updated DESC" ]]; then
+        merge=delta_first
+    elif (( max_results > 0 )) && [[ -s "${entry}.$$.delta" ]]; then
+        debug "Search cache: capped query in another order changed, refetching"
+        rm -f "${entry}.$$.delta"
+        return 1
+    fi
+    jq -c -n --slurpfile delta "${entry}.$$.delta" --argjson max "$max_results" --arg merge "$merge" '
+        ($delta | map({key: .key, value: .}) | from_entries) as $changed
+        | [inputs] as $cached
+        | ($cached | map({key: .key, value: true}) | from_entries) as $seen
+        | if $merge == "delta_first" then $delta + [$cached[] | select($changed[.key] | not)]
+          else [($cached[] | $changed[.key] // .), ($delta[] | select($seen[.key] | not))] end
+        | if $merge == "by_key" then sort_by(.key | split("-") | [.[0], (.[1] | tonumber? // 0)]) else . end
+        | if $max > 0 then .[:$max] else . end
+        | .[]' "${entry}.ndjson" > "${entry}.$$.ndjson" &&
+        mv -f "${entry}.$$.ndjson" "${entry}.ndjson"
+    local rc=$?
+    rm -f "${entry}.$$.delta" "${entry}.$$.ndjson"
+    return $rc
+}
+
+# Drop least recently used entries until the cache fits JIRA_SEARCH_CACHE_MAX_BYTES
+_jira_search_cache_evict() {
+    local max_bytes="${JIRA_SEARCH_CACHE_MAX_BYTES:-52428800}"
+    local total=0 size name
+    # ls -t lists the most recently used entry first (reads touch the file)
+    while read -r _ _ _ _ size _ _ _ name; do
+        [[ "$name" == *.ndjson ]] || continue
+        total=$(( total + size ))
+        if (( total > max_bytes )); then
+            rm -f "$name" "${name%.ndjson}.meta"
+        fi
+    done < <(ls -lt "$_JSC_DIR"/*.ndjson 2>/dev/null)
+}
+
+# Collect a stream into the jira_search JSON object: <stream function> <args>...
+_jira_search_collect() {
+    local issues
+    issues=$("$@") || return 1
+    printf '%s\n' "$issues" | jq -s '{issues: ., total: length}'
+}
+
+# Function: jira_search
+# Searches JIRA using a JQL query
+#
+# Arguments:
+#   $1 - JQL query string
+#   $2 - (optional) Fields to retrieve (comma-separated, default: "summary,issuetype,status,description")
+#   $3 - (optional) Max results (default: 50; 0 = every match, across pages)
+#
+# Returns:
+#   JSON object {"issues": [...], "total": N} (use jira_search_stream for large result sets)
+#
+# Example:
+#   results=$(jira_search "project = RVV AND text ~ \"spring boot\"")
+#   echo "$results" | jq -r '.issues[] | "\(.key): \(.fields.summary)"'
+#
+jira_search() {
+    _jira_search_collect jira_search_stream "$1" "${2:-summary,issuetype,status,description}" "${3:-50}"
+}
+
 # Function: jira_search_by_epic
 # Searches for all tickets linked to a specific epic
 #
@@ -88,14 +375,43 @@ jira_search_by_epic() {
         return 1
     fi
     
+    _jira_search_collect jira_search_epic_stream "$epic_key" "$additional_filters" "$max_results"
+}
+
+# Function: jira_search_epic_stream
+# Streams the tickets under an epic as NDJSON: from the local mirror when it is
+# usable and there are no additional filters, else from JIRA (cached search)
+#
+# Arguments: same as jira_search_by_epic (max results default: 0 = all)
+#
+jira_search_epic_stream() {
+    local epic_key="$1"
+    local additional_filters="${2:-}"
+    local max_results="${3:-0}"
+    
+    if [[ -z "$additional_filters" ]] && jira_mirror_usable "${epic_key%%-*}"; then
+        debug "Answering epic search from the mirror"
+        jira_mirror_search_stream "${epic_key%%-*}" --epic "$epic_key" "$max_results"
+        return
+    fi
+    jira_search_stream_cached "$(jira_epic_jql "$epic_key" "$additional_filters")" \
+        "summary,issuetype,status,description,epic" "$max_results"
+}
+
+# Function: jira_epic_jql
+# Builds the JQL used by jira_search_by_epic (for jira_search_stream)
+#
+# Arguments:
+#   $1 - Epic key
+#   $2 - (optional) Additional JQL filters
+#
+jira_epic_jql() {
     # Try both "parent" (JIRA Cloud) and "Epic Link" (old syntax) for compatibility
-    local jql="(parent = $epic_key OR \"Epic Link\" = $epic_key)"
-    if [[ -n "$additional_filters" ]]; then
-        jql="$jql $additional_filters"
+    local jql="(parent = $1 OR \"Epic Link\" = $1)"
+    if [[ -n "${2:-}" ]]; then
+        jql="$jql $2"
     fi
-    jql="$jql ORDER BY key ASC"
-    
-    jira_search "$jql" "summary,issuetype,status,description,epic" "$max_results"
+    echo "$jql ORDER BY key ASC"
 }
 
 # Function: jira_search_by_text
@@ -124,54 +440,190 @@ jira_search_by_text() {
         return 1
     fi
     
-    local jql="project = $project AND text ~ \"$search_text\""
-    if [[ -n "$additional_filters" ]]; then
-        jql="$jql $additional_filters"
-    fi
-    jql="$jql ORDER BY key ASC"
+    _jira_search_collect jira_search_text_stream "$project" "$search_text" "$additional_filters" "$max_results"
+}
+
+# Function: jira_search_text_stream
+# Streams the tickets of a project containing some text as NDJSON: from the
+# local mirror when it is usable and there are no additional filters, else from
+# JIRA (cached search)
+#
+# Arguments: same as jira_search_by_text (max results default: 0 = all)
+#
+jira_search_text_stream() {
+    local project="$1"
+    local search_text="$2"
+    local additional_filters="${3:-}"
+    local max_results="${4:-0}"
     
-    jira_search "$jql" "summary,issuetype,status,description" "$max_results"
+    if [[ -z "$additional_filters" ]] && jira_mirror_usable "$project"; then
+        debug "Answering text search from the mirror"
+        jira_mirror_search_stream "$project" --text "$search_text" "$max_results"
+        return
+    fi
+    jira_search_stream_cached "$(jira_text_jql "$project" "$search_text" "$additional_filters")" \
+        "summary,issuetype,status,description" "$max_results"
+}
+
+# Function: jira_text_jql
+# Builds the JQL used by jira_search_by_text (for jira_search_stream)
+#
+# Arguments:
+#   $1 - Project key
+#   $2 - Search text
+#   $3 - (optional) Additional JQL filters
+#
+jira_text_jql() {
+    local jql="project = $1 AND text ~ \"$2\""
+    if [[ -n "${3:-}" ]]; then
+        jql="$jql $3"
+    fi
+    echo "$jql ORDER BY key ASC"
 }
 
+# Function: jira_search_similar_stream
+# Streams the tickets most similar to a ticket as NDJSON, best first, each with
+# a "score" (TF-IDF cosine similarity of summary and description, 0-1; see
+# scripts/lib/jira_similarity.py). The ticket itself is never included.
+#
+# Candidates are the NDJSON written by the given command, or by default every
+# ticket of the ticket's project: from the local mirror when it is usable
+# (ranked against a prebuilt matrix with NumPy), else the most recently updated
+# JIRA_SIMILAR_MAX_CANDIDATES tickets (default: 1000) from JIRA.
+#
+# Arguments:
+#   $1 - Ticket key
+#   $2 - (optional) Number of results (default: 10, 0 = every candidate with a score above 0)
+#   $3... - (optional) Command streaming the candidates
+#
+# Example:
+#   jira_search_similar_stream RVV-1234 5
+#   jira_search_similar_stream RVV-1234 5 jira_search_epic_stream RVV-1178
+#
+jira_search_similar_stream() {
+    local issue_key="$1"
+    local top="${2:-10}"
+    shift $(( $# < 2 ? $# : 2 ))
+    local project="${issue_key%%-*}"
+
+    local target_file rc=0
+    target_file=$(mktemp "${TMPDIR:-/tmp}/jira-similar.XXXXXX") || return 1
+    if ! jira_get_issue_profile "$issue_key" similar > "$target_file"; then
+        rm -f "$target_file"
+        return 1
+    fi
+
+    local rank=(python3 "${_JIRA_SEARCH_LIB_DIR}/jira_similarity.py" --target "$target_file" --top "$top")
+    if [[ $# -gt 0 ]]; then
+        "$@" | "${rank[@]}" || rc=$?
+    elif jira_mirror_usable "$project"; then
+        debug "Ranking the ${project} mirror"
+        "${rank[@]}" --db "$(jira_mirror_db "$project")" --project "$project" || rc=$?
+    else
+        jira_search_stream_cached "project = ${project} ORDER BY updated DESC" \
+            "summary,issuetype,status,description" "${JIRA_SIMILAR_MAX_CANDIDATES:-1000}" \
+            | "${rank[@]}" || rc=$?
+    fi
+    rm -f "$target_file"
+    return $rc
+}
+
+# Function: jira_search_duplicates_stream
+# Streams the existing tickets of a project that nearly duplicate a new ticket
+# as NDJSON issues (key and summary) with a "score", best first: the Jaccard
+# similarity of word unigrams and bigrams, 0-1 (see scripts/lib/jira_dupes.py).
+#
+# Checked against the MinHash/LSH index kept in the local mirror when it is
+# usable (updated incrementally after each sync), else against the tickets
+# sharing a summary word with the new one (JIRA_DUPLICATE_MAX_CANDIDATES,
+# default: 200, most recently updated first).
+#
+# Arguments:
+#   $1 - Project key
+#   $2 - Summary of the new ticket
+#   $3 - (optional) Description of the new ticket
+#
+# Environment:
+#   JIRA_DUPLICATE_THRESHOLD - minimum score reported (default: 0.5)
+#
+# Example:
+#   jira_search_duplicates_stream RVV "Upgrade Spring Boot to 3.2" | jira_extract_summaries
+#
+jira_search_duplicates_stream() {
+    local project="$1"
+    local summary="$2"
+    local description="${3:-}"
+
+    local check=(python3 "${_JIRA_SEARCH_LIB_DIR}/jira_dupes.py" check --summary "$summary"
+                 --description "$description" --threshold "${JIRA_DUPLICATE_THRESHOLD:-0.5}")
+    if jira_mirror_usable "$project"; then
+        debug "Checking the ${project} mirror for duplicates"
+        "${check[@]}" --db "$(jira_mirror_db "$project")" --project "$project"
+        return
+    fi
+
+    local words clause=""
+    words=$(printf '%s\n' "$summary" | tr -cs '[:alnum:]' '\n' | awk 'length($0) >= 3' | head -10)
+    [[ -n "$words" ]] || return 0
+    while IFS= read -r word; do
+        clause+="${clause:+ OR }summary ~ \"${word}\""
+    done <<< "$words"
+    jira_search_stream_cached "project = ${project} AND (${clause}) ORDER BY updated DESC" \
+        "summary,description" "${JIRA_DUPLICATE_MAX_CANDIDATES:-200}" | "${check[@]}"
+}
+
+# Search results for the helpers below: $1 if given, else stdin; either the
+# JSON object from jira_search or the NDJSON stream from jira_search_stream
+_jira_search_input() {
+    if [[ $# -gt 0 ]]; then
+        printf '%s\n' "$1"
+    else
+        cat
+    fi
+}
+
+# jq prefix turning either form of search results into one issue per input
+_JIRA_SEARCH_ISSUES='if type == "object" and has("issues") then .issues[] else . end'
+
 # Function: jira_extract_keys
 # Extracts ticket keys from search results
 #
 # Arguments:
-#   $1 - JSON search results
+#   $1 - (optional) JSON search results or NDJSON issues (default: stdin)
 #
 # Returns:
 #   List of ticket keys (one per line)
 #
 # Example:
 #   keys=$(jira_extract_keys "$search_results")
+#   jira_search_stream "$jql" summary | jira_extract_keys
 #
 jira_extract_keys() {
-    local search_results="$1"
-    echo "$search_results" | jq -r '.issues[].key'
+    _jira_search_input "$@" | jq -r "${_JIRA_SEARCH_ISSUES} | .key"
 }
 
 # Function: jira_extract_summaries
 # Extracts ticket keys and summaries from search results
 #
 # Arguments:
-#   $1 - JSON search results
+#   $1 - (optional) JSON search results or NDJSON issues (default: stdin)
 #
 # Returns:
-#   List of "KEY: Summary" (one per line)
+#   List of "KEY: Summary" (one per line), "KEY [score]: Summary" for ranked results
 #
 # Example:
 #   jira_extract_summaries "$search_results"
 #
 jira_extract_summaries() {
-    local search_results="$1"
-    echo "$search_results" | jq -r '.issues[] | "\(.key): \(.fields.summary)"'
+    _jira_search_input "$@" \
+        | jq -r "${_JIRA_SEARCH_ISSUES}"' | "\(.key)\(if .score then " [\(.score)]" else "" end): \(.fields.summary)"'
 }
 
 # Function: jira_search_count
 # Returns the total count of search results
 #
 # Arguments:
-#   $1 - JSON search results
+#   $1 - (optional) JSON search results or NDJSON issues (default: stdin)
 #
 # Returns:
 #   Total count of tickets found
@@ -180,19 +632,19 @@ jira_extract_summaries() {
 #   count=$(jira_search_count "$search_results")
 #
 jira_search_count() {
-    local search_results="$1"
-    echo "$search_results" | jq -r '.total'
+    _jira_search_input "$@" | jq -n '[inputs | if type == "object" and has("issues") then (.total // (.issues | length)) else 1 end] | add // 0'
 }
 
 # Function: jira_search_filter_by_summary
 # Filters search results by summary pattern
 #
 # Arguments:
-#   $1 - JSON search results
+#   $1 - JSON search results or NDJSON issues ("-" reads stdin)
 #   $2 - Grep pattern (e.g., "Spring Boot|spring boot")
 #
 # Returns:
-#   Filtered JSON with matching tickets
+#   Filtered JSON with matching tickets (search results in, search results out;
+#   NDJSON in, NDJSON out)
 #
 # Example:
 #   filtered=$(jira_search_filter_by_summary "$results" "Spring Boot")
@@ -201,8 +653,17 @@ jira_search_filter_by_summary() {
     local search_results="$1"
     local pattern="$2"
     
-    echo "$search_results" | jq --arg pattern "$pattern" '
-        .issues |= map(select(.fields.summary | test($pattern; "i")))
-        | .total = (.issues | length)
+    if [[ "$search_results" == "-" ]]; then
+        _jira_search_input
+    else
+        _jira_search_input "$search_results"
+    fi | jq -r --arg pattern "$pattern" '
+        if type == "object" and has("issues") then
+            .issues |= map(select(.fields.summary | test($pattern; "i")))
+            | .total = (.issues | length)
+        else
+            # -r prints this string as is: one compact line per issue
+            select(.fields.summary | test($pattern; "i")) | tojson
+        end
     '
 }
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+jira_calibrate.py
+
+Fits the team-scale estimator's factor weights and rounding thresholds to the
+story points completed tickets actually got, used by jira-estimate-calibrate.sh.
+
+Usage:
+  jira_calibrate.py [--points-field customfield_10016] [--output weights.json] [--prior 10] < done.ndjson
+
+Reads NDJSON issues (as jira_search_stream prints them) with their story points
+and writes a weights file for scripts/lib/jira_estimate.py, which loads it at
+start-up when JIRA_ESTIMATE_WEIGHTS points at it. The file holds a weight for
+every factor level (TEAM_LEVELS) and the five thresholds between 0.5, 1, 2, 3,
+4 and 5 points; its "version" goes up by one each time the same file is
+recalibrated. Tickets without story points are skipped.
+
+Every ticket is scanned once with the estimator's own KeywordMatcher into a
+ticket x keyword matrix. From there it is NumPy throughout: the keyword tables
+are matrix products, the factor levels estimate_story_points_team picks become
+one-hot columns and the weights one least-squares solve, pulled towards the
+built-in weights by --prior (as many tickets' worth of evidence per weight),
+so that levels which always occur together, such as high complexity and
+integration testing, keep their built-in ratio. The thresholds then minimise
+the squared error of the rounded estimates, by dynamic programming over the
+distinct raw totals. Zero levels (simple complexity, no uncertainty, no test
+changes) stay at zero.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import jira_estimate as engine
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised where NumPy is missing
+    np = None
+
+POINTS_FIELD = 'customfield_10016'
+
+# Fitted weights, as (factor, level); every other level weighs zero
+WEIGHT_COLUMNS = (
+    ('base', 'bug'), ('base', 'story'),
+    ('complexity', 'standard'), ('complexity', 'moderate'), ('complexity', 'high'),
+    ('uncertainty', 'some'), ('uncertainty', 'significant'),
+    ('testing', 'unit'), ('testing', 'integration'),
+)
+
+
+def story_points(issue: Dict, field: str) -> Optional[float]:
+    fields = issue.get('fields') if isinstance(issue.get('fields'), dict) else {}
+    value = fields.get(field)
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not value > 0:
+        return None
+    return float(value)
+
+
+def read_history(stream, field: str) -> Tuple[List[Tuple[str, str, str]], List[float], int]:
+    """(estimator inputs, story points) of every ticket with points, and how many had none"""
+    inputs, points, skipped = [], [], 0
+    for _, issue in engine._read_issues(stream):
+        value = story_points(issue, field)
+        if value is None:
+            skipped += 1
+            continue
+        inputs.append(engine.issue_inputs(issue))
+        points.append(value)
+    return inputs, points, skipped
+
+
+def keyword_matrices(inputs: Sequence[Tuple[str, str, str]]) -> Dict[str, 'np.ndarray']:
+    """Ticket x keyword matches: in summary + description ("text"), and where the estimator
+    looks for bug keywords ("summary") and uncertainty keywords ("description")"""
+    matcher = engine.TEAM_MATCHER
+    column = {k: j for j, k in enumerate(matcher.keywords)}
+    bug = matcher.tables['bug']
+    uncertainty = matcher.tables['reference'] | matcher.tables['uncertain'] | matcher.tables['unsure']
+    hits = {'text': ([], []), 'summary': ([], []), 'description': ([], [])}
+    for i, (summary, description, _) in enumerate(inputs):
+        found = matcher.scan(f"{summary} {description}")
+        # A keyword of either part is a keyword of both together, so only those are looked up again
+        for name, keys in (('text', found),
+                           ('summary', [k for k in found & bug if k in summary]),
+                           ('description', [k for k in found & uncertainty if k in description])):
+            rows, cols = hits[name]
+            rows.extend([i] * len(keys))
+            cols.extend(column[k] for k in keys)
+    matrices = {}
+    for name, (rows, cols) in hits.items():
+        matrix = np.zeros((len(inputs), len(matcher.keywords)), dtype=np.float32)
+        matrix[rows, cols] = 1
+        matrices[name] = matrix
+    return matrices
+
+
+def team_levels(matrices: Dict[str, 'np.ndarray'], issue_types: Sequence[str]) -> 'np.ndarray':
+    """Ticket x factor level indices (into TEAM_LEVELS), as jira_estimate.team_levels picks them"""
+    matcher = engine.TEAM_MATCHER
+    names = list(matcher.tables)
+    membership = np.array([[k in matcher.tables[t] for t in names] for k in matcher.keywords], dtype=np.float32)
+    text, summary, description = ((matrices[m] @ membership) > 0 for m in ('text', 'summary', 'description'))
+
+    def table(hits, name):
+        return hits[:, names.index(name)]
+
+    def level(factor, name):
+        return engine.TEAM_LEVELS[factor].index(name)
+
+    base = np.where(table(summary, 'bug') | (np.asarray(issue_types) == 'Bug'),
+                    level('base', 'bug'), level('base', 'story'))
+    high = table(text, 'high')
+    complexity = np.select(
+        [high & table(text, 'reference'), high, table(text, 'medium'), table(text, 'low')],
+        [level('complexity', n) for n in ('moderate', 'high', 'moderate', 'simple')],
+        default=level('complexity', 'standard'))
+    uncertainty = np.select(
+        [table(description, 'reference'), table(description, 'uncertain'), table(description, 'unsure')],
+        [level('uncertainty', n) for n in ('none', 'significant', 'some')],
+        default=level('uncertainty', 'none'))
+    testing = np.select(
+        [complexity == level('complexity', 'high'), table(text, 'config') & table(text, 'simple')],
+        [level('testing', 'integration'), level('testing', 'none')],
+        default=level('testing', 'unit'))
+    return np.column_stack([base, complexity, uncertainty, testing])
+
+
+def design_matrix(levels: 'np.ndarray') -> 'np.ndarray':
+    """One-hot ticket x WEIGHT_COLUMNS matrix"""
+    factors = list(engine.TEAM_LEVELS)
+    return np.column_stack([levels[:, factors.index(f)] == engine.TEAM_LEVELS[f].index(level)
+                            for f, level in WEIGHT_COLUMNS]).astype(np.float64)
+
+
+def weight_vector(weights: Dict) -> 'np.ndarray':
+    return np.array([float(weights[f][level]) for f, level in WEIGHT_COLUMNS])
+
+
+def fit_weights(design: 'np.ndarray', points: 'np.ndarray', prior: float) -> 'np.ndarray':
+    """Least-squares weights, each also pulled towards its built-in value with `prior` tickets' weight"""
+    default = weight_vector(engine.DEFAULT_TEAM_WEIGHTS)
+    a = np.vstack([design, np.sqrt(prior) * np.eye(len(default))])
+    b = np.concatenate([points, np.sqrt(prior) * default])
+    return np.round(np.linalg.lstsq(a, b, rcond=None)[0], 2)
+
+
+def fit_thresholds(raw: 'np.ndarray', points: 'np.ndarray') -> List[float]:
+    """Thresholds between the scale values minimising the squared error of the rounded totals"""
+    scale = np.array([float(p) for p in engine.TEAM_SCALE])
+    values, group = np.unique(raw, return_inverse=True)
+    count = np.bincount(group, minlength=len(values))
+    total = np.bincount(group, weights=points, minlength=len(values))
+    squares = np.bincount(group, weights=points * points, minlength=len(values))
+    # cost[k, g]: every ticket of raw total values[g] rounded to scale[k]
+    cost = count * scale[:, None] ** 2 - 2 * scale[:, None] * total + squares
+    prefix = np.concatenate([np.zeros((len(scale), 1)), np.cumsum(cost, axis=1)], axis=1)
+
+    # best[j]: least cost of rounding the first j totals to the scale values so far;
+    # starts[k][j]: where scale value k begins in that solution
+    best, starts = prefix[0], []
+    positions = np.arange(len(values) + 1)
+    for k in range(1, len(scale)):
+        candidate = best - prefix[k]
+        running = np.minimum.accumulate(candidate)
+        starts.append(np.maximum.accumulate(np.where(candidate == running, positions, 0)))
+        best = prefix[k] + running
+
+    cuts, j = [], len(values)
+    for start in reversed(starts):
+        j = int(start[j])
+        cuts.append(j)
+    edges = np.concatenate([[values[0] - 1], (values[:-1] + values[1:]) / 2, [values[-1] + 1]])
+    return [round(float(edges[j]), 3) for j in reversed(cuts)]
+
+
+def predict(design: 'np.ndarray', weights: 'np.ndarray', thresholds: Sequence[float]) -> 'np.ndarray':
+    raw = np.round(design @ weights, 2)
+    scale = np.array([float(p) for p in engine.TEAM_SCALE])
+    return scale[np.searchsorted(np.asarray(thresholds, dtype=np.float64), raw, side='left')]
+
+
+def calibrate(inputs: Sequence[Tuple[str, str, str]], points: Sequence[float], prior: float = 10.0) -> Dict:
+    """Fitted weights and thresholds, with the fit before and after and the time of each stage"""
+    timings = {}
+    started = time.perf_counter()
+    matrices = keyword_matrices(inputs)
+    timings['keywords'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    actual = np.asarray(points, dtype=np.float64)
+    design = design_matrix(team_levels(matrices, [issue_type for _, _, issue_type in inputs]))
+    weights = fit_weights(design, actual, prior)
+    thresholds = fit_thresholds(np.round(design @ weights, 2), actual)
+    timings['fit'] = time.perf_counter() - started
+
+    def fit(w, t):
+        estimate = predict(design, w, t)
+        return {"rmse": round(float(np.sqrt(np.mean((estimate - actual) ** 2))), 3),
+                "exact": round(float(np.mean(estimate == actual)), 3)}
+
+    fitted = {f: {level: 0 for level in levels} for f, levels in engine.TEAM_LEVELS.items()}
+    for (f, level), w in zip(WEIGHT_COLUMNS, weights):
+        fitted[f][level] = float(w)
+    default_thresholds = [float(t) for t in engine.DEFAULT_TEAM_WEIGHTS['thresholds']]
+    return {
+        "weights": fitted,
+        "thresholds": thresholds,
+        "before": fit(weight_vector(engine.DEFAULT_TEAM_WEIGHTS), default_thresholds),
+        "after": fit(weights, thresholds),
+        "timings": timings,
+    }
+
+
+def previous_version(path: str) -> int:
+    try:
+        with open(path, encoding='utf-8') as f:
+            return int(json.load(f).get('version', 0))
+    except (OSError, ValueError, TypeError, AttributeError):
+        return 0
+
+
+def weights_document(result: Dict, tickets: int, field: str, version: int) -> Dict:
+    return {
+        "format": engine.WEIGHTS_FORMAT,
+        "version": version,
+        "fitted_at": datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        "tickets": tickets,
+        "points_field": field,
+        "fit": {"before": result['before'], "after": result['after']},
+        "weights": result['weights'],
+        "thresholds": result['thresholds'],
+    }
+
+
+def write_weights(path: str, doc: Dict):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(doc, indent=2) + '\n')
+    os.replace(tmp, path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Fit the team-scale estimation weights to completed tickets')
+    parser.add_argument('--points-field', default=POINTS_FIELD, help=f'story points field (default: {POINTS_FIELD})')
+    parser.add_argument('--output', default='-', help='weights file to write (default: stdout)')
+    parser.add_argument('--prior', type=float, default=10.0,
+                        help='tickets of evidence the built-in weights count as (default: 10)')
+    parser.add_argument('--min-tickets', type=int, default=30,
+                        help='fewest tickets with story points to calibrate on (default: 30)')
+    opts = parser.parse_args(argv)
+
+    if np is None:
+        print("Calibration needs NumPy: pip install numpy", file=sys.stderr)
+        return 1
+    started = time.perf_counter()
+    inputs, points, skipped = read_history(sys.stdin, opts.points_field)
+    read_seconds = time.perf_counter() - started
+    if len(inputs) < opts.min_tickets:
+        print(f"Only {len(inputs)} ticket(s) with story points in {opts.points_field} "
+              f"({skipped} without); at least {opts.min_tickets} needed", file=sys.stderr)
+        return 1
+
+    result = calibrate(inputs, points, opts.prior)
+    version = previous_version(opts.output) + 1 if opts.output != '-' else 1
+    doc = weights_document(result, len(inputs), opts.points_field, version)
+    if opts.output == '-':
+        sys.stdout.write(json.dumps(doc, indent=2) + '\n')
+    else:
+        try:
+            write_weights(opts.output, doc)
+        except OSError as e:
+            print(f"Cannot write {opts.output}: {e}", file=sys.stderr)
+            return 1
+
+    before, after, timings = result['before'], result['after'], result['timings']
+    print(f"Calibrated weights v{version} on {len(inputs)} ticket(s) ({skipped} without story points) in "
+          f"{read_seconds + timings['keywords'] + timings['fit']:.1f}s "
+          f"(read {read_seconds:.1f}s, keywords {timings['keywords']:.1f}s, fit {timings['fit']:.2f}s)",
+          file=sys.stderr)
+    print(f"RMSE {before['rmse']} -> {after['rmse']}, exact {before['exact']:.0%} -> {after['exact']:.0%}",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
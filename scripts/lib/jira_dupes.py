@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+jira_dupes.py
+
+MinHash/LSH near-duplicate index over ticket summaries and descriptions, used
+by jira-create.sh (and the MCP create_ticket tool) to flag a new ticket that
+almost matches an existing one.
+
+Usage:
+  jira_dupes.py check --db mirror.sqlite --project RVV --summary TEXT [--description TEXT]
+                      [--threshold 0.5] [--limit 5]
+  jira_dupes.py check --summary TEXT [--description TEXT] < candidates.ndjson
+
+Prints the near-duplicates as NDJSON issues (key, summary and "score"), best
+first.
+
+With --db the index lives in the local mirror (scripts/lib/jira_mirror.py):
+signatures are stored next to the tickets and brought up to date on the first
+check after a mirror sync, recomputing only tickets whose text changed, so
+neither a check nor a server start rebuilds the index. Without --db the
+candidates on stdin (e.g. a JIRA text search) are indexed in memory.
+
+Each ticket gets two 64-slot MinHash signatures, one over its summary and one
+over summary plus description (word unigrams and bigrams, stop words dropped),
+split into 16 bands of 4 rows for LSH lookup (candidate pairs from about 0.5
+Jaccard similarity up). Signatures use one-permutation hashing with
+densification, so a ticket costs one hash per shingle rather than 64. The
+candidates the buckets nominate are scored by exact Jaccard similarity: the
+higher of summary against summary and full text against full text, or the
+summary alone when the new ticket has no description.
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import sys
+import zlib
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from jira_mirror import STOP_WORDS, flatten_adf
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+# Bump when shingling or hashing changes; stored signatures are then recomputed
+VERSION = 1
+
+# One-permutation hashing: the top 6 bits of a shingle's 32-bit hash pick one of
+# the NUM_PERM slots, the low 25 bits are the value kept (minimum per slot)
+_SLOT_SHIFT = 25
+_VALUE_MASK = (1 << _SLOT_SHIFT) - 1
+_EMPTY = 0xFFFFFFFF
+
+_WORD = re.compile(r'[a-z0-9]+(?:[._][a-z0-9]+)*')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS dup_signatures (
+    key TEXT PRIMARY KEY,
+    digest INTEGER NOT NULL,
+    summary_shingles BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dup_buckets (bucket INTEGER NOT NULL, key TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS dup_buckets_bucket ON dup_buckets (bucket);
+CREATE INDEX IF NOT EXISTS dup_buckets_key ON dup_buckets (key);
+CREATE TABLE IF NOT EXISTS dup_state (project TEXT PRIMARY KEY, synced INTEGER NOT NULL, version INTEGER NOT NULL);
+'''
+
+
+def shingles(text: str) -> Set[int]:
+    """Hashed word unigrams and bigrams of `text`"""
+    words = [w for w in _WORD.findall(text.lower()) if w not in STOP_WORDS]
+    grams = set(words)
+    grams.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+    # Multiplicative (Fibonacci) hashing spreads the CRC over the top bits that pick the slot
+    return {(zlib.crc32(g.encode()) * 0x9E3779B1) & 0xFFFFFFFF for g in grams}
+
+
+def signature(hashes: Set[int]) -> array:
+    """MinHash signature of NUM_PERM slots (all _EMPTY for empty text)
+
+    One hash per shingle instead of NUM_PERM (one-permutation hashing); slots no
+    shingle fell into take the value of the next filled slot plus an offset per
+    step (densification by rotation), so signatures stay comparable slot by slot.
+    """
+    slots = [_EMPTY] * NUM_PERM
+    for h in hashes:
+        slot, value = h >> 26, h & _VALUE_MASK
+        if value < slots[slot]:
+            slots[slot] = value
+    if hashes and _EMPTY in slots:
+        filled = list(slots)
+        for i, value in enumerate(filled):
+            if value != _EMPTY:
+                continue
+            step = 1
+            while filled[(i + step) % NUM_PERM] == _EMPTY:
+                step += 1
+            slots[i] = filled[(i + step) % NUM_PERM] + (step << _SLOT_SHIFT)
+    return array('I', slots)
+
+
+def buckets(sig: array, offset: int = 0) -> List[int]:
+    """LSH bucket ids of a signature, one per band (offset keeps the two signature kinds apart)"""
+    rows = sig.tobytes()
+    width = ROWS * sig.itemsize
+    return [((offset + band) << 32) | zlib.crc32(rows[band * width:(band + 1) * width]) for band in range(BANDS)]
+
+
+def signatures(summary_shingles: Set[int], text_shingles: Set[int]) -> Tuple[array, array]:
+    """(summary signature, summary + description signature)"""
+    return signature(summary_shingles), signature(summary_shingles | text_shingles)
+
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    """Exact Jaccard similarity of two shingle sets"""
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+def _digest(summary: str, description: str) -> int:
+    return zlib.crc32(f"{summary}\0{description}".encode())
+
+
+def _placeholders(values: Sequence) -> str:
+    return ','.join('?' * len(values))
+
+
+class DuplicateIndex:
+    """LSH index over MinHash signatures, kept in SQLite (a mirror database or :memory:)
+
+    Summary shingles are stored with each signature; descriptions and summaries
+    of matches are read back from the mirror's issues table, or from `texts`
+    (key -> (summary, description)) when given.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, texts: Optional[Dict[str, Tuple[str, str]]] = None):
+        self.conn = conn
+        self.texts = texts
+        conn.executescript(SCHEMA)
+
+    def _rows(self, key: str, summary: str, description: str):
+        summary_shingles = shingles(summary)
+        summary_sig, text_sig = signatures(summary_shingles, shingles(description))
+        signature_row = (key, _digest(summary, description), array('I', summary_shingles).tobytes())
+        return signature_row, [(b, key) for b in buckets(summary_sig) + buckets(text_sig, BANDS)]
+
+    def add_many(self, tickets: Iterable[Tuple[str, str, str]]) -> int:
+        """Index (key, summary, description) tickets not indexed yet; returns how many"""
+        signature_rows, bucket_rows = [], []
+        for key, summary, description in tickets:
+            signature_row, ticket_buckets = self._rows(key, summary, description)
+            signature_rows.append(signature_row)
+            bucket_rows.extend(ticket_buckets)
+        self.conn.executemany('INSERT OR REPLACE INTO dup_signatures VALUES (?, ?, ?)', signature_rows)
+        self.conn.executemany('INSERT INTO dup_buckets VALUES (?, ?)', bucket_rows)
+        return len(signature_rows)
+
+    def add(self, key: str, summary: str, description: str) -> None:
+        self.remove([key])
+        self.add_many([(key, summary, description)])
+
+    def remove(self, keys: Sequence[str]) -> None:
+        rows = [(key,) for key in keys]
+        self.conn.executemany('DELETE FROM dup_signatures WHERE key = ?', rows)
+        self.conn.executemany('DELETE FROM dup_buckets WHERE key = ?', rows)
+
+    def refresh(self, project: str) -> int:
+        """Bring the index up to date with the mirror's issues table; returns tickets (re)indexed"""
+        state = self.conn.execute('SELECT synced, version FROM dup_state WHERE project = ?', (project,)).fetchone()
+        mirror = self.conn.execute('SELECT last_sync FROM sync_state WHERE project = ?', (project,)).fetchone()
+        synced = mirror[0] if mirror else 0
+        if state == (synced, VERSION):
+            return 0
+        with self.conn:
+            if state and state[1] != VERSION:
+                self.conn.execute('DELETE FROM dup_signatures')
+                self.conn.execute('DELETE FROM dup_buckets')
+            indexed = dict(self.conn.execute('SELECT key, digest FROM dup_signatures'))
+            changed = []
+            for key, summary, description in self.conn.execute(
+                    'SELECT key, summary, description FROM issues WHERE project = ?', (project,)):
+                if indexed.pop(key, None) != _digest(summary, description):
+                    changed.append((key, summary, description))
+            self.remove([key for key, _, _ in changed] + list(indexed))
+            if len(changed) > 1000:
+                # Bulk (re)build: filling the table and indexing it once is far cheaper than per row
+                self.conn.execute('DROP INDEX IF EXISTS dup_buckets_bucket')
+                self.conn.execute('DROP INDEX IF EXISTS dup_buckets_key')
+            self.add_many(changed)
+            self.conn.execute('CREATE INDEX IF NOT EXISTS dup_buckets_bucket ON dup_buckets (bucket)')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS dup_buckets_key ON dup_buckets (key)')
+            self.conn.execute('INSERT OR REPLACE INTO dup_state VALUES (?, ?, ?)', (project, synced, VERSION))
+        return len(changed)
+
+    def _candidates(self, probes: List[int], exclude: Optional[str]) -> Set[str]:
+        found = self.conn.execute(f'SELECT key FROM dup_buckets WHERE bucket IN ({_placeholders(probes)})', probes)
+        return {key for (key,) in found if key != exclude}
+
+    def _texts(self, keys: List[str]) -> Dict[str, Tuple[str, str]]:
+        if self.texts is not None:
+            return {key: self.texts[key] for key in keys if key in self.texts}
+        found = self.conn.execute(
+            f'SELECT key, summary, description FROM issues WHERE key IN ({_placeholders(keys)})', keys)
+        return {key: (summary, description) for key, summary, description in found}
+
+    def query(self, summary: str, description: str = '', threshold: float = 0.5,
+              limit: int = 5, exclude: Optional[str] = None) -> List[Tuple[float, str, str]]:
+        """(score, key, summary) of indexed tickets scoring at least `threshold`, best first
+
+        The LSH buckets only nominate candidates; each is then scored by the
+        exact Jaccard similarity of its shingles, which short summaries need
+        (a 64-slot estimate of an 8-word summary is off by up to 0.2).
+        """
+        summary_shingles = shingles(summary)
+        text_shingles = summary_shingles | shingles(description) if description.strip() else set()
+        summary_sig, text_sig = signatures(summary_shingles, text_shingles)
+        by_summary = self._candidates(buckets(summary_sig), exclude)
+        by_text = self._candidates(buckets(text_sig, BANDS), exclude) if text_shingles else set()
+        scored = {}
+        found = sorted(by_summary | by_text)
+        for key, blob in self.conn.execute(
+                f'SELECT key, summary_shingles FROM dup_signatures WHERE key IN ({_placeholders(found)})', found):
+            scored[key] = jaccard(summary_shingles, set(array('I', blob)))
+        if by_text:
+            # Only text-band candidates pay for shingling their description
+            for key, (other_summary, other_description) in self._texts(sorted(by_text)).items():
+                other_text = shingles(other_summary) | shingles(other_description)
+                scored[key] = max(scored.get(key, 0.0), jaccard(text_shingles, other_text))
+        best = sorted(((round(score, 4), key) for key, score in scored.items() if score >= threshold),
+                      key=lambda item: (-item[0], item[1]))
+        best = best[:limit] if limit else best
+        texts = self._texts([key for _, key in best])
+        return [(score, key, texts[key][0]) for score, key in best if key in texts]
+
+
+def check_mirror(db_path: str, project: str, summary: str, description: str = '',
+                 threshold: float = 0.5, limit: int = 5) -> List[Dict]:
+    """Near-duplicates of a new ticket among the project's tickets in the local mirror"""
+    conn = sqlite3.connect(db_path)
+    try:
+        index = DuplicateIndex(conn)
+        index.refresh(project)
+        return [{"key": key, "fields": {"summary": name}, "score": score}
+                for score, key, name in index.query(summary, description, threshold, limit)]
+    finally:
+        conn.close()
+
+
+def check_candidates(candidates: Iterable[Dict], summary: str, description: str = '',
+                     threshold: float = 0.5, limit: int = 5) -> List[Dict]:
+    """Near-duplicates of a new ticket among issues in the shape of a JIRA search result"""
+    texts = {}
+    for issue in candidates:
+        fields = issue.get('fields') or {}
+        texts[issue['key']] = (fields.get('summary') or '', flatten_adf(fields.get('description')))
+    conn = sqlite3.connect(':memory:')
+    try:
+        index = DuplicateIndex(conn, texts)
+        index.add_many((key, s, d) for key, (s, d) in texts.items())
+        return [{"key": key, "fields": {"summary": name}, "score": score}
+                for score, key, name in index.query(summary, description, threshold, limit)]
+    finally:
+        conn.close()
+
+
+def _read_ndjson(stream) -> Iterator[Dict]:
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='MinHash/LSH near-duplicate check for new JIRA tickets')
+    sub = parser.add_subparsers(dest='command', required=True)
+    check = sub.add_parser('check')
+    check.add_argument('--summary', required=True)
+    check.add_argument('--description', default='')
+    check.add_argument('--threshold', type=float, default=0.5, help='Minimum estimated Jaccard similarity')
+    check.add_argument('--limit', type=int, default=5, help='Duplicates to report (0 = all)')
+    check.add_argument('--db', help='Local mirror to check against (default: candidates NDJSON on stdin)')
+    check.add_argument('--project')
+    args = parser.parse_args(argv)
+    if args.db and not args.project:
+        parser.error('--db needs --project')
+
+    try:
+        if args.db:
+            found = check_mirror(args.db, args.project, args.summary, args.description, args.threshold, args.limit)
+        else:
+            found = check_candidates(_read_ndjson(sys.stdin), args.summary, args.description,
+                                     args.threshold, args.limit)
+    except (sqlite3.Error, ValueError, KeyError) as e:
+        print(f"Duplicate check failed: {e}", file=sys.stderr)
+        return 1
+    for duplicate in found:
+        sys.stdout.write(json.dumps(duplicate) + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
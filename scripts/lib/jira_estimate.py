@@ -0,0 +1,710 @@
+#!/usr/bin/env python3
+"""
+jira_estimate.py
+
+Story point estimation engine behind estimate_story_points_team
+(scripts/lib/jira-estimate-team.sh) and scripts/jira-estimate-batch.sh.
+
+Usage:
+  jira_estimate.py team < issue.json
+  jira_estimate.py batch [--format ndjson|csv] < issues.ndjson
+  jira_estimate.py memo --scale team|fibonacci --cache-dir DIR < issue.json
+  jira_estimate.py comment --cache-dir DIR --ticket KEY --hash HASH --points N (--check | --mark)
+
+Prints the team-scale estimate (0.5, 1, 2, 3, 4, 5) of one issue as the JSON
+document estimate_story_points_team has always printed, byte for byte: the
+same factor strings, bc's number formatting (".5", "2.0") and the reasoning
+with literal \\n separators.
+
+Every keyword table is compiled once into a KeywordMatcher holding each
+distinct keyword a single time, so a ticket is scored from one scan of its
+text (plus its summary for bug keywords and its description for uncertainty
+keywords) without the jq/tr/bc processes the shell version forked per factor.
+Keywords match as plain substrings of the lowercased text, exactly like the
+shell's [[ $text == *"$keyword"* ]] tests.
+
+The keywords put each factor at a level (complexity simple, standard, moderate
+or high, and so on) and each level adds a weight; the raw total is rounded to
+the scale at fixed thresholds. When JIRA_ESTIMATE_WEIGHTS names a weights file
+written by jira_calibrate.py, its fitted weights and thresholds replace the
+built-in ones (DEFAULT_TEAM_WEIGHTS) from start-up.
+
+The batch command streams NDJSON issues (as jira_search_stream prints them) and
+writes one row per ticket with both the team-scale estimate and the Fibonacci
+estimate of estimate_story_points (scripts/lib/jira-estimate.sh), each computed
+from the ticket exactly as jira-groom.sh --estimate would.
+
+The memo command is the groom's estimate cache: the estimator output is stored
+under a hash of the normalized inputs it reads (lowercased summary, description
+and issue type, the scale and RULESET_VERSION), so re-grooming an unchanged
+ticket reuses it. The comment command records which estimate was last posted
+as an estimation comment on a ticket, so the same comment is not posted twice.
+"""
+
+import argparse
+import csv
+import fcntl
+import hashlib
+import json
+import math
+import os
+import re
+import sys
+import tempfile
+from decimal import Decimal
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Keyword tables (kept identical to the arrays in jira-estimate-team.sh)
+HIGH_COMPLEXITY_KEYWORDS = (
+    "framework upgrade", "migration", "refactor", "architecture", "third-party", "external api",
+    "integration", "webhook", "security", "authentication", "authorization", "encryption",
+    "performance", "optimization", "caching", "async", "spring boot", "framework",
+)
+MEDIUM_COMPLEXITY_KEYWORDS = (
+    "database", "schema", "query", "endpoint", "api", "business logic", "validation",
+    "error handling", "multiple", "several", "various", "component", "service", "connector",
+)
+LOW_COMPLEXITY_KEYWORDS = (
+    "simple", "minor", "small", "quick", "easy", "config", "configuration", "setting", "flag",
+    "typo", "label", "text", "wording",
+)
+UNCERTAINTY_HIGH_KEYWORDS = (
+    "unclear", "unknown", "investigate", "research", "might need", "possibly", "maybe", "tbd",
+    "to be determined", "needs clarification", "not sure",
+)
+UNCERTAINTY_MEDIUM_KEYWORDS = (
+    "explore", "consider", "evaluate", "assess", "dependent on", "depends on", "requires",
+)
+UNCERTAINTY_REDUCING_KEYWORDS = (
+    "reference", "similar", "like", "same as", "follow", "based on", "example", "template",
+    "pattern", "precedent", "already done", "previously",
+)
+BUG_KEYWORDS = ("bug", "fix", "defect", "issue", "broken", "error")
+CONFIG_KEYWORDS = ("config", "configuration", "setting", "environment", "env")
+
+TEAM_TABLES = {
+    "high": HIGH_COMPLEXITY_KEYWORDS,
+    "medium": MEDIUM_COMPLEXITY_KEYWORDS,
+    "low": LOW_COMPLEXITY_KEYWORDS,
+    "uncertain": UNCERTAINTY_HIGH_KEYWORDS,
+    "unsure": UNCERTAINTY_MEDIUM_KEYWORDS,
+    "reference": UNCERTAINTY_REDUCING_KEYWORDS,
+    "bug": BUG_KEYWORDS,
+    "config": CONFIG_KEYWORDS,
+    "simple": ("simple",),
+}
+
+# tr '[:upper:]' '[:lower:]' only folds ASCII
+_LOWER = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+
+
+class KeywordMatcher:
+    """Named keyword tables compiled into one deduplicated keyword list"""
+
+    def __init__(self, tables: Dict[str, Sequence[str]]):
+        self.keywords: Tuple[str, ...] = tuple(sorted({k for table in tables.values() for k in table}))
+        self.tables: Dict[str, FrozenSet[str]] = {name: frozenset(table) for name, table in tables.items()}
+        self._subsets: Dict[Tuple[str, ...], Tuple[str, ...]] = {(): self.keywords}
+
+    def scan(self, text: str, *tables: str) -> FrozenSet[str]:
+        """Every keyword (of `tables`, default all) occurring in `text`, each looked up once"""
+        keywords = self._subsets.get(tables)
+        if keywords is None:
+            keywords = self._subsets[tables] = tuple(sorted(set().union(*(self.tables[t] for t in tables))))
+        return frozenset(k for k in keywords if k in text)
+
+    def any(self, found: FrozenSet[str], table: str) -> bool:
+        return not found.isdisjoint(self.tables[table])
+
+
+TEAM_MATCHER = KeywordMatcher(TEAM_TABLES)
+
+
+def _jq_number(value) -> str:
+    """A JSON number as jq 1.6 prints it: a double in its shortest digits"""
+    number = min(max(float(value), -sys.float_info.max), sys.float_info.max)
+    if number != number:
+        return 'null'
+    sign, digits, exponent = Decimal(repr(number)).normalize().as_tuple()
+    text = ''.join(map(str, digits))
+    point = len(text) + exponent
+    if point <= -4 or point > len(text) + 15:
+        mantissa = text[0] + ('.' + text[1:] if len(text) > 1 else '')
+        text = f"{mantissa}e{'+' if point > 0 else '-'}{abs(point - 1):02d}"
+    elif point <= 0:
+        text = '0.' + '0' * -point + text
+    else:
+        text = text.ljust(point, '0') if point >= len(text) else text[:point] + '.' + text[point:]
+    return ('-' if sign else '') + text
+
+
+def _jq_dump(value) -> str:
+    """Value as jq prints it (2-space indent, numbers as jq formats them)"""
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False).replace('\x7f', '\\u007f')
+    if isinstance(value, (int, float)):
+        return _jq_number(value)
+    if not value:
+        return '[]' if isinstance(value, list) else '{}'
+    if isinstance(value, list):
+        items = [_jq_dump(v) for v in value]
+    else:
+        items = [f"{_jq_dump(str(k))}: {_jq_dump(v)}" for k, v in value.items()]
+    body = ',\n'.join(items).replace('\n', '\n  ')
+    return ('[\n  ' if isinstance(value, list) else '{\n  ') + body + ('\n]' if isinstance(value, list) else '\n}')
+
+
+def jq_raw(doc, path: Sequence[str], default: Optional[str]) -> str:
+    """What `echo "$doc" | jq -r '.a.b // "default"'` leaves in a shell variable
+
+    A `default` of None stands for a path read without `//` (null prints "null").
+    """
+    value = doc
+    for name in path:
+        if value is None:
+            break
+        if not isinstance(value, dict):
+            return ''                      # jq errors out and prints nothing
+        value = value.get(name)
+    if (value is None or value is False) and default is not None:
+        return default
+    text = value if isinstance(value, str) else _jq_dump(value)
+    return text.replace('\0', '').rstrip('\n')
+
+
+def bc(value: Decimal) -> str:
+    """A number the way bc prints it (no leading zero before the point)"""
+    if value == 0:
+        return '0'
+    text = f"{value:f}"
+    if text.startswith('0.'):
+        return text[1:]
+    if text.startswith('-0.'):
+        return '-' + text[2:]
+    return text
+
+
+# Factor levels of the team scale and their built-in weights (the values the
+# shell helpers print); a calibrated weights file (jira_calibrate.py) replaces them
+TEAM_LEVELS = {
+    "base": ("bug", "story"),
+    "complexity": ("simple", "standard", "moderate", "high"),
+    "uncertainty": ("none", "some", "significant"),
+    "testing": ("none", "unit", "integration"),
+}
+DEFAULT_TEAM_WEIGHTS = {
+    "version": 0,
+    "base": {"bug": "0.5", "story": "1.0"},
+    "complexity": {"simple": "0", "standard": "0.5", "moderate": "1.0", "high": "2.0"},
+    "uncertainty": {"none": "0", "some": "0.5", "significant": "1.0"},
+    "testing": {"none": "0", "unit": "0.5", "integration": "1.0"},
+    # Upper bounds of the raw total rounded to 0.5, 1, 2, 3 and 4 points (5 above)
+    "thresholds": ("0.75", "1.5", "2.5", "3.5", "4.5"),
+}
+WEIGHTS_FORMAT = 1
+TEAM_SCALE = ('0.5', '1', '2', '3', '4', '5')
+
+
+def _weight(value) -> str:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise ValueError(f"not a number: {value!r}")
+    return str(Decimal(repr(value)))
+
+
+def load_team_weights(path: Optional[str]) -> Dict:
+    """The weights and thresholds of a weights file, or the built-in ones without one
+
+    An unreadable or invalid file is reported on stderr and ignored.
+    """
+    if not path:
+        return DEFAULT_TEAM_WEIGHTS
+    try:
+        with open(path, encoding='utf-8') as f:
+            doc = json.load(f)
+        if doc.get('format') != WEIGHTS_FORMAT:
+            raise ValueError(f"unsupported format {doc.get('format')!r}")
+        weights = {"version": int(doc['version'])}
+        for factor, levels in TEAM_LEVELS.items():
+            weights[factor] = {level: _weight(doc['weights'][factor][level]) for level in levels}
+        thresholds = tuple(_weight(t) for t in doc['thresholds'])
+        if len(thresholds) != len(TEAM_SCALE) - 1 or \
+                any(Decimal(a) > Decimal(b) for a, b in zip(thresholds, thresholds[1:])):
+            raise ValueError(f"expected {len(TEAM_SCALE) - 1} ascending thresholds")
+        weights['thresholds'] = thresholds
+        return weights
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        print(f"Ignoring estimate weights {path}: {e}", file=sys.stderr)
+        return DEFAULT_TEAM_WEIGHTS
+
+
+TEAM_WEIGHTS = load_team_weights(os.environ.get('JIRA_ESTIMATE_WEIGHTS'))
+
+
+def _team_scale(raw: Decimal) -> str:
+    for bound, points in zip(TEAM_WEIGHTS['thresholds'], TEAM_SCALE):
+        if raw <= Decimal(bound):
+            return points
+    return TEAM_SCALE[-1]
+
+
+def team_levels(summary: str, description: str, issue_type: str) -> Tuple[str, str, str, str]:
+    """(base, complexity, uncertainty, testing) levels of a ticket, as named in TEAM_LEVELS
+
+    `summary` and `description` are already lowercased.
+    """
+    found = TEAM_MATCHER.scan(f"{summary} {description}")
+    # Bug keywords count in the summary only, uncertainty keywords in the description only
+    in_summary = TEAM_MATCHER.scan(summary, 'bug')
+    in_description = TEAM_MATCHER.scan(description, 'reference', 'uncertain', 'unsure')
+
+    base = 'bug' if TEAM_MATCHER.any(in_summary, 'bug') or issue_type == 'Bug' else 'story'
+
+    if TEAM_MATCHER.any(found, 'high'):
+        complexity = 'moderate' if TEAM_MATCHER.any(found, 'reference') else 'high'
+    elif TEAM_MATCHER.any(found, 'medium'):
+        complexity = 'moderate'
+    elif TEAM_MATCHER.any(found, 'low'):
+        complexity = 'simple'
+    else:
+        complexity = 'standard'
+
+    if TEAM_MATCHER.any(in_description, 'reference'):
+        uncertainty = 'none'
+    elif TEAM_MATCHER.any(in_description, 'uncertain'):
+        uncertainty = 'significant'
+    elif TEAM_MATCHER.any(in_description, 'unsure'):
+        uncertainty = 'some'
+    else:
+        uncertainty = 'none'
+
+    if complexity == 'high':
+        testing = 'integration'
+    elif TEAM_MATCHER.any(found, 'config') and TEAM_MATCHER.any(found, 'simple'):
+        testing = 'none'
+    else:
+        testing = 'unit'
+    return base, complexity, uncertainty, testing
+
+
+def _level_weights(levels: Sequence[str]) -> Tuple[str, str, str, str]:
+    return tuple(TEAM_WEIGHTS[factor][level] for factor, level in zip(TEAM_LEVELS, levels))
+
+
+def team_factors(summary: str, description: str, issue_type: str) -> Tuple[str, str, str, str]:
+    """(base, complexity, uncertainty, testing) as the shell helpers print them (or as calibrated)"""
+    return _level_weights(team_levels(summary, description, issue_type))
+
+
+def _points(weight: str, sign: str = '') -> str:
+    """A weight as the reasoning shows it: "1.0" -> "1", with an explicit + when asked"""
+    text = f"{Decimal(weight).normalize():f}"
+    return sign + text if sign and not text.startswith('-') else text
+
+
+def team_reasoning(levels: Sequence[str], final: str) -> str:
+    """format_estimation_reasoning_team: lines joined by a literal backslash-n"""
+    base, complexity, uncertainty, testing = levels
+    w = dict(zip(TEAM_LEVELS, _level_weights(levels)))
+    lines = [f"Base: {_points(w['base'])} point " +
+             ('(bug fix/small change)' if base == 'bug' else '(new feature/story)')]
+    lines.append(f"Complexity: {_points(w['complexity'], '+')} " + {
+        'simple': '(simple task)',
+        'standard': '(standard implementation)',
+        'moderate': '(moderate - database/API)',
+        'high': '(high - framework/integration)',
+    }[complexity])
+    if uncertainty != 'none':
+        lines.append(f"Uncertainty: {_points(w['uncertainty'], '+')} " +
+                     ('(some unknowns)' if uncertainty == 'some' else '(significant unknowns)'))
+    lines.append(f"Testing: {_points(w['testing'], '+')} " + {
+        'none': '(no test changes)', 'unit': '(unit tests)', 'integration': '(integration + E2E)'}[testing])
+    points = Decimal(final)
+    focus_hours = f"{points * 7:.0f}"                       # printf "%.0f" rounds half to even
+    focus_days = points.quantize(Decimal('0.1'))            # bc: scale=1; $final / 1
+    lines.append(f"Total: {final} points (~{focus_hours} focus hours / {bc(focus_days)} focus days)")
+    lines.append(f"With 50% philosophy: ~{bc(focus_days * 2)} working days")
+    return '\\n'.join(lines)
+
+
+def estimate_team(summary: str, description: str, issue_type: str) -> Dict:
+    """Team-scale estimate of a ticket; factor values are kept as the strings printed"""
+    levels = team_levels(summary, description, issue_type)
+    base, complexity, uncertainty, testing = _level_weights(levels)
+    total = Decimal(base) + Decimal(complexity) + Decimal(uncertainty) + Decimal(testing)
+    final = _team_scale(total)
+    # Confidence follows the levels, whatever their calibrated weights
+    spread = Decimal(DEFAULT_TEAM_WEIGHTS['complexity'][levels[1]]) + \
+        Decimal(DEFAULT_TEAM_WEIGHTS['uncertainty'][levels[2]])
+    return {
+        "estimated_points": final,
+        "breakdown": {"base": base, "complexity": complexity, "uncertainty": uncertainty,
+                      "testing": testing, "total_raw": bc(total)},
+        "reasoning": team_reasoning(levels, final),
+        "should_split": 'true' if Decimal(final) >= 4 else 'false',
+        "confidence": 'high' if spread <= 1 else 'medium' if spread <= 2 else 'low',
+    }
+
+
+def issue_inputs(doc) -> Tuple[str, str, str]:
+    """(summary, description, issue type) as estimate_story_points_team extracts them"""
+    summary = jq_raw(doc, ('fields', 'summary'), '').translate(_LOWER)
+    description = jq_raw(doc, ('fields', 'description'), '').translate(_LOWER)
+    return summary, description, jq_raw(doc, ('fields', 'issuetype', 'name'), 'Story')
+
+
+# estimate_story_points: (grep -iE pattern, points, factor), in the shell's order
+FIBONACCI_FACTORS = (
+    ("upgrade|migration|framework|refactor|redesign|rewrite", 8, "Framework/major change"),
+    ("new feature|implement|add support for", 5, "New feature"),
+    ("bug fix|fix|resolve|patch", 2, "Bug fix"),
+    ("config|configuration|settings|environment", 1, "Configuration change"),
+    ("multiple|several|various|all|across", 3, "Multiple systems/components"),
+    ("integration|external|api|third.?party|provider", 3, "External dependencies"),
+    ("downstream|upstream|dependent|dependency", 2, "Internal dependencies"),
+    ("test|testing|validation|verify|validate", 2, "Testing requirements"),
+    ("critical|production|live|customer.?facing", 2, "Critical/production system"),
+    ("unknown|unclear|investigate|research|explore", 3, "High uncertainty"),
+    ("new technology|never done|unfamiliar", 5, "New technology"),
+    ("document|documentation|guide|readme|wiki", 1, "Documentation"),
+    ("simple|straightforward|trivial|minor|small", -2, "Marked as simple"),
+    ("well.?known|familiar|standard|common pattern", -1, "Well-known pattern"),
+)
+FIBONACCI = (1, 2, 3, 5, 8, 13, 21, 34, 55)
+
+# No pattern spans a newline, so one search of the whole text matches grep's per-line
+# search; the text is lowercased once instead of every pattern matching case-insensitively
+_FIBONACCI_RULES = tuple((re.compile(pattern), points, factor) for pattern, points, factor in FIBONACCI_FACTORS)
+
+
+def estimate_fibonacci(description: str, summary: str) -> Tuple[int, int, List[str]]:
+    """estimate_story_points: (estimate, raw score, factors as printed to stderr)"""
+    text = f"{description} {summary}".translate(_LOWER)
+    points = 0
+    factors = []
+    for rule, weight, factor in _FIBONACCI_RULES:
+        if rule.search(text):
+            points += weight
+            factors.append(f"{factor}: {weight:+d}")
+    points = max(points, 1)
+    return min(FIBONACCI, key=lambda fib: abs(fib - points)), points, factors
+
+
+def _jq_tojson(value) -> str:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return _jq_number(value)
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def _adf_text(node) -> str:
+    """jq '[.. | .text? // empty] | join(" ")' of an ADF document"""
+    parts = []
+    stack = [node]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            text = value.get('text')
+            if text is not None and text is not False:
+                parts.append(text if isinstance(text, str) else _jq_tojson(text))
+            stack.extend(reversed(list(value.values())))
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
+    return ' '.join(parts).replace('\0', '').rstrip('\n')
+
+
+def fibonacci_inputs(doc) -> Tuple[str, str]:
+    """(description text, summary) as jira-groom.sh passes them to estimate_story_points"""
+    fields = doc.get('fields') if isinstance(doc, dict) else None
+    adf = fields.get('description') if isinstance(fields, dict) else None
+    if isinstance(adf, dict):
+        return _adf_text(adf), jq_raw(doc, ('fields', 'summary'), None)
+    description = jq_raw(doc, ('fields', 'description'), '')
+    if description:
+        try:
+            parsed = json.loads(description)
+        except ValueError:
+            parsed = description                # not JSON: the groom falls back to the raw text
+        if isinstance(parsed, dict):
+            description = _adf_text(parsed)
+        elif isinstance(parsed, str):
+            description = parsed.replace('\0', '').rstrip('\n')
+    return description, jq_raw(doc, ('fields', 'summary'), None)
+
+
+BATCH_COLUMNS = (
+    'key', 'summary', 'issue_type',
+    'estimated_points', 'base', 'complexity', 'uncertainty', 'testing', 'total_raw', 'should_split', 'confidence',
+    'fibonacci_points', 'fibonacci_raw', 'fibonacci_factors',
+)
+
+
+def _number(text: str):
+    """A printed factor ("1.0", ".5") as a JSON number: 1, 0.5"""
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+
+def estimate_issue(issue: Dict) -> Dict:
+    """Both estimates of one issue as a flat batch row (numbers as numbers)"""
+    fields = issue.get('fields') if isinstance(issue.get('fields'), dict) else {}
+    issue_type = fields.get('issuetype') if isinstance(fields.get('issuetype'), dict) else {}
+    team = estimate_team(*issue_inputs(issue))
+    b = team['breakdown']
+    fib, raw, factors = estimate_fibonacci(*fibonacci_inputs(issue))
+    return {
+        'key': issue.get('key') or '',
+        'summary': fields.get('summary') or '',
+        'issue_type': issue_type.get('name') or '',
+        'estimated_points': _number(team['estimated_points']),
+        'base': _number(b['base']),
+        'complexity': _number(b['complexity']),
+        'uncertainty': _number(b['uncertainty']),
+        'testing': _number(b['testing']),
+        'total_raw': _number(b['total_raw']),
+        'should_split': team['should_split'] == 'true',
+        'confidence': team['confidence'],
+        'fibonacci_points': fib,
+        'fibonacci_raw': raw,
+        'fibonacci_factors': factors,
+    }
+
+
+def _read_issues(stream) -> Iterator[Tuple[int, Dict]]:
+    """Issues of an NDJSON stream; bad lines are reported on stderr and skipped"""
+    for number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            issue = json.loads(line)
+        except ValueError as e:
+            print(f"Skipping line {number}: {e}", file=sys.stderr)
+            continue
+        if not isinstance(issue, dict):
+            print(f"Skipping line {number}: not an issue object", file=sys.stderr)
+            continue
+        yield number, issue
+
+
+def write_batch(issues: Iterable[Tuple[int, Dict]], out, fmt: str = 'ndjson') -> int:
+    """Estimate every issue, writing one NDJSON or CSV row each; returns the row count"""
+    writer = None
+    if fmt == 'csv':
+        writer = csv.writer(out, lineterminator='\n')
+        writer.writerow(BATCH_COLUMNS)
+    count = 0
+    for _, issue in issues:
+        row = estimate_issue(issue)
+        if writer is None:
+            out.write(json.dumps(row, ensure_ascii=False) + '\n')
+        else:
+            writer.writerow([
+                str(v).lower() if isinstance(v, bool) else
+                '; '.join(v) if isinstance(v, list) else v
+                for v in (row[c] for c in BATCH_COLUMNS)
+            ])
+        count += 1
+    return count
+
+
+def render_team(estimate: Dict) -> str:
+    """The JSON document printed by estimate_story_points_team"""
+    b = estimate["breakdown"]
+    return (
+        '{\n'
+        f'  "estimated_points": {estimate["estimated_points"]},\n'
+        '  "breakdown": {\n'
+        f'    "base": {b["base"]},\n'
+        f'    "complexity": {b["complexity"]},\n'
+        f'    "uncertainty": {b["uncertainty"]},\n'
+        f'    "testing": {b["testing"]},\n'
+        f'    "total_raw": {b["total_raw"]}\n'
+        '  },\n'
+        f'  "reasoning": "{estimate["reasoning"]}",\n'
+        f'  "should_split": {estimate["should_split"]},\n'
+        f'  "confidence": "{estimate["confidence"]}"\n'
+        '}\n'
+    )
+
+
+# Bump when the estimators change in a way the keyword tables do not show
+ENGINE_REVISION = 1
+RULESET_VERSION = hashlib.sha256(json.dumps(
+    [ENGINE_REVISION, TEAM_TABLES, FIBONACCI_FACTORS]
+    + ([TEAM_WEIGHTS] if TEAM_WEIGHTS is not DEFAULT_TEAM_WEIGHTS else [])).encode()).hexdigest()[:12]
+SCALES = ('team', 'fibonacci')
+
+_TICKET_KEY = re.compile(r'[A-Z][A-Z0-9_]*-\d+')
+
+
+def memo_inputs(doc, scale: str) -> Tuple[str, ...]:
+    """The estimator inputs of a ticket after the estimator's own normalization"""
+    if scale == 'team':
+        return issue_inputs(doc)
+    description, summary = fibonacci_inputs(doc)
+    return description.translate(_LOWER), summary.translate(_LOWER)
+
+
+def content_hash(inputs: Sequence[str], scale: str) -> str:
+    return hashlib.sha256(json.dumps([RULESET_VERSION, scale, *inputs]).encode()).hexdigest()
+
+
+def render_estimate(inputs: Sequence[str], scale: str) -> str:
+    """estimate_story_points_team's JSON, or the Fibonacci points followed by the analysis"""
+    if scale == 'team':
+        return render_team(estimate_team(*inputs))
+    estimate, raw, factors = estimate_fibonacci(*inputs)
+    if not factors:
+        return f"{estimate}\n"
+    return (f"{estimate}\nAI Estimation Analysis:\n" + ''.join(f"  • {factor}\n" for factor in factors)
+            + f"  Raw score: {raw} → Fibonacci: {estimate}\n")
+
+
+class EstimateMemo:
+    """Estimates and posted estimation comments, on disk
+
+    estimates/<hash> holds an estimator output, comments/<TICKET> the
+    "<hash> <points>" of the last estimation comment posted on that ticket and
+    counters.json how many estimates and comments were skipped.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, *parts: str) -> str:
+        return os.path.join(self.directory, *parts)
+
+    def _write(self, path: str, text: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp, path)
+
+    def lookup(self, digest: str) -> Optional[str]:
+        try:
+            with open(self._path('estimates', digest), encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def store(self, digest: str, output: str):
+        self._write(self._path('estimates', digest), output)
+
+    def _comment_path(self, ticket: str) -> str:
+        if not _TICKET_KEY.fullmatch(ticket):
+            raise ValueError(f"Invalid ticket key: {ticket}")
+        return self._path('comments', ticket)
+
+    def comment_posted(self, ticket: str, digest: str, points: str) -> bool:
+        try:
+            with open(self._comment_path(ticket), encoding='utf-8') as f:
+                return f.read() == f"{digest} {points}"
+        except FileNotFoundError:
+            return False
+
+    def mark_comment(self, ticket: str, digest: str, points: str):
+        self._write(self._comment_path(ticket), f"{digest} {points}")
+
+    def count(self, counter: str) -> int:
+        """Adds one to a skip counter (estimates_skipped, comments_skipped); returns the new total"""
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._path('counters.json'), 'a+', encoding='utf-8') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            f.seek(0)
+            try:
+                counters = json.loads(f.read() or '{}')
+            except ValueError:
+                counters = {}
+            counters[counter] = counters.get(counter, 0) + 1
+            f.seek(0)
+            f.truncate()
+            f.write(json.dumps(counters, sort_keys=True))
+        return counters[counter]
+
+
+def memo_estimate(memo: EstimateMemo, doc, scale: str) -> Tuple[str, bool, str]:
+    """(content hash, whether it was memoized, estimator output) for one ticket"""
+    inputs = memo_inputs(doc, scale)
+    digest = content_hash(inputs, scale)
+    output = memo.lookup(digest)
+    if output is not None:
+        return digest, True, output
+    output = render_estimate(inputs, scale)
+    memo.store(digest, output)
+    return digest, False, output
+
+
+def _load_issue(text: str):
+    try:
+        return json.loads(text)
+    except ValueError as e:
+        print(f"jq: error: {e}", file=sys.stderr)
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+    if args[:1] == ['batch']:
+        parser = argparse.ArgumentParser(prog='jira_estimate.py batch',
+                                         description='Estimate NDJSON issues read from stdin')
+        parser.add_argument('--format', choices=('ndjson', 'csv'), default='ndjson')
+        opts = parser.parse_args(args[1:])
+        count = write_batch(_read_issues(sys.stdin), sys.stdout, opts.format)
+        print(f"Estimated {count} ticket(s)", file=sys.stderr)
+        return 0
+    if args[:1] == ['memo']:
+        parser = argparse.ArgumentParser(prog='jira_estimate.py memo',
+                                         description='Estimate the issue on stdin through the estimate memo')
+        parser.add_argument('--scale', choices=SCALES, required=True)
+        parser.add_argument('--cache-dir', required=True)
+        opts = parser.parse_args(args[1:])
+        memo = EstimateMemo(opts.cache_dir)
+        doc = _load_issue(sys.stdin.read())
+        if doc is None:
+            return 1
+        try:
+            digest, hit, output = memo_estimate(memo, doc, opts.scale)
+            skipped = memo.count('estimates_skipped') if hit else 0
+        except OSError as e:
+            print(f"Estimate memo failed: {e}", file=sys.stderr)
+            return 1
+        sys.stdout.write(f"{digest} {'hit' if hit else 'miss'} {skipped}\n{output}")
+        return 0
+    if args[:1] == ['comment']:
+        parser = argparse.ArgumentParser(prog='jira_estimate.py comment',
+                                         description='Check or record the estimation comment posted on a ticket')
+        parser.add_argument('--cache-dir', required=True)
+        parser.add_argument('--ticket', required=True)
+        parser.add_argument('--hash', required=True)
+        parser.add_argument('--points', required=True)
+        action = parser.add_mutually_exclusive_group(required=True)
+        action.add_argument('--check', action='store_true', help='exit 0 (printing the skip count) if already posted')
+        action.add_argument('--mark', action='store_true', help='record the comment as posted')
+        opts = parser.parse_args(args[1:])
+        memo = EstimateMemo(opts.cache_dir)
+        try:
+            if opts.mark:
+                memo.mark_comment(opts.ticket, opts.hash, opts.points)
+                return 0
+            if not memo.comment_posted(opts.ticket, opts.hash, opts.points):
+                return 1
+            print(memo.count('comments_skipped'))
+        except (OSError, ValueError) as e:
+            print(f"Estimate memo failed: {e}", file=sys.stderr)
+            return 1
+        return 0
+    if args != ['team']:
+        print('Usage: jira_estimate.py team < issue.json', file=sys.stderr)
+        print('       jira_estimate.py batch [--format ndjson|csv] < issues.ndjson', file=sys.stderr)
+        print('       jira_estimate.py memo --scale team|fibonacci --cache-dir DIR < issue.json', file=sys.stderr)
+        print('       jira_estimate.py comment --cache-dir DIR --ticket KEY --hash HASH --points N (--check | --mark)',
+              file=sys.stderr)
+        return 2
+    doc = _load_issue(sys.stdin.read())
+    summary, description, issue_type = issue_inputs(doc) if doc is not None else ('', '', '')
+    sys.stdout.write(render_team(estimate_team(summary, description, issue_type)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+jira_mirror.py
+
+Local SQLite FTS5 mirror of one JIRA project's tickets (key, summary, type, status,
+epic and the description flattened to text), used by scripts/lib/jira-mirror.sh to
+answer epic and text searches without a round trip to JIRA.
+
+Usage:
+  jira_mirror.py ingest --db mirror.sqlite --project RVV --synced-at EPOCH [--full] < issues.ndjson
+  jira_mirror.py status --db mirror.sqlite --project RVV
+  jira_mirror.py search --db mirror.sqlite --project RVV (--epic KEY | --text TEXT) [--max-results N]
+
+ingest reads issues as NDJSON (jira_search_stream output) and upserts them; with
+--full, tickets missing from the input are deleted. --synced-at is when the
+fetch started and becomes the watermark for the next incremental sync.
+
+status prints "<last sync epoch> <last full sync epoch> <tickets>" (zeros for a
+mirror that was never loaded).
+
+search prints matching tickets as NDJSON in the shape of a JIRA search result,
+ordered by key; the description comes back as a one-paragraph ADF document.
+Text queries match tickets containing every word (FTS5 prefix-free, case-insensitive).
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional
+
+# Columns row_issue() takes, in order
+ISSUE_COLUMNS = 'key, summary, issuetype, status, epic, description'
+
+# Fields jira-mirror.sh requests for a sync
+SYNC_FIELDS = 'summary,issuetype,status,description,parent,updated'
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    project TEXT NOT NULL,
+    num INTEGER NOT NULL,
+    summary TEXT NOT NULL DEFAULT '',
+    issuetype TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL DEFAULT '',
+    epic TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT '',
+    updated TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS issues_epic ON issues (project, epic);
+-- rowid of an issues_fts row is the rowid of its issues row
+CREATE VIRTUAL TABLE IF NOT EXISTS issues_fts USING fts5 (summary, description);
+CREATE TABLE IF NOT EXISTS sync_state (
+    project TEXT PRIMARY KEY,
+    last_sync INTEGER NOT NULL,
+    full_sync INTEGER NOT NULL
+);
+'''
+
+# Words left out of term counts (jira_similarity.py) and shingles (jira_dupes.py)
+STOP_WORDS = frozenset('''
+a an and are as at be been but by can could do does for from has have how if in into is it
+its may more must not of on or should so than that the their then there these this those to
+was we were what when where which while who will with would you your
+'''.split())
+
+# ADF nodes that end a line of text
+_BLOCK_NODES = {'paragraph', 'heading', 'listItem', 'codeBlock', 'blockquote', 'tableRow', 'rule'}
+
+
+def connect(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def flatten_adf(node) -> str:
+    """Plain text of an ADF document (or a plain string description)"""
+    if node is None:
+        return ''
+    if isinstance(node, str):
+        return node
+    parts: List[str] = []
+
+    def walk(n):
+        if isinstance(n, list):
+            for child in n:
+                walk(child)
+            return
+        if not isinstance(n, dict):
+            return
+        if n.get('type') == 'text':
+            parts.append(n.get('text', ''))
+        elif n.get('type') == 'hardBreak':
+            parts.append('\n')
+        walk(n.get('content') or [])
+        if n.get('type') in _BLOCK_NODES:
+            parts.append('\n')
+
+    walk(node)
+    return re.sub(r'\n{2,}', '\n', ''.join(parts)).strip()
+
+
+def _issue_row(issue: Dict) -> Optional[tuple]:
+    key = issue.get('key') or ''
+    match = re.fullmatch(r'([A-Z][A-Z0-9_]*)-(\d+)', key)
+    if not match:
+        return None
+    fields = issue.get('fields') or {}
+    return (
+        key, match.group(1), int(match.group(2)),
+        fields.get('summary') or '',
+        (fields.get('issuetype') or {}).get('name') or '',
+        (fields.get('status') or {}).get('name') or '',
+        (fields.get('parent') or {}).get('key') or '',
+        flatten_adf(fields.get('description')),
+        fields.get('updated') or '',
+    )
+
+
+def ingest(conn: sqlite3.Connection, project: str, issues: Iterable[Dict], synced_at: int, full: bool) -> int:
+    """Upsert issues of `project`; returns how many were written"""
+    seen = []
+    with conn:
+        for issue in issues:
+            row = _issue_row(issue)
+            if row is None or row[1] != project:
+                continue
+            # Upsert in place so the rowid, and with it the issues_fts row, is kept
+            conn.execute('INSERT INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET '
+                         'summary = excluded.summary, issuetype = excluded.issuetype, status = excluded.status, '
+                         'epic = excluded.epic, description = excluded.description, updated = excluded.updated',
+                         row)
+            rowid = conn.execute('SELECT rowid FROM issues WHERE key = ?', (row[0],)).fetchone()[0]
+            conn.execute('INSERT OR REPLACE INTO issues_fts (rowid, summary, description) VALUES (?, ?, ?)',
+                         (rowid, row[3], row[7]))
+            seen.append(row[0])
+        if full:
+            conn.execute('CREATE TEMP TABLE IF NOT EXISTS seen_keys (key TEXT PRIMARY KEY)')
+            conn.execute('DELETE FROM seen_keys')
+            conn.executemany('INSERT OR IGNORE INTO seen_keys VALUES (?)', ((k,) for k in seen))
+            conn.execute('DELETE FROM issues_fts WHERE rowid IN (SELECT rowid FROM issues WHERE project = ? '
+                         'AND key NOT IN (SELECT key FROM seen_keys))', (project,))
+            conn.execute('DELETE FROM issues WHERE project = ? AND key NOT IN (SELECT key FROM seen_keys)',
+                         (project,))
+        previous = conn.execute('SELECT full_sync FROM sync_state WHERE project = ?', (project,)).fetchone()
+        full_sync = synced_at if full or previous is None else previous[0]
+        conn.execute('INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)', (project, synced_at, full_sync))
+    return len(seen)
+
+
+def status(conn: sqlite3.Connection, project: str) -> str:
+    state = conn.execute('SELECT last_sync, full_sync FROM sync_state WHERE project = ?', (project,)).fetchone()
+    count = conn.execute('SELECT COUNT(*) FROM issues WHERE project = ?', (project,)).fetchone()[0]
+    last_sync, full_sync = state or (0, 0)
+    return f"{last_sync} {full_sync} {count}"
+
+
+def _fts_query(text: str) -> str:
+    """Every word of `text` as a quoted FTS5 term (implicit AND)"""
+    words = re.findall(r'\w+', text, re.UNICODE)
+    return ' '.join('"%s"' % w for w in words)
+
+
+def search(conn: sqlite3.Connection, project: str, epic: Optional[str] = None,
+           text: Optional[str] = None, max_results: int = 0) -> Iterator[Dict]:
+    """Tickets under `epic` and/or containing every word of `text`, ordered by key"""
+    sql = f'SELECT {ISSUE_COLUMNS} FROM issues WHERE project = ?'
+    params: List = [project]
+    if epic:
+        sql += ' AND epic = ?'
+        params.append(epic)
+    if text is not None:
+        query = _fts_query(text)
+        if not query:
+            return
+        sql += ' AND rowid IN (SELECT rowid FROM issues_fts WHERE issues_fts MATCH ?)'
+        params.append(query)
+    sql += ' ORDER BY num'
+    if max_results:
+        sql += ' LIMIT ?'
+        params.append(max_results)
+    for row in conn.execute(sql, params):
+        yield row_issue(*row)
+
+
+def row_issue(key: str, summary: str, issuetype: str, status_name: str, epic_key: str, description: str) -> Dict:
+    """A mirror row in the shape of a JIRA search result issue"""
+    fields = {
+        "summary": summary,
+        "issuetype": {"name": issuetype},
+        "status": {"name": status_name},
+        "description": {"type": "doc", "version": 1, "content": [
+            {"type": "paragraph", "content": [{"type": "text", "text": description}]}
+        ] if description else []},
+    }
+    if epic_key:
+        fields["parent"] = {"key": epic_key}
+    return {"key": key, "fields": fields}
+
+
+def _read_ndjson(stream) -> Iterator[Dict]:
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Local SQLite FTS5 mirror of JIRA tickets')
+    sub = parser.add_subparsers(dest='command', required=True)
+    for name in ('ingest', 'status', 'search'):
+        cmd = sub.add_parser(name)
+        cmd.add_argument('--db', required=True)
+        cmd.add_argument('--project', required=True)
+        if name == 'ingest':
+            cmd.add_argument('--synced-at', type=int, required=True)
+            cmd.add_argument('--full', action='store_true')
+        if name == 'search':
+            cmd.add_argument('--epic')
+            cmd.add_argument('--text')
+            cmd.add_argument('--max-results', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    try:
+        conn = connect(args.db)
+    except sqlite3.Error as e:
+        print(f"Error opening mirror {args.db}: {e}", file=sys.stderr)
+        return 1
+    try:
+        if args.command == 'ingest':
+            count = ingest(conn, args.project, _read_ndjson(sys.stdin), args.synced_at, args.full)
+            print(count)
+        elif args.command == 'status':
+            print(status(conn, args.project))
+        else:
+            if not args.epic and args.text is None:
+                parser.error('search needs --epic or --text')
+            for issue in search(conn, args.project, args.epic, args.text, args.max_results):
+                sys.stdout.write(json.dumps(issue) + '\n')
+    except (sqlite3.Error, ValueError) as e:
+        print(f"Mirror {args.command} failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
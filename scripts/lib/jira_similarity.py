@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+jira_similarity.py
+
+Ranks tickets by TF-IDF cosine similarity to a target ticket, used by
+find-related-tickets.sh --similar.
+
+Usage:
+  jira_similarity.py --target target.json [--top 10] [--min-score 0.05] < candidates.ndjson
+  jira_similarity.py --target target.json --db mirror.sqlite --project RVV [--top 10]
+
+The target is an issue JSON (summary and description). Candidates are either
+NDJSON in the shape of jira_search_stream output or every ticket of a project
+in the local mirror (scripts/lib/jira_mirror.py). Prints the top candidates as
+NDJSON, best first, each with a "score" (cosine similarity, 0-1). The target
+itself is never returned.
+
+Terms are lowercase words of two or more characters from the summary (counted
+twice) and the description, minus common English stop words; weights are
+sublinear tf times smoothed idf over the candidate set, rows L2-normalized.
+
+With NumPy installed the candidates become a CSR matrix and a query is a
+handful of array operations. For the mirror the matrix is kept next to the
+database (mirror-<PROJECT>.tfidf.npz) and rebuilt on the first query after a
+sync, so ranking a whole project only tokenizes the target. Without NumPy the
+same scores are computed in pure Python on every query.
+"""
+
+import argparse
+import heapq
+import json
+import math
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from jira_mirror import ISSUE_COLUMNS, STOP_WORDS, flatten_adf, row_issue
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised where NumPy is missing
+    np = None
+
+_WORD = re.compile(r'[a-z0-9][a-z0-9_]+')
+
+def text_terms(summary: str, description: str) -> Counter:
+    """Term counts for one ticket (summary weighted twice)"""
+    terms = Counter(_WORD.findall(summary.lower()))
+    terms += terms
+    terms.update(_WORD.findall(description.lower()))
+    for word in STOP_WORDS.intersection(terms):
+        del terms[word]
+    return terms
+
+
+def issue_terms(issue: Dict) -> Counter:
+    fields = issue.get('fields') or {}
+    return text_terms(fields.get('summary') or '', flatten_adf(fields.get('description')))
+
+
+def _tf(count: float) -> float:
+    return 1.0 + math.log(count)
+
+
+def _idf(df: int, n: int) -> float:
+    return math.log((1 + n) / (1 + df)) + 1.0
+
+
+class TfidfIndex:
+    """Row-normalized TF-IDF matrix of a ticket set in CSR form (needs NumPy)"""
+
+    def __init__(self, keys, vocab, idf, indptr, indices, data, stamp: int = 0):
+        self.keys = keys          # row -> ticket key
+        self.vocab = vocab        # sorted terms; column i is vocab[i]
+        self.idf = idf
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.stamp = stamp        # mirror sync the index was built from
+
+    @classmethod
+    def build(cls, keys: Sequence[str], docs: Sequence[Counter], stamp: int = 0) -> 'TfidfIndex':
+        n = len(docs)
+        vocab = sorted(set().union(*docs)) if docs else []
+        column = {term: i for i, term in enumerate(vocab)}
+        lengths = np.fromiter((len(d) for d in docs), dtype=np.int64, count=n)
+        nnz = int(lengths.sum())
+        indptr = np.concatenate(([0], np.cumsum(lengths)))
+        indices = np.fromiter((column[t] for d in docs for t in d), dtype=np.int32, count=nnz)
+        counts = np.fromiter((c for d in docs for c in d.values()), dtype=np.float64, count=nnz)
+        idf = np.log((1 + n) / (1 + np.bincount(indices, minlength=len(vocab)))) + 1.0
+        data = (1.0 + np.log(counts)) * idf[indices]
+        rows = np.repeat(np.arange(n), lengths)
+        norms = np.sqrt(np.bincount(rows, weights=data * data, minlength=n))
+        if nnz:
+            data /= norms[rows]
+        return cls(np.array(keys, dtype=str), np.array(vocab, dtype=str), idf, indptr, indices, data, stamp)
+
+    def save(self, path: str) -> None:
+        """Write atomically, so concurrent queries never read half an index"""
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.npz')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, keys=self.keys, vocab=self.vocab, idf=self.idf, indptr=self.indptr,
+                         indices=self.indices, data=self.data, stamp=np.int64(self.stamp))
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> 'TfidfIndex':
+        with np.load(path, allow_pickle=False) as f:
+            return cls(f['keys'], f['vocab'], f['idf'], f['indptr'], f['indices'], f['data'], int(f['stamp']))
+
+    def scores(self, query: Counter) -> List[float]:
+        """Cosine similarity of every row to the query"""
+        n = len(self.keys)
+        terms = list(query)
+        if not terms or not len(self.vocab):
+            return [0.0] * n
+        pos = np.minimum(np.searchsorted(self.vocab, terms), len(self.vocab) - 1)
+        known = self.vocab[pos] == np.array(terms, dtype=str)
+        columns = pos[known]
+        q = np.zeros(len(self.vocab))
+        q[columns] = (1.0 + np.log(np.array([query[t] for t in terms], dtype=np.float64)[known])) * self.idf[columns]
+        q_norm = float(np.sqrt(q[columns] @ q[columns]))
+        if q_norm == 0.0:
+            return [0.0] * n
+        rows = np.repeat(np.arange(n), np.diff(self.indptr))
+        return (np.bincount(rows, weights=self.data * q[self.indices], minlength=n) / q_norm).tolist()
+
+
+def _scores_python(query: Counter, docs: Sequence[Counter]) -> List[float]:
+    n = len(docs)
+    df: Counter = Counter()
+    for terms in docs:
+        df.update(terms.keys())
+    idf = {term: _idf(count, n) for term, count in df.items()}
+    q = {term: _tf(count) * idf[term] for term, count in query.items() if term in idf}
+    q_norm = math.sqrt(sum(w * w for w in q.values()))
+    scores = [0.0] * n
+    if q_norm == 0.0:
+        return scores
+    for row, terms in enumerate(docs):
+        shared = q.keys() & terms.keys()
+        if not shared:
+            continue
+        dot = sum(_tf(terms[t]) * idf[t] * q[t] for t in shared)
+        norm = math.sqrt(sum((_tf(c) * idf[t]) ** 2 for t, c in terms.items()))
+        scores[row] = dot / (norm * q_norm)
+    return scores
+
+
+def _best(scores: Sequence[float], keys: Sequence[str], exclude: str, top: int,
+          min_score: float) -> List[Tuple[float, int]]:
+    """(score, row) of the best rows, highest score first, then input order"""
+    scored = [(score, row) for row, score in enumerate(scores) if score > min_score and keys[row] != exclude]
+    order = lambda item: (-item[0], item[1])  # noqa: E731
+    best = heapq.nsmallest(top, scored, key=order) if top else sorted(scored, key=order)
+    return [(round(score, 4), row) for score, row in best]
+
+
+def rank(target: Dict, candidates: Iterable[Dict], top: int = 10,
+         min_score: float = 0.0) -> List[Tuple[float, Dict]]:
+    """Top `top` candidates (0 = all) scoring above `min_score`, best first"""
+    issues = list(candidates)
+    keys = [issue.get('key') for issue in issues]
+    docs = [issue_terms(issue) for issue in issues]
+    query = issue_terms(target)
+    scores = TfidfIndex.build(keys, docs).scores(query) if np is not None else _scores_python(query, docs)
+    return [(score, issues[row]) for score, row in _best(scores, keys, target.get('key'), top, min_score)]
+
+
+def index_path(db_path: str) -> str:
+    return os.path.splitext(db_path)[0] + '.tfidf.npz'
+
+
+def _mirror_index(conn: sqlite3.Connection, project: str, path: str, stamp: int) -> 'TfidfIndex':
+    """The project's index, rebuilt when the mirror was synced since it was written"""
+    try:
+        index = TfidfIndex.load(path)
+        if index.stamp == stamp:
+            return index
+    except (OSError, ValueError, KeyError):
+        pass
+    rows = conn.execute('SELECT key, summary, description FROM issues WHERE project = ? ORDER BY num',
+                        (project,)).fetchall()
+    index = TfidfIndex.build([r[0] for r in rows], [text_terms(r[1], r[2]) for r in rows], stamp)
+    try:
+        index.save(path)
+    except OSError as e:
+        print(f"Warning: could not save similarity index {path}: {e}", file=sys.stderr)
+    return index
+
+
+def rank_mirror(db_path: str, project: str, target: Dict, top: int = 10,
+                min_score: float = 0.0) -> List[Tuple[float, Dict]]:
+    """rank() over every ticket of `project` in the local mirror"""
+    conn = sqlite3.connect(db_path)
+    try:
+        state = conn.execute('SELECT last_sync FROM sync_state WHERE project = ?', (project,)).fetchone()
+        query = issue_terms(target)
+        if np is not None:
+            index = _mirror_index(conn, project, index_path(db_path), state[0] if state else 0)
+            keys = index.keys.tolist()
+            scores = index.scores(query)
+        else:
+            rows = conn.execute('SELECT key, summary, description FROM issues WHERE project = ? ORDER BY num',
+                                (project,)).fetchall()
+            keys = [r[0] for r in rows]
+            scores = _scores_python(query, [text_terms(r[1], r[2]) for r in rows])
+        best = _best(scores, keys, target.get('key'), top, min_score)
+        ranked = []
+        for score, row in best:
+            found = conn.execute(f'SELECT {ISSUE_COLUMNS} FROM issues WHERE key = ?', (keys[row],)).fetchone()
+            if found:
+                ranked.append((score, row_issue(*found)))
+        return ranked
+    finally:
+        conn.close()
+
+
+def _read_ndjson(stream) -> Iterator[Dict]:
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Rank tickets by TF-IDF cosine similarity to a target ticket')
+    parser.add_argument('--target', required=True, help='Issue JSON file of the target ticket')
+    parser.add_argument('--top', type=int, default=10, help='Results to return (0 = all)')
+    parser.add_argument('--min-score', type=float, default=0.0, help='Drop candidates scoring at or below this')
+    parser.add_argument('--db', help='Rank every ticket of --project in this mirror instead of stdin')
+    parser.add_argument('--project')
+    args = parser.parse_args(argv)
+    if args.db and not args.project:
+        parser.error('--db needs --project')
+
+    try:
+        with open(args.target) as f:
+            target = json.load(f)
+        if args.db:
+            ranked = rank_mirror(args.db, args.project, target, args.top, args.min_score)
+        else:
+            ranked = rank(target, _read_ndjson(sys.stdin), args.top, args.min_score)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"Similarity ranking failed: {e}", file=sys.stderr)
+        return 1
+    for score, issue in ranked:
+        sys.stdout.write(json.dumps({**issue, "score": score}) + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
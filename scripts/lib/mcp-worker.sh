@@ -0,0 +1,88 @@
+#!/usr/bin/env bash
+
+# Warm worker for the MCP server (see ScriptPool / BashWorkerPool in
+# mcp-server/jira_bash_wrapper.py).
+#
+# The libraries and .env are loaded once when the worker starts. Each job then
+# runs a script by sourcing it in a forked subshell, so it starts from the
+# already-loaded state instead of paying for a new bash, library parsing and
+# load_env on every tool call.
+#
+# Protocol (stdin, NUL-separated fields):
+#   cwd script stdin-file stdout-file stderr-file
+#   N env-assignments... N unset-names... N args...
+# The worker prints "READY" once loaded and "DONE <exit-code>" after each job.
+# Jobs run one at a time, so $$ (the worker's PID) is still unique among the
+# scripts running concurrently across workers.
+# It exits on EOF; the server kills its process group to cancel a job.
+
+if (( BASH_VERSINFO[0] < 5 )); then
+    echo "mcp-worker.sh needs bash 5+ (running ${BASH_VERSION})" >&2
+    exit 3
+fi
+
+_w_lib_dir="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+# shellcheck source=./utils.sh
+source "${_w_lib_dir}/utils.sh"
+# shellcheck source=./jira-api.sh
+source "${_w_lib_dir}/jira-api.sh"
+# shellcheck source=./jira-search.sh
+source "${_w_lib_dir}/jira-search.sh"
+# shellcheck source=./confluence-api.sh
+source "${_w_lib_dir}/confluence-api.sh"
+# shellcheck source=./jira-format.sh
+source "${_w_lib_dir}/jira-format.sh"
+# shellcheck source=./github-api.sh
+source "${_w_lib_dir}/github-api.sh"
+# shellcheck source=./jira-estimate.sh
+source "${_w_lib_dir}/jira-estimate.sh"
+# shellcheck source=./jira-estimate-team.sh
+source "${_w_lib_dir}/jira-estimate-team.sh"
+
+load_env "${_w_lib_dir}/../../.env"
+
+# The libraries turn on errexit/nounset; the loop itself must survive failing jobs
+set +euo pipefail
+
+# Usage: _w_read <var>
+_w_read() {
+    IFS= read -r -d '' "$1"
+}
+
+# Usage: _w_read_list <array-var>   (count followed by that many fields)
+_w_read_list() {
+    local -n _w_list="$1"
+    local _w_n _w_i _w_item
+    _w_read _w_n || return 1
+    _w_list=()
+    for (( _w_i = 0; _w_i < _w_n; _w_i++ )); do
+        _w_read _w_item || return 1
+        _w_list+=("$_w_item")
+    done
+}
+
+printf 'READY\n'
+
+while _w_read _w_cwd; do
+    _w_read _w_script && _w_read _w_in && _w_read _w_out && _w_read _w_err &&
+        _w_read_list _w_env && _w_read_list _w_unset && _w_read_list _w_args || exit 1
+
+    (
+        cd "$_w_cwd" || exit 1
+        for _w_var in "${_w_env[@]}"; do
+            export "$_w_var" 2>/dev/null
+        done
+        for _w_var in "${_w_unset[@]}"; do
+            unset "$_w_var" 2>/dev/null
+        done
+        # The script sees itself as $0 and its own arguments, as if it had been exec'd
+        BASH_ARGV0="$_w_script"
+        set -- "${_w_args[@]}"
+        unset _w_env _w_unset _w_args _w_var _w_cwd _w_in _w_out _w_err
+        # shellcheck disable=SC1090
+        source "$_w_script"
+    ) <"$_w_in" >"$_w_out" 2>"$_w_err"
+
+    printf 'DONE %d\n' "$?"
+done
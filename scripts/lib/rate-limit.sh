@@ -0,0 +1,181 @@
+#!/usr/bin/env bash
+
+# Shared rate-limit governor for Jira and Confluence calls
+#
+# atlassian_curl is a drop-in for curl. Before each request it takes a token from
+# a token bucket shared by every process of this user: the bucket lives in a
+# state file under JIRA_RATE_LIMIT_DIR and is updated under flock. jira-sync.sh,
+# interactive grooms and the MCP server (mcp-server/jira_client.py reads the same
+# files) therefore spend one request budget. HTTP 429 responses are retried with
+# exponential backoff and jitter, waiting at least Retry-After; the pause is
+# written to the shared state so the other processes hold off too.
+#
+# State file (one line): tokens_micro last_us blocked_until_us requests wait_ms throttled
+#
+# Note: This is a library file meant to be sourced.
+# Do not use 'set -euo pipefail' here as it affects the calling script.
+
+# Load once per shell (scripts/lib/mcp-worker.sh preloads the libraries)
+if [[ -n "${_RATE_LIMIT_SH_LOADED:-}" ]]; then
+    return 0
+fi
+_RATE_LIMIT_SH_LOADED=1
+
+# Without flock(1) (e.g. stock macOS) each process still honours 429/Retry-After,
+# but bucket updates are not serialized between processes
+_RL_FLOCK=""
+command -v flock >/dev/null 2>&1 && _RL_FLOCK=1
+
+# Directory holding the shared bucket: lock, state, per-process header files
+_rl_dir() {
+    _RL_DIR="${JIRA_RATE_LIMIT_DIR:-${TMPDIR:-/tmp}}"
+    [[ -n "${JIRA_RATE_LIMIT_DIR:-}" ]] || _RL_DIR="${_RL_DIR%/}/jira-rate-limit-${UID:-0}"
+    [[ -d "$_RL_DIR" ]] || mkdir -p "$_RL_DIR" 2>/dev/null || _RL_DIR=""
+    return 0
+}
+
+_rl_now() {
+    if [[ -n "${EPOCHREALTIME:-}" ]]; then
+        _RL_NOW="${EPOCHREALTIME/[.,]/}"
+    else
+        _RL_NOW="$(date +%s)000000"
+    fi
+}
+
+_rl_load() {
+    _rl_tokens=0 _rl_last=0 _rl_blocked=0 _rl_requests=0 _rl_wait_ms=0 _rl_throttled=0
+    if [[ -f "$_RL_DIR/state" ]]; then
+        read -r _rl_tokens _rl_last _rl_blocked _rl_requests _rl_wait_ms _rl_throttled < "$_RL_DIR/state" || true
+    fi
+    local v
+    for v in _rl_tokens _rl_last _rl_blocked _rl_requests _rl_wait_ms _rl_throttled; do
+        [[ "${!v:-}" =~ ^-?[0-9]+$ ]] || printf -v "$v" '%d' 0
+    done
+}
+
+_rl_store() {
+    printf '%d %d %d %d %d %d\n' "$_rl_tokens" "$_rl_last" "$_rl_blocked" \
+        "$_rl_requests" "$_rl_wait_ms" "$_rl_throttled" > "$_RL_DIR/state"
+}
+
+# Usage: _rl_locked <function> [args...]   (runs it while holding the bucket lock)
+_rl_locked() {
+    if [[ -n "$_RL_FLOCK" ]]; then
+        { flock -x 9 && "$@"; } 9>>"$_RL_DIR/lock"
+    else
+        "$@"
+    fi
+}
+
+# Take one token; sets _RL_WAIT_US to how long the caller must sleep first
+_rl_take() {
+    local rps="$1" cap=$(( $2 * 1000000 ))
+    _rl_load
+    _rl_now
+    if (( rps > 0 )); then
+        (( _rl_last == 0 )) && _rl_tokens=$cap     # a new bucket starts full
+        _rl_tokens=$(( _rl_tokens + (_RL_NOW - _rl_last) * rps ))
+        (( _rl_tokens > cap )) && _rl_tokens=$cap
+        # Reserve the token now; a negative balance is the queue of waiting callers
+        _rl_tokens=$(( _rl_tokens - 1000000 ))
+    fi
+    _RL_WAIT_US=0
+    (( _rl_tokens < 0 && rps > 0 )) && _RL_WAIT_US=$(( -_rl_tokens / rps ))
+    (( _rl_blocked - _RL_NOW > _RL_WAIT_US )) && _RL_WAIT_US=$(( _rl_blocked - _RL_NOW ))
+    _rl_last=$_RL_NOW
+    _rl_requests=$(( _rl_requests + 1 ))
+    _rl_wait_ms=$(( _rl_wait_ms + _RL_WAIT_US / 1000 ))
+    _rl_store
+}
+
+# Pause every process until <delay_us> from now
+_rl_block() {
+    _rl_load
+    _rl_now
+    (( _RL_NOW + $1 > _rl_blocked )) && _rl_blocked=$(( _RL_NOW + $1 ))
+    _rl_throttled=$(( _rl_throttled + 1 ))
+    _rl_store
+}
+
+# Wait for a request slot (token bucket and any shared 429 pause)
+# Usage: rate_limit_acquire
+rate_limit_acquire() {
+    local rps="${JIRA_RATE_LIMIT_RPS:-10}"
+    _RL_WAIT_US=0
+    _rl_dir
+    [[ -n "$_RL_DIR" ]] || return 0
+    _rl_locked _rl_take "$rps" "${JIRA_RATE_LIMIT_BURST:-10}" || return 0
+    if (( _RL_WAIT_US > 0 )); then
+        local secs
+        printf -v secs '%d.%06d' $(( _RL_WAIT_US / 1000000 )) $(( _RL_WAIT_US % 1000000 ))
+        sleep "$secs"
+        if [[ "${JIRA_MCP_PHASE_MARKERS:-}" == "1" ]]; then
+            echo "::jira-mcp-phase name=throttle_wait ms=$(( _RL_WAIT_US / 1000 ))" >&2
+        fi
+    fi
+    return 0
+}
+
+# Record a 429: back off exponentially with jitter, at least Retry-After
+# Usage: rate_limit_backoff <attempt> [retry_after_seconds]
+rate_limit_backoff() {
+    local attempt="$1" retry_after="${2:-}"
+    local base_us=$(( ${JIRA_RATE_LIMIT_BACKOFF_MS:-1000} * 1000 ))
+    local max_us=$(( ${JIRA_RATE_LIMIT_MAX_BACKOFF_MS:-60000} * 1000 ))
+    local delay_us=$(( base_us << attempt ))
+    (( delay_us > max_us )) && delay_us=$max_us
+    # Equal jitter: half fixed, half random, so throttled processes spread out
+    delay_us=$(( delay_us / 2 + RANDOM * (delay_us / 2) / 32767 ))
+    if [[ "$retry_after" =~ ^[0-9]+$ ]] && (( retry_after * 1000000 > delay_us )); then
+        delay_us=$(( retry_after * 1000000 + RANDOM * 250000 / 32767 ))
+    fi
+    echo -e "${YELLOW:-}⚠️  Rate limited by Atlassian (HTTP 429), retrying in $(( delay_us / 1000 ))ms${NC:-}" >&2
+    _rl_dir
+    [[ -n "$_RL_DIR" ]] && _rl_locked _rl_block "$delay_us"
+    return 0
+}
+
+# curl through the governor; same arguments and output as curl
+# Usage: atlassian_curl [curl args...]
+atlassian_curl() {
+    local max_retries="${JIRA_RATE_LIMIT_MAX_RETRIES:-5}"
+    local attempt=0 out rc status retry_after line hdr
+    while true; do
+        rate_limit_acquire
+        # BASHPID keeps concurrent subshells apart (bash 3.2 has only $$)
+        hdr="${_RL_DIR:-${TMPDIR:-/tmp}}/headers.${BASHPID:-$$.$RANDOM}"
+        rc=0
+        out=$(curl "$@" -D "$hdr") || rc=$?
+        status="" retry_after=""
+        if [[ -f "$hdr" ]]; then
+            # The last status line wins (redirects and 100-continue add earlier ones)
+            while IFS= read -r line; do
+                line="${line%$'\r'}"
+                case "$line" in
+                    HTTP/*) status="${line#* }"; status="${status%% *}"; retry_after="" ;;
+                    [Rr][Ee][Tt][Rr][Yy]-[Aa][Ff][Tt][Ee][Rr]:*) retry_after="${line#*:}"; retry_after="${retry_after// /}" ;;
+                esac
+            done < "$hdr"
+            rm -f "$hdr"
+        fi
+        if [[ "$status" == "429" ]] && (( attempt < max_retries )); then
+            rate_limit_backoff "$attempt" "$retry_after"
+            attempt=$(( attempt + 1 ))
+            continue
+        fi
+        printf '%s' "$out"
+        return $rc
+    done
+}
+
+# Print cumulative governor totals shared by all processes: requests wait_ms throttled
+# Usage: rate_limit_totals
+rate_limit_totals() {
+    _rl_dir
+    if [[ -z "$_RL_DIR" ]]; then
+        echo "0 0 0"
+        return 0
+    fi
+    _rl_load
+    echo "$_rl_requests $_rl_wait_ms $_rl_throttled"
+}
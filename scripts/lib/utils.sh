@@ -4,6 +4,12 @@
 
 set -euo pipefail
 
+# Load once per shell (scripts/lib/mcp-worker.sh preloads the libraries)
+if [[ -n "${_UTILS_SH_LOADED:-}" ]]; then
+    return 0
+fi
+_UTILS_SH_LOADED=1
+
 # Colors
 RED='\033[0;31m'
 GREEN='\033[0;32m'
@@ -35,14 +41,32 @@ debug() {
     fi
 }
 
+# Phase timing markers for the MCP server's metrics (silent unless JIRA_MCP_PHASE_MARKERS=1)
+# Usage: phase_start <name>; ...; phase_end <name>
+# phase_end prints "::jira-mcp-phase name=<name> ms=<elapsed>" on stderr.
+# Uses $EPOCHREALTIME (bash 5+, no fork); older shells skip the markers.
+phase_start() {
+    [[ "${JIRA_MCP_PHASE_MARKERS:-}" == "1" && -n "${EPOCHREALTIME:-}" ]] || return 0
+    printf -v "_PHASE_T0_$1" '%s' "${EPOCHREALTIME/[.,]/}"
+}
+
+phase_end() {
+    [[ "${JIRA_MCP_PHASE_MARKERS:-}" == "1" && -n "${EPOCHREALTIME:-}" ]] || return 0
+    local start_var="_PHASE_T0_$1"
+    [[ -n "${!start_var:-}" ]] || return 0
+    local now="${EPOCHREALTIME/[.,]/}"
+    echo "::jira-mcp-phase name=$1 ms=$(( (now - ${!start_var}) / 1000 ))" >&2
+    unset "$start_var"
+}
+
 # Load environment from .env file
 load_env() {
     local env_file="${1:-.env}"
 
     # If a test env exists next to the requested env file, prefer it.
     # e.g., if env_file is ./.env or /path/to/.env then check for .env.test.local
-    local env_dir
-    env_dir=$(dirname "$env_file")
+    local env_dir="."
+    [[ "$env_file" == */* ]] && env_dir="${env_file%/*}"
     local test_env_file="$env_dir/.env.test.local"
     if [[ -f "$test_env_file" ]]; then
         env_file="$test_env_file"
@@ -72,6 +96,29 @@ validate_ticket_key() {
     return 0
 }
 
+# Read a prefetched issue JSON (as returned by jira_get_issue) from a file or stdin
+# Usage: read_issue_json <file|->
+read_issue_json() {
+    local source="$1"
+    local data
+    
+    if [[ "$source" == "-" ]]; then
+        data=$(cat)
+    elif [[ -f "$source" ]]; then
+        data=$(cat "$source")
+    else
+        error "Issue JSON file not found: $source"
+        return 1
+    fi
+    
+    if ! echo "$data" | jq -e '.fields' >/dev/null 2>&1; then
+        error "Invalid issue JSON (expected a JIRA issue with .fields): $source"
+        return 1
+    fi
+    
+    echo "$data"
+}
+
 # Truncate text to max length
 truncate_text() {
     local text="$1"
@@ -4,21 +4,99 @@ Simple mock JIRA HTTP server used for integration testing.
 Provides deterministic responses for a couple of endpoints used by tests:
 - GET /rest/api/3/issue/OK-1 -> 200 with JSON {"key": "OK-1"}
 - GET /rest/api/3/issue/AUTH-1 -> 401 with plain text
+- GET /rest/api/3/issue/DENY-1 -> 403, GET /rest/api/3/issue/GONE-1 -> 404
+- GET /rest/api/3/issue/MOCK-<n>[/transitions] -> 200 with a synthetic issue / transitions
+  (honours ?fields=a,b like Jira: only those fields are returned; summary from `edits`)
+- PUT /rest/api/3/issue/MOCK-<n> -> 204
+- POST /rest/api/3/issue -> 201 with the next MOCK key after the project's tickets
+- POST /rest/api/3/issue/MOCK-<n>/comment -> 201 (recorded in `comments`), POST .../transitions -> 204
+  (400 for an unknown id)
+- POST /rest/api/3/search/jql -> 200 with maxResults synthetic MOCK issues, or for
+  "key in (A, B)" issues A and B (400 like Jira if any is not a MOCK-<n> key), or for
+  "mocktotal = N" MOCK-1..N in pages of maxResults linked by nextPageToken (honours "fields"); adding
+  "AND updated >= -Xm" returns only the keys in the server's `edits` (key -> summary);
+  "project = MOCK" behaves like "mocktotal = <project_total>" (default 30) with every
+  even-numbered issue under the epic MOCK-1
+- GET /rest/api/3/issue/THROTTLE-<n> -> 429 (Retry-After: 1) for the first n requests, then 200
 - GET /health -> 200 OK (used to wait for readiness)
 
-Run: python3 scripts/mock_jira.py --port 8765
+Speaks HTTP/1.1 with keep-alive, so pooled clients can reuse connections.
+
+Run: python3 scripts/mock_jira.py --port 8765 [--quiet]
 """
 import argparse
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import json
+import re
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+_MOCK_ISSUE = re.compile(r'^/rest/api/3/issue/(MOCK-\d+)(/transitions|/comment)?(?:\?(.*))?$')
+_MOCK_TOTAL = re.compile(r'mocktotal\s*=\s*(\d+)')
+_PROJECT = re.compile(r'^project\s*=\s*MOCK\b', re.IGNORECASE)
+_KEY_IN = re.compile(r'^key in \(([^)]*)\)$', re.IGNORECASE)
+_THROTTLED_ISSUE = re.compile(r'^/rest/api/3/issue/(THROTTLE-(\d+))(?:\?.*)?$')
+
+TRANSITIONS = [
+    {"id": "11", "name": "To Do"},
+    {"id": "21", "name": "In Progress"},
+    {"id": "31", "name": "Done"},
+]
+
+
+def mock_issue(key, fields=None, summary=None):
+    issue = {
+        "key": key,
+        "fields": {
+            "summary": summary or f"Mock issue {key}",
+            "issuetype": {"name": "Story"},
+            "status": {"name": "To Do"},
+            "updated": "2024-01-01T00:00:00.000+0000",
+            "description": {"type": "doc", "version": 1, "content": [
+                {"type": "paragraph", "content": [{"type": "text", "text": f"Description of {key}"}]}
+            ]},
+            "customfield_10016": None,
+            "labels": ["mock"],
+            "comment": {"comments": [], "total": 0},
+        },
+    }
+    if fields:
+        issue["fields"] = {name: value for name, value in issue["fields"].items() if name in fields}
+    return issue
+
+
+def requested_fields(query):
+    """Field names from a ?fields=a,b query string (None means all fields)"""
+    values = parse_qs(query or '').get('fields')
+    return set(','.join(values).split(',')) if values else None
+
 
 class MockJiraHandler(BaseHTTPRequestHandler):
-    def _send(self, code, body, content_type='application/json'):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are separate writes; without this, keep-alive clients stall on delayed ACKs
+    disable_nagle_algorithm = True
+    quiet = False
+    # Requests seen per THROTTLE-<n> key (shared by all handler threads)
+    throttle_hits = {}
+    # Issues edited since the last search: key -> new summary
+    edits = {}
+    # Tickets in the MOCK project ("project = MOCK" searches)
+    project_total = 30
+    # Comments posted: (key, request body)
+    comments = []
+
+    def _send(self, code, body, content_type='application/json', headers=None):
         self.send_response(code)
         self.send_header('Content-Type', content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
         self.send_header('Content-Length', str(len(body.encode('utf-8'))))
         self.end_headers()
         self.wfile.write(body.encode('utf-8'))
 
+    def _read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
     def do_GET(self):
         path = self.path
         if path.startswith('/rest/api/3/issue/OK-1'):
@@ -27,24 +105,130 @@ class MockJiraHandler(BaseHTTPRequestHandler):
         if path.startswith('/rest/api/3/issue/AUTH-1'):
             self._send(401, 'Authentication failed', content_type='text/plain')
             return
+        if path.startswith('/rest/api/3/issue/DENY-1'):
+            self._send(403, '{"errorMessages":["Forbidden"]}')
+            return
+        if path.startswith('/rest/api/3/issue/GONE-1'):
+            self._send(404, '{"errorMessages":["Issue does not exist"]}')
+            return
+        throttled = _THROTTLED_ISSUE.match(path)
+        if throttled:
+            key = throttled.group(1)
+            self.throttle_hits[key] = self.throttle_hits.get(key, 0) + 1
+            if self.throttle_hits[key] <= int(throttled.group(2)):
+                self._send(429, '{"errorMessages":["Rate limit exceeded"]}', headers={'Retry-After': '1'})
+            else:
+                self._send(200, json.dumps(mock_issue(key)))
+            return
+        match = _MOCK_ISSUE.match(path)
+        if match and match.group(2) == '/transitions':
+            self._send(200, json.dumps({"transitions": TRANSITIONS}))
+            return
+        if match and not match.group(2):
+            self._send(200, json.dumps(mock_issue(match.group(1), requested_fields(match.group(3)),
+                                                  self.edits.get(match.group(1)))))
+            return
         if path.startswith('/health'):
             self._send(200, 'OK', content_type='text/plain')
             return
         # default
         self._send(500, '{}')
 
+    def do_PUT(self):
+        self._read_body()
+        match = _MOCK_ISSUE.match(self.path)
+        if match and not match.group(2):
+            self._send(204, '')
+            return
+        self._send(500, '{}')
+
+    def do_POST(self):
+        body = self._read_body()
+        if self.path == '/rest/api/3/search/jql':
+            request = json.loads(body or b'{}')
+            count = int(request.get('maxResults', 50))
+            fields = set(request.get('fields') or []) or None
+            jql = request.get('jql', '').strip()
+            keys = _KEY_IN.match(jql)
+            total = _MOCK_TOTAL.search(jql)
+            project = _PROJECT.match(jql)
+            if project:
+                total = self.project_total
+            elif total:
+                total = int(total.group(1))
+            if total and 'updated >=' in jql:
+                issues = [self._search_issue(key, fields, summary, project)
+                          for key, summary in sorted(self.edits.items())]
+                self._send(200, json.dumps({"issues": issues[:count], "isLast": True}))
+                return
+            if total:
+                start = int(request.get('nextPageToken') or 0)
+                end = min(start + count, total)
+                page = {"issues": [self._search_issue(f"MOCK-{n}", fields, self.edits.get(f"MOCK-{n}"), project)
+                                   for n in range(start + 1, end + 1)],
+                        "isLast": end >= total}
+                if not page["isLast"]:
+                    page["nextPageToken"] = str(end)
+                self._send(200, json.dumps(page))
+                return
+            if keys:
+                wanted = [key.strip() for key in keys.group(1).split(',')]
+                unknown = [key for key in wanted if not re.fullmatch(r'MOCK-\d+', key)]
+                if unknown:
+                    self._send(400, json.dumps({"errorMessages": [
+                        f"An issue with key '{key}' does not exist for field 'key'." for key in unknown]}))
+                    return
+                issues = [mock_issue(key, fields) for key in wanted][:count]
+            else:
+                issues = [mock_issue(f"MOCK-{n}", fields) for n in range(1, count + 1)]
+            self._send(200, json.dumps({"issues": issues, "isLast": True}))
+            return
+        if self.path == '/rest/api/3/issue':
+            key = f"MOCK-{self.project_total + 1}"
+            self._send(201, json.dumps({"id": "10001", "key": key, "self": f"/rest/api/3/issue/{key}"}))
+            return
+        match = _MOCK_ISSUE.match(self.path)
+        if match and match.group(2) == '/comment':
+            self.comments.append((match.group(1), json.loads(body or b'{}')))
+            self._send(201, '{"id":"10000"}')
+            return
+        if match and match.group(2) == '/transitions':
+            wanted = (json.loads(body or b'{}').get('transition') or {}).get('id')
+            if wanted not in {t['id'] for t in TRANSITIONS}:
+                self._send(400, json.dumps({"errorMessages": [f"Transition id '{wanted}' is not valid for this issue."]}))
+                return
+            self._send(204, '')
+            return
+        self._send(500, '{}')
+
+    @staticmethod
+    def _search_issue(key, fields, summary, project):
+        issue = mock_issue(key, fields, summary)
+        if project and int(key.split('-')[1]) % 2 == 0 and (not fields or 'parent' in fields):
+            issue["fields"]["parent"] = {"key": "MOCK-1"}
+        return issue
+
     def log_message(self, format, *args):
         # reduce noise in CI logs
-        print("[mock_jira] %s" % (format % args))
+        if not self.quiet:
+            print("[mock_jira] %s" % (format % args))
+
+
+def make_server(port=8765, quiet=False):
+    """Create (but do not start) the mock server; port 0 picks a free port"""
+    handler = type('Handler', (MockJiraHandler,), {'quiet': quiet, 'throttle_hits': {}, 'edits': {},
+                                                    'comments': []})
+    return ThreadingHTTPServer(('127.0.0.1', port), handler)
 
 
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--quiet', action='store_true', help='do not log requests')
     args = parser.parse_args()
 
-    server = HTTPServer(('127.0.0.1', args.port), MockJiraHandler)
-    print(f"Mock JIRA running on http://127.0.0.1:{args.port}")
+    server = make_server(args.port, args.quiet)
+    print(f"Mock JIRA running on http://127.0.0.1:{server.server_address[1]}", flush=True)
     try:
         server.serve_forever()
     except KeyboardInterrupt:
@@ -28,3 +28,17 @@ setup() {
   reasoning=$(echo "$output" | jq -r '.reasoning')
   echo "$reasoning" | grep -q "Base: 0.5"
 }
+
+@test "team estimation: anonymized golden tickets match expected.ndjson" {
+  golden="$ROOT_DIR/tests/golden/estimation"
+
+  for n in 1 2 3 4; do
+    ticket=$(jq -c "select(.key == \"ANON-$n\")" "$golden/corpus.ndjson")
+    # "<points> = <base>+<complexity>+<uncertainty>+<testing> (<total>) <confidence>"
+    expected=$(jq -r "select(.key == \"ANON-$n\") | .team | split(\" \") | \"\(.[0]) \(.[-1])\"" "$golden/expected.ndjson")
+
+    output=$(estimate_story_points_team "$ticket")
+    actual=$(echo "$output" | jq -r '"\(.estimated_points) \(.confidence)"')
+    [ "$actual" = "$expected" ]
+  done
+}
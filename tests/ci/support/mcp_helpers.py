@@ -29,24 +29,22 @@ def load_jira_module():
     # minimal fake mcp
     fake_mcp_pkg = types.SimpleNamespace()
     class DummyServer:
+        """Records registered handlers in ``_handlers`` so tests can invoke them."""
         def __init__(self, name=None):
-            pass
-        def list_tools(self):
+            self._handlers = {}
+        def _record(self, key):
             def decorator(f):
+                self._handlers[key] = f
                 return f
             return decorator
+        def list_tools(self):
+            return self._record('list_tools')
         def list_resources(self):
-            def decorator(f):
-                return f
-            return decorator
+            return self._record('list_resources')
         def read_resource(self):
-            def decorator(f):
-                return f
-            return decorator
+            return self._record('read_resource')
         def call_tool(self):
-            def decorator(f):
-                return f
-            return decorator
+            return self._record('call_tool')
         def get_capabilities(self, notification_options=None, experimental_capabilities=None):
             return {}
 
@@ -0,0 +1,53 @@
+"""Shared mock Jira server fixture and script environment for tests against scripts/mock_jira.py."""
+
+import contextlib
+import importlib.util
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+@contextlib.contextmanager
+def serve_mock_jira(edits=None):
+    """Run scripts/mock_jira.py on a free port in a background thread.
+
+    Yields the server; ``server.url`` is its base URL and ``edits`` (key -> summary)
+    seeds the issues reported as recently updated.
+    """
+    spec = importlib.util.spec_from_file_location('mock_jira', REPO_ROOT / 'scripts' / 'mock_jira.py')
+    mock = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mock)
+    server = mock.make_server(port=0, quiet=True)
+    server.url = f'http://127.0.0.1:{server.server_address[1]}'
+    server.RequestHandlerClass.edits.update(edits or {})
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def mock_jira():
+    with serve_mock_jira() as server:
+        yield server
+
+
+def jira_env(tmp_path, server=None, **extra):
+    """Environment for running the bash scripts in isolation, against `server` if given.
+
+    Every on-disk cache and HOME live under tmp_path; extra variables are added last.
+    """
+    env = {'PATH': os.environ['PATH'], 'TMPDIR': str(tmp_path), 'HOME': str(tmp_path),
+           'JIRA_RATE_LIMIT_DIR': str(tmp_path / 'rl'), 'JIRA_SEARCH_CACHE_DIR': str(tmp_path / 'cache'),
+           'JIRA_MIRROR_DIR': str(tmp_path / 'mirror'),
+           'JIRA_TRANSITION_CACHE_DIR': str(tmp_path / 'transitions')}
+    if server is not None:
+        env.update({'JIRA_BASE_URL': server.url, 'JIRA_EMAIL': 'me', 'JIRA_TOKEN': 't', 'JIRA_PROJECT': 'MOCK'})
+    env.update(extra)
+    return env
@@ -0,0 +1,124 @@
+"""Tests for the pre-warmed bash worker pool behind ScriptPool."""
+
+import asyncio
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+from tests.ci.support.mcp_helpers import load_jira_module
+
+mod = load_jira_module()
+JiraBashWrapper = mod.JiraBashWrapper
+BashWorkerPool = mod.BashWorkerPool
+ScriptPool = mod.ScriptPool
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _project(tmp_path, scripts):
+    """A project dir with the real worker and libraries plus the given stub scripts."""
+    shutil.copytree(REPO_ROOT / 'scripts' / 'lib', tmp_path / 'scripts' / 'lib')
+    for name, body in scripts.items():
+        p = tmp_path / 'scripts' / name
+        p.write_text('#!/usr/bin/env bash\n' + body + '\n')
+        p.chmod(0o755)
+    return tmp_path / 'scripts'
+
+
+def _run(pool, script, *args, input_data=None, env=None, timeout=10):
+    return asyncio.run(pool.run([str(script), *args], str(script.parent.parent), input_data, timeout, env))
+
+
+def test_warm_worker_matches_forked_script(tmp_path):
+    scripts = _project(tmp_path, {'probe.sh': (
+        'set -euo pipefail\n'
+        'source "$(dirname "${BASH_SOURCE[0]}")/lib/utils.sh"\n'
+        'echo "$(basename "$0") $# ${1:-} [${2:-}]"\n'
+        'echo "stdin: $(cat)"\n'
+        'echo "env: ${PROBE_VAR:-unset} $(type -t info)"\n'
+        'echo "to stderr" >&2\n'
+        'exit 3'
+    )})
+    probe = scripts / 'probe.sh'
+    pool = BashWorkerPool(str(scripts), size=1)
+    args = ('RVV-1', 'two words')
+    env = {'PROBE_VAR': 'x'}
+
+    warm = _run(pool, probe, *args, input_data='hello', env=env)
+    cold = asyncio.run(ScriptPool().execute([str(probe), *args], str(tmp_path), 'hello', env=env))
+    pool.close()
+
+    assert warm == cold
+    assert warm['exit_code'] == 3
+    assert warm['output'].splitlines() == ['probe.sh 2 RVV-1 [two words]', 'stdin: hello', 'env: x function']
+    assert warm['error'] == 'to stderr\n'
+    assert pool.jobs == 1
+
+
+def test_worker_recycled_after_max_jobs_and_env_change(tmp_path):
+    scripts = _project(tmp_path, {'pid.sh': 'echo "$$ ${GREETING:-}"'})
+    (tmp_path / '.env').write_text('GREETING=hello\n')
+    pool = BashWorkerPool(str(scripts), size=1, max_jobs=2)
+    script = scripts / 'pid.sh'
+
+    first, second, third = (_run(pool, script)['output'].split() for _ in range(3))
+    assert first == second                      # same warm worker
+    assert third[0] != first[0]                 # recycled after max_jobs
+    assert third[1] == 'hello'                  # .env loaded by the worker
+
+    (tmp_path / '.env').write_text('GREETING=bye\n')
+    os.utime(tmp_path / '.env', ns=(0, 1))      # make sure the mtime moves
+    fourth = _run(pool, script)['output'].split()
+    assert fourth[1] == 'bye'
+    assert pool.stats()['recycled'] >= 2
+    pool.close()
+
+
+def test_worker_timeout_kills_job_and_worker(tmp_path):
+    pid_file = tmp_path / 'child.pid'
+    scripts = _project(tmp_path, {'slow.sh': f'sleep 30 &\necho $! > {pid_file}\nwait'})
+    pool = BashWorkerPool(str(scripts), size=1)
+
+    res = _run(pool, scripts / 'slow.sh', timeout=0.5)
+
+    assert res['success'] is False and 'timed out' in res['error']
+    child = int(pid_file.read_text())
+    alive = True
+    for _ in range(40):
+        try:
+            os.kill(child, 0)
+        except ProcessLookupError:
+            alive = False
+            break
+        time.sleep(0.05)
+    assert not alive, 'background child of the timed-out script is still running'
+    assert pool.stats()['idle'] == 0
+
+
+def test_script_pool_forks_when_workers_unavailable(tmp_path):
+    scripts = tmp_path / 'scripts'
+    (scripts / 'lib').mkdir(parents=True)
+    (scripts / 'ok.sh').write_text('#!/bin/sh\necho forked\n')
+    (scripts / 'ok.sh').chmod(0o755)
+    workers = BashWorkerPool(str(scripts))           # no mcp-worker.sh here
+    pool = ScriptPool(workers=workers)
+
+    res = asyncio.run(pool.run([str(scripts / 'ok.sh')], str(tmp_path)))
+
+    assert res['output'] == 'forked\n'
+    assert workers.available is False and workers.jobs == 0
+
+
+def test_tool_calls_dispatch_to_warm_workers(tmp_path):
+    scripts = _project(tmp_path, {'jira-groom.sh': 'echo "groomed $1"'})
+    w = JiraBashWrapper()
+    w.scripts_dir = str(scripts)
+    handler = w.server._handlers['call_tool']
+
+    out = asyncio.run(handler('groom_ticket', {'ticket_key': 'RVV-1'}))
+
+    assert json.loads(out[0].text)['output'] == 'groomed RVV-1\n'
+    assert w.script_pool.workers.stats()['jobs'] == 1
+    w.script_pool.workers.close()
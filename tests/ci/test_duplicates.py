@@ -0,0 +1,137 @@
+"""Tests for the near-duplicate check (scripts/lib/jira_dupes.py, jira-create.sh --duplicates)."""
+
+import importlib.util
+import re
+import sqlite3
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from tests.ci.support.mcp_helpers import load_jira_module
+from tests.ci.support.mock_jira_helpers import jira_env, serve_mock_jira
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+LIB_DIR = REPO_ROOT / 'scripts' / 'lib'
+
+
+def _load(name):
+    spec = importlib.util.spec_from_file_location(name, LIB_DIR / f'{name}.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def dupes(monkeypatch):
+    monkeypatch.syspath_prepend(str(LIB_DIR))
+    return _load('jira_dupes')
+
+
+@pytest.fixture
+def mock_jira():
+    with serve_mock_jira(edits={'MOCK-4': 'Payment retry timeout on checkout'}) as server:
+        yield server
+
+
+def _issue(key, summary, description=''):
+    return {'key': key, 'fields': {'summary': summary, 'description': description}}
+
+
+CANDIDATES = [
+    _issue('P-1', 'Upgrade Spring Boot to 3.2 in the payments service'),
+    _issue('P-2', 'Kafka consumer lag alerts', 'Page the on-call engineer when consumer lag exceeds five minutes'),
+    _issue('P-3', 'Update README'),
+]
+
+
+def test_near_duplicates_score_by_exact_jaccard(dupes):
+    # Stop words do not count
+    found = dupes.check_candidates(CANDIDATES, 'Upgrade Spring Boot to 3.2 for the payments service')
+    assert found == [{'key': 'P-1', 'fields': {'summary': CANDIDATES[0]['fields']['summary']}, 'score': 1.0}]
+
+    # 5 of the 6 words: 9 of 11 unigrams and bigrams shared
+    found = dupes.check_candidates(CANDIDATES, 'Upgrade Spring Boot to 3.2 in the payments')
+    assert [(d['key'], d['score']) for d in found] == [('P-1', round(9 / 11, 4))]
+
+    assert dupes.check_candidates(CANDIDATES, 'Rotate database credentials') == []
+    assert dupes.check_candidates(CANDIDATES, 'Upgrade Spring Boot', threshold=0.9) == []
+
+
+def test_description_catches_a_reworded_summary(dupes):
+    description = 'Page the on-call engineer when consumer lag exceeds five minutes'
+    assert dupes.check_candidates(CANDIDATES, 'Alert on consumer lag') == []
+
+    found = dupes.check_candidates(CANDIDATES, 'Alert on consumer lag', description)
+    assert [d['key'] for d in found] == ['P-2'] and found[0]['score'] >= 0.5
+
+
+def test_mirror_index_is_updated_incrementally(dupes, tmp_path):
+    mirror = _load('jira_mirror')
+    db = str(tmp_path / 'mirror-P.sqlite')
+    conn = mirror.connect(db)
+    mirror.ingest(conn, 'P', CANDIDATES, synced_at=100, full=True)
+    index = dupes.DuplicateIndex(conn)
+
+    assert index.refresh('P') == 3
+    assert index.refresh('P') == 0                   # no sync since
+
+    mirror.ingest(conn, 'P', [_issue('P-3', 'Update README for Kafka consumers'), CANDIDATES[0]],
+                  synced_at=200, full=False)
+    assert index.refresh('P') == 1                   # only the changed ticket
+    mirror.ingest(conn, 'P', CANDIDATES[:2], synced_at=300, full=True)
+    assert index.refresh('P') == 0
+    assert conn.execute('SELECT COUNT(*) FROM dup_signatures').fetchone()[0] == 2
+    conn.close()
+
+    found = dupes.check_mirror(db, 'P', 'Kafka consumer lag alert')
+    assert [d['key'] for d in found] == ['P-2']
+    with sqlite3.connect(db) as conn:
+        assert conn.execute('SELECT synced FROM dup_state').fetchone() == (300,)
+
+
+def _create(env, *args):
+    return subprocess.run(['bash', str(REPO_ROOT / 'scripts' / 'jira-create.sh'),
+                           '--summary', 'Payment retry timeout at checkout', *args],
+                          env=env, capture_output=True, text=True, timeout=60)
+
+
+@pytest.mark.parametrize('mirrored', [False, True])
+def test_create_warns_or_blocks_on_duplicates(tmp_path, mock_jira, mirrored):
+    env = jira_env(tmp_path, mock_jira)
+    if mirrored:
+        subprocess.run(['bash', str(REPO_ROOT / 'scripts' / 'jira-mirror.sh')], env=env, check=True,
+                       capture_output=True, timeout=60)
+
+    res = _create(env)
+    assert res.returncode == 0, res.stderr
+    assert re.search(r'Possible duplicates:\n  MOCK-4 \(1(\.0)?\): Payment retry timeout on checkout', res.stdout)
+    assert 'Created: MOCK-31' in res.stdout
+
+    res = _create(env, '--duplicates', 'block')
+    assert res.returncode == 3 and 'Created' not in res.stdout
+    assert re.search(r'  MOCK-4 \(1(\.0)?\): Payment retry timeout on checkout', res.stdout)
+
+    res = _create(jira_env(tmp_path, mock_jira, JIRA_DUPLICATE_CHECK='block'), '--duplicates', 'off')
+    assert res.returncode == 0 and 'Possible duplicates' not in res.stdout
+
+
+def test_mcp_create_ticket_reports_duplicates(monkeypatch):
+    mod = load_jira_module()
+    w = mod.JiraBashWrapper()
+    calls = []
+    listing = '⚠️  Possible duplicates:\n  RVV-7 (0.8667): Payment retry timeout\n'
+    results = iter([
+        {'success': True, 'output': listing + '✅ Created: RVV-9\n', 'exit_code': 0},
+        {'success': False, 'output': listing, 'error': '❌ Not created', 'exit_code': 3},
+    ])
+    monkeypatch.setattr(w, '_run_script', lambda name, args=None, input_data=None:
+                        calls.append(args) or next(results))
+
+    created = w.create_ticket('Payment retry timeouts')
+    blocked = w.create_ticket('Payment retry timeouts', duplicates='block')
+
+    duplicate = {'key': 'RVV-7', 'score': 0.8667, 'summary': 'Payment retry timeout'}
+    assert created['ticket_key'] == 'RVV-9' and created['duplicates'] == [duplicate]
+    assert blocked['success'] is False and blocked['blocked'] is True and blocked['duplicates'] == [duplicate]
+    assert calls[1][-2:] == ['--duplicates', 'block']
@@ -0,0 +1,112 @@
+"""Tests for batch estimation (scripts/jira-estimate-batch.sh, jira_estimate.py batch)."""
+
+import csv
+import importlib.util
+import io
+import json
+import re
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from tests.ci.support.mock_jira_helpers import jira_env, mock_jira  # noqa: F401 (fixture)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+LIB_DIR = REPO_ROOT / 'scripts' / 'lib'
+SCRIPT = REPO_ROOT / 'scripts' / 'jira-estimate-batch.sh'
+
+ISSUES = [
+    {"key": "P-1", "fields": {"summary": "Fix broken login button", "issuetype": {"name": "Bug"},
+                              "description": "The login button is not working in production"}},
+    {"key": "P-2", "fields": {"summary": "Spring Boot upgrade", "issuetype": {"name": "Story"}, "description": {
+        "type": "doc", "version": 1, "content": [{"type": "paragraph", "content": [
+            {"type": "text", "text": "Investigate the migration across several services"}]}]}}},
+]
+
+
+@pytest.fixture
+def engine():
+    spec = importlib.util.spec_from_file_location('jira_estimate', LIB_DIR / 'jira_estimate.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _batch(env, *args, stdin=None):
+    return subprocess.run(['bash', str(SCRIPT), *args], input=stdin, env=env, capture_output=True, text=True,
+                          timeout=60)
+
+
+def test_rows_carry_both_estimates(engine):
+    rows = [engine.estimate_issue(issue) for issue in ISSUES]
+
+    assert rows[0] == {
+        'key': 'P-1', 'summary': 'Fix broken login button', 'issue_type': 'Bug',
+        'estimated_points': 1, 'base': 0.5, 'complexity': 0.5, 'uncertainty': 0, 'testing': 0.5, 'total_raw': 1.5,
+        'should_split': False, 'confidence': 'high',
+        'fibonacci_points': 3, 'fibonacci_raw': 4,
+        'fibonacci_factors': ['Bug fix: +2', 'Critical/production system: +2'],
+    }
+    assert (rows[1]['estimated_points'], rows[1]['should_split'], rows[1]['confidence']) == (5, True, 'low')
+    assert (rows[1]['fibonacci_points'], rows[1]['fibonacci_raw']) == (13, 14)
+
+
+@pytest.mark.parametrize('description, summary', [
+    ('', ''),
+    ('Implement the new feature across all services; research the API first', 'Add support for webhooks'),
+    ('A simple, well-known config change', 'Update settings'),
+    ('line one\nthird\nparty provider', 'Customer-facing LIVE patch'),
+])
+def test_fibonacci_matches_the_shell_estimator(engine, description, summary):
+    script = f'source "{LIB_DIR}/jira-estimate.sh"; estimate_story_points "$1" "$2"'
+    res = subprocess.run(['bash', '-c', script, 'bash', description, summary], capture_output=True, text=True)
+
+    estimate, raw, factors = engine.estimate_fibonacci(description, summary)
+    assert res.stdout == f'{estimate}\n'
+    if factors:
+        assert res.stderr.splitlines()[1:-1] == [f'  • {factor}' for factor in factors]
+        assert res.stderr.splitlines()[-1] == f'  Raw score: {raw} → Fibonacci: {estimate}'
+    else:
+        assert res.stderr == ''
+
+
+def test_batch_reads_ndjson_and_skips_bad_lines(tmp_path):
+    stdin = json.dumps(ISSUES[0]) + '\nnot json\n\n' + json.dumps(ISSUES[1]) + '\n'
+    res = _batch(jira_env(tmp_path), '--input', '-', stdin=stdin)
+    assert res.returncode == 0, res.stderr
+    assert [json.loads(line)['key'] for line in res.stdout.splitlines()] == ['P-1', 'P-2']
+    assert 'Skipping line 2' in res.stderr and 'Estimated 2 ticket(s)' in res.stderr
+
+    res = _batch(jira_env(tmp_path), '--input', '-', '--format', 'csv', stdin=stdin)
+    rows = list(csv.DictReader(io.StringIO(res.stdout)))
+    assert rows[0]['total_raw'] == '1.5' and rows[0]['should_split'] == 'false'
+    assert rows[1]['fibonacci_factors'].split('; ')[0] == 'Framework/major change: +8'
+
+
+def test_batch_streams_a_jql_search(tmp_path, mock_jira):
+    out = tmp_path / 'estimates.csv'
+    res = _batch(jira_env(tmp_path, mock_jira), '--jql', 'project = MOCK', '--format', 'csv', '-o', str(out))
+    assert res.returncode == 0, res.stderr
+    assert res.stdout == ''
+
+    rows = list(csv.DictReader(out.open()))
+    assert [row['key'] for row in rows] == [f'MOCK-{n}' for n in range(1, 31)]
+    assert {row['estimated_points'] for row in rows} == {'1'}    # "text" in the ADF JSON: a simple task
+
+    res = _batch(jira_env(tmp_path, mock_jira), '--epic', 'MOCK-1', '--max-results', '5')
+    assert res.returncode == 0, res.stderr
+    assert len(res.stdout.splitlines()) == 5
+
+
+def test_batch_needs_exactly_one_source(tmp_path):
+    res = _batch(jira_env(tmp_path), '--jql', 'project = X', '--input', '-')
+    assert res.returncode == 1 and 'Exactly one of' in res.stderr
+
+
+def test_fibonacci_factors_match_the_shell_library(engine):
+    shell = (LIB_DIR / 'jira-estimate.sh').read_text()
+    patterns = re.findall(r'grep -qiE "([^"]+)"', shell)
+    factors = re.findall(r'factors\+=\("([^"]+): ([+-]\d+)"\)', shell)
+
+    assert [(p, int(w), f) for p, (f, w) in zip(patterns, factors)] == list(engine.FIBONACCI_FACTORS)
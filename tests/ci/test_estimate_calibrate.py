@@ -0,0 +1,156 @@
+"""Tests for estimation weight calibration (scripts/lib/jira_calibrate.py, jira-estimate-calibrate.sh)."""
+
+import importlib.util
+import itertools
+import json
+import os
+import random
+import subprocess
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+LIB_DIR = REPO_ROOT / 'scripts' / 'lib'
+CORPUS = REPO_ROOT / 'tests' / 'golden' / 'estimation' / 'corpus.ndjson'
+
+# What a team that estimates higher than the built-in weights might have fitted
+TEAM_HISTORY_WEIGHTS = {
+    "format": 1, "version": 3,
+    "weights": {"base": {"bug": 0.4, "story": 1.2},
+                "complexity": {"simple": 0, "standard": 0.3, "moderate": 1.4, "high": 1.8},
+                "uncertainty": {"none": 0, "some": 0.8, "significant": 1.5},
+                "testing": {"none": 0, "unit": 0.6, "integration": 0.9}},
+    "thresholds": [0.9, 1.6, 2.4, 3.6, 4.4],
+}
+TICKET = {"fields": {"summary": "Spring boot upgrade", "description": "Unclear which services",
+                     "issuetype": {"name": "Story"}}}
+
+
+@pytest.fixture
+def calibrate(monkeypatch):
+    monkeypatch.delenv('JIRA_ESTIMATE_WEIGHTS', raising=False)
+    monkeypatch.syspath_prepend(str(LIB_DIR))
+    spec = importlib.util.spec_from_file_location('jira_calibrate', LIB_DIR / 'jira_calibrate.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='module')
+def corpus():
+    with open(CORPUS, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _history(engine, corpus, weights_path, monkeypatch, field='customfield_10016'):
+    """The corpus with the story points the estimator gives it under a weights file"""
+    monkeypatch.setattr(engine, 'TEAM_WEIGHTS', engine.load_team_weights(str(weights_path)))
+    history = []
+    for issue in corpus:
+        points = float(engine.estimate_team(*engine.issue_inputs(issue))['estimated_points'])
+        history.append(dict(issue, fields=dict(issue['fields'], **{field: points})))
+    monkeypatch.setattr(engine, 'TEAM_WEIGHTS', engine.DEFAULT_TEAM_WEIGHTS)
+    return history
+
+
+def test_vectorized_levels_match_the_estimator(calibrate, corpus):
+    np = pytest.importorskip('numpy')
+    engine = calibrate.engine
+    inputs = [engine.issue_inputs(issue) for issue in corpus]
+    levels = calibrate.team_levels(calibrate.keyword_matrices(inputs), [t for _, _, t in inputs])
+    expected = [[engine.TEAM_LEVELS[f].index(level) for f, level in zip(engine.TEAM_LEVELS, engine.team_levels(*i))]
+                for i in inputs]
+    assert np.array_equal(levels, np.array(expected))
+
+
+def test_calibrated_weights_reproduce_the_team_history(calibrate, corpus, tmp_path, monkeypatch):
+    pytest.importorskip('numpy')
+    engine = calibrate.engine
+    (tmp_path / 'team.json').write_text(json.dumps(TEAM_HISTORY_WEIGHTS))
+    history = _history(engine, corpus, tmp_path / 'team.json', monkeypatch)
+    inputs = [engine.issue_inputs(issue) for issue in history]
+    points = [issue['fields']['customfield_10016'] for issue in history]
+
+    result = calibrate.calibrate(inputs, points)
+    assert result['before']['exact'] < 0.6 and result['after']['exact'] >= 0.98
+    assert result['after']['rmse'] < result['before']['rmse']
+    assert all(w == 0 for w in (result['weights']['complexity']['simple'], result['weights']['uncertainty']['none'],
+                                result['weights']['testing']['none']))
+
+    # The estimator, loading the written file, gives the points the fit predicted
+    doc = calibrate.weights_document(result, len(inputs), 'customfield_10016', 1)
+    calibrate.write_weights(str(tmp_path / 'fitted.json'), doc)
+    monkeypatch.setattr(engine, 'TEAM_WEIGHTS', engine.load_team_weights(str(tmp_path / 'fitted.json')))
+    estimated = [float(engine.estimate_team(*i)['estimated_points']) for i in inputs]
+    assert sum(e == p for e, p in zip(estimated, points)) / len(points) == pytest.approx(result['after']['exact'],
+                                                                                          abs=0.001)
+
+
+def test_thresholds_minimise_the_squared_error(calibrate):
+    np = pytest.importorskip('numpy')
+    scale = [float(p) for p in calibrate.engine.TEAM_SCALE]
+    rng = random.Random(7)
+    for _ in range(20):
+        raw = np.array([rng.choice([0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 4.0, 5.5]) for _ in range(12)])
+        points = np.array([rng.choice(scale) for _ in range(12)])
+
+        def sse(thresholds):
+            rounded = np.array(scale)[np.searchsorted(np.asarray(thresholds), raw, side='left')]
+            return float(((rounded - points) ** 2).sum())
+
+        # Every way of rounding the distinct totals monotonically to the scale
+        values = sorted(set(raw))
+        brute = min(sse(cuts) for cuts in itertools.combinations_with_replacement(
+            [values[0] - 1] + [(a + b) / 2 for a, b in zip(values, values[1:])] + [values[-1] + 1], len(scale) - 1))
+        assert sse(calibrate.fit_thresholds(raw, points)) == pytest.approx(brute)
+
+
+def test_calibrate_script_writes_versioned_weights_the_estimator_loads(calibrate, corpus, tmp_path, monkeypatch):
+    pytest.importorskip('numpy')
+    (tmp_path / 'team.json').write_text(json.dumps(TEAM_HISTORY_WEIGHTS))
+    history = _history(calibrate.engine, corpus[:400], tmp_path / 'team.json', monkeypatch)
+    history[0]['fields'].pop('customfield_10016')
+    (tmp_path / 'done.ndjson').write_text(''.join(json.dumps(issue) + '\n' for issue in history))
+
+    env = {'PATH': os.environ['PATH'], 'HOME': str(tmp_path)}
+    weights = tmp_path / 'weights' / 'estimate-weights.json'
+
+    def run(*args):
+        return subprocess.run(['bash', str(REPO_ROOT / 'scripts' / 'jira-estimate-calibrate.sh'), *args],
+                              env=env, capture_output=True, text=True, timeout=120)
+
+    first = run('-i', str(tmp_path / 'done.ndjson'), '-o', str(weights))
+    assert first.returncode == 0, first.stdout + first.stderr
+    assert 'Calibrated weights v1 on 399 ticket(s) (1 without story points)' in first.stderr
+    assert 'Set JIRA_ESTIMATE_WEIGHTS=' in first.stderr
+    assert run('-i', str(tmp_path / 'done.ndjson'), '-o', str(weights)).returncode == 0
+    doc = json.loads(weights.read_text())
+    assert (doc['format'], doc['version'], doc['tickets']) == (1, 2, 399)
+
+    def estimate(weights_path):
+        script = 'import sys, jira_estimate as e; sys.stdout.write(e.RULESET_VERSION + "\\n"); e.main(["team"])'
+        return subprocess.run(['python3', '-c', script], input=json.dumps(TICKET), capture_output=True, text=True,
+                              cwd=LIB_DIR, env=dict(env, JIRA_ESTIMATE_WEIGHTS=weights_path))
+
+    default, fitted = estimate(''), estimate(str(weights))
+    assert fitted.stderr == ''
+    assert default.stdout.split('\n', 1)[0] != fitted.stdout.split('\n', 1)[0]      # memoized estimates expire
+    breakdown = json.loads(fitted.stdout.split('\n', 1)[1])['breakdown']
+    assert breakdown['complexity'] == doc['weights']['complexity']['high']
+    assert breakdown['uncertainty'] == doc['weights']['uncertainty']['significant']
+
+    (tmp_path / 'bad.json').write_text(json.dumps(dict(doc, thresholds=[3, 2, 1, 4, 5])))
+    bad = estimate(str(tmp_path / 'bad.json'))
+    assert 'Ignoring estimate weights' in bad.stderr and 'ascending thresholds' in bad.stderr
+    assert bad.stdout == default.stdout
+
+
+def test_too_little_history_is_refused(calibrate, tmp_path):
+    pytest.importorskip('numpy')
+    done = ''.join(json.dumps({"key": f"D-{i}", "fields": {"summary": "Fix", "customfield_10016": 1}}) + '\n'
+                   for i in range(5))
+    res = subprocess.run(['python3', str(LIB_DIR / 'jira_calibrate.py'), '--output', str(tmp_path / 'w.json')],
+                         input=done, capture_output=True, text=True, env={'PATH': os.environ['PATH']})
+    assert res.returncode == 1 and 'Only 5 ticket(s) with story points' in res.stderr
+    assert not (tmp_path / 'w.json').exists()
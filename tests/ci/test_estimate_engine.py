@@ -0,0 +1,120 @@
+"""Tests for the estimation engine (scripts/lib/jira_estimate.py) behind estimate_story_points_team."""
+
+import importlib.util
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+LIB_DIR = REPO_ROOT / 'scripts' / 'lib'
+
+BUG = {"fields": {"summary": "Fix broken login button", "description": "The login button is not working in production",
+                  "issuetype": {"name": "Bug"}}}
+
+BUG_ESTIMATE = '''{
+  "estimated_points": 1,
+  "breakdown": {
+    "base": 0.5,
+    "complexity": 0.5,
+    "uncertainty": 0,
+    "testing": 0.5,
+    "total_raw": 1.5
+  },
+  "reasoning": "Base: 0.5 point (bug fix/small change)\\nComplexity: +0.5 (standard implementation)\\nTesting: +0.5 (unit tests)\\nTotal: 1 points (~7 focus hours / 1.0 focus days)\\nWith 50% philosophy: ~2.0 working days",
+  "should_split": false,
+  "confidence": "high"
+}
+'''
+
+
+@pytest.fixture
+def engine():
+    spec = importlib.util.spec_from_file_location('jira_estimate', LIB_DIR / 'jira_estimate.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _team(ticket):
+    res = subprocess.run(['python3', str(LIB_DIR / 'jira_estimate.py'), 'team'], input=json.dumps(ticket),
+                         capture_output=True, text=True, timeout=30)
+    assert res.returncode == 0, res.stderr
+    return res.stdout
+
+
+def test_prints_the_shell_estimators_json_byte_for_byte():
+    assert _team(BUG) == BUG_ESTIMATE
+
+
+@pytest.mark.parametrize('summary, description, issue_type, factors, points, total, tail', [
+    # bc drops the leading zero of 0.5
+    ('Fix simple config typo', '', 'Bug', ('0.5', '0', '0', '0'), '0.5', '.5',
+     'Total: 0.5 points (~4 focus hours / .5 focus days)\\nWith 50% philosophy: ~1.0 working days'),
+    ('Spring Boot framework upgrade', 'Unclear how to investigate the MIGRATION', 'Story',
+     ('1.0', '2.0', '1.0', '1.0'), '5', '5.0',
+     'Total: 5 points (~35 focus hours / 5.0 focus days)\\nWith 50% philosophy: ~10.0 working days'),
+    # A reference implementation lowers high complexity and removes uncertainty
+    ('Add caching', 'Same as the orders endpoint; might need tuning', 'Task', ('1.0', '1.0', '0', '0.5'), '2',
+     '2.5', 'Total: 2 points (~14 focus hours / 2.0 focus days)\\nWith 50% philosophy: ~4.0 working days'),
+])
+def test_team_factors_and_formatting(engine, summary, description, issue_type, factors, points, total, tail):
+    ticket = {"fields": {"summary": summary, "description": description, "issuetype": {"name": issue_type}}}
+    estimate = engine.estimate_team(*engine.issue_inputs(ticket))
+
+    b = estimate['breakdown']
+    assert (b['base'], b['complexity'], b['uncertainty'], b['testing']) == factors
+    assert (estimate['estimated_points'], b['total_raw']) == (points, total)
+    assert estimate['reasoning'].endswith(tail)
+    assert f'"total_raw": {total}\n' in engine.render_team(estimate)
+
+
+def test_bug_keywords_count_in_the_summary_and_uncertainty_in_the_description(engine):
+    found = engine.team_factors('add login page', 'fix the error, research first', 'Story')
+    assert found[:1] == ('1.0',) and found[2] == '1.0'
+    assert engine.team_factors('research login bug', 'add a page', 'Story')[::2] == ('0.5', '0')
+
+
+def test_description_is_read_like_jq_raw_output(engine):
+    ticket = {"fields": {"summary": None, "description": {
+        "type": "doc", "version": 1.0, "content": [{"type": "text", "text": "Ünïcode API\t", "marks": []}]}}}
+    jq = subprocess.run(['jq', '-r', '.fields.description // ""'], input=json.dumps(ticket), capture_output=True,
+                        text=True, check=True).stdout.rstrip('\n')
+
+    assert engine.jq_raw(ticket, ('fields', 'description'), '') == jq
+    assert engine.issue_inputs(ticket)[0] == '' and engine.issue_inputs({"fields": "x"}) == ('', '', '')
+    assert engine.issue_inputs(ticket)[1] == ''.join(c.lower() if c.isascii() else c for c in jq)   # like tr
+
+
+def test_keyword_tables_match_the_shell_library(engine):
+    names = ['HIGH_COMPLEXITY_KEYWORDS', 'MEDIUM_COMPLEXITY_KEYWORDS', 'LOW_COMPLEXITY_KEYWORDS',
+             'UNCERTAINTY_HIGH_KEYWORDS', 'UNCERTAINTY_MEDIUM_KEYWORDS', 'UNCERTAINTY_REDUCING_KEYWORDS',
+             'BUG_KEYWORDS', 'CONFIG_KEYWORDS']
+    script = f'source "{LIB_DIR}/jira-estimate-team.sh"; ' + '; '.join(
+        f'printf "%s\\n" "${{{name}[@]}}" | paste -sd "|" -' for name in names)
+    res = subprocess.run(['bash', '-c', script], capture_output=True, text=True, check=True)
+
+    assert res.stdout.splitlines() == ['|'.join(getattr(engine, name)) for name in names]
+
+
+def test_shell_function_is_a_thin_caller(tmp_path):
+    script = f'source "{LIB_DIR}/jira-estimate-team.sh"; estimate_story_points_team "$1"'
+    res = subprocess.run(['bash', '-c', script, 'bash', json.dumps(BUG)], capture_output=True, text=True,
+                         cwd=tmp_path, env={'PATH': os.environ['PATH']}, timeout=30)
+    assert res.returncode == 0, res.stderr
+    assert res.stdout == BUG_ESTIMATE
+
+    res = subprocess.run(['bash', '-c', script, 'bash', ''], capture_output=True, text=True)
+    assert res.returncode == 1 and 'Ticket data is required' in res.stderr
+
+
+def test_exported_shell_function_runs_in_a_child_shell(tmp_path):
+    # Sourced through a relative path, then called by a child bash in another directory
+    script = ('source scripts/lib/jira-estimate-team.sh; '
+              f'cd "{tmp_path}"; bash -c \'estimate_story_points_team "$1"\' bash "$1"')
+    res = subprocess.run(['bash', '-c', script, 'bash', json.dumps(BUG)], capture_output=True, text=True,
+                         cwd=REPO_ROOT, env={'PATH': os.environ['PATH']}, timeout=30)
+    assert res.returncode == 0, res.stderr
+    assert res.stdout == BUG_ESTIMATE
@@ -0,0 +1,96 @@
+"""Golden-corpus regression tests for the story point estimators (tests/golden/estimation)."""
+
+import importlib.util
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+GOLDEN_DIR = REPO_ROOT / 'tests' / 'golden' / 'estimation'
+
+
+def _load(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='module')
+def golden():
+    return _load('golden', GOLDEN_DIR / 'golden.py')
+
+
+@pytest.fixture(scope='module')
+def engine(golden):
+    return golden.load_engine()
+
+
+@pytest.fixture(scope='module')
+def corpus(golden):
+    return golden.read_ndjson(golden.CORPUS)
+
+
+def test_corpus_outputs_match_expected(golden, engine, corpus):
+    expected = golden.read_ndjson(golden.EXPECTED)
+    assert len(corpus) == len(expected) >= 2000
+
+    changed = [(want, got) for want, got in
+               ((want, golden.expected_row(engine, issue)) for issue, want in zip(corpus, expected)) if want != got]
+    detail = '\n'.join(f"{want['key']}: team {want['team']} -> {got['team']}, "
+                       f"fibonacci {want['fibonacci']} -> {got['fibonacci']}" for want, got in changed[:10])
+    assert not changed, (f"{len(changed)} ticket(s) estimate differently; if intended, run "
+                         f"python tests/golden/estimation/golden.py expected\n{detail}")
+
+
+def test_corpus_spans_both_scales(engine, corpus):
+    team = {engine.estimate_team(*engine.issue_inputs(issue))['estimated_points'] for issue in corpus}
+    fibonacci = {engine.estimate_fibonacci(*engine.fibonacci_inputs(issue))[0] for issue in corpus}
+    assert team == {'0.5', '1', '2', '3', '4', '5'}
+    assert {1, 2, 3, 5, 8, 13, 21} <= fibonacci
+
+
+def test_gate_reports_changed_outputs(golden, engine, corpus):
+    bench = _load('bench_estimation', REPO_ROOT / 'tests' / 'perf' / 'bench_estimation.py')
+    expected = golden.read_ndjson(golden.EXPECTED)[:50]
+    expected[7] = dict(expected[7], sha256='0' * 16)
+    mismatches = bench.check_outputs(golden, engine, corpus[:50], expected)
+    assert [want['key'] for want, _ in mismatches] == [expected[7]['key']]
+
+
+@pytest.mark.parametrize('scale', ['fibonacci', 'team'])
+def test_shell_functions_match_the_corpus_sample(golden, engine, scale):
+    if scale == 'team' and not shutil.which('bc'):
+        pytest.skip('bc not installed')
+    bench = _load('bench_estimation', REPO_ROOT / 'tests' / 'perf' / 'bench_estimation.py')
+    with open(golden.CORPUS, encoding='utf-8') as f:
+        lines = [line for line in f if line.strip()]
+    count, bad, _ = bench.shell_sample(golden, engine, lines, 20)[scale]
+    assert count == 20 and not bad
+
+
+def test_benchmark_check_passes_on_the_committed_files():
+    res = subprocess.run(['python3', str(REPO_ROOT / 'tests' / 'perf' / 'bench_estimation.py'), '--repeat', '1',
+                          '--check'], capture_output=True, text=True, timeout=300)
+    assert res.returncode == 0, res.stdout + res.stderr
+    assert 'tickets/s' in res.stdout and 'throughput ' in res.stdout
+    assert json.loads((GOLDEN_DIR / 'baseline.json').read_text())['tickets'] == 3000
+
+
+def test_throughput_drop_is_advisory_unless_strict(tmp_path, monkeypatch, capsys):
+    bench = _load('bench_estimation', REPO_ROOT / 'tests' / 'perf' / 'bench_estimation.py')
+    monkeypatch.setattr(bench, 'BASELINE', tmp_path / 'baseline.json')
+    bench.BASELINE.write_text(json.dumps({'normalized_throughput': 1e9, 'tickets': 3000}))
+    monkeypatch.setenv('GITHUB_ACTIONS', 'true')
+
+    monkeypatch.setattr('sys.argv', ['bench_estimation.py', '--repeat', '1', '--check'])
+    assert bench.main() == 0
+    out = capsys.readouterr().out
+    assert 'throughput below baseline (advisory)' in out and '::warning title=Estimation throughput::' in out
+
+    monkeypatch.setattr('sys.argv', ['bench_estimation.py', '--repeat', '1', '--check', '--strict-throughput'])
+    assert bench.main() == 1
+    assert 'throughput FAIL' in capsys.readouterr().out
@@ -0,0 +1,115 @@
+"""Tests for the estimate memo (jira_estimate.py memo/comment, jira-groom.sh --estimate)."""
+
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from tests.ci.support.mock_jira_helpers import jira_env, mock_jira  # noqa: F401 (fixture)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+LIB_DIR = REPO_ROOT / 'scripts' / 'lib'
+
+TICKET = {"key": "P-1", "fields": {"summary": "Fix broken login button", "issuetype": {"name": "Bug"},
+                                   "description": "The login button is not working in production"}}
+
+
+@pytest.fixture
+def engine():
+    spec = importlib.util.spec_from_file_location('jira_estimate', LIB_DIR / 'jira_estimate.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _ticket(summary=None, description=None, issue_type='Bug'):
+    fields = dict(TICKET['fields'], issuetype={"name": issue_type})
+    if summary is not None:
+        fields['summary'] = summary
+    if description is not None:
+        fields['description'] = description
+    return {"key": "P-1", "fields": fields}
+
+
+def test_unchanged_tickets_reuse_the_stored_estimate(engine, tmp_path):
+    memo = engine.EstimateMemo(str(tmp_path))
+    digest, hit, output = engine.memo_estimate(memo, TICKET, 'team')
+    assert not hit and output == engine.render_team(engine.estimate_team(*engine.issue_inputs(TICKET)))
+
+    # Case does not reach the estimator, so it does not change the key
+    assert engine.memo_estimate(memo, _ticket(summary='FIX broken login button'), 'team') == (digest, True, output)
+
+    for changed in (_ticket(description='The login button is not working in staging'), _ticket(issue_type='Task')):
+        assert engine.memo_estimate(memo, changed, 'team')[:2] != (digest, True)
+    assert engine.memo_estimate(memo, TICKET, 'fibonacci')[0] != digest
+
+
+def test_fibonacci_output_is_what_the_shell_estimator_prints(engine, tmp_path):
+    _, _, output = engine.memo_estimate(engine.EstimateMemo(str(tmp_path)), TICKET, 'fibonacci')
+    script = f'source "{LIB_DIR}/jira-estimate.sh"; estimate_story_points "$1" "$2" 2>&1'
+    res = subprocess.run(['bash', '-c', script, 'bash', TICKET['fields']['description'], TICKET['fields']['summary']],
+                         capture_output=True, text=True)
+    assert output == res.stdout
+
+
+def test_memo_and_comment_commands_count_skips(tmp_path):
+    env = {'PATH': os.environ['PATH'], 'JIRA_ESTIMATE_CACHE_DIR': str(tmp_path / 'memo')}
+
+    def shell(snippet, *args):
+        return subprocess.run(['bash', '-c', f'source "{LIB_DIR}/jira-estimate-team.sh"; {snippet}', 'bash', *args],
+                              env=env, capture_output=True, text=True)
+
+    first = shell('estimate_story_points_memo team "$1"', json.dumps(TICKET))
+    second = shell('estimate_story_points_memo team "$1"', json.dumps(TICKET))
+    digest, state, skipped = first.stdout.splitlines()[0].split()
+    assert (state, skipped) == ('miss', '0')
+    assert second.stdout.splitlines()[0] == f'{digest} hit 1'
+    assert first.stdout.split('\n', 1)[1] == second.stdout.split('\n', 1)[1]
+
+    assert shell('estimation_comment_posted P-1 "$1" 1', digest).returncode == 1
+    assert shell('estimation_comment_mark P-1 "$1" 1', digest).returncode == 0
+    res = shell('estimation_comment_posted P-1 "$1" 1', digest)
+    assert res.returncode == 0 and res.stdout == '1\n'
+    assert shell('estimation_comment_posted P-1 "$1" 2', digest).returncode == 1      # overridden points
+    assert shell('estimation_comment_posted "../x" "$1" 1', digest).returncode == 1
+
+    counters = json.loads((tmp_path / 'memo' / 'counters.json').read_text())
+    assert counters == {'estimates_skipped': 1, 'comments_skipped': 1}
+
+
+@pytest.mark.parametrize('scale', [[], ['--team-scale']])
+def test_regrooming_an_unchanged_ticket_skips_the_estimation_comment(tmp_path, mock_jira, scale):
+    # A copy of the scripts, so the groom's .temp files stay out of the repository
+    shutil.copytree(REPO_ROOT / 'scripts', tmp_path / 'scripts', ignore=shutil.ignore_patterns('__pycache__'))
+    env = jira_env(tmp_path, mock_jira, JIRA_ESTIMATE_CACHE_DIR=str(tmp_path / 'memo'), JIRA_API_TOKEN='t')
+
+    def groom():
+        res = subprocess.run(['bash', str(tmp_path / 'scripts' / 'jira-groom.sh'), 'MOCK-3', '--estimate',
+                              '--auto-estimate', *scale], env=env, capture_output=True, text=True,
+                             stdin=subprocess.DEVNULL, timeout=120)
+        assert res.returncode == 0, res.stdout + res.stderr
+        return res.stdout
+
+    def estimation_comments():
+        return [body for key, body in mock_jira.RequestHandlerClass.comments
+                if 'AI Story Point Estimation' in json.dumps(body)]
+
+    first = groom()
+    assert 'Added ADF-formatted estimation comment' in first and 'reusing it' not in first
+    assert len(estimation_comments()) == 1
+
+    second = groom()
+    assert 'reusing it (1 estimate(s) skipped so far)' in second
+    assert 'not posting it again (1 comment(s) skipped so far)' in second
+    assert len(estimation_comments()) == 1
+    assert first.count('Story points updated to') == second.count('Story points updated to') == 1
+    assert [line for line in first.splitlines() if 'Estimate' in line][:2] == \
+        [line for line in second.splitlines() if 'Estimate' in line][:2]
+
+    env['JIRA_ESTIMATE_NO_CACHE'] = '1'
+    groom()
+    assert len(estimation_comments()) == 2
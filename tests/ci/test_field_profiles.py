@@ -0,0 +1,58 @@
+"""Tests for issue field-projection profiles (jira_issue_profile / jira_get_issue_profile)."""
+
+import json
+import subprocess
+from pathlib import Path
+
+from tests.ci.support.mcp_helpers import load_jira_module
+from tests.ci.support.mock_jira_helpers import jira_env, mock_jira  # noqa: F401 (fixture)
+
+mod = load_jira_module()
+Metrics = mod.Metrics
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _bash(env, cmd):
+    script = f'source "{REPO_ROOT}/scripts/lib/jira-api.sh"; {cmd}'
+    return subprocess.run(['bash', '-c', script], env=env, capture_output=True, text=True, timeout=30)
+
+
+def test_profile_fetch_requests_only_its_fields(tmp_path, mock_jira):
+    res = _bash(jira_env(tmp_path, mock_jira, JIRA_MCP_PHASE_MARKERS='1'), 'jira_get_issue_profile MOCK-1 status')
+
+    assert res.returncode == 0, res.stderr
+    issue = json.loads(res.stdout)
+    assert issue['fields'] == {'status': {'name': 'To Do'}, 'issuetype': {'name': 'Story'}}
+    assert f'::jira-mcp-fetch profile=status bytes={len(res.stdout.rstrip())}' in res.stderr
+
+
+def test_unknown_profile_is_rejected(tmp_path, mock_jira):
+    res = _bash(jira_env(tmp_path, mock_jira), 'jira_get_issue_profile MOCK-1 everything')
+    assert res.returncode != 0
+    assert 'Unknown issue profile: everything' in res.stderr
+
+
+def test_profile_sizes_reports_bytes_saved(tmp_path, mock_jira):
+    res = subprocess.run(['bash', str(REPO_ROOT / 'scripts' / 'jira-fetch.sh'), '--profile-sizes', 'MOCK-1'],
+                         env=jira_env(tmp_path, mock_jira), capture_output=True, text=True, timeout=30)
+
+    assert res.returncode == 0, res.stderr
+    rows = {line.split()[0]: line.split() for line in res.stdout.splitlines()[1:]}
+    assert rows['full'][-1] == '0%'
+    assert int(rows['status'][-2]) < int(rows['groom'][-2]) < int(rows['full'][-2])
+    assert int(rows['status'][-1].rstrip('%')) > 50
+
+
+def test_fetch_markers_feed_per_profile_byte_counters():
+    m = Metrics()
+    assert m.record_marker('::jira-mcp-fetch profile=status bytes=58')
+    assert m.record_marker('::jira-mcp-fetch profile=status bytes=60')
+    assert m.record_marker('::jira-mcp-fetch profile=template-detect bytes=239')
+
+    assert m.summary()['fetch_profiles'] == {'status': {'fetches': 2, 'bytes': 118},
+                                             'template-detect': {'fetches': 1, 'bytes': 239}}
+    text = m.prometheus()
+    assert 'jira_mcp_fetch_bytes_total{profile="status"} 118' in text
+    assert 'jira_mcp_fetches_total{profile="template-detect"} 1' in text
+    assert mod._strip_phase_markers('a\n::jira-mcp-fetch profile=status bytes=58\nb\n') == 'a\nb\n'
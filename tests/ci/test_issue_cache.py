@@ -0,0 +1,196 @@
+"""Tests for the shared issue snapshot cache and its handoff to the bash scripts."""
+
+import asyncio
+import json
+import shutil
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+from tests.ci.support.mcp_helpers import load_jira_module
+
+mod = load_jira_module()
+JiraBashWrapper = mod.JiraBashWrapper
+IssueCache = mod.IssueCache
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_cache_lru_eviction_and_byte_cap():
+    cache = IssueCache(ttl=60, max_entries=2, max_bytes=1000)
+    cache.put('A-1', 'a' * 100, 't1')
+    cache.put('A-2', 'b' * 100, 't1')
+    assert cache.lookup('A-1')[2] is True      # A-1 becomes most recently used
+    cache.put('A-3', 'c' * 100, 't1')          # evicts A-2
+    assert cache.lookup('A-2') is None
+    assert cache.lookup('A-1') is not None
+
+    cache.put('A-4', 'd' * 950, 't1')          # over the byte cap: everything older goes
+    stats = cache.stats()
+    assert stats['bytes'] <= 1000
+    assert stats['entries'] == 1
+    assert stats['evictions'] >= 3
+    assert stats['hits'] >= 2 and stats['misses'] == 1
+
+
+def test_stale_entry_is_revalidated_against_updated():
+    w = JiraBashWrapper()
+    w.issue_cache = IssueCache(ttl=0.01)
+    issue = {'key': 'RVV-1', 'fields': {'updated': '2024-01-01T00:00:00.000+0000', 'summary': 's'}}
+    calls = []
+
+    def fake_fetch(key, fields=None):
+        calls.append(fields)
+        if fields == 'updated':
+            return {'fields': {'updated': issue['fields']['updated']}}
+        return issue
+
+    w._fetch_issue = fake_fetch
+    assert json.loads(w._get_issue_snapshot('RVV-1'))['key'] == 'RVV-1'
+    time.sleep(0.02)
+    w._get_issue_snapshot('RVV-1')             # stale but unchanged -> cheap revalidation
+    assert calls == [None, 'updated']
+    assert w.issue_cache.stats()['revalidations'] == 1
+
+    issue['fields']['updated'] = '2024-02-01T00:00:00.000+0000'
+    time.sleep(0.02)
+    w._get_issue_snapshot('RVV-1')             # changed -> full refetch
+    assert calls == [None, 'updated', 'updated', None]
+    assert w.issue_cache.stats()['refreshes'] == 1
+
+
+def test_jira_get_issue_answers_from_snapshot_dir(tmp_path):
+    (tmp_path / 'RVV-7.json').write_text('{"key":"RVV-7"}')
+    cmd = f'source "{REPO_ROOT}/scripts/lib/jira-api.sh"; jira_get_issue RVV-7'
+    res = subprocess.run(['bash', '-c', cmd], capture_output=True, text=True,
+                         env={'PATH': '/usr/bin:/bin', 'JIRA_ISSUE_SNAPSHOT_DIR': str(tmp_path)})
+    assert res.returncode == 0
+    assert json.loads(res.stdout)['key'] == 'RVV-7'
+
+
+def test_snapshot_dir_is_shared_by_threads_of_one_call(tmp_path, monkeypatch):
+    monkeypatch.setattr(mod.tempfile, 'tempdir', str(tmp_path))
+    call = mod._ToolCall(loop=None)
+    keys = [f'RVV-{n}' for n in range(32)]
+    barrier = threading.Barrier(len(keys))
+
+    def share(key):
+        barrier.wait()
+        call.share_snapshot(key, json.dumps({'key': key}))
+
+    threads = [threading.Thread(target=share, args=(key,)) for key in keys]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    try:
+        snapshot_dir = Path(call.env['JIRA_ISSUE_SNAPSHOT_DIR'])
+        assert sorted(p.name for p in snapshot_dir.iterdir()) == sorted(f'{key}.json' for key in keys)
+        assert list(tmp_path.iterdir()) == [snapshot_dir]
+    finally:
+        call.close()
+    assert not snapshot_dir.exists()
+
+
+def _stub_scripts(tmp_path):
+    """Stubs that read the ticket through the real jira_get_issue (no Jira configured)."""
+    scripts = tmp_path / 'scripts'
+    (scripts / 'lib').mkdir(parents=True)
+    for lib in ('jira-api.sh', 'utils.sh'):
+        shutil.copy(REPO_ROOT / 'scripts' / 'lib' / lib, scripts / 'lib' / lib)
+    count_file = tmp_path / 'fetches.txt'
+
+    def write(name, body):
+        p = scripts / name
+        p.write_text('#!/usr/bin/env bash\n' + body + '\n')
+        p.chmod(0o755)
+
+    write('jira-fetch.sh', f'echo "fetch $*" >> {count_file}\n'
+          'echo \'{"key":"RVV-1","fields":{"updated":"2024-01-01","summary":"Upgrade",'
+          '"issuetype":{"name":"Story"}}}\'')
+    write('get-description-template.sh', f'echo "template $*" >> {count_file}\n'
+          'echo .prompts/generate-description-story.md')
+    write('find-related-tickets.sh', 'source "$(dirname "$0")/lib/utils.sh"\n'
+          'source "$(dirname "$0")/lib/jira-api.sh"\n'
+          'jira_get_issue "$2" >/dev/null || exit 1\n'
+          'echo "related $*"')
+    # Reads the prefetched issue when given --issue-json, otherwise goes to jira_get_issue
+    write('jira-groom.sh', 'source "$(dirname "$0")/lib/utils.sh"\n'
+          'source "$(dirname "$0")/lib/jira-api.sh"\n'
+          'if [[ "${2:-}" == "--issue-json" ]]; then read_issue_json "$3" >/dev/null || exit 1\n'
+          'else jira_get_issue "$1" >/dev/null || exit 1; fi\n'
+          'echo "groomed $*"')
+    return scripts, count_file
+
+
+def test_auto_template_groom_fetches_issue_once(tmp_path):
+    scripts, count_file = _stub_scripts(tmp_path)
+    w = JiraBashWrapper()
+    w.scripts_dir = str(scripts)
+    handler = w.server._handlers['call_tool']
+
+    out = asyncio.run(handler('groom_ticket', {'ticket_key': 'RVV-1', 'auto_template': True}))
+    parsed = json.loads(out[0].text)
+
+    # Grooming succeeded without Jira credentials -> it used the prefetched issue
+    assert parsed['success'], parsed
+    assert 'groomed RVV-1 --issue-json -' in parsed['output']
+    # The template comes from the prefetched issue type; the template script never runs
+    assert parsed['template']['template_name'] == 'story'
+    assert count_file.read_text().splitlines() == ['fetch RVV-1 --json']
+    # Grooming changed the ticket, so it is no longer cached
+    assert w.issue_cache.lookup('RVV-1') is None
+
+
+def test_later_tool_calls_are_served_from_the_cached_snapshot(tmp_path):
+    scripts, count_file = _stub_scripts(tmp_path)
+    w = JiraBashWrapper()
+    w.scripts_dir = str(scripts)
+    handler = w.server._handlers['call_tool']
+
+    for _ in range(2):
+        out = asyncio.run(handler('find_related_tickets', {'ticket_key': 'RVV-1'}))
+        assert json.loads(out[0].text)['success'], out[0].text
+    # A separate, writing call reads the ticket from the snapshot too (no Jira configured)
+    out = asyncio.run(handler('groom_ticket', {'ticket_key': 'RVV-1'}))
+    assert json.loads(out[0].text)['success'], out[0].text
+
+    assert count_file.read_text().splitlines() == ['fetch RVV-1 --json']
+    assert w.issue_cache.stats()['hits'] == 2
+
+
+def test_prompt_template_from_cached_issue(tmp_path):
+    scripts, count_file = _stub_scripts(tmp_path)
+    w = JiraBashWrapper()
+    w.scripts_dir = str(scripts)
+    assert w._get_prompt_template('RVV-1').endswith('generate-description-story.md')
+    assert w._get_prompt_template('RVV-1').endswith('generate-description-story.md')
+    # Chosen from the cached issue: one fetch, and the template script never runs
+    assert count_file.read_text().splitlines() == ['fetch RVV-1 --json']
+
+
+def test_prompt_template_from_prefetched_issue():
+    w = JiraBashWrapper()
+    task = {'fields': {'issuetype': {'name': 'Task'}, 'summary': 'Investigate slow queries',
+                       'description': {'content': [{'content': [{'text': 'spike'}]}]}}}
+    assert w._get_prompt_template('RVV-1', issue=task).endswith('generate-description-spike.md')
+    bug = {'fields': {'issuetype': {'name': 'Defect'}, 'summary': 'x'}}
+    assert w._get_prompt_template('RVV-1', issue=bug).endswith('generate-description-bug.md')
+
+
+def test_scripts_accept_issue_json_without_jira_config(tmp_path):
+    issue = {'key': 'RVV-9', 'fields': {'summary': 'Upgrade to Java 21', 'status': {'name': 'Open'},
+                                        'issuetype': {'name': 'Task'}}}
+    env = {'PATH': '/usr/bin:/bin', 'HOME': str(tmp_path)}
+    res = subprocess.run([str(REPO_ROOT / 'scripts' / 'get-description-template.sh'), 'RVV-9',
+                          '--print', '--issue-json', '-'], input=json.dumps(issue),
+                         capture_output=True, text=True, env=env, cwd=tmp_path)
+    assert res.returncode == 0, res.stderr
+    assert res.stdout.strip().endswith('generate-description-tech-debt.md')
+
+    res = subprocess.run([str(REPO_ROOT / 'scripts' / 'jira-fetch.sh'), 'RVV-9', '--json',
+                          '--issue-json', '-'], input=json.dumps(issue),
+                         capture_output=True, text=True, env=env, cwd=tmp_path)
+    assert res.returncode == 0, res.stderr
+    assert json.loads(res.stdout.splitlines()[-1])['key'] == 'RVV-9'
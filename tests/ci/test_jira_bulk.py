@@ -0,0 +1,98 @@
+"""Tests for the bulk transition engine behind jira-sync.sh (scripts/lib/jira-bulk.sh)."""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+from tests.ci.support.mock_jira_helpers import jira_env, mock_jira  # noqa: F401 (fixture)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+DECISIONS = (
+    'MOCK-1\tIn Progress\tapi#1\n'
+    'MOCK-1\tDone\tweb#7\n'          # merged elsewhere: "Done" wins
+    'MOCK-2\tTo Do\tapi#2\n'         # already there
+    'GONE-9\tDone\tapi#3\n'          # not returned by the search
+    'MOCK-3\tBlocked\tapi#4\n'       # no such transition
+    'MOCK-4\tIn Progress\tweb#8\n'
+)
+
+
+def _bash(tmp_path, server, cmd, stdin=''):
+    env = jira_env(tmp_path, server)
+    libs = ' '.join(f'source "{REPO_ROOT}/scripts/lib/{name}";'
+                    for name in ('utils.sh', 'jira-api.sh', 'jira-search.sh', 'jira-bulk.sh'))
+    return subprocess.run(['bash', '-c', f'{libs} {cmd}'], input=stdin, env=env,
+                          capture_output=True, text=True, timeout=60)
+
+
+def test_plan_dedupes_and_looks_up_statuses_around_unknown_keys(tmp_path, mock_jira):
+    res = _bash(tmp_path, mock_jira, 'jira_bulk_plan; rate_limit_totals >&2', DECISIONS)
+
+    assert res.returncode == 0, res.stderr
+    assert res.stdout.splitlines() == [
+        'MOCK-1\tTo Do\tDone\tStory\tweb#7',
+        'MOCK-3\tTo Do\tBlocked\tStory\tapi#4',
+        'MOCK-4\tTo Do\tIn Progress\tStory\tweb#8',
+    ]
+    assert 'GONE-9 not found or inaccessible' in res.stderr
+    # Jira rejects the batch over GONE-9: all 5 keys, then GONE-9 + MOCK-1, GONE-9, MOCK-1, MOCK-2..4
+    assert res.stderr.splitlines()[-1].split()[0] == '5'
+
+
+def test_plan_lookups_are_one_search_per_batch(tmp_path, mock_jira):
+    res = _bash(tmp_path, mock_jira, 'jira_bulk_plan | wc -l; rate_limit_totals',
+                ''.join(line for line in DECISIONS.splitlines(keepends=True) if not line.startswith('GONE-9')))
+    assert res.returncode == 0, res.stderr
+    planned, totals = res.stdout.split('\n')[:2]
+    assert int(planned) == 3 and totals.split()[0] == '1'
+
+
+def test_plan_lookups_are_batched(tmp_path, mock_jira):
+    decisions = ''.join(f'MOCK-{n}\tDone\tapi#{n}\n' for n in range(1, 8))
+    res = _bash(tmp_path, mock_jira, 'JIRA_BULK_LOOKUP_BATCH=3; jira_bulk_plan | wc -l; rate_limit_totals',
+                decisions)
+    assert res.returncode == 0, res.stderr
+    planned, totals = res.stdout.split('\n')[:2]
+    assert int(planned) == 7 and totals.split()[0] == '3'
+
+
+def test_transitions_run_in_parallel_with_per_item_results(tmp_path, mock_jira):
+    plan = ''.join(f'MOCK-{n}\tTo Do\tDone\tStory\tapi#{n}\n' for n in range(1, 7))
+    plan += 'MOCK-9\tTo Do\tBlocked\tStory\tapi#9\n'
+    res = _bash(tmp_path, mock_jira, 'jira_bulk_transition 3', plan)
+
+    assert res.returncode == 0, res.stderr
+    results = [line.split('\t') for line in res.stdout.splitlines()]
+    assert [r[0] for r in results] == [f'MOCK-{n}' for n in range(1, 7)] + ['MOCK-9']
+    assert all(r[1:4] == ['ok', 'To Do', 'Done'] for r in results[:6])
+    assert results[6][1] == 'failed' and results[6][4] == "Transition 'Blocked' not found."
+    assert not list(tmp_path.glob('jira-bulk.*'))             # work directory cleaned up
+
+
+def test_print_plan_lists_every_transition(tmp_path, mock_jira):
+    res = _bash(tmp_path, mock_jira, 'jira_bulk_print_plan',
+                'MOCK-1\tTo Do\tDone\tStory\tweb#7\nMOCK-4\tTo Do\tIn Progress\tStory\tweb#8\n')
+    assert res.returncode == 0, res.stderr
+    lines = res.stdout.splitlines()
+    assert 'MOCK-1' in lines[0] and '→ Done' in lines[0] and 'web#7' in lines[0]
+    assert lines[-1].strip() == '2 transition(s) planned'
+
+
+def test_sync_moves_the_valid_tickets_when_a_key_does_not_exist(tmp_path, mock_jira):
+    prs = [{"number": 7, "title": "MOCK-1: Retry feed reads", "body": "Also GONE-9", "state": "MERGED",
+            "mergedAt": "2024-05-01T00:00:00Z", "url": ""},
+           {"number": 8, "title": "MOCK-4 WIP", "body": "", "state": "OPEN", "mergedAt": None, "url": ""}]
+    (tmp_path / 'prs.json').write_text(json.dumps(prs))
+    (tmp_path / 'bin').mkdir()
+    (tmp_path / 'bin' / 'gh').write_text(f'#!/usr/bin/env bash\ncat "{tmp_path}/prs.json"\n')
+    (tmp_path / 'bin' / 'gh').chmod(0o755)
+    env = jira_env(tmp_path, mock_jira, PATH=f"{tmp_path / 'bin'}:{os.environ['PATH']}", GITHUB_TOKEN='g')
+    res = subprocess.run(['bash', str(REPO_ROOT / 'scripts' / 'jira-sync.sh'), '--repo', 'acme/api'],
+                         env=env, capture_output=True, text=True, timeout=60)
+
+    assert res.returncode == 0, res.stdout + res.stderr
+    assert 'GONE-9 not found or inaccessible' in res.stderr
+    assert 'MOCK-1: To Do → Done' in res.stdout and 'MOCK-4: To Do → In Progress' in res.stdout
+    assert 'Updated: 2 tickets' in res.stdout
@@ -0,0 +1,68 @@
+"""Tests for the pooled Jira REST client against scripts/mock_jira.py."""
+
+import sys
+
+import pytest
+
+from tests.ci.support.mcp_helpers import load_jira_module
+from tests.ci.support.mock_jira_helpers import mock_jira  # noqa: F401 (fixture)
+
+mod = load_jira_module()
+JiraBashWrapper = mod.JiraBashWrapper
+JiraClient = mod.JiraClient
+JiraApiError = mod.JiraApiError
+
+
+@pytest.fixture
+def client(mock_jira):
+    c = JiraClient.from_env({'JIRA_BASE_URL': mock_jira.url, 'JIRA_EMAIL': 'me', 'JIRA_API_TOKEN': 't'})
+    yield c
+    c.close()
+
+
+def test_operations_reuse_one_connection(client):
+    issue = client.get_issue('MOCK-7', fields='summary,updated')
+    assert issue['key'] == 'MOCK-7' and issue['fields']['summary'] == 'Mock issue MOCK-7'
+    assert client.update_issue('MOCK-7', {'fields': {'summary': 'x'}}) is None
+    assert client.add_comment('MOCK-7', 'Estimated 3 points') == {'id': '10000'}
+    client.transition('MOCK-7', 'in progress')
+    found = client.search('project = MOCK', 'summary', max_results=3)
+    assert [i['key'] for i in found['issues']] == ['MOCK-1', 'MOCK-2', 'MOCK-3']
+
+    stats = client.stats()
+    assert stats['requests'] == 6
+    assert stats['connections_opened'] == 1 and stats['connections_reused'] == 5
+
+
+@pytest.mark.parametrize('key,status,message', [
+    ('AUTH-1', 401, 'Authentication failed. Check your JIRA_EMAIL and JIRA_TOKEN.'),
+    ('DENY-1', 403, 'Permission denied. Check your JIRA permissions.'),
+    ('GONE-1', 404, 'Resource not found.'),
+    ('FAIL-1', 500, 'API error (HTTP 500): {}'),
+])
+def test_status_codes_map_to_the_bash_errors(client, key, status, message):
+    with pytest.raises(JiraApiError) as exc:
+        client.get_issue(key)
+    assert exc.value.status == status and str(exc.value) == message
+
+
+def test_unknown_transition_lists_available_ones(client):
+    with pytest.raises(JiraApiError, match="Transition 'Blocked' not found. Available transitions: To Do, In Progress, Done"):
+        client.transition('MOCK-1', 'Blocked')
+
+
+def test_from_env_requires_jira_config():
+    assert JiraClient.from_env({'JIRA_BASE_URL': 'https://x.atlassian.net', 'JIRA_EMAIL': 'me'}) is None
+
+
+def test_server_fetches_and_resolves_jql_in_process(client):
+    w = JiraBashWrapper()
+    w.jira_client = client
+    w._run_script = lambda *a, **k: pytest.fail('expected no script to run')
+
+    assert w._fetch_issue('MOCK-3')['fields']['status']['name'] == 'To Do'
+    assert w._fetch_issue('GONE-1') is None
+    assert w._resolve_jql('project = MOCK', max_results=2) == {'success': True, 'ticket_keys': ['MOCK-1', 'MOCK-2']}
+    summary = w.metrics_summary()
+    assert summary['phases']['jira_fetch']['count'] == 2
+    assert summary['jira_client']['requests'] == 3
@@ -0,0 +1,103 @@
+"""Tests for the local SQLite ticket mirror (scripts/lib/jira-mirror.sh and jira_mirror.py)."""
+
+import json
+import subprocess
+from pathlib import Path
+
+from tests.ci.support.mock_jira_helpers import jira_env, mock_jira  # noqa: F401 (fixture)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _bash(env, cmd):
+    """Run `cmd` after the search libraries; returns (stdout lines, requests made)"""
+    libs = ' '.join(f'source "{REPO_ROOT}/scripts/lib/{name}";' for name in ('utils.sh', 'jira-api.sh', 'jira-search.sh'))
+    script = f'''{libs}
+before=$(rate_limit_totals | cut -d' ' -f1)
+{cmd}
+echo $(( $(rate_limit_totals | cut -d' ' -f1) - before ))'''
+    res = subprocess.run(['bash', '-c', script], env=env, capture_output=True, text=True, timeout=60)
+    assert res.returncode == 0, res.stderr
+    lines = res.stdout.splitlines()
+    return lines[:-1], int(lines[-1])
+
+
+def _sync(env, full=False):
+    res = subprocess.run(['bash', str(REPO_ROOT / 'scripts' / 'jira-mirror.sh')] + (['--full'] if full else []),
+                         env=env, capture_output=True, text=True, timeout=60)
+    assert res.returncode == 0, res.stderr
+    return res.stdout
+
+
+def test_loaded_mirror_answers_epic_and_text_searches_offline(tmp_path, mock_jira):
+    env = jira_env(tmp_path, mock_jira)
+    assert '30 ticket(s) written' in _sync(env)
+
+    lines, requests = _bash(env, '''
+jira_search_epic_stream MOCK-1 | jira_extract_keys | tr '\\n' ' '; echo
+jira_search_text_stream MOCK "description of mock-7" | jira_extract_summaries
+jira_search_by_text MOCK "MOCK-12" | jira_search_count''')
+
+    assert requests == 0
+    assert lines[0].split() == [f'MOCK-{n}' for n in range(2, 31, 2)]
+    assert lines[1:] == ['MOCK-7: Mock issue MOCK-7', '1']
+
+
+def test_incremental_sync_fetches_only_updated_tickets(tmp_path, mock_jira):
+    env = jira_env(tmp_path, mock_jira)
+    _sync(env)
+    mock_jira.RequestHandlerClass.edits.update({'MOCK-4': 'Payment retry timeout'})
+
+    assert '1 ticket(s) written' in _sync(env)
+    lines, requests = _bash(env, 'jira_search_text_stream MOCK "retry payment" | jira_extract_summaries')
+    assert requests == 0 and lines == ['MOCK-4: Payment retry timeout']
+
+
+def test_full_sync_drops_deleted_tickets(tmp_path, mock_jira):
+    env = jira_env(tmp_path, mock_jira)
+    _sync(env)
+    mock_jira.RequestHandlerClass.project_total = 20
+
+    assert '20 ticket(s) written' in _sync(env, full=True)
+    assert 'Tickets: 20' in _sync(env, full=False)
+
+
+def test_searches_fall_back_to_jira_when_mirror_is_unusable(tmp_path, mock_jira):
+    search = 'jira_search_text_stream MOCK "issue" | jira_search_count'
+    # Never loaded
+    lines, requests = _bash(jira_env(tmp_path, mock_jira), search)
+    assert (lines, requests) == (['30'], 1)
+
+    # Loaded but disabled, or carrying extra filters the mirror cannot evaluate
+    _sync(jira_env(tmp_path, mock_jira))
+    _, requests = _bash(jira_env(tmp_path, mock_jira, JIRA_MIRROR='0', JIRA_SEARCH_NO_CACHE='1'), search)
+    assert requests == 1
+    _, requests = _bash(jira_env(tmp_path, mock_jira, JIRA_SEARCH_NO_CACHE='1'),
+                        'jira_search_text_stream MOCK "issue" "AND status = Done" >/dev/null')
+    assert requests == 1
+
+    # Stale without auto-sync
+    _, requests = _bash(jira_env(tmp_path, mock_jira, JIRA_MIRROR_MAX_AGE='-1', JIRA_MIRROR_AUTO_SYNC='0',
+                             JIRA_SEARCH_NO_CACHE='1'), search)
+    assert requests == 1
+
+
+def test_stale_mirror_syncs_once_before_answering(tmp_path, mock_jira):
+    _sync(jira_env(tmp_path, mock_jira))
+    mock_jira.RequestHandlerClass.edits.update({'MOCK-9': 'Freshly edited'})
+
+    lines, requests = _bash(jira_env(tmp_path, mock_jira, JIRA_MIRROR_MAX_AGE='-1'),
+                            'jira_search_text_stream MOCK "freshly" | jira_extract_keys')
+    assert (lines, requests) == (['MOCK-9'], 1)
+
+
+def test_find_related_tickets_reads_the_mirror(tmp_path, mock_jira):
+    env = jira_env(tmp_path, mock_jira)
+    _sync(env)
+    res = subprocess.run(['bash', str(REPO_ROOT / 'scripts' / 'find-related-tickets.sh'), '--epic', 'MOCK-1'],
+                         env=env, capture_output=True, text=True, timeout=60)
+
+    assert res.returncode == 0, res.stderr
+    assert 'Found 15 tickets' in res.stdout
+    result = json.loads(res.stdout[res.stdout.rindex('\n{'):])
+    assert result['total'] == 15 and result['issues'][0]['fields']['parent'] == {'key': 'MOCK-1'}
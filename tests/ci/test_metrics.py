@@ -0,0 +1,96 @@
+"""Tests for tool/phase metrics and the metrics://summary resource."""
+
+import asyncio
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+from tests.ci.support.mcp_helpers import load_jira_module
+
+mod = load_jira_module()
+JiraBashWrapper = mod.JiraBashWrapper
+Metrics = mod.Metrics
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Reports two phases through the real utils.sh helpers; RVV-2 fails after its fetch
+GROOM_STUB = '''#!/usr/bin/env bash
+set -euo pipefail
+source "$(dirname "${BASH_SOURCE[0]}")/lib/utils.sh"
+phase_start jira_fetch
+sleep 0.1
+phase_end jira_fetch
+if [[ "$1" == "RVV-2" ]]; then
+    error "Update rejected"
+    exit 1
+fi
+phase_start jira_update
+phase_end jira_update
+echo "groomed $1"
+'''
+
+
+def test_metrics_histograms_and_prometheus_text():
+    m = Metrics()
+    for seconds in (0.2, 0.3, 4.0):
+        m.record_call('groom_ticket', seconds, error=False)
+    m.record_call('groom_ticket', 0.1, error=True)
+    assert m.record_marker('::jira-mcp-phase name=llm_call ms=1500')
+    assert not m.record_marker('ℹ️  Fetching ticket details...')
+
+    summary = m.summary()
+    groom = summary['tools']['groom_ticket']
+    assert groom['calls'] == 4 and groom['errors'] == 1
+    assert groom['latency']['p50_seconds'] == 0.25
+    assert groom['latency']['p95_seconds'] == 4.0
+    assert summary['phases']['llm_call']['sum_seconds'] == 1.5
+
+    text = m.prometheus()
+    assert 'jira_mcp_tool_calls_total{tool="groom_ticket"} 4' in text
+    assert 'jira_mcp_tool_errors_total{tool="groom_ticket"} 1' in text
+    assert 'jira_mcp_tool_duration_seconds_bucket{tool="groom_ticket",le="0.25"} 2' in text
+    assert 'jira_mcp_phase_duration_seconds_count{phase="llm_call"} 1' in text
+
+
+def test_tool_calls_and_script_phases_reach_the_summary_resource(tmp_path):
+    scripts = tmp_path / 'scripts'
+    shutil.copytree(REPO_ROOT / 'scripts' / 'lib', scripts / 'lib')
+    (scripts / 'jira-groom.sh').write_text(GROOM_STUB)
+    (scripts / 'jira-groom.sh').chmod(0o755)
+    w = JiraBashWrapper()
+    w.scripts_dir = str(scripts)
+    w.metrics_file = str(tmp_path / 'jira_mcp.prom')
+    call_tool = w.server._handlers['call_tool']
+
+    async def run():
+        return await asyncio.gather(call_tool('groom_ticket', {'ticket_key': 'RVV-1'}),
+                                    call_tool('groom_ticket', {'ticket_key': 'RVV-2'}))
+
+    ok, failed = asyncio.run(run())
+    w.script_pool.workers.close()
+
+    # Marker lines are consumed by the metrics, not returned to the client
+    assert json.loads(ok[0].text)['output'] == 'groomed RVV-1\n'
+    error = json.loads(failed[0].text)['error']
+    assert 'Update rejected' in error and '::jira-mcp-phase' not in error
+
+    resources = asyncio.run(w.server._handlers['list_resources']())
+    assert 'metrics://summary' in [r['uri'] for r in resources]
+    summary = json.loads(asyncio.run(w.server._handlers['read_resource']('metrics://summary')))
+    groom = summary['tools']['groom_ticket']
+    assert groom['calls'] == 2 and groom['errors'] == 1
+    assert summary['phases']['jira_fetch']['count'] == 2
+    assert summary['phases']['jira_fetch']['sum_seconds'] >= 0.2
+    assert summary['phases']['jira_update']['count'] == 1
+    assert 'issue_cache' in summary and 'workers' in summary
+
+    prom = (tmp_path / 'jira_mcp.prom').read_text()
+    assert 'jira_mcp_tool_calls_total{tool="groom_ticket"} 2' in prom
+
+
+def test_phase_markers_are_silent_outside_the_server():
+    cmd = f'source "{REPO_ROOT}/scripts/lib/utils.sh"; phase_start x; phase_end x'
+    res = subprocess.run(['bash', '-c', cmd], capture_output=True, text=True,
+                         env={'PATH': '/usr/bin:/bin'})
+    assert res.returncode == 0 and res.stderr == ''
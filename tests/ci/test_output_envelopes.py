@@ -0,0 +1,80 @@
+"""Tests for capping inline tool output and serving the rest as output:// resources."""
+
+import asyncio
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from tests.ci.support.mcp_helpers import load_jira_module
+
+mod = load_jira_module()
+JiraBashWrapper = mod.JiraBashWrapper
+OutputStore = mod.OutputStore
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# ~30KB of related-ticket lines with status lines at both ends (stdout only)
+RELATED_STUB = '''#!/usr/bin/env bash
+source "$(dirname "${BASH_SOURCE[0]}")/lib/utils.sh"
+info "Searching tickets related to $2..."
+for i in $(seq 1 1000); do echo "RVV-$i  Related ticket summary $i"; done
+success "Found 1000 related tickets"
+'''
+
+
+def _wrapper(tmp_path):
+    scripts = tmp_path / 'scripts'
+    shutil.copytree(REPO_ROOT / 'scripts' / 'lib', scripts / 'lib')
+    (scripts / 'find-related-tickets.sh').write_text(RELATED_STUB)
+    (scripts / 'find-related-tickets.sh').chmod(0o755)
+    w = JiraBashWrapper()
+    w.scripts_dir = str(scripts)
+    w.script_pool.workers = None
+    w.inline_output_chars = 4096
+    w.output_store = OutputStore(max_entries=2, chunk_chars=10000)
+    return w
+
+
+def test_large_output_is_capped_and_readable_in_chunks(tmp_path):
+    w = _wrapper(tmp_path)
+    handlers = w.server._handlers
+
+    out = asyncio.run(handlers['call_tool']('find_related_tickets', {'ticket_key': 'RVV-1'}))
+    result = json.loads(out[0].text)
+
+    assert result['success'] and result['ticket_key'] == 'RVV-1'
+    assert len(result['output']) <= 4096 and result['output'].endswith('\n')
+    overflow = result['output_overflow']
+    assert overflow['total_lines'] == 1002
+    assert overflow['chunks'] == -(-overflow['total_chars'] // 10000)
+    assert overflow['highlights'] == ['ℹ️  Searching tickets related to RVV-1...',
+                                      '✅ Found 1000 related tickets']
+
+    uri = overflow['uri']
+    assert uri in [r['uri'] for r in asyncio.run(handlers['list_resources']())]
+    full = asyncio.run(handlers['read_resource'](uri))
+    assert len(full) == overflow['total_chars'] and full.startswith(result['output'])
+    parts = [asyncio.run(handlers['read_resource'](f'{uri}?chunk={i}')) for i in range(overflow['chunks'])]
+    assert ''.join(parts) == full
+    with pytest.raises(ValueError):
+        asyncio.run(handlers['read_resource'](f"{uri}?chunk={overflow['chunks']}"))
+
+
+def test_output_store_evicts_least_recently_read():
+    store = OutputStore(max_entries=2)
+    a, b = store.put('t', 'a' * 10), store.put('t', 'b' * 10)
+    assert store.read(a) == 'a' * 10            # a is now the most recent
+    c = store.put('t', 'c' * 10)
+
+    assert store.read(b) is None
+    assert store.read(a) and store.read(c)
+    assert store.stats()['evictions'] == 1
+
+
+def test_small_results_are_unchanged(tmp_path):
+    w = _wrapper(tmp_path)
+    result = {'success': True, 'output': 'short\n'}
+    assert w._bound_result('find_related_tickets', result) is result
+    assert w.output_store.stats()['stored'] == 0
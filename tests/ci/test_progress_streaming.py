@@ -0,0 +1,112 @@
+"""Tests for streaming script progress lines as MCP progress notifications."""
+
+import asyncio
+import json
+import shutil
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+from tests.ci.support.mcp_helpers import load_jira_module
+
+mod = load_jira_module()
+JiraBashWrapper = mod.JiraBashWrapper
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Prints progress through the real utils.sh helpers; the pauses keep stdout/stderr order
+GROOM_STUB = '''#!/usr/bin/env bash
+source "$(dirname "${BASH_SOURCE[0]}")/lib/utils.sh"
+info "Fetching ticket details for $1..."
+echo "plain output line"
+sleep 0.6
+warning "No reference file given"
+sleep 0.3
+success "Ticket $1 updated"
+'''
+
+
+class FakeSession:
+    def __init__(self):
+        self.sent = []
+
+    async def send_progress_notification(self, progress_token, progress, total=None, message=None):
+        self.sent.append((progress_token, progress, message, time.monotonic()))
+
+
+def _wrapper(tmp_path, warm, progress_token='tok-1'):
+    scripts = tmp_path / 'scripts'
+    shutil.copytree(REPO_ROOT / 'scripts' / 'lib', scripts / 'lib')
+    (scripts / 'jira-groom.sh').write_text(GROOM_STUB)
+    (scripts / 'jira-groom.sh').chmod(0o755)
+
+    w = JiraBashWrapper()
+    w.scripts_dir = str(scripts)
+    if not warm:
+        w.script_pool.workers = None
+    session = FakeSession()
+    w.server.request_context = types.SimpleNamespace(
+        meta=types.SimpleNamespace(progressToken=progress_token), session=session)
+    return w, session
+
+
+@pytest.mark.parametrize('warm', [False, True], ids=['forked', 'warm-worker'])
+def test_progress_lines_stream_before_the_result(tmp_path, warm):
+    w, session = _wrapper(tmp_path, warm)
+    handler = w.server._handlers['call_tool']
+
+    out = asyncio.run(handler('groom_ticket', {'ticket_key': 'RVV-1'}))
+    finished = time.monotonic()
+    if w.script_pool.workers is not None:
+        w.script_pool.workers.close()
+
+    assert [(p, m) for _, p, m, _ in session.sent] == [
+        (1, 'ℹ️  Fetching ticket details for RVV-1...'),
+        (2, '⚠️  No reference file given'),
+        (3, '✅ Ticket RVV-1 updated'),
+    ]
+    assert all(token == 'tok-1' for token, *_ in session.sent)
+    # The first line arrived while the script was still sleeping
+    assert finished - session.sent[0][3] > 0.4
+    # The full output is still returned at the end
+    output = json.loads(out[0].text)['output']
+    assert 'plain output line' in output and 'Ticket RVV-1 updated' in output
+
+
+def test_batch_progress_is_sent_as_notifications(tmp_path):
+    w, session = _wrapper(tmp_path, warm=False)
+    handler = w.server._handlers['call_tool']
+
+    out = asyncio.run(handler('groom_tickets', {'ticket_keys': ['RVV-1', 'RVV-2'], 'max_parallel': 2}))
+
+    assert json.loads(out[0].text)['succeeded'] == 2
+    assert [p for _, p, _, _ in session.sent] == list(range(1, len(session.sent) + 1))
+    messages = [m for _, _, m, _ in session.sent]
+    batch = [m for m in messages if m.startswith('[')]
+    assert [m[:5] for m in batch] == ['[1/2]', '[2/2]']
+    assert {m.split()[1] for m in batch} == {'RVV-1', 'RVV-2'}
+    # Each ticket's line follows its script's own progress lines
+    for line in batch:
+        assert messages.index(line) > messages.index(f'✅ Ticket {line.split()[1]} updated')
+
+
+def test_no_notifications_without_progress_token(tmp_path):
+    w, session = _wrapper(tmp_path, warm=False, progress_token=None)
+    handler = w.server._handlers['call_tool']
+
+    out = asyncio.run(handler('groom_ticket', {'ticket_key': 'RVV-1'}))
+
+    assert json.loads(out[0].text)['success']
+    assert session.sent == []
+
+
+def test_line_splitter_skips_overlong_lines():
+    lines = []
+    splitter = mod._LineSplitter('stdout', lambda stream, line: lines.append(line))
+    splitter.MAX_LINE = 8
+    splitter.feed(b'short\n' + b'x' * 10)
+    splitter.feed(b'yyyy\nnext line\npart')
+    splitter.close()
+    assert lines == ['short', 'next line', 'part']
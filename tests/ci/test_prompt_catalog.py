@@ -0,0 +1,89 @@
+"""Tests for the in-memory prompt template catalog behind prompt:// resources."""
+
+import asyncio
+import builtins
+import os
+import time
+
+from tests.ci.support.mcp_helpers import load_jira_module
+
+mod = load_jira_module()
+JiraBashWrapper = mod.JiraBashWrapper
+PromptCatalog = mod.PromptCatalog
+
+
+def _wrapper(prompts):
+    w = JiraBashWrapper()
+    w.prompts_dir = str(prompts)
+    return w
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_resources_served_from_memory_and_reloaded_on_change(tmp_path, monkeypatch):
+    prompts = tmp_path / '.prompts'
+    prompts.mkdir()
+    (prompts / 'generate-description-story.md').write_text('# story v1')
+    (prompts / 'README.md').write_text('not a template')
+    w = _wrapper(prompts)
+    list_resources = w.server._handlers['list_resources']
+    read_resource = w.server._handlers['read_resource']
+
+    uris = [r['uri'] for r in asyncio.run(list_resources())]
+    assert uris == ['metrics://summary', 'prompt://generate-description-story.md']
+
+    # Unchanged files are not opened again
+    opened = []
+    real_open = builtins.open
+    monkeypatch.setattr(builtins, 'open', lambda f, *a, **k: opened.append(f) or real_open(f, *a, **k))
+    for _ in range(3):
+        assert asyncio.run(read_resource('prompt://generate-description-story.md')) == '# story v1'
+        asyncio.run(list_resources())
+    assert opened == []
+
+    # Same content with a new mtime is re-hashed but not counted as a reload
+    _bump_mtime(prompts / 'generate-description-story.md')
+    asyncio.run(read_resource('prompt://generate-description-story.md'))
+    assert w.prompt_catalog.reloads == 0
+
+    (prompts / 'generate-description-story.md').write_text('# story v2 (longer)')
+    (prompts / 'generate-description-bug.md').write_text('# bug')
+    assert asyncio.run(read_resource('prompt://generate-description-story.md')) == '# story v2 (longer)'
+    uris = [r['uri'] for r in asyncio.run(list_resources())]
+    assert 'prompt://generate-description-bug.md' in uris
+    assert w.metrics_summary()['prompt_catalog']['reloads'] == 1
+
+
+def test_watcher_refreshes_in_background(tmp_path):
+    prompts = tmp_path / '.prompts'
+    prompts.mkdir()
+    (prompts / 'generate-description-bug.md').write_text('# bug v1')
+    catalog = PromptCatalog(str(prompts))
+    catalog.start_watching(0.05)
+    try:
+        assert catalog.content('generate-description-bug.md') == '# bug v1'
+        (prompts / 'generate-description-bug.md').write_text('# bug v2, edited')
+        for _ in range(40):
+            if catalog.content('generate-description-bug.md') != '# bug v1':
+                break
+            time.sleep(0.05)
+        assert catalog.content('generate-description-bug.md') == '# bug v2, edited'
+        (prompts / 'generate-description-bug.md').unlink()
+        time.sleep(0.3)
+        assert 'generate-description-bug.md' not in catalog
+    finally:
+        catalog.stop_watching()
+
+
+def test_prompt_template_falls_back_to_default_when_missing(tmp_path):
+    prompts = tmp_path / '.prompts'
+    prompts.mkdir()
+    for name in ('generate-description-default.md', 'generate-description-bug.md'):
+        (prompts / name).write_text(name)
+    w = _wrapper(prompts)
+
+    assert w._get_prompt_template('RVV-1', issue_type='Bug') == str(prompts / 'generate-description-bug.md')
+    assert w._get_prompt_template('RVV-1', issue_type='Story') == str(prompts / 'generate-description-default.md')
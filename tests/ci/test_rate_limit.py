@@ -0,0 +1,75 @@
+"""Tests for the shared rate-limit governor (scripts/lib/rate-limit.sh and RateLimiter)."""
+
+import subprocess
+import time
+from pathlib import Path
+
+from tests.ci.support.mcp_helpers import load_jira_module
+from tests.ci.support.mock_jira_helpers import jira_env, mock_jira  # noqa: F401 (fixture)
+
+mod = load_jira_module()
+JiraClient = mod.JiraClient
+RateLimiter = mod.RateLimiter
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _env(tmp_path, server=None, **extra):
+    return jira_env(tmp_path, server, JIRA_RATE_LIMIT_BACKOFF_MS='50', **extra)
+
+
+def _bash(env, cmd):
+    script = f'source "{REPO_ROOT}/scripts/lib/jira-api.sh"; {cmd}'
+    return subprocess.run(['bash', '-c', script], env=env, capture_output=True, text=True, timeout=30)
+
+
+def test_bash_calls_retry_429_after_retry_after(tmp_path, mock_jira):
+    env = _env(tmp_path, mock_jira, JIRA_MCP_PHASE_MARKERS='1')
+    started = time.monotonic()
+    res = _bash(env, 'jira_get_issue THROTTLE-1; echo; rate_limit_totals')
+    elapsed = time.monotonic() - started
+
+    assert res.returncode == 0, res.stderr
+    body, totals = res.stdout.rsplit('\n', 2)[:2]
+    assert '"key": "THROTTLE-1"' in body
+    requests, wait_ms, throttled = map(int, totals.split())
+    assert (requests, throttled) == (2, 1)
+    assert elapsed >= 1.0 and wait_ms >= 1000         # Retry-After: 1 beats the 50ms backoff
+    assert 'HTTP 429' in res.stderr and '::jira-mcp-phase name=throttle_wait' in res.stderr
+
+
+def test_bash_gives_up_after_max_retries(tmp_path, mock_jira):
+    env = _env(tmp_path, mock_jira, JIRA_RATE_LIMIT_MAX_RETRIES='0')
+    res = _bash(env, 'jira_get_issue THROTTLE-5')
+    assert res.returncode == 1 and 'API error (HTTP 429)' in res.stderr
+
+
+def test_python_client_retries_and_reports_wait(tmp_path, mock_jira):
+    waits = []
+    env = _env(tmp_path, mock_jira)
+    client = JiraClient.from_env(env, on_throttle=waits.append)
+    try:
+        assert client.get_issue('THROTTLE-1')['key'] == 'THROTTLE-1'
+    finally:
+        client.close()
+    assert client.stats()['requests'] == 2
+    assert sum(waits) >= 1.0
+    totals = client.rate_limiter.totals()
+    assert totals['throttled'] == 1 and totals['process_throttled'] == 1
+
+
+def test_bucket_is_shared_between_python_and_bash(tmp_path):
+    env = _env(tmp_path, JIRA_RATE_LIMIT_RPS='10', JIRA_RATE_LIMIT_BURST='1')
+    limiter = RateLimiter.from_env(env)
+    assert limiter.acquire() == 0                    # a new bucket starts full
+
+    # Python already spent the only token: the script waits ~0.1s for the refill
+    res = _bash(env, 'rate_limit_acquire; rate_limit_totals')
+    requests, wait_ms, _ = map(int, res.stdout.split())
+    assert requests == 2 and 50 <= wait_ms <= 150
+
+    # A 429 seen by Python pauses the scripts too
+    limiter.backoff(0, retry_after='1')
+    started = time.monotonic()
+    _bash(env, 'rate_limit_acquire')
+    assert time.monotonic() - started >= 0.9
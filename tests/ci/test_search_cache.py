@@ -0,0 +1,92 @@
+"""Tests for the on-disk JQL result cache (jira_search_stream_cached in scripts/lib/jira-search.sh)."""
+
+import json
+import subprocess
+from pathlib import Path
+
+from tests.ci.support.mock_jira_helpers import jira_env, mock_jira  # noqa: F401 (fixture)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _search(tmp_path, server, jql, fields='summary', max_results=0, **extra):
+    """Run one cached search in a fresh shell; returns (keys and summaries, requests made)"""
+    env = jira_env(tmp_path, server, JIRA_SEARCH_PAGE_SIZE='10', **extra)
+    libs = ' '.join(f'source "{REPO_ROOT}/scripts/lib/{name}";' for name in ('utils.sh', 'jira-api.sh', 'jira-search.sh'))
+    script = f'''{libs}
+before=$(rate_limit_totals | cut -d' ' -f1)
+jira_search_stream_cached '{jql}' '{fields}' {max_results} > "$TMPDIR/out.ndjson"
+echo $(( $(rate_limit_totals | cut -d' ' -f1) - before ))'''
+    res = subprocess.run(['bash', '-c', script], env=env, capture_output=True, text=True, timeout=60)
+    assert res.returncode == 0, res.stderr
+    issues = [json.loads(line) for line in (tmp_path / 'out.ndjson').read_text().splitlines()]
+    return [(i['key'], i['fields']['summary']) for i in issues], int(res.stdout.split()[-1])
+
+
+def test_repeat_search_is_served_from_disk(tmp_path, mock_jira):
+    first, requests = _search(tmp_path, mock_jira, 'mocktotal = 30')
+    assert len(first) == 30 and requests == 3
+
+    # Same query modulo whitespace and keyword case, same fields in another order
+    again, requests = _search(tmp_path, mock_jira, '  mocktotal   =  30 ', fields='summary,summary')
+    assert again == first and requests == 0
+
+
+def test_revalidation_merges_only_updated_issues(tmp_path, mock_jira):
+    jql = 'mocktotal = 30 order by key asc'
+    _search(tmp_path, mock_jira, jql)
+    mock_jira.RequestHandlerClass.edits.update({'MOCK-2': 'Edited', 'MOCK-0': 'New'})
+
+    merged, requests = _search(tmp_path, mock_jira, jql, JIRA_SEARCH_CACHE_FRESH='0')
+
+    assert requests == 1                                   # the "updated >=" delta only
+    assert merged[:3] == [('MOCK-0', 'New'), ('MOCK-1', 'Mock issue MOCK-1'), ('MOCK-2', 'Edited')]
+    assert len(merged) == 31
+
+
+def test_capped_recent_first_query_puts_new_issues_on_top(tmp_path, mock_jira):
+    jql = 'mocktotal = 30 ORDER BY updated DESC'
+    first, _ = _search(tmp_path, mock_jira, jql, max_results=5)
+    mock_jira.RequestHandlerClass.edits.update({'MOCK-3': 'Edited', 'MOCK-31': 'New'})
+
+    merged, requests = _search(tmp_path, mock_jira, jql, max_results=5, JIRA_SEARCH_CACHE_FRESH='0')
+
+    assert requests == 1
+    # The delta comes back most recently updated first and leads the capped list
+    assert merged == [('MOCK-3', 'Edited'), ('MOCK-31', 'New')] + [i for i in first if i[0] != 'MOCK-3'][:3]
+
+
+def test_capped_query_in_another_order_is_refetched_when_it_changed(tmp_path, mock_jira):
+    jql = 'mocktotal = 30 ORDER BY created DESC'
+    _search(tmp_path, mock_jira, jql, max_results=5)
+    _, unchanged = _search(tmp_path, mock_jira, jql, max_results=5, JIRA_SEARCH_CACHE_FRESH='0')
+    mock_jira.RequestHandlerClass.edits['MOCK-31'] = 'New'
+
+    _, changed = _search(tmp_path, mock_jira, jql, max_results=5, JIRA_SEARCH_CACHE_FRESH='0')
+
+    assert unchanged == 1                                  # an empty delta keeps the entry
+    assert changed == 2                                    # delta, then the full fetch
+
+
+def test_max_age_forces_a_full_refetch(tmp_path, mock_jira):
+    _search(tmp_path, mock_jira, 'mocktotal = 30')
+    _, requests = _search(tmp_path, mock_jira, 'mocktotal = 30',
+                          JIRA_SEARCH_CACHE_FRESH='0', JIRA_SEARCH_CACHE_MAX_AGE='0')
+    assert requests == 3
+
+
+def test_bypass_flag_skips_the_cache(tmp_path, mock_jira):
+    _, requests = _search(tmp_path, mock_jira, 'mocktotal = 5', JIRA_SEARCH_NO_CACHE='1')
+    _, again = _search(tmp_path, mock_jira, 'mocktotal = 5', JIRA_SEARCH_NO_CACHE='1')
+    assert (requests, again) == (1, 1)
+    assert not list((tmp_path / 'cache').glob('*.ndjson'))
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, mock_jira):
+    limit = {'JIRA_SEARCH_CACHE_MAX_BYTES': '3000'}       # room for about one 30-issue entry
+    _search(tmp_path, mock_jira, 'mocktotal = 30', **limit)
+    _search(tmp_path, mock_jira, 'mocktotal = 31', **limit)
+
+    entries = list((tmp_path / 'cache').glob('*.ndjson'))
+    assert len(entries) == 1 and entries[0].read_text().count('\n') == 31
+    assert len(list((tmp_path / 'cache').glob('*.meta'))) == 1
@@ -0,0 +1,96 @@
+"""Tests for paginated, streaming JQL search (jira_search_stream and JiraClient.iter_search)."""
+
+import json
+import subprocess
+from pathlib import Path
+
+from tests.ci.support.mcp_helpers import load_jira_module
+from tests.ci.support.mock_jira_helpers import jira_env, mock_jira  # noqa: F401 (fixture)
+
+mod = load_jira_module()
+JiraClient = mod.JiraClient
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _bash(env, cmd):
+    libs = ' '.join(f'source "{REPO_ROOT}/scripts/lib/{name}";' for name in ('utils.sh', 'jira-api.sh', 'jira-search.sh'))
+    return subprocess.run(['bash', '-c', f'{libs} {cmd}'], env=env, capture_output=True, text=True, timeout=60)
+
+
+def test_stream_follows_every_page_as_ndjson(tmp_path, mock_jira):
+    env = jira_env(tmp_path, mock_jira, JIRA_SEARCH_PAGE_SIZE='7')
+    res = _bash(env, 'jira_search_stream "mocktotal = 30" summary; rate_limit_totals >&2')
+
+    assert res.returncode == 0, res.stderr
+    issues = [json.loads(line) for line in res.stdout.splitlines()]
+    assert [i['key'] for i in issues] == [f'MOCK-{n}' for n in range(1, 31)]
+    assert issues[0]['fields'] == {'summary': 'Mock issue MOCK-1'}
+    assert res.stderr.splitlines()[-1].split()[0] == '5'       # ceil(30 / 7) pages
+    assert not list(tmp_path.glob('jira-search.*'))
+
+
+def test_max_results_stops_paging_and_warns(tmp_path, mock_jira):
+    env = jira_env(tmp_path, mock_jira, JIRA_SEARCH_PAGE_SIZE='5')
+    res = _bash(env, 'jira_search_stream "mocktotal = 30" summary 12 | jira_extract_keys; rate_limit_totals')
+
+    assert res.returncode == 0, res.stderr
+    lines = res.stdout.splitlines()
+    assert lines[:-1] == [f'MOCK-{n}' for n in range(1, 13)]
+    assert lines[-1].split()[0] == '3'                          # 5 + 5 + 2
+    assert 'Stopped at 12 results' in res.stderr
+
+
+def test_helpers_accept_search_json_and_streams(tmp_path, mock_jira):
+    res = _bash(jira_env(tmp_path, mock_jira), '''
+r=$(jira_search "mocktotal = 120" summary 0)
+jira_search_count "$r"
+jira_extract_keys "$r" | tail -1
+jira_search_stream "mocktotal = 3" summary | jira_search_count
+jira_search_stream "mocktotal = 3" summary | jira_extract_summaries | head -1
+jira_search_stream "mocktotal = 12" summary | jira_search_filter_by_summary - "MOCK-1[0-9]$" | jira_extract_keys
+''')
+    assert res.returncode == 0, res.stderr
+    assert res.stdout.splitlines() == ['120', 'MOCK-120', '3', 'MOCK-1: Mock issue MOCK-1',
+                                       'MOCK-10', 'MOCK-11', 'MOCK-12']
+
+
+def test_filter_by_summary_keeps_the_form_of_its_input(tmp_path, mock_jira):
+    res = _bash(jira_env(tmp_path, mock_jira), '''
+r=$(jira_search "mocktotal = 12" summary 0)
+jira_search_filter_by_summary "$r" "MOCK-1[12]$"
+echo ---
+jira_search_stream "mocktotal = 12" summary | jira_search_filter_by_summary - "MOCK-1[12]$"
+''')
+    assert res.returncode == 0, res.stderr
+    results, stream = res.stdout.split('---\n')
+    # Search results in: the filtered object, pretty-printed as before
+    assert results == json.dumps(json.loads(results), indent=2, ensure_ascii=False) + '\n'
+    assert [i['key'] for i in json.loads(results)['issues']] == ['MOCK-11', 'MOCK-12']
+    assert json.loads(results)['total'] == 2
+    # NDJSON in: one compact issue per line
+    assert [json.loads(line)['key'] for line in stream.splitlines()] == ['MOCK-11', 'MOCK-12']
+    assert all(line.startswith('{"') for line in stream.splitlines())
+
+
+def test_find_related_tickets_streams_all_pages(tmp_path, mock_jira):
+    keys_file = tmp_path / 'keys.txt'
+    res = subprocess.run(
+        ['bash', str(REPO_ROOT / 'scripts' / 'find-related-tickets.sh'), '--jql', 'mocktotal = 130',
+         '--max-results', '0', '--output', str(keys_file)],
+        env=jira_env(tmp_path, mock_jira), capture_output=True, text=True, timeout=60)
+
+    assert res.returncode == 0, res.stderr
+    assert 'MOCK-130: Mock issue MOCK-130' in res.stdout and 'Found 130 tickets' in res.stdout
+    assert keys_file.read_text().splitlines()[-1] == 'MOCK-130'
+    assert json.loads(res.stdout[res.stdout.rindex('\n{'):])['total'] == 130
+
+
+def test_client_iter_search_prefetches_pages(mock_jira):
+    client = JiraClient(mock_jira.url, 'me', 't')
+    try:
+        keys = [i['key'] for i in client.iter_search('mocktotal = 250', 'summary', page_size=100)]
+        assert keys == [f'MOCK-{n}' for n in range(1, 251)]
+        assert client.search('mocktotal = 250', 'summary', max_results=120)['total'] == 120
+    finally:
+        client.close()
@@ -0,0 +1,133 @@
+"""Tests for similarity ranking (scripts/lib/jira_similarity.py, find-related-tickets.sh --similar)."""
+
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from tests.ci.support.mcp_helpers import load_jira_module
+from tests.ci.support.mock_jira_helpers import jira_env, serve_mock_jira
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+LIB_DIR = REPO_ROOT / 'scripts' / 'lib'
+
+EDITS = {'MOCK-2': 'Retry payment on timeout errors', 'MOCK-4': 'Payment retry timeout',
+         'MOCK-9': 'Payment gateway retry', 'MOCK-11': 'Upgrade spring boot'}
+
+
+@pytest.fixture
+def similarity(monkeypatch):
+    monkeypatch.syspath_prepend(str(LIB_DIR))
+    spec = importlib.util.spec_from_file_location('jira_similarity', LIB_DIR / 'jira_similarity.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def mock_jira():
+    with serve_mock_jira(edits=EDITS) as server:
+        yield server
+
+
+def _issue(key, summary, description=''):
+    return {'key': key, 'fields': {'summary': summary, 'description': description}}
+
+
+CANDIDATES = [
+    _issue('P-1', 'Kafka consumer lag alerts'),
+    _issue('P-2', 'Payment retry on gateway timeout', 'Retries exhaust the payment gateway pool'),
+    _issue('P-3', 'Payment service timeout', 'The payment gateway times out under load'),
+    _issue('P-4', 'Update README'),
+    _issue('P-5', 'Payment gateway retry storm'),
+]
+TARGET = _issue('P-5', 'Payment gateway retry storm')
+
+
+def test_rank_orders_by_cosine_and_skips_the_target(similarity):
+    ranked = similarity.rank(TARGET, CANDIDATES, top=10)
+
+    assert [issue['key'] for _, issue in ranked] == ['P-2', 'P-3']
+    assert 1 > ranked[0][0] > ranked[1][0] > 0
+    assert similarity.rank(TARGET, CANDIDATES, top=1)[0][1]['key'] == 'P-2'
+    assert similarity.rank(TARGET, CANDIDATES, min_score=ranked[1][0]) == ranked[:1]
+
+
+def test_terms_weight_the_summary_and_drop_stop_words(similarity):
+    terms = similarity.issue_terms(_issue('P-1', 'Retry the payment', {
+        'type': 'doc', 'content': [{'type': 'paragraph', 'content': [{'type': 'text', 'text': 'Payment a X'}]}]}))
+    assert terms == {'retry': 2, 'payment': 3}
+
+
+def test_numpy_matrix_matches_the_pure_python_scores(similarity):
+    pytest.importorskip('numpy')
+    docs = [similarity.issue_terms(issue) for issue in CANDIDATES]
+    query = similarity.issue_terms(TARGET)
+    index = similarity.TfidfIndex.build([i['key'] for i in CANDIDATES], docs)
+    assert index.scores(query) == pytest.approx(similarity._scores_python(query, docs))
+
+
+def test_mirror_index_is_rebuilt_after_a_sync(similarity, tmp_path):
+    pytest.importorskip('numpy')
+    spec = importlib.util.spec_from_file_location('jira_mirror', LIB_DIR / 'jira_mirror.py')
+    mirror = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mirror)
+    db = str(tmp_path / 'mirror-P.sqlite')
+    conn = mirror.connect(db)
+    mirror.ingest(conn, 'P', CANDIDATES, synced_at=100, full=True)
+
+    assert similarity.rank_mirror(db, 'P', TARGET)[0][1]['key'] == 'P-2'
+    assert similarity.TfidfIndex.load(similarity.index_path(db)).stamp == 100
+
+    mirror.ingest(conn, 'P', [_issue('P-6', 'Payment gateway retry storm again')], synced_at=200, full=False)
+    conn.close()
+    assert similarity.rank_mirror(db, 'P', TARGET)[0][1]['key'] == 'P-6'
+    assert similarity.TfidfIndex.load(similarity.index_path(db)).stamp == 200
+
+
+def _find_related(env, *args):
+    res = subprocess.run(['bash', str(REPO_ROOT / 'scripts' / 'find-related-tickets.sh'), *args],
+                         env=env, capture_output=True, text=True, timeout=60)
+    assert res.returncode == 0, res.stderr
+    return res.stdout, json.loads(res.stdout[res.stdout.rindex('\n{'):])
+
+
+@pytest.mark.parametrize('mirrored', [False, True])
+def test_find_related_tickets_similar_mode(tmp_path, mock_jira, mirrored):
+    env = jira_env(tmp_path, mock_jira)
+    if mirrored:
+        subprocess.run(['bash', str(REPO_ROOT / 'scripts' / 'jira-mirror.sh')], env=env, check=True,
+                       capture_output=True, timeout=60)
+
+    stdout, result = _find_related(env, '--similar', 'MOCK-2', '--top', '3')
+
+    assert [i['key'] for i in result['issues'][:2]] == ['MOCK-4', 'MOCK-9']
+    assert result['total'] == 3 and 'MOCK-2' not in [i['key'] for i in result['issues']]
+    assert f"MOCK-4 [{result['issues'][0]['score']}]: Payment retry timeout" in stdout
+
+
+def test_similar_mode_ranks_a_given_candidate_set(tmp_path, mock_jira):
+    _, result = _find_related(jira_env(tmp_path, mock_jira), '--similar', 'MOCK-2', '--jql', 'mocktotal = 10',
+                              '--top', '0')
+    assert [i['key'] for i in result['issues'][:2]] == ['MOCK-4', 'MOCK-9']
+    assert len(result['issues']) == 9            # every other candidate shares "mock"
+
+
+def test_mcp_tool_returns_scored_related_tickets(monkeypatch):
+    mod = load_jira_module()
+    w = mod.JiraBashWrapper()
+    calls = []
+    output = ('ℹ️  Similar to: RVV-1 (top 2)\nRVV-7 [0.61]: Payment retry\n\n'
+              + json.dumps({'issues': [{'key': 'RVV-7', 'score': 0.61, 'fields': {'summary': 'Payment retry'}}],
+                            'total': 1}, indent=2))
+    monkeypatch.setattr(w, '_run_script', lambda name, args=None, input_data=None:
+                        calls.append(args) or {'success': True, 'output': output})
+
+    result = w.find_related_tickets('RVV-1', similar=True, top_k=2)
+
+    assert calls == [['--similar', 'RVV-1', '--top', '2']]
+    assert result['related'] == [{'key': 'RVV-7', 'score': 0.61, 'summary': 'Payment retry'}]
+    assert 'related' not in w.find_related_tickets('RVV-1')
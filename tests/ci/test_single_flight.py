@@ -0,0 +1,70 @@
+"""Tests for single-flight coalescing and per-ticket serialization of tool calls."""
+
+import asyncio
+import json
+import shutil
+from pathlib import Path
+
+from tests.ci.support.mcp_helpers import load_jira_module
+
+mod = load_jira_module()
+JiraBashWrapper = mod.JiraBashWrapper
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _wrapper(tmp_path, scripts):
+    d = tmp_path / 'scripts'
+    shutil.copytree(REPO_ROOT / 'scripts' / 'lib', d / 'lib')
+    for name, body in scripts.items():
+        (d / name).write_text('#!/usr/bin/env bash\n' + body + '\n')
+        (d / name).chmod(0o755)
+    w = JiraBashWrapper()
+    w.scripts_dir = str(d)
+    return w
+
+
+def test_identical_read_only_calls_share_one_execution(tmp_path):
+    runs = tmp_path / 'runs.log'
+    w = _wrapper(tmp_path, {'find-related-tickets.sh': f'echo run >> {runs}\nsleep 0.5\necho "related to $2"'})
+    call_tool = w.server._handlers['call_tool']
+
+    async def run():
+        return await asyncio.gather(*(call_tool('find_related_tickets', {'ticket_key': key})
+                                      for key in ['RVV-1'] * 4 + ['RVV-2']))
+
+    results = asyncio.run(run())
+    w.script_pool.workers.close()
+
+    outputs = [json.loads(r[0].text)['output'] for r in results]
+    assert outputs == ['related to RVV-1\n'] * 4 + ['related to RVV-2\n']
+    assert runs.read_text().count('run') == 2
+    summary = w.metrics_summary()
+    assert summary['single_flight']['coalesced'] == 3
+    assert summary['single_flight']['in_flight'] == 0
+    # Every caller is still counted as a call
+    assert summary['tools']['find_related_tickets']['calls'] == 5
+
+
+def test_mutating_calls_on_one_ticket_are_serialized(tmp_path):
+    log = tmp_path / 'groom.log'
+    w = _wrapper(tmp_path, {'jira-groom.sh': (
+        f'echo "start $1" >> {log}\nsleep 0.3\necho "end $1" >> {log}'
+    )})
+    call_tool = w.server._handlers['call_tool']
+
+    async def run():
+        return await asyncio.gather(call_tool('groom_ticket', {'ticket_key': 'RVV-1'}),
+                                    call_tool('groom_ticket', {'ticket_key': 'RVV-2'}),
+                                    call_tool('groom_ticket', {'ticket_key': 'RVV-1'}))
+
+    results = asyncio.run(run())
+    w.script_pool.workers.close()
+
+    assert all(json.loads(r[0].text)['success'] for r in results)
+    events = log.read_text().split('\n')[:-1]
+    rvv1 = [e for e in events if e.endswith('RVV-1')]
+    assert rvv1 == ['start RVV-1', 'end RVV-1', 'start RVV-1', 'end RVV-1']
+    # A different ticket is not held up behind RVV-1
+    assert events.index('start RVV-2') < events.index('end RVV-1')
+    assert w.metrics_summary()['ticket_locks'] == {'held': 0, 'waits': 1}
@@ -0,0 +1,59 @@
+"""Tests for the on-disk transition-ID cache used by jira_transition (scripts/lib/jira-api.sh)."""
+
+import subprocess
+from pathlib import Path
+
+from tests.ci.support.mock_jira_helpers import jira_env, mock_jira  # noqa: F401 (fixture)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _bash(env, cmd):
+    script = f'source "{REPO_ROOT}/scripts/lib/jira-api.sh"; {cmd}; echo; rate_limit_totals'
+    res = subprocess.run(['bash', '-c', script], env=env, capture_output=True, text=True, timeout=30)
+    requests = int(res.stdout.rsplit('\n', 2)[-2].split()[0]) if res.returncode == 0 else None
+    return res, requests
+
+
+def test_cached_ids_make_a_transition_a_single_request(tmp_path, mock_jira):
+    env = jira_env(tmp_path, mock_jira)
+    res, requests = _bash(env, 'jira_transition MOCK-1 Done Story "To Do"; jira_transition MOCK-2 done Story "To Do"')
+
+    assert res.returncode == 0, res.stderr
+    assert requests == 3                              # GET transitions once, then one POST each
+    cache = tmp_path / 'transitions' / 'MOCK__Story__To_Do'
+    lines = cache.read_text().splitlines()
+    assert lines[0].isdigit() and 'done\t31\tDone' in lines[1:]
+
+
+def test_without_issue_context_or_with_ttl_zero_nothing_is_cached(tmp_path, mock_jira):
+    res, requests = _bash(jira_env(tmp_path, mock_jira), 'jira_transition MOCK-1 Done; jira_transition MOCK-1 Done')
+    assert res.returncode == 0, res.stderr
+    assert requests == 4
+
+    env = jira_env(tmp_path, mock_jira, JIRA_TRANSITION_CACHE_TTL='0')
+    res, _ = _bash(env, 'jira_transition MOCK-1 Done Story "To Do"')
+    assert res.returncode == 0 and not list((tmp_path / 'transitions').glob('*'))
+
+
+def test_expired_entries_are_refetched(tmp_path, mock_jira):
+    cache_dir = tmp_path / 'transitions'
+    cache_dir.mkdir()
+    (cache_dir / 'MOCK__Story__To_Do').write_text('1000\ndone\t31\tDone\n')
+
+    res, requests = _bash(jira_env(tmp_path, mock_jira), 'jira_transition MOCK-1 Done Story "To Do"')
+    assert res.returncode == 0, res.stderr
+    assert requests == 2
+    assert (cache_dir / 'MOCK__Story__To_Do').read_text().splitlines()[0] != '1000'
+
+
+def test_stale_id_invalidates_the_entry_and_refetches_once(tmp_path, mock_jira):
+    cache_dir = tmp_path / 'transitions'
+    cache_dir.mkdir()
+    (cache_dir / 'MOCK__Story__To_Do').write_text('9999999999\ndone\t99\tDone\n')
+
+    res, requests = _bash(jira_env(tmp_path, mock_jira), 'jira_transition MOCK-1 Done Story "To Do"')
+    assert res.returncode == 0, res.stderr
+    assert requests == 3                              # rejected POST, GET transitions, POST
+    assert 'was rejected; refreshing transitions' in res.stderr
+    assert 'done\t31\tDone' in (cache_dir / 'MOCK__Story__To_Do').read_text()
@@ -0,0 +1,66 @@
+"""Tests for the groom_tickets batch tool."""
+
+import asyncio
+import json
+
+from tests.ci.support.mcp_helpers import load_jira_module
+
+mod = load_jira_module()
+JiraBashWrapper = mod.JiraBashWrapper
+
+
+class BatchWrapper(JiraBashWrapper):
+    """Fake script runner: JQL resolves to fixed keys, RVV-3 fails to groom."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def _run_script(self, script_name, args=None, input_data=None):
+        self.calls.append((script_name, list(args or [])))
+        if script_name == 'find-related-tickets.sh':
+            out = args[args.index('--output') + 1]
+            with open(out, 'w') as f:
+                f.write('RVV-2\nRVV-3\nRVV-4\n')
+            return {'success': True, 'output': ''}
+        if script_name == 'jira-groom.sh':
+            if args[0] == 'RVV-3':
+                return {'success': False, 'error': 'boom', 'exit_code': 1}
+            return {'success': True, 'output': f'Groomed {args[0]}', 'exit_code': 0}
+        return {'success': False, 'error': 'unknown'}
+
+
+def test_groom_tickets_requires_keys_or_jql():
+    res = BatchWrapper().groom_tickets()
+    assert res['success'] is False
+    assert 'required' in res['error']
+
+
+def test_groom_tickets_keys_and_jql_aggregate_results():
+    w = BatchWrapper()
+    res = w.groom_tickets(ticket_keys=['RVV-1', 'RVV-2'], jql='project = RVV', max_parallel=3,
+                          estimate=True)
+
+    # keys from the list first, then JQL results, duplicates dropped
+    assert [r['ticket_key'] for r in res['results']] == ['RVV-1', 'RVV-2', 'RVV-3', 'RVV-4']
+    assert res['total'] == 4 and res['succeeded'] == 3 and res['failed'] == 1
+    assert res['success'] is False
+    failed = [r for r in res['results'] if not r['success']]
+    assert failed[0]['ticket_key'] == 'RVV-3' and failed[0]['error'] == 'boom'
+    assert all('seconds' in r for r in res['results'])
+    assert len(res['progress']) == 4
+
+    jql_call = [c for c in w.calls if c[0] == 'find-related-tickets.sh'][0]
+    assert jql_call[1][:2] == ['--jql', 'project = RVV']
+    # batch estimation is always auto-accepted
+    groom_args = [c[1] for c in w.calls if c[0] == 'jira-groom.sh']
+    assert all('--auto-estimate' in a for a in groom_args)
+
+
+def test_groom_tickets_via_call_tool():
+    w = BatchWrapper()
+    handler = w.server._handlers['call_tool']
+    out = asyncio.run(handler('groom_tickets', {'ticket_keys': ['RVV-1', 'RVV-5']}))
+    parsed = json.loads(out[0].text)
+    assert parsed['success']
+    assert parsed['succeeded'] == 2
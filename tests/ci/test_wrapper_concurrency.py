@@ -0,0 +1,95 @@
+"""Concurrency tests: tool calls run scripts on a bounded asyncio pool without blocking the loop."""
+
+import asyncio
+import json
+import os
+import time
+
+from tests.ci.support.mcp_helpers import load_jira_module
+
+mod = load_jira_module()
+JiraBashWrapper = mod.JiraBashWrapper
+
+STUB_DELAY = 0.5
+
+
+def _make_wrapper(tmp_path, script_body, max_concurrency=8):
+    scripts = tmp_path / 'scripts'
+    scripts.mkdir(exist_ok=True)
+    script = scripts / 'jira-groom.sh'
+    script.write_text('#!/bin/sh\n' + script_body + '\n')
+    script.chmod(0o755)
+
+    w = JiraBashWrapper()
+    w.scripts_dir = str(scripts)
+    w.script_pool = mod.ScriptPool(max_concurrency=max_concurrency, timeout=30)
+    return w
+
+
+def _groom_many(w, n):
+    handler = w.server._handlers['call_tool']
+
+    async def run():
+        calls = [handler('groom_ticket', {'ticket_key': f'RVV-{i}'}) for i in range(n)]
+        return await asyncio.gather(*calls)
+
+    start = time.monotonic()
+    results = asyncio.run(run())
+    return results, time.monotonic() - start
+
+
+def test_concurrent_groom_calls_finish_in_about_one_script_time(tmp_path):
+    w = _make_wrapper(tmp_path, f'sleep {STUB_DELAY}; echo "groomed $1"')
+
+    _, single = _groom_many(w, 1)
+    results, elapsed = _groom_many(w, 6)
+
+    for i, out in enumerate(results):
+        parsed = json.loads(out[0].text)
+        assert parsed['success']
+        assert f'groomed RVV-{i}' in parsed['output']
+    # Six calls in parallel should take roughly as long as one, not six times as long
+    assert elapsed < single * 2.5, f'6 calls took {elapsed:.2f}s vs single {single:.2f}s'
+
+
+def test_pool_limit_queues_excess_calls(tmp_path):
+    w = _make_wrapper(tmp_path, f'sleep {STUB_DELAY}; echo done', max_concurrency=2)
+
+    results, elapsed = _groom_many(w, 4)
+
+    assert all(json.loads(out[0].text)['success'] for out in results)
+    # Two slots, four calls -> at least two rounds
+    assert elapsed >= STUB_DELAY * 2
+
+
+def test_cancelling_call_kills_script_process_group(tmp_path):
+    pid_file = tmp_path / 'child.pid'
+    w = _make_wrapper(tmp_path, f'sleep 30 &\necho $! > {pid_file}\nwait')
+    handler = w.server._handlers['call_tool']
+
+    async def run():
+        task = asyncio.ensure_future(handler('groom_ticket', {'ticket_key': 'RVV-1'}))
+        for _ in range(50):
+            if pid_file.exists() and pid_file.read_text().strip():
+                break
+            await asyncio.sleep(0.05)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        # give the worker thread a moment to observe the cancellation
+        await asyncio.sleep(0.2)
+
+    asyncio.run(run())
+
+    child_pid = int(pid_file.read_text().strip())
+    alive = True
+    for _ in range(40):
+        try:
+            os.kill(child_pid, 0)
+        except ProcessLookupError:
+            alive = False
+            break
+        time.sleep(0.05)
+    assert not alive, 'background child of the cancelled script is still running'
@@ -3,7 +3,6 @@
 import os
 import sys
 import importlib.util
-import subprocess
 from pathlib import Path
 import types
 
@@ -56,28 +55,22 @@ sys.modules['dotenv'] = fake_dotenv
 spec.loader.exec_module(jbw)
 JiraBashWrapper = jbw.JiraBashWrapper
 
-class DummyCompleted:
-    def __init__(self, returncode=0, stdout='', stderr=''):
-        self.returncode = returncode
-        self.stdout = stdout
-        self.stderr = stderr
+def _write_script(path, body):
+    path.write_text('#!/bin/sh\n' + body + '\n')
+    path.chmod(0o755)
 
-# Monkeypatch subprocess.run and os.path.exists to exercise _run_script success and timeout
+
+# Exercise _run_script against real stub scripts (success and timeout)
 
 def test_run_script_success(monkeypatch, tmp_path):
     # simulate scripts dir existing and a script file
     tmp_scripts = tmp_path / 'scripts'
     tmp_scripts.mkdir()
-    script_file = tmp_scripts / 'jira-groom.sh'
-    script_file.write_text('#!/bin/sh\necho groom')
+    _write_script(tmp_scripts / 'jira-groom.sh', 'echo ok')
 
     monkeypatch.setenv('PYTEST', '1')
     # Simulate path detection
     monkeypatch.setattr('os.path.exists', lambda p: True)
-    # Fake subprocess.run
-    def fake_run(cmd, cwd, capture_output, text, input, timeout):
-        return DummyCompleted(returncode=0, stdout='ok', stderr='')
-    monkeypatch.setattr('subprocess.run', fake_run)
 
     w = JiraBashWrapper()
     w.scripts_dir = str(tmp_scripts)
@@ -88,14 +81,12 @@ def test_run_script_success(monkeypatch, tmp_path):
 def test_run_script_timeout(monkeypatch, tmp_path):
     tmp_scripts = tmp_path / 'scripts'
     tmp_scripts.mkdir()
+    _write_script(tmp_scripts / 'jira-groom.sh', 'sleep 5')
     monkeypatch.setattr('os.path.exists', lambda p: True)
 
-    def fake_run_timeout(cmd, cwd, capture_output, text, input, timeout):
-        raise subprocess.TimeoutExpired(cmd, timeout)
-    monkeypatch.setattr('subprocess.run', fake_run_timeout)
-
     w = JiraBashWrapper()
     w.scripts_dir = str(tmp_scripts)
+    w.script_pool.timeout = 0.2
     res = w._run_script('jira-groom.sh')
     assert not res['success'] and 'timed out' in res['error']
 
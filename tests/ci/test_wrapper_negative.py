@@ -2,7 +2,6 @@
 
 import os
 import types
-import subprocess
 import json
 import importlib.util
 from pathlib import Path
@@ -42,10 +41,10 @@ def test_run_script_handles_general_exception(monkeypatch, tmp_path):
     # point wrapper to tmp scripts
     w.scripts_dir = str(scripts)
 
-    def fake_run(cmd, cwd, capture_output, text, input, timeout):
+    async def fake_exec(*cmd, **kwargs):
         raise Exception('boom')
 
-    monkeypatch.setattr('subprocess.run', fake_run)
+    monkeypatch.setattr('asyncio.create_subprocess_exec', fake_exec)
     res = w._run_script('jira-groom.sh')
     assert res['success'] is False
     assert 'Script execution failed' in res['error']
@@ -100,7 +99,8 @@ def test_handle_list_resources_when_prompts_missing(tmp_path):
     import asyncio
     resources = asyncio.run(handler())
     assert isinstance(resources, list)
-    assert resources == []
+    # no prompt templates, only the always-present metrics resource
+    assert [r['uri'] for r in resources] == ['metrics://summary']
 
 
 def test_handle_read_resource_errors(tmp_path):
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Golden corpus for the story point estimators
+
+corpus.ndjson holds synthetic tickets (anonymized shapes of real ones: ADF and
+plain-text descriptions, missing fields, odd types, mixed case and Unicode),
+expected.ndjson what estimate_story_points_team and estimate_story_points (as
+jira-groom.sh --estimate feeds it) produce for each: a readable summary and a
+digest of the exact output bytes.
+
+Usage:
+    python tests/golden/estimation/golden.py corpus [-n 3000]   # regenerate both files
+    python tests/golden/estimation/golden.py expected           # after an intended rule change
+
+tests/ci/test_estimate_golden.py fails when an output drifts from
+expected.ndjson; tests/perf/bench_estimation.py --check also gates throughput.
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+import random
+import sys
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+REPO_ROOT = HERE.parents[2]
+CORPUS = HERE / 'corpus.ndjson'
+EXPECTED = HERE / 'expected.ndjson'
+
+
+def load_engine():
+    """The estimators with their built-in weights, whatever JIRA_ESTIMATE_WEIGHTS says"""
+    spec = importlib.util.spec_from_file_location('jira_estimate', REPO_ROOT / 'scripts' / 'lib' / 'jira_estimate.py')
+    module = importlib.util.module_from_spec(spec)
+    weights = os.environ.pop('JIRA_ESTIMATE_WEIGHTS', None)
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        if weights is not None:
+            os.environ['JIRA_ESTIMATE_WEIGHTS'] = weights
+    return module
+
+
+def read_ndjson(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def outputs(engine, issue):
+    """(team JSON, Fibonacci stdout + analysis) exactly as the shell functions print them"""
+    team = engine.render_team(engine.estimate_team(*engine.issue_inputs(issue)))
+    fibonacci = engine.render_estimate(engine.fibonacci_inputs(issue), 'fibonacci')
+    return team, fibonacci
+
+
+def expected_row(engine, issue):
+    team, fibonacci = outputs(engine, issue)
+    estimate = engine.estimate_team(*engine.issue_inputs(issue))
+    b = estimate['breakdown']
+    fib, raw, _ = engine.estimate_fibonacci(*engine.fibonacci_inputs(issue))
+    return {
+        "key": issue.get('key'),
+        "team": f"{estimate['estimated_points']} = {b['base']}+{b['complexity']}+{b['uncertainty']}+{b['testing']}"
+                f" ({b['total_raw']}) {estimate['confidence']}",
+        "fibonacci": f"{fib} (raw {raw})",
+        "sha256": hashlib.sha256(f"{team}\0{fibonacci}".encode()).hexdigest()[:16],
+    }
+
+
+# Corpus vocabulary: every keyword of both estimators among neutral words
+COMPONENTS = ['Feed Ingestor', 'Odds Adapter', 'Results Connector', 'Payments API', 'Account Service',
+              'Race Card UI', 'Notification Hub', 'Pricing Engine', 'Data Lake Loader', 'Auth Gateway']
+NEUTRAL = ('the when then with from into for and of to on a an it this that we our should must be is are '
+           'page user customer event message request response job queue batch report screen field value '
+           'status owner team release sprint ticket feed race market price odds bet account wallet').split()
+SUMMARY_TEMPLATES = [
+    '[{c}] {verb} {thing}', '{verb} {thing} in {c}', '{c}: {verb} {thing}', '{verb} {thing}',
+    '[{c}] {thing} {problem}', '{thing} {problem} on {c}',
+]
+VERBS = ['Upgrade', 'Migrate', 'Fix', 'Add', 'Implement', 'Refactor', 'Update', 'Remove', 'Investigate',
+         'Rewrite', 'Redesign', 'Document', 'Configure', 'Add support for', 'Explore', 'Patch', 'Validate']
+THINGS = ['Spring Boot', 'Kafka consumer', 'login button', 'retry policy', 'config flag', 'README', 'webhook',
+          'database schema', 'caching layer', 'error handling', 'API endpoint', 'feature toggle', 'label text',
+          'third-party provider', 'authentication flow', 'settings page', 'integration tests', 'wiki guide']
+PROBLEMS = ['is broken', 'throws an error', 'times out', 'shows the wrong wording', 'has a typo', 'is slow',
+            'fails in production', 'defect', 'issue after release', 'bug']
+ISSUE_TYPES = ['Story'] * 5 + ['Bug'] * 3 + ['Task'] * 3 + ['Spike', 'Sub-task', 'Epic']
+
+
+def _keywords(engine):
+    words = set()
+    for table in engine.TEAM_TABLES.values():
+        words.update(table)
+    for pattern, _, _ in engine.FIBONACCI_FACTORS:
+        # "third.?party" -> "thirdparty", "third-party", "third party"
+        words.update(p.replace('.?', sep) for p in pattern.split('|') for sep in ('', '-', ' '))
+    return sorted(words)
+
+
+def _sentence(rng, keywords):
+    words = rng.choices(NEUTRAL, k=rng.randint(3, 12))
+    for _ in range(rng.choice((0, 1, 1, 2, 3))):
+        words.insert(rng.randrange(len(words) + 1), rng.choice(keywords))
+    text = ' '.join(words)
+    if rng.random() < 0.15:
+        text = text.upper()
+    elif rng.random() < 0.5:
+        text = text[0].upper() + text[1:]
+    return text + rng.choice(['.', '.', '.', '!', '?', ':', ''])
+
+
+def _adf(rng, paragraphs):
+    content = []
+    for text in paragraphs:
+        kind = rng.random()
+        if kind < 0.15:
+            content.append({"type": "bulletList", "content": [
+                {"type": "listItem", "content": [{"type": "paragraph", "content": [{"type": "text", "text": t}]}]}
+                for t in text.split('. ') if t]})
+        elif kind < 0.25:
+            words = text.split(' ')
+            cut = rng.randrange(len(words) + 1)
+            content.append({"type": "paragraph", "content": [
+                {"type": "text", "text": ' '.join(words[:cut]) + ' '},
+                {"type": "text", "text": ' '.join(words[cut:]) or 'link',
+                 "marks": [{"type": "link", "attrs": {"href": f"https://example.com/{rng.choice(NEUTRAL)}"}}]},
+                {"type": "hardBreak"},
+            ]})
+        elif kind < 0.3:
+            content.append({"type": "codeBlock", "attrs": {"language": "yaml"},
+                            "content": [{"type": "text", "text": f"{rng.choice(NEUTRAL)}: true\n"}]})
+        else:
+            content.append({"type": "paragraph", "content": [{"type": "text", "text": text}]})
+    return {"type": "doc", "version": 1, "content": content}
+
+
+def synthetic_ticket(rng, num, keywords):
+    summary = rng.choice(SUMMARY_TEMPLATES).format(
+        c=rng.choice(COMPONENTS), verb=rng.choice(VERBS), thing=rng.choice(THINGS), problem=rng.choice(PROBLEMS))
+    paragraphs = [' '.join(_sentence(rng, keywords) for _ in range(rng.randint(1, 4)))
+                  for _ in range(rng.choice((0, 1, 1, 2, 2, 3, 5)))]
+    shape = rng.random()
+    if not paragraphs or shape < 0.05:
+        description = rng.choice([None, '', {"type": "doc", "version": 1, "content": []}])
+    elif shape < 0.3:
+        description = '\n\n'.join(paragraphs)
+    else:
+        description = _adf(rng, paragraphs)
+
+    fields = {"summary": summary, "description": description, "issuetype": {"name": rng.choice(ISSUE_TYPES)}}
+    quirk = rng.random()
+    if quirk < 0.02:
+        del fields['issuetype']
+    elif quirk < 0.03:
+        fields['summary'] = None
+    elif quirk < 0.04:
+        fields['summary'] = f"{summary} — Ünïcödé café ✓"
+    elif quirk < 0.045:
+        fields['summary'] = summary + '\t\n'
+    elif quirk < 0.05 and isinstance(description, dict) and description['content']:
+        description['content'].append({"type": "paragraph", "content": [{"type": "text", "text": 1.5}]})
+    return {"key": f"GOLD-{num}", "fields": fields}
+
+
+# Anonymized shapes of tickets from the estimation guide
+ANONYMIZED = [
+    {"summary": "Fix typo in error message", "description": "Wording on the login error is wrong",
+     "issuetype": {"name": "Bug"}},
+    {"summary": "[Feed Ingestor] Spring boot upgrade", "issuetype": {"name": "Story"}, "description": {
+        "type": "doc", "version": 1, "content": [{"type": "paragraph", "content": [{"type": "text", "text":
+            "Upgrade to Spring Boot 3 across multiple services; downstream consumers depend on it. "
+            "Verify in production."}]}]}},
+    {"summary": "Add support for new racing data provider", "issuetype": {"name": "Story"},
+     "description": "Integrate the third-party provider API. Unknown rate limits; needs documentation."},
+    {"summary": "Update config flag for retries", "issuetype": {"name": "Task"},
+     "description": "Simple config change, same as the previous toggle"},
+]
+
+
+def build_corpus(engine, n, seed=2024):
+    rng = random.Random(seed)
+    keywords = _keywords(engine)
+    tickets = [{"key": f"ANON-{i}", "fields": fields} for i, fields in enumerate(ANONYMIZED, 1)]
+    tickets += [synthetic_ticket(rng, num, keywords) for num in range(1, n - len(tickets) + 1)]
+    return tickets
+
+
+def write_ndjson(path, rows):
+    with open(path, 'w', encoding='utf-8') as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + '\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    sub = parser.add_subparsers(dest='command', required=True)
+    corpus = sub.add_parser('corpus', help='regenerate corpus.ndjson and expected.ndjson')
+    corpus.add_argument('-n', type=int, default=3000, help='tickets (default: 3000)')
+    sub.add_parser('expected', help='recompute expected.ndjson from the current estimators')
+    opts = parser.parse_args(argv)
+
+    engine = load_engine()
+    if opts.command == 'corpus':
+        write_ndjson(CORPUS, build_corpus(engine, opts.n))
+    tickets = read_ndjson(CORPUS)
+    write_ndjson(EXPECTED, (expected_row(engine, issue) for issue in tickets))
+    print(f"{len(tickets)} tickets, ruleset {engine.RULESET_VERSION}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
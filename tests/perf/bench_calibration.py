@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark: calibrating the team-scale estimation weights on a large history
+
+Builds an NDJSON history of N completed tickets from the golden estimation
+corpus (tests/golden/estimation/corpus.ndjson, repeated), each with the story
+points the estimator gives it plus some noise, then times
+scripts/lib/jira_calibrate.py stage by stage: reading and extracting the
+estimator inputs, the ticket x keyword matrix, and the NumPy fit (levels,
+least squares and thresholds). Needs NumPy; no Jira access is needed.
+
+Usage:
+    python tests/perf/bench_calibration.py [-n 50000]
+"""
+
+import argparse
+import importlib.util
+import io
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+LIB_DIR = REPO_ROOT / 'scripts' / 'lib'
+CORPUS = REPO_ROOT / 'tests' / 'golden' / 'estimation' / 'corpus.ndjson'
+
+
+def load(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def history(engine, n, seed=1):
+    """NDJSON of n tickets with story points: the estimate, one in ten replaced at random"""
+    rng = random.Random(seed)
+    with open(CORPUS, encoding='utf-8') as f:
+        corpus = [json.loads(line) for line in f if line.strip()]
+    points = [float(engine.estimate_team(*engine.issue_inputs(issue))['estimated_points']) for issue in corpus]
+    lines = []
+    for num in range(n):
+        issue, estimate = corpus[num % len(corpus)], points[num % len(corpus)]
+        if rng.random() < 0.1:
+            estimate = rng.choice([0.5, 1.0, 2.0, 3.0, 4.0, 5.0])
+        lines.append(json.dumps(dict(issue, fields=dict(issue['fields'], customfield_10016=estimate))) + '\n')
+    return ''.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-n', type=int, default=50000, help='tickets (default: 50000)')
+    opts = parser.parse_args()
+
+    sys.path.insert(0, str(LIB_DIR))
+    calibrate = load('jira_calibrate', LIB_DIR / 'jira_calibrate.py')
+    if calibrate.np is None:
+        print("NumPy is not installed; nothing to benchmark")
+        return 1
+    text = history(calibrate.engine, opts.n)
+
+    started = time.perf_counter()
+    inputs, points, _ = calibrate.read_history(io.StringIO(text), calibrate.POINTS_FIELD)
+    read = time.perf_counter() - started
+    result = calibrate.calibrate(inputs, points)
+    timings = {'read + extract': read, **result['timings']}
+    total = sum(timings.values())
+
+    print(f"{len(inputs)} tickets ({len(text) / 1e6:.0f}MB): calibrated in {total:.2f}s "
+          f"({len(inputs) / total:,.0f} tickets/s)")
+    for name, seconds in timings.items():
+        print(f"  {name:<15} {seconds:>6.2f}s {seconds / total:>5.0%}")
+    before, after = result['before'], result['after']
+    print(f"  RMSE {before['rmse']} -> {after['rmse']}, exact {before['exact']:.0%} -> {after['exact']:.0%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: cold-fork vs warm-worker script dispatch
+
+Runs each script N times through ScriptPool.execute (a new bash per call) and
+through BashWorkerPool.run (a pre-warmed scripts/lib/mcp-worker.sh), and prints
+median / p95 latency. The default scripts exit right after loading their
+libraries and .env, so the numbers are the fixed per-call start-up cost; no
+Jira access is needed.
+
+Usage:
+    python tests/perf/bench_dispatch.py [-n 50] [script [args...]]
+
+Examples:
+    python tests/perf/bench_dispatch.py
+    python tests/perf/bench_dispatch.py -n 100 jira-close.sh
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS_DIR = REPO_ROOT / 'scripts'
+
+# Scripts that load their libraries and .env, then stop on argument validation
+DEFAULT_CASES = [
+    ['jira-groom.sh', 'not-a-key'],
+    ['jira-close.sh', 'not-a-key'],
+    ['get-description-template.sh', 'RVV-1', '--print', '--issue-json', '/nonexistent'],
+]
+
+
+def load_wrapper():
+    spec = importlib.util.spec_from_file_location('jira_bash_wrapper', REPO_ROOT / 'mcp-server' / 'jira_bash_wrapper.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def summarize(samples):
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return statistics.median(samples) * 1000, p95 * 1000
+
+
+async def bench(mod, cases, n):
+    cold_pool = mod.ScriptPool(max_concurrency=1)
+    workers = mod.BashWorkerPool(str(SCRIPTS_DIR), size=1, max_jobs=n + 1)
+    workers.warm()
+    cwd = str(REPO_ROOT)
+    rows = []
+    try:
+        for case in cases:
+            cmd = [str(SCRIPTS_DIR / case[0])] + case[1:]
+            await workers.run(cmd, cwd)                   # wait for READY, warm caches
+            timings = {'cold': [], 'warm': []}
+            for _ in range(n):
+                start = time.perf_counter()
+                await cold_pool.execute(cmd, cwd)
+                timings['cold'].append(time.perf_counter() - start)
+                start = time.perf_counter()
+                await workers.run(cmd, cwd)
+                timings['warm'].append(time.perf_counter() - start)
+            rows.append((' '.join(case), summarize(timings['cold']), summarize(timings['warm'])))
+    finally:
+        workers.close()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-n', type=int, default=50, help='runs per script (default: 50)')
+    parser.add_argument('script', nargs=argparse.REMAINDER, help='script name and arguments')
+    opts = parser.parse_args()
+
+    cases = [opts.script] if opts.script else DEFAULT_CASES
+    rows = asyncio.run(bench(load_wrapper(), cases, opts.n))
+
+    width = max(len('script'), *(len(row[0]) for row in rows))
+    print(f"{'script':<{width}} {'cold p50':>9} {'cold p95':>9} {'warm p50':>9} {'warm p95':>9} {'speedup':>8}")
+    for name, (cold50, cold95), (warm50, warm95) in rows:
+        print(f"{name:<{width}} {cold50:>7.1f}ms {cold95:>7.1f}ms {warm50:>7.1f}ms {warm95:>7.1f}ms {cold50 / warm50:>7.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
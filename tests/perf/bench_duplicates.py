@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: near-duplicate check over a synthetic project
+
+Loads N synthetic tickets (8-word summaries and 80-word descriptions drawn from
+a few thousand words) into a local mirror, times the first MinHash/LSH index
+build, the refresh after a sync that changed one ticket, and then checks new
+tickets against the index: a near-copy of an existing summary (one word
+dropped), the same with its description, and an unrelated summary. No Jira
+access is needed.
+
+Usage:
+    python tests/perf/bench_duplicates.py [-n 20000] [--repeat 200]
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+LIB_DIR = REPO_ROOT / 'scripts' / 'lib'
+
+
+def load(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def synthetic_issues(n, seed=1):
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(5000)]
+    for num in range(1, n + 1):
+        yield {"key": f"BENCH-{num}", "fields": {
+            "summary": ' '.join(rng.choices(words, k=8)),
+            "description": ' '.join(rng.choices(words, k=80)),
+        }}
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - start)
+    return result, statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-n', type=int, default=20000, help='tickets (default: 20000)')
+    parser.add_argument('--repeat', type=int, default=200, help='checks per variant, median reported (default: 200)')
+    opts = parser.parse_args()
+
+    sys.path.insert(0, str(LIB_DIR))
+    mirror = load('jira_mirror', LIB_DIR / 'jira_mirror.py')
+    dupes = load('jira_dupes', LIB_DIR / 'jira_dupes.py')
+    issues = list(synthetic_issues(opts.n))
+    original = issues[len(issues) // 2]['fields']
+    near_copy = ' '.join(original['summary'].split()[:-1])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = mirror.connect(os.path.join(tmp, 'mirror-BENCH.sqlite'))
+        mirror.ingest(conn, 'BENCH', issues, synced_at=1, full=True)
+        index = dupes.DuplicateIndex(conn)
+
+        start = time.perf_counter()
+        built = index.refresh('BENCH')
+        build_s = time.perf_counter() - start
+        mirror.ingest(conn, 'BENCH', [{"key": "BENCH-1", "fields": {"summary": "Edited", "description": ""}}],
+                      synced_at=2, full=False)
+        start = time.perf_counter()
+        refreshed = index.refresh('BENCH')
+        refresh_ms = (time.perf_counter() - start) * 1000
+
+        rows = [
+            ('near-copy summary', timed(lambda: index.query(near_copy), opts.repeat)),
+            ('near-copy summary + description',
+             timed(lambda: index.query(near_copy, original['description']), opts.repeat)),
+            ('unrelated summary', timed(lambda: index.query('Rotate the database credentials'), opts.repeat)),
+        ]
+        conn.close()
+
+    print(f"{opts.n} tickets: index built in {build_s:.1f}s ({built} signed), "
+          f"refreshed after a one-ticket sync in {refresh_ms:.0f}ms ({refreshed} signed)")
+    width = max(len(name) for name, _ in rows)
+    print(f"{'check':<{width}} {'median':>10}  best match")
+    for name, (found, ms) in rows:
+        best = f"{found[0][1]} ({found[0][0]})" if found else '-'
+        print(f"{name:<{width}} {ms:>8.3f}ms  {best}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
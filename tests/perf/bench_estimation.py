@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Benchmark and regression gate: story point estimation over the golden corpus
+
+Runs both estimators over tests/golden/estimation/corpus.ndjson (a few thousand
+synthetic tickets) and reports tickets per second and the cost of each stage:
+parsing the ticket JSON, extracting the estimator inputs the way the shell
+functions do, the team-scale estimate and its JSON rendering, and the Fibonacci
+estimate with its analysis. No Jira access is needed.
+
+--check turns it into a gate: it fails when any output differs from
+expected.ndjson. It also compares throughput with baseline.json, as a ratio to
+a fixed pure-Python reference workload timed alongside each round (median over
+rounds). The ratio still varies between machines, so a drop of more than
+--max-drop is only reported (as a warning annotation under GitHub Actions)
+unless --strict-throughput is given, e.g. against a baseline recorded on the
+same machine. --record rewrites baseline.json. --shell-sample N also runs the
+shell functions on N tickets, checking their output and timing them (the team
+scale needs bc).
+
+Usage:
+    python tests/perf/bench_estimation.py [--repeat 3] [--check [--max-drop 0.3] [--strict-throughput]]
+                                          [--record] [--shell-sample 50]
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+GOLDEN_DIR = REPO_ROOT / 'tests' / 'golden' / 'estimation'
+BASELINE = GOLDEN_DIR / 'baseline.json'
+LIB_DIR = REPO_ROOT / 'scripts' / 'lib'
+
+
+def load(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def reference_workload():
+    """Fixed mix of JSON, string search and formatting work; seconds per run"""
+    doc = {"summary": "Reference ticket", "description": ' '.join(f"word{i}" for i in range(200))}
+    start = time.perf_counter()
+    for i in range(3000):
+        text = json.dumps(doc).lower()
+        found = sum(1 for k in ('word1', 'word199', 'absent', 'ticket') if k in text)
+        json.loads(text)
+        f"{i}: {found}".join(('[', ']'))
+    return time.perf_counter() - start
+
+
+def run_stages(engine, lines):
+    """Seconds spent in each stage over every ticket"""
+    cost = dict.fromkeys(('parse', 'extract', 'team estimate', 'team render', 'fibonacci'), 0.0)
+    clock = time.perf_counter
+    for line in lines:
+        t0 = clock()
+        issue = json.loads(line)
+        t1 = clock()
+        team_inputs = engine.issue_inputs(issue)
+        fibonacci_inputs = engine.fibonacci_inputs(issue)
+        t2 = clock()
+        estimate = engine.estimate_team(*team_inputs)
+        t3 = clock()
+        engine.render_team(estimate)
+        t4 = clock()
+        engine.render_estimate(fibonacci_inputs, 'fibonacci')
+        t5 = clock()
+        cost['parse'] += t1 - t0
+        cost['extract'] += t2 - t1
+        cost['team estimate'] += t3 - t2
+        cost['team render'] += t4 - t3
+        cost['fibonacci'] += t5 - t4
+    return cost
+
+
+def check_outputs(golden, engine, tickets, expected):
+    mismatches = []
+    for issue, want in zip(tickets, expected):
+        got = golden.expected_row(engine, issue)
+        if got != want:
+            mismatches.append((want, got))
+    return mismatches
+
+
+# The pre-engine estimate_story_points_team, composed from the shell helpers it called
+SHELL_TEAM = r'''
+summary=$(echo "$1" | jq -r '.fields.summary // ""' | tr '[:upper:]' '[:lower:]')
+description=$(echo "$1" | jq -r '.fields.description // ""' | tr '[:upper:]' '[:lower:]')
+issue_type=$(echo "$1" | jq -r '.fields.issuetype.name // "Story"')
+combined_text="$summary $description"
+base_points=$(calculate_base_points_team "$summary" "$issue_type")
+complexity=$(calculate_complexity_factor_team "$combined_text")
+uncertainty=$(calculate_uncertainty_factor_team "$description")
+testing=$(calculate_testing_factor_team "$combined_text" "$complexity")
+total=$(echo "$base_points + $complexity + $uncertainty + $testing" | bc -l)
+final_points=$(round_to_team_scale "$total")
+should_split=$(should_suggest_breakdown "$final_points")
+confidence=$(calculate_confidence "$complexity" "$uncertainty")
+reasoning=$(format_estimation_reasoning_team "$base_points" "$complexity" "$uncertainty" "$testing" "$final_points")
+cat << EOF
+{
+  "estimated_points": $final_points,
+  "breakdown": {
+    "base": $base_points,
+    "complexity": $complexity,
+    "uncertainty": $uncertainty,
+    "testing": $testing,
+    "total_raw": $total
+  },
+  "reasoning": "$reasoning",
+  "should_split": $should_split,
+  "confidence": "$confidence"
+}
+EOF
+'''
+
+# jira-groom.sh --estimate feeding estimate_story_points
+SHELL_FIBONACCI = r'''
+summary=$(echo "$1" | jq -r '.fields.summary')
+current_description=$(echo "$1" | jq -r '.fields.description // empty')
+description_text=""
+if [[ -n "$current_description" ]]; then
+    description_text=$(echo "$current_description" | jq -r '
+        if type == "object" then
+            [.. | .text? // empty] | join(" ")
+        else
+            .
+        end
+    ' 2>/dev/null || echo "$current_description")
+fi
+estimate_story_points "$description_text" "$summary" 2>&1
+'''
+
+
+def shell_sample(golden, engine, lines, count):
+    """(tickets checked, mismatching keys, seconds per ticket) per scale for the shell functions"""
+    step = max(1, len(lines) // count)
+    sample = lines[::step][:count]
+    scripts = {'fibonacci': f'source "{LIB_DIR}/jira-estimate.sh"\n{SHELL_FIBONACCI}'}
+    if shutil.which('bc'):
+        scripts['team'] = f'source "{LIB_DIR}/jira-estimate-team.sh"\n{SHELL_TEAM}'
+    results = {}
+    for scale, script in scripts.items():
+        bad = []
+        start = time.perf_counter()
+        for line in sample:
+            issue = json.loads(line)
+            res = subprocess.run(['bash', '-c', script, 'bash', line], capture_output=True, text=True,
+                                 env={'PATH': os.environ['PATH'], 'LC_ALL': 'C.UTF-8'})
+            team, fibonacci = golden.outputs(engine, issue)
+            if res.stdout != (team if scale == 'team' else fibonacci):
+                bad.append(issue.get('key'))
+        results[scale] = (len(sample), bad, (time.perf_counter() - start) / len(sample))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=3, help='rounds over the corpus (default: 3)')
+    parser.add_argument('--check', action='store_true', help='fail on changed outputs, report a throughput drop')
+    parser.add_argument('--max-drop', type=float, default=0.3,
+                        help='throughput drop below the baseline that is reported (default: 0.3 = 30%%)')
+    parser.add_argument('--strict-throughput', action='store_true',
+                        help='with --check, also fail on a throughput drop')
+    parser.add_argument('--record', action='store_true', help='write this run as the new baseline')
+    parser.add_argument('--shell-sample', type=int, default=0, metavar='N',
+                        help='also run the shell functions on N tickets')
+    opts = parser.parse_args()
+
+    golden = load('golden', GOLDEN_DIR / 'golden.py')
+    engine = golden.load_engine()
+    with open(golden.CORPUS, encoding='utf-8') as f:
+        lines = [line for line in f if line.strip()]
+
+    # Each round is paired with the reference workload, so both see the same machine load
+    best, ratios = None, []
+    for _ in range(opts.repeat):
+        reference = reference_workload()
+        cost = run_stages(engine, lines)
+        ratios.append(len(lines) / sum(cost.values()) * reference)
+        if best is None or sum(cost.values()) < sum(best.values()):
+            best = cost
+    total = sum(best.values())
+    rate = len(lines) / total
+    normalized = sorted(ratios)[len(ratios) // 2]
+
+    print(f"{len(lines)} tickets (ruleset {engine.RULESET_VERSION}): {rate:,.0f} tickets/s "
+          f"({total * 1000:.0f}ms, {total / len(lines) * 1e6:.0f}us per ticket)")
+    width = max(len(name) for name in best)
+    print(f"{'stage':<{width}} {'per ticket':>11} {'share':>6}")
+    for name, seconds in best.items():
+        print(f"{name:<{width}} {seconds / len(lines) * 1e6:>9.1f}us {seconds / total:>6.0%}")
+
+    if opts.shell_sample:
+        for scale, (count, bad, seconds) in shell_sample(golden, engine, lines, opts.shell_sample).items():
+            print(f"shell {scale}: {1 / seconds:.1f} tickets/s over {count} tickets "
+                  f"({seconds * rate:,.0f}x slower), {len(bad)} output mismatch(es) {' '.join(bad[:5])}")
+            if bad and opts.check:
+                return 1
+        if not shutil.which('bc'):
+            print("shell team: skipped (bc not installed)")
+
+    status = 0
+    if opts.check:
+        mismatches = check_outputs(golden, engine, [json.loads(line) for line in lines],
+                                   golden.read_ndjson(golden.EXPECTED))
+        if mismatches:
+            print(f"FAIL: {len(mismatches)} ticket(s) estimate differently from expected.ndjson")
+            for want, got in mismatches[:10]:
+                print(f"  {want['key']}: team {want['team']} -> {got['team']}, "
+                      f"fibonacci {want['fibonacci']} -> {got['fibonacci']}")
+            print("  (intended? python tests/golden/estimation/golden.py expected)")
+            status = 1
+        if BASELINE.exists():
+            baseline = json.loads(BASELINE.read_text())
+            floor = baseline['normalized_throughput'] * (1 - opts.max_drop)
+            dropped = normalized < floor
+            verdict = 'ok' if not dropped else 'FAIL' if opts.strict_throughput else 'below baseline (advisory)'
+            print(f"throughput {verdict}: {normalized:.2f} vs baseline {baseline['normalized_throughput']:.2f} "
+                  f"(minimum {floor:.2f}; tickets/s x reference workload seconds)")
+            if dropped and opts.strict_throughput:
+                status = 1
+            elif dropped and os.environ.get('GITHUB_ACTIONS') == 'true':
+                print(f"::warning title=Estimation throughput::{normalized:.2f} vs baseline "
+                      f"{baseline['normalized_throughput']:.2f} (timings vary between runners)")
+        else:
+            print("throughput: no baseline.json (run with --record)")
+
+    if opts.record:
+        BASELINE.write_text(json.dumps({
+            "normalized_throughput": round(normalized, 2),
+            "tickets_per_sec": round(rate),
+            "tickets": len(lines),
+            "python": sys.version.split()[0],
+        }, indent=2) + '\n')
+        print(f"baseline written to {BASELINE.relative_to(REPO_ROOT)}")
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
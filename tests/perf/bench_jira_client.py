@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: per-call curl vs the pooled Python Jira client
+
+Starts scripts/mock_jira.py on a free local port and fetches an issue N times
+three ways: jira_get_issue from scripts/lib/jira-api.sh (one curl process and
+one new connection per call, all inside a single bash), JiraClient with no
+idle pool (a new connection per call, no process spawn), and JiraClient with
+its keep-alive pool. Prints median / p95 latency per call. No Jira access is
+needed; against a real HTTPS Jira the pooled client also skips the TLS
+handshake on every call after the first.
+
+Usage:
+    python tests/perf/bench_jira_client.py [-n 200]
+"""
+
+import argparse
+import importlib.util
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+ISSUE_KEY = 'MOCK-1'
+
+
+def load(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def summarize(samples):
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return statistics.median(samples) * 1000, p95 * 1000
+
+
+def bench_curl(base_url, n):
+    """Time each jira_get_issue call inside one bash, so only the curl cost is measured"""
+    script = f'''
+source "{REPO_ROOT}/scripts/lib/jira-api.sh"
+for _ in $(seq {n}); do
+    start=$EPOCHREALTIME
+    jira_get_issue {ISSUE_KEY} >/dev/null || exit 1
+    echo "$start $EPOCHREALTIME"
+done
+'''
+    env = {**os.environ, 'JIRA_BASE_URL': base_url, 'JIRA_EMAIL': 'bench', 'JIRA_TOKEN': 'bench',
+           'JIRA_PROJECT': 'MOCK'}
+    out = subprocess.run(['bash', '-c', script], env=env, capture_output=True, text=True, check=True).stdout
+    return [float(end) - float(start) for start, end in (line.split() for line in out.splitlines())]
+
+
+def bench_client(client, n):
+    samples = []
+    for _ in range(n):
+        start = time.perf_counter()
+        client.get_issue(ISSUE_KEY)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-n', type=int, default=200, help='calls per variant (default: 200)')
+    opts = parser.parse_args()
+
+    mock = load('mock_jira', REPO_ROOT / 'scripts' / 'mock_jira.py')
+    jira_client = load('jira_client', REPO_ROOT / 'mcp-server' / 'jira_client.py')
+    server = mock.make_server(port=0, quiet=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f'http://127.0.0.1:{server.server_address[1]}'
+
+    try:
+        unpooled = jira_client.JiraClient(base_url, 'bench', 'bench', pool_size=0)
+        pooled = jira_client.JiraClient(base_url, 'bench', 'bench')
+        rows = [
+            ('curl per call (jira-api.sh)', bench_curl(base_url, opts.n)),
+            ('client, new connection', bench_client(unpooled, opts.n)),
+            ('client, pooled keep-alive', bench_client(pooled, opts.n)),
+        ]
+        pooled.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    baseline = summarize(rows[0][1])[0]
+    width = max(len(name) for name, _ in rows)
+    print(f"{'variant':<{width}} {'p50':>9} {'p95':>9} {'speedup':>8}")
+    for name, samples in rows:
+        p50, p95 = summarize(samples)
+        print(f"{name:<{width}} {p50:>7.2f}ms {p95:>7.2f}ms {baseline / p50:>7.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: similarity ranking over a synthetic project
+
+Loads N synthetic tickets (random words drawn from a few thousand, plus a few
+shared topic words) into a local mirror and ranks them against one target three
+ways: on the fly from NDJSON candidates (tokenize everything, then score), from
+the mirror with the TF-IDF matrix built on the first query, and from the mirror
+with the prebuilt matrix (the steady state between syncs). Without NumPy only
+the pure-Python path runs. No Jira access is needed.
+
+Usage:
+    python tests/perf/bench_similarity.py [-n 20000] [--repeat 5]
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+LIB_DIR = REPO_ROOT / 'scripts' / 'lib'
+
+
+def load(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def synthetic_issues(n, seed=1):
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(5000)] + 'payment retry timeout kafka consumer spring boot upgrade'.split()
+    for num in range(1, n + 1):
+        yield {"key": f"BENCH-{num}", "fields": {
+            "summary": ' '.join(rng.choices(words, k=8)),
+            "description": {"type": "doc", "version": 1, "content": [
+                {"type": "paragraph", "content": [{"type": "text", "text": ' '.join(rng.choices(words, k=80))}]}
+            ]},
+        }}
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - start)
+    return result, statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-n', type=int, default=20000, help='tickets (default: 20000)')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per variant, median reported (default: 5)')
+    opts = parser.parse_args()
+
+    sys.path.insert(0, str(LIB_DIR))
+    mirror = load('jira_mirror', LIB_DIR / 'jira_mirror.py')
+    similarity = load('jira_similarity', LIB_DIR / 'jira_similarity.py')
+    issues = list(synthetic_issues(opts.n))
+    target = {"key": "BENCH-0", "fields": {"summary": "Kafka consumer retry timeout", "description": "payment retry"}}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, 'mirror-BENCH.sqlite')
+        conn = mirror.connect(db)
+        mirror.ingest(conn, 'BENCH', issues, synced_at=1, full=True)
+        conn.close()
+
+        rows = [('on the fly (NDJSON candidates)', timed(lambda: similarity.rank(target, issues), opts.repeat))]
+        if similarity.np is not None:
+            def cold():
+                if os.path.exists(similarity.index_path(db)):
+                    os.unlink(similarity.index_path(db))
+                return similarity.rank_mirror(db, 'BENCH', target)
+            rows.append(('mirror, matrix built', timed(cold, opts.repeat)))
+            rows.append(('mirror, prebuilt matrix', timed(lambda: similarity.rank_mirror(db, 'BENCH', target),
+                                                          opts.repeat)))
+        else:
+            rows.append(('mirror (pure Python)', timed(lambda: similarity.rank_mirror(db, 'BENCH', target),
+                                                       opts.repeat)))
+
+    print(f"{opts.n} tickets, NumPy {'available' if similarity.np is not None else 'not installed'}")
+    width = max(len(name) for name, _ in rows)
+    print(f"{'variant':<{width}} {'median':>10}  top result")
+    for name, (ranked, ms) in rows:
+        best = f"{ranked[0][1]['key']} ({ranked[0][0]})" if ranked else '-'
+        print(f"{name:<{width}} {ms:>8.1f}ms  {best}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())